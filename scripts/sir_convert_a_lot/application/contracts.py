@@ -30,6 +30,8 @@ class JobProgress(BaseModel):
     last_heartbeat_at: datetime | None = None
     current_phase_started_at: datetime | None = None
     phase_timings_ms: dict[str, int] = Field(default_factory=dict)
+    cache_hit: bool = False
+    coalesced_with_job_id: str | None = None
 
 
 class JobLinks(BaseModel):
@@ -86,6 +88,11 @@ class ConversionMetadata(BaseModel):
     ocr_enabled: bool
     table_mode: TableMode
     options_fingerprint: str
+    formula_enrichment_used: bool | None = None
+    ocr_languages: list[str] | None = None
+    backend_route_reasons: list[str] | None = None
+    preclassification_labels: list[str] | None = None
+    preclassification_hits: dict[str, bool] | None = None
 
 
 class ResultPayload(BaseModel):
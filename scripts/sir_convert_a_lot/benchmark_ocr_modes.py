@@ -0,0 +1,272 @@
+"""Benchmark Docling OCR modes on the benchmark PDF corpus.
+
+Purpose:
+    Convert every fixture PDF with each requested OCR mode (by default
+    full-page `force` against region-limited `regions`) and emit a
+    machine-readable speed/quality comparison. Quality is measured as the
+    word-level F1 of the markdown against the PDF's own text layer, which
+    full-page OCR replaces and region OCR keeps.
+
+Relationships:
+    - Drives `infrastructure.docling_backend.DoclingConversionBackend` directly,
+      bypassing the job API, result cache and coalescing.
+    - Shares the output-path policy with the other benchmark runners.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import statistics
+import time
+from collections import Counter
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TypedDict
+
+from scripts.sir_convert_a_lot.benchmarking.output_policy import enforce_generated_output_path
+from scripts.sir_convert_a_lot.domain.specs import (
+    BackendStrategy,
+    FormulaEnrichmentMode,
+    OcrMode,
+    TableMode,
+)
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
+    BackendExecutionError,
+    BackendGpuUnavailableError,
+    BackendInputError,
+    ConversionBackend,
+    ConversionRequest,
+    PdfSource,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_backend import DoclingConversionBackend
+from scripts.sir_convert_a_lot.infrastructure.pdf_inspection import open_pdf
+
+DEFAULT_FIXTURES_DIR = Path("tests/fixtures/benchmark_pdfs")
+DEFAULT_OUTPUT_JSON = Path("build/benchmarks/ocr-modes/benchmark-ocr-modes-local.json")
+DEFAULT_MODES = (OcrMode.FORCE, OcrMode.REGIONS)
+
+_WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+class OcrModeJobRecord(TypedDict):
+    """One fixture converted with one OCR mode."""
+
+    source_file: str
+    ocr_mode: str
+    status: str
+    error_code: str | None
+    latency_seconds: float
+    markdown_chars: int
+    text_layer_f1: float | None
+
+
+class OcrModeSummary(TypedDict):
+    """Per-mode aggregate over the corpus."""
+
+    ocr_mode: str
+    total_jobs: int
+    succeeded_jobs: int
+    mean_latency_seconds: float
+    total_latency_seconds: float
+    mean_text_layer_f1: float | None
+
+
+class OcrModeComparison(TypedDict):
+    """Speed and quality of one mode relative to the baseline mode."""
+
+    baseline_mode: str
+    candidate_mode: str
+    speedup: float | None
+    text_layer_f1_delta: float | None
+
+
+class OcrModeBenchmarkPayload(TypedDict):
+    """Canonical OCR-mode benchmark payload shape."""
+
+    benchmark_id: str
+    stage: str
+    generated_at: str
+    fixtures_dir: str
+    modes: list[OcrModeSummary]
+    comparisons: list[OcrModeComparison]
+    jobs: list[OcrModeJobRecord]
+
+
+def _utc_now_iso() -> str:
+    """Return current UTC timestamp in RFC3339 format."""
+    return datetime.now(UTC).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def text_layer_words(source: PdfSource) -> Counter[str]:
+    """Return lowercase word counts of the PDF's programmatic text layer."""
+    with open_pdf(source) as document:
+        text = " ".join(page.get_text("text") for page in document)
+    return Counter(word.lower() for word in _WORD_PATTERN.findall(text))
+
+
+def text_layer_f1(markdown: str, reference: Counter[str]) -> float | None:
+    """Return the word-multiset F1 of `markdown` against `reference`, or None without text."""
+    candidate = Counter(word.lower() for word in _WORD_PATTERN.findall(markdown))
+    if not reference or not candidate:
+        return None
+    overlap = sum((candidate & reference).values())
+    if overlap == 0:
+        return 0.0
+    precision = overlap / sum(candidate.values())
+    recall = overlap / sum(reference.values())
+    return round(2 * precision * recall / (precision + recall), 6)
+
+
+def _request(path: Path, ocr_mode: OcrMode) -> ConversionRequest:
+    return ConversionRequest(
+        source_filename=path.name,
+        source=path,
+        backend_strategy=BackendStrategy.DOCLING,
+        ocr_mode=ocr_mode,
+        table_mode=TableMode.FAST,
+        gpu_available=True,
+        formula_enrichment=FormulaEnrichmentMode.OFF,
+    )
+
+
+def _run_job(backend: ConversionBackend, path: Path, ocr_mode: OcrMode) -> OcrModeJobRecord:
+    record: OcrModeJobRecord = {
+        "source_file": path.name,
+        "ocr_mode": ocr_mode.value,
+        "status": "failed",
+        "error_code": None,
+        "latency_seconds": 0.0,
+        "markdown_chars": 0,
+        "text_layer_f1": None,
+    }
+    started = time.perf_counter()
+    try:
+        result = backend.convert(_request(path, ocr_mode))
+    except BackendGpuUnavailableError:
+        record["error_code"] = "gpu_not_available"
+    except BackendInputError:
+        record["error_code"] = "pdf_unreadable"
+    except BackendExecutionError:
+        record["error_code"] = "conversion_internal_error"
+    else:
+        record["status"] = "succeeded"
+        record["markdown_chars"] = len(result.markdown_content)
+        record["text_layer_f1"] = text_layer_f1(result.markdown_content, text_layer_words(path))
+    record["latency_seconds"] = round(time.perf_counter() - started, 6)
+    return record
+
+
+def _summarize(ocr_mode: OcrMode, jobs: Sequence[OcrModeJobRecord]) -> OcrModeSummary:
+    succeeded = [job for job in jobs if job["status"] == "succeeded"]
+    latencies = [job["latency_seconds"] for job in succeeded]
+    scores = [job["text_layer_f1"] for job in succeeded if job["text_layer_f1"] is not None]
+    return {
+        "ocr_mode": ocr_mode.value,
+        "total_jobs": len(jobs),
+        "succeeded_jobs": len(succeeded),
+        "mean_latency_seconds": round(statistics.mean(latencies), 6) if latencies else 0.0,
+        "total_latency_seconds": round(sum(latencies), 6),
+        "mean_text_layer_f1": round(statistics.mean(scores), 6) if scores else None,
+    }
+
+
+def _compare(baseline: OcrModeSummary, candidate: OcrModeSummary) -> OcrModeComparison:
+    baseline_f1 = baseline["mean_text_layer_f1"]
+    candidate_f1 = candidate["mean_text_layer_f1"]
+    return {
+        "baseline_mode": baseline["ocr_mode"],
+        "candidate_mode": candidate["ocr_mode"],
+        "speedup": round(baseline["total_latency_seconds"] / candidate["total_latency_seconds"], 6)
+        if candidate["total_latency_seconds"] > 0 and baseline["succeeded_jobs"] > 0
+        else None,
+        "text_layer_f1_delta": round(candidate_f1 - baseline_f1, 6)
+        if baseline_f1 is not None and candidate_f1 is not None
+        else None,
+    }
+
+
+def run_benchmark(
+    *,
+    fixtures_dir: Path,
+    output_json: Path,
+    stage: str,
+    modes: Sequence[OcrMode] = DEFAULT_MODES,
+    warmup: bool = True,
+    backend: ConversionBackend | None = None,
+) -> OcrModeBenchmarkPayload:
+    """Convert every fixture with each mode and return the output payload.
+
+    The first mode is the comparison baseline. `warmup` converts the first
+    fixture once per mode before timing so converter construction and model
+    loading are not charged to a single job.
+    """
+    enforce_generated_output_path(output_json, label="output_json")
+    fixture_paths = sorted(fixtures_dir.glob("*.pdf"))
+    if not fixture_paths:
+        raise ValueError(f"No PDF fixtures found in {fixtures_dir}")
+    if not modes:
+        raise ValueError("At least one OCR mode is required.")
+    if backend is None:
+        backend = DoclingConversionBackend()
+
+    jobs: list[OcrModeJobRecord] = []
+    summaries: list[OcrModeSummary] = []
+    for ocr_mode in modes:
+        if warmup:
+            _run_job(backend, fixture_paths[0], ocr_mode)
+        mode_jobs = [_run_job(backend, path, ocr_mode) for path in fixture_paths]
+        jobs.extend(mode_jobs)
+        summaries.append(_summarize(ocr_mode, mode_jobs))
+
+    payload: OcrModeBenchmarkPayload = {
+        "benchmark_id": "docling-ocr-modes",
+        "stage": stage,
+        "generated_at": _utc_now_iso(),
+        "fixtures_dir": str(fixtures_dir.resolve()),
+        "modes": summaries,
+        "comparisons": [_compare(summaries[0], summary) for summary in summaries[1:]],
+        "jobs": jobs,
+    }
+    output_json.parent.mkdir(parents=True, exist_ok=True)
+    output_json.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return payload
+
+
+def main() -> None:
+    """Parse CLI args and run the OCR-mode benchmark."""
+    parser = argparse.ArgumentParser(description="Compare Docling OCR modes on a PDF corpus.")
+    parser.add_argument("--fixtures-dir", type=Path, default=DEFAULT_FIXTURES_DIR)
+    parser.add_argument("--output-json", type=Path, default=DEFAULT_OUTPUT_JSON)
+    parser.add_argument("--stage", default="local")
+    parser.add_argument(
+        "--mode",
+        dest="modes",
+        action="append",
+        type=OcrMode,
+        help="OCR mode to benchmark (repeatable; first is the baseline). "
+        "Defaults to force and regions.",
+    )
+    parser.add_argument("--warmup", action=argparse.BooleanOptionalAction, default=True)
+    args = parser.parse_args()
+
+    payload = run_benchmark(
+        fixtures_dir=args.fixtures_dir,
+        output_json=args.output_json,
+        stage=args.stage,
+        modes=args.modes or DEFAULT_MODES,
+        warmup=args.warmup,
+    )
+    print("benchmark-written", args.output_json)
+    for comparison in payload["comparisons"]:
+        print(
+            f"{comparison['candidate_mode']}-vs-{comparison['baseline_mode']}",
+            f"speedup={comparison['speedup']}",
+            f"text_layer_f1_delta={comparison['text_layer_f1_delta']}",
+        )
+
+
+if __name__ == "__main__":
+    main()
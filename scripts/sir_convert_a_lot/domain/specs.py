@@ -37,6 +37,7 @@ class OcrMode(StrEnum):
     AUTO = "auto"
     OFF = "off"
     FORCE = "force"
+    REGIONS = "regions"
 
 
 class TableMode(StrEnum):
@@ -44,6 +45,19 @@ class TableMode(StrEnum):
 
     FAST = "fast"
     ACCURATE = "accurate"
+    ADAPTIVE = "adaptive"
+
+
+class FormulaEnrichmentMode(StrEnum):
+    """Formula enrichment modes supported by v1.
+
+    `auto` decodes formulas only when the layout stage detects formula
+    clusters; `on` and `off` force the decision.
+    """
+
+    AUTO = "auto"
+    ON = "on"
+    OFF = "off"
 
 
 class NormalizeMode(StrEnum):
@@ -103,6 +117,7 @@ class ConversionSpec(BaseModel):
     ocr_mode: OcrMode
     table_mode: TableMode
     normalize: NormalizeMode
+    formula_enrichment: FormulaEnrichmentMode = FormulaEnrichmentMode.AUTO
 
 
 class ExecutionSpec(BaseModel):
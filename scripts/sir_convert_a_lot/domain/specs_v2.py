@@ -20,6 +20,7 @@ from pydantic import BaseModel, ConfigDict, Field, model_validator
 from scripts.sir_convert_a_lot.domain.specs import (
     AccelerationPolicy,
     BackendStrategy,
+    FormulaEnrichmentMode,
     NormalizeMode,
     OcrMode,
     Priority,
@@ -77,6 +78,7 @@ class PdfOptionsV2(BaseModel):
     ocr_mode: OcrMode
     table_mode: TableMode
     normalize: NormalizeMode
+    formula_enrichment: FormulaEnrichmentMode = FormulaEnrichmentMode.AUTO
 
 
 class ExecutionSpecV2(BaseModel):
@@ -3,10 +3,14 @@
 Purpose:
     Centralize backend-selection and rollout-compatibility checks so runtime
     orchestration remains focused on job lifecycle and persistence concerns.
+    `backend_strategy=auto` is resolved by a PyMuPDF structural triage that
+    sends simple born-digital PDFs to the CPU PyMuPDF backend when the
+    acceleration policy permits CPU execution, and everything else to Docling.
 
 Relationships:
     - Used by `infrastructure.runtime_engine` for backend-policy enforcement.
     - Consumes canonical domain enums from `domain.specs`.
+    - Triage features come from `infrastructure.pdf_preclassification`.
 """
 
 from __future__ import annotations
@@ -16,10 +20,31 @@ from dataclasses import dataclass
 from scripts.sir_convert_a_lot.domain.specs import (
     AccelerationPolicy,
     BackendStrategy,
+    FormulaEnrichmentMode,
     JobSpec,
     OcrMode,
 )
-from scripts.sir_convert_a_lot.infrastructure.conversion_backend import ConversionBackend
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
+    ConversionBackend,
+    PdfSource,
+)
+from scripts.sir_convert_a_lot.infrastructure.pdf_preclassification import preclassify_pdf
+
+ROUTE_SIMPLE_TEXT_LAYER = "simple_text_layer"
+ROUTE_POLICY_GPU_REQUIRED = "policy_gpu_required"
+ROUTE_POLICY_CPU_FALLBACK_DISABLED = "policy_cpu_fallback_disabled"
+ROUTE_OCR_REQUESTED = "ocr_requested"
+ROUTE_FORMULA_ENRICHMENT_REQUESTED = "formula_enrichment_requested"
+ROUTE_TRIAGE_UNAVAILABLE = "triage_unavailable"
+ROUTE_TEXT_LAYER_INCOMPLETE = "text_layer_incomplete"
+ROUTE_IMAGE_HEAVY = "image_heavy"
+ROUTE_RULED_TABLES = "ruled_tables"
+ROUTE_FORMULA_GLYPHS = "formula_glyphs"
+ROUTE_PAGE_COUNT = "page_count"
+
+_MAX_SIMPLE_IMAGE_AREA_RATIO = 0.2
+_MAX_SIMPLE_MATH_CHARS = 10
+_MAX_SIMPLE_PAGE_COUNT = 300
 
 
 @dataclass(frozen=True)
@@ -106,6 +131,75 @@ def validate_acceleration_policy(
     return None
 
 
+@dataclass(frozen=True)
+class BackendRoute:
+    """Resolved backend strategy for a job and the reason codes behind it."""
+
+    backend_strategy: BackendStrategy
+    reasons: tuple[str, ...]
+
+
+def auto_route_policy_reasons(spec: JobSpec, *, allow_cpu_fallback: bool) -> tuple[str, ...]:
+    """Return why `spec` must stay on Docling regardless of content, or () when triage may run.
+
+    GPU-required jobs never leave the GPU path, and GPU-preferring jobs may
+    use the CPU only where CPU fallback is unlocked, mirroring
+    `validate_acceleration_policy`. PyMuPDF cannot OCR or enrich formulas.
+    """
+    reasons: list[str] = []
+    policy = spec.execution.acceleration_policy
+    if policy == AccelerationPolicy.GPU_REQUIRED:
+        reasons.append(ROUTE_POLICY_GPU_REQUIRED)
+    elif policy == AccelerationPolicy.GPU_PREFER and not allow_cpu_fallback:
+        reasons.append(ROUTE_POLICY_CPU_FALLBACK_DISABLED)
+    if spec.conversion.ocr_mode in {OcrMode.FORCE, OcrMode.REGIONS}:
+        reasons.append(ROUTE_OCR_REQUESTED)
+    if spec.conversion.formula_enrichment == FormulaEnrichmentMode.ON:
+        reasons.append(ROUTE_FORMULA_ENRICHMENT_REQUESTED)
+    return tuple(reasons)
+
+
+def triage_complexity_reasons(source: PdfSource) -> tuple[str, ...]:
+    """Return why a PDF needs Docling, or () when PyMuPDF can convert it faithfully.
+
+    Simple means every page has a text layer, images cover little of the
+    sampled page area, and there are no ruled tables, formula glyphs, or
+    more pages than the triage sample represents well.
+    """
+    features = preclassify_pdf(source)
+    if features is None or features.page_count == 0:
+        return (ROUTE_TRIAGE_UNAVAILABLE,)
+    reasons: list[str] = []
+    if features.scanned_pages > 0:
+        reasons.append(ROUTE_TEXT_LAYER_INCOMPLETE)
+    if features.image_area_ratio > _MAX_SIMPLE_IMAGE_AREA_RATIO:
+        reasons.append(ROUTE_IMAGE_HEAVY)
+    if features.ruled_pages > 0:
+        reasons.append(ROUTE_RULED_TABLES)
+    if features.math_chars > _MAX_SIMPLE_MATH_CHARS:
+        reasons.append(ROUTE_FORMULA_GLYPHS)
+    if features.page_count > _MAX_SIMPLE_PAGE_COUNT:
+        reasons.append(ROUTE_PAGE_COUNT)
+    return tuple(reasons)
+
+
+def route_auto_backend(
+    spec: JobSpec, source: PdfSource, *, allow_cpu_fallback: bool
+) -> BackendRoute:
+    """Resolve `backend_strategy=auto` to PyMuPDF or Docling for one PDF.
+
+    Policy reasons are checked first so GPU-bound jobs skip the triage.
+    """
+    reasons = auto_route_policy_reasons(
+        spec, allow_cpu_fallback=allow_cpu_fallback
+    ) or triage_complexity_reasons(source)
+    if reasons:
+        return BackendRoute(backend_strategy=BackendStrategy.DOCLING, reasons=reasons)
+    return BackendRoute(
+        backend_strategy=BackendStrategy.PYMUPDF, reasons=(ROUTE_SIMPLE_TEXT_LAYER,)
+    )
+
+
 def select_backend(
     *,
     backend_strategy: BackendStrategy,
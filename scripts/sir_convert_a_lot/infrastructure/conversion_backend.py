@@ -11,24 +11,94 @@ Relationships:
 
 from __future__ import annotations
 
+import threading
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Protocol
 
-from scripts.sir_convert_a_lot.domain.specs import BackendStrategy, OcrMode, TableMode
+from scripts.sir_convert_a_lot.domain.specs import (
+    BackendStrategy,
+    FormulaEnrichmentMode,
+    OcrMode,
+    TableMode,
+)
 from scripts.sir_convert_a_lot.infrastructure.gpu_runtime_probe import GpuRuntimeProbeResult
 
 
+@dataclass(frozen=True)
+class ConversionProgress:
+    """One backend progress report: pages completed within a pipeline stage."""
+
+    stage: str
+    pages_completed: int
+    pages_total: int | None
+
+
+ProgressCallback = Callable[[ConversionProgress], None]
+
+
+class CancelToken:
+    """Cooperative cancellation flag for one conversion, optionally tied to a parent.
+
+    A child token reads as canceled once it or any ancestor is canceled, so a
+    hedge can stop its own attempt without losing the job's deadline.
+    """
+
+    def __init__(self, parent: CancelToken | None = None) -> None:
+        self._event = threading.Event()
+        self._parent = parent
+
+    def cancel(self) -> None:
+        """Ask the conversion holding this token to stop."""
+        self._event.set()
+
+    @property
+    def canceled(self) -> bool:
+        """True once this token or one of its ancestors was canceled."""
+        return self._event.is_set() or (self._parent is not None and self._parent.canceled)
+
+
+# A PDF held in memory, or a file on disk that readers open by path instead of loading whole.
+PdfSource = bytes | Path
+
+
 @dataclass(frozen=True)
 class ConversionRequest:
-    """Backend-independent request payload for one PDF conversion."""
+    """Backend-independent request payload for one PDF conversion.
+
+    `source` is the PDF itself: the job upload is passed as its path, so the
+    document is never copied into memory just to be handed to a backend
+    (or pickled into a conversion worker process). Page subsets cut out
+    during a conversion are passed as bytes. A canceled `cancel` token stops
+    the conversion at its next progress checkpoint with
+    `ConversionCanceledError`.
+    """
 
     source_filename: str
-    source_bytes: bytes
+    source: PdfSource
     backend_strategy: BackendStrategy
     ocr_mode: OcrMode
     table_mode: TableMode
     gpu_available: bool
     gpu_runtime_probe: GpuRuntimeProbeResult | None = None
+    formula_enrichment: FormulaEnrichmentMode = FormulaEnrichmentMode.AUTO
+    progress: ProgressCallback | None = field(default=None, compare=False, repr=False)
+    preclassified_labels: frozenset[str] = frozenset()
+    ocr_languages: tuple[str, ...] = ()
+    cancel: CancelToken | None = field(default=None, compare=False, repr=False)
+
+    def report_progress(self, *, stage: str, pages_completed: int, pages_total: int | None) -> None:
+        """Forward one progress report to the caller; raise if the conversion was canceled."""
+        if self.cancel is not None and self.cancel.canceled:
+            raise ConversionCanceledError("conversion canceled at a progress checkpoint")
+        if self.progress is None:
+            return
+        self.progress(
+            ConversionProgress(
+                stage=stage, pages_completed=pages_completed, pages_total=pages_total
+            )
+        )
 
 
 @dataclass(frozen=True)
@@ -41,6 +111,10 @@ class ConversionResultData:
     ocr_enabled: bool
     warnings: list[str] = field(default_factory=list)
     phase_timings_ms: dict[str, int] = field(default_factory=dict)
+    formula_enrichment_used: bool = False
+    ocr_languages: tuple[str, ...] = ()
+    preclassification_labels: tuple[str, ...] | None = None
+    preclassification_hits: dict[str, bool] | None = None
 
 
 class ConversionBackend(Protocol):
@@ -76,3 +150,11 @@ class BackendGpuUnavailableError(Exception):
             "backend": self.backend,
             **self.probe.as_details(),
         }
+
+
+class BackendWorkerCrashedError(Exception):
+    """Raised when an isolated conversion worker process dies mid-conversion."""
+
+
+class ConversionCanceledError(Exception):
+    """Raised when a conversion stops because its cancel token was canceled."""
@@ -0,0 +1,371 @@
+"""Process-isolated conversion workers for Sir Convert-a-Lot.
+
+Purpose:
+    Run Docling/PyMuPDF conversions in long-lived worker processes so heavy
+    Python post-processing gets real CPU parallelism and a native crash in
+    torch or pymupdf cannot take down the API process. Each worker builds its
+    backends once and keeps their converter caches warm across jobs.
+
+Relationships:
+    - Opt-in via `ServiceConfig.conversion_isolation == "process"`; built by
+      `infrastructure.runtime_backends` and shared by the v1 and v2 runtimes.
+    - Canceled conversions (watchdog deadlines, lost hedges) terminate their
+      worker through `conversion_backend.CancelToken`.
+    - `ProcessIsolatedBackend` satisfies `conversion_backend.ConversionBackend`
+      so routing/normalization code is unchanged.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, replace
+from multiprocessing.managers import SyncManager
+from multiprocessing.sharedctypes import Synchronized
+from queue import Queue
+from typing import TYPE_CHECKING, Literal, TypeVar
+
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
+    BackendExecutionError,
+    BackendGpuUnavailableError,
+    BackendInputError,
+    BackendWorkerCrashedError,
+    CancelToken,
+    ConversionBackend,
+    ConversionCanceledError,
+    ConversionProgress,
+    ConversionRequest,
+    ConversionResultData,
+    ProgressCallback,
+)
+from scripts.sir_convert_a_lot.infrastructure.gpu_runtime_probe import GpuRuntimeProbeResult
+from scripts.sir_convert_a_lot.infrastructure.runtime_models import ConverterPrewarmProfile
+
+if TYPE_CHECKING:
+    from scripts.sir_convert_a_lot.infrastructure.docling_backend import (
+        DoclingConversionBackend,
+    )
+
+WorkerBackendName = Literal["docling", "pymupdf"]
+_OutcomeT = TypeVar("_OutcomeT")
+_CANCEL_POLL_SECONDS = 0.1
+_WORKER_START_TIMEOUT_SECONDS = 30.0
+
+_WORKER_BACKENDS: dict[str, ConversionBackend] = {}
+_worker_docling_backend: DoclingConversionBackend | None = None
+
+
+@dataclass(frozen=True)
+class _WorkerFailure:
+    """Picklable description of a backend exception raised inside a worker."""
+
+    kind: Literal["input", "execution", "gpu_unavailable"]
+    message: str
+    backend: str = ""
+    probe: GpuRuntimeProbeResult | None = None
+
+    def to_exception(self) -> Exception:
+        if self.kind == "gpu_unavailable" and self.probe is not None:
+            return BackendGpuUnavailableError(backend=self.backend, probe=self.probe)
+        if self.kind == "input":
+            return BackendInputError(self.message)
+        return BackendExecutionError(self.message)
+
+
+def _initialize_worker(
+    worker_pid: Synchronized[int],
+    pymupdf_parallel_min_pages: int,
+    pymupdf_parallel_max_processes: int,
+    converter_cache_max_entries: int | None = None,
+) -> None:
+    global _worker_docling_backend
+    worker_pid.value = os.getpid()
+    from scripts.sir_convert_a_lot.infrastructure.docling_backend import (
+        DoclingConversionBackend,
+    )
+    from scripts.sir_convert_a_lot.infrastructure.docling_converter_registry import (
+        shared_docling_converter_registry,
+    )
+    from scripts.sir_convert_a_lot.infrastructure.pymupdf_backend import (
+        PyMuPdfConversionBackend,
+    )
+
+    if converter_cache_max_entries is not None:
+        shared_docling_converter_registry().ensure_capacity(converter_cache_max_entries)
+    _worker_docling_backend = DoclingConversionBackend()
+    _WORKER_BACKENDS["docling"] = _worker_docling_backend
+    _WORKER_BACKENDS["pymupdf"] = PyMuPdfConversionBackend(
+        parallel_min_pages=pymupdf_parallel_min_pages,
+        parallel_max_processes=pymupdf_parallel_max_processes,
+    )
+
+
+def _convert_in_worker(
+    backend_name: WorkerBackendName,
+    request: ConversionRequest,
+    progress_queue: Queue[ConversionProgress | None] | None = None,
+) -> ConversionResultData | _WorkerFailure:
+    backend = _WORKER_BACKENDS[backend_name]
+    if progress_queue is not None:
+        request = replace(request, progress=progress_queue.put)
+    try:
+        return backend.convert(request)
+    except BackendInputError as exc:
+        return _WorkerFailure(kind="input", message=str(exc))
+    except BackendGpuUnavailableError as exc:
+        return _WorkerFailure(
+            kind="gpu_unavailable", message=str(exc), backend=exc.backend, probe=exc.probe
+        )
+    except Exception as exc:
+        return _WorkerFailure(kind="execution", message=f"{type(exc).__name__}: {exc}")
+
+
+def _prewarm_in_worker(profile: ConverterPrewarmProfile) -> int | _WorkerFailure:
+    if _worker_docling_backend is None:
+        return _WorkerFailure(kind="execution", message="docling worker backend not initialized")
+    try:
+        return _worker_docling_backend.prewarm(profile)
+    except BackendGpuUnavailableError as exc:
+        return _WorkerFailure(
+            kind="gpu_unavailable", message=str(exc), backend=exc.backend, probe=exc.probe
+        )
+    except Exception as exc:
+        return _WorkerFailure(kind="execution", message=f"{type(exc).__name__}: {exc}")
+
+
+class _Worker:
+    """One single-process executor and the pid its initializer reports."""
+
+    def __init__(self, initargs: tuple[int, int, int | None]) -> None:
+        # Spawn (not fork) so CUDA/ROCm state from the API process never leaks into workers.
+        context = multiprocessing.get_context("spawn")
+        self.pid: Synchronized[int] = context.Value("i", 0)
+        self.executor = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=context,
+            initializer=_initialize_worker,
+            initargs=(self.pid, *initargs),
+        )
+
+    def terminate(self) -> None:
+        """Kill the worker process, waiting for it to report its pid if it is still starting."""
+        deadline = time.monotonic() + _WORKER_START_TIMEOUT_SECONDS
+        while self.pid.value == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        if self.pid.value != 0:
+            try:
+                os.kill(self.pid.value, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class _ProgressRelay:
+    """Forward worker progress reports from a manager queue to the caller's callback."""
+
+    def __init__(self, *, manager: SyncManager, callback: ProgressCallback) -> None:
+        self.queue: Queue[ConversionProgress | None] = manager.Queue()
+        self._callback = callback
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    def _drain(self) -> None:
+        forwarding = True
+        while True:
+            try:
+                progress = self.queue.get()
+            except (EOFError, OSError):
+                return
+            if progress is None:
+                return
+            if not forwarding:
+                continue
+            try:
+                self._callback(progress)
+            except Exception:
+                # A failing callback ends forwarding, not the worker.
+                forwarding = False
+
+    def stop(self) -> None:
+        try:
+            self.queue.put(None)
+        except (EOFError, OSError):
+            return
+        self._thread.join(timeout=5.0)
+
+
+class ConversionWorkerPool:
+    """Fixed set of spawned conversion worker processes, one executor per worker.
+
+    Giving each worker its own single-process executor lets the pool stop
+    exactly the worker running a given conversion, by the pid the worker
+    reports from its initializer: a conversion whose cancel
+    token is canceled has its worker terminated and replaced, and a worker
+    that dies mid-conversion is replaced with `BackendWorkerCrashedError`
+    reported so the runtime can requeue the job. Conversions beyond
+    `max_workers` wait for a free worker.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int,
+        pymupdf_parallel_min_pages: int = 0,
+        pymupdf_parallel_max_processes: int = 0,
+        converter_cache_max_entries: int | None = None,
+    ) -> None:
+        self._max_workers = max(1, max_workers)
+        self._initargs = (
+            pymupdf_parallel_min_pages,
+            pymupdf_parallel_max_processes,
+            converter_cache_max_entries,
+        )
+        self._lock = threading.Lock()
+        self._closed = False
+        self._workers = [_Worker(self._initargs) for _ in range(self._max_workers)]
+        self._idle: queue.SimpleQueue[int] = queue.SimpleQueue()
+        for index in range(self._max_workers):
+            self._idle.put(index)
+        self._progress_manager: SyncManager | None = None
+
+    def convert(
+        self, backend_name: WorkerBackendName, request: ConversionRequest
+    ) -> ConversionResultData:
+        """Run one conversion in a worker process and re-raise backend errors locally.
+
+        The progress callback cannot cross the process boundary, so reports are
+        relayed through a manager queue and replayed on a local thread. The
+        cancel token is polled while waiting; once canceled, the worker is
+        terminated and `ConversionCanceledError` is raised.
+        """
+        index = self._acquire_worker(request.cancel)
+        relay = None
+        try:
+            with self._lock:
+                worker = self._workers[index]
+            if request.progress is not None:
+                relay = _ProgressRelay(manager=self._manager(), callback=request.progress)
+            future = worker.executor.submit(
+                _convert_in_worker,
+                backend_name,
+                replace(request, progress=None, cancel=None),
+                relay.queue if relay is not None else None,
+            )
+            outcome = self._await_worker(
+                index, worker, future, cancel=request.cancel, task=f"{backend_name} conversion"
+            )
+        finally:
+            self._idle.put(index)
+            if relay is not None:
+                relay.stop()
+        if isinstance(outcome, _WorkerFailure):
+            raise outcome.to_exception()
+        return outcome
+
+    def prewarm(self, profile: ConverterPrewarmProfile) -> int:
+        """Prewarm Docling converters for `profile` in every worker process.
+
+        Waits for busy workers to finish their conversion, then warms all of
+        them at once. Returns the largest per-worker warmed count.
+        """
+        indexes = [self._acquire_worker(None) for _ in range(self._max_workers)]
+        try:
+            with self._lock:
+                workers = [(index, self._workers[index]) for index in indexes]
+            futures = [
+                (index, worker, worker.executor.submit(_prewarm_in_worker, profile))
+                for index, worker in workers
+            ]
+            outcomes = [
+                self._await_worker(index, worker, future, cancel=None, task="docling prewarm")
+                for index, worker, future in futures
+            ]
+        finally:
+            for index in indexes:
+                self._idle.put(index)
+        warmed = 0
+        for outcome in outcomes:
+            if isinstance(outcome, _WorkerFailure):
+                raise outcome.to_exception()
+            warmed = max(warmed, outcome)
+        return warmed
+
+    def _acquire_worker(self, cancel: CancelToken | None) -> int:
+        while True:
+            try:
+                return self._idle.get(timeout=None if cancel is None else _CANCEL_POLL_SECONDS)
+            except queue.Empty:
+                if cancel is not None and cancel.canceled:
+                    raise ConversionCanceledError("conversion canceled while waiting for a worker")
+
+    def _await_worker(
+        self,
+        index: int,
+        worker: _Worker,
+        future: Future[_OutcomeT],
+        *,
+        cancel: CancelToken | None,
+        task: str,
+    ) -> _OutcomeT:
+        try:
+            while True:
+                try:
+                    return future.result(timeout=None if cancel is None else _CANCEL_POLL_SECONDS)
+                except TimeoutError:
+                    if cancel is not None and cancel.canceled:
+                        self._recycle_worker(index, worker)
+                        raise ConversionCanceledError(f"{task} canceled; worker terminated")
+        except BrokenProcessPool as exc:
+            self._recycle_worker(index, worker, terminate=False)
+            raise BackendWorkerCrashedError(f"worker process exited during {task}") from exc
+
+    def _manager(self) -> SyncManager:
+        with self._lock:
+            if self._progress_manager is None:
+                self._progress_manager = multiprocessing.get_context("spawn").Manager()
+            return self._progress_manager
+
+    def _recycle_worker(self, index: int, worker: _Worker, *, terminate: bool = True) -> None:
+        """Give `worker`'s slot a fresh process, terminating the old one unless it already died."""
+        with self._lock:
+            if self._workers[index] is worker and not self._closed:
+                self._workers[index] = _Worker(self._initargs)
+        if terminate:
+            worker.terminate()
+        else:
+            worker.executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        """Stop all worker processes without waiting for in-flight conversions."""
+        with self._lock:
+            self._closed = True
+            workers = list(self._workers)
+            manager, self._progress_manager = self._progress_manager, None
+        for worker in workers:
+            worker.executor.shutdown(wait=False, cancel_futures=True)
+        if manager is not None:
+            manager.shutdown()
+
+
+class ProcessIsolatedBackend:
+    """`ConversionBackend` proxy that executes a named backend in the worker pool."""
+
+    def __init__(self, *, pool: ConversionWorkerPool, backend_name: WorkerBackendName) -> None:
+        self._pool = pool
+        self._backend_name: WorkerBackendName = backend_name
+
+    def convert(self, request: ConversionRequest) -> ConversionResultData:
+        return self._pool.convert(self._backend_name, request)
+
+    def prewarm(self, profile: ConverterPrewarmProfile) -> int:
+        """Prewarm Docling converters for `profile` inside the worker processes."""
+        return self._pool.prewarm(profile)
+
+
+__all__ = ["ConversionWorkerPool", "ProcessIsolatedBackend", "WorkerBackendName"]
@@ -0,0 +1,267 @@
+"""Startup prewarm of declared Docling converter profiles.
+
+Purpose:
+    Build the converters for `ServiceConfig.converter_prewarm_profiles` and
+    push a tiny built-in PDF through each of them in the background at service
+    startup, so model download/verification, weight loading and accelerator
+    kernel warmup finish before `/readyz` reports ready instead of inside the
+    first user request.
+
+Relationships:
+    - Owned by `infrastructure.runtime_engine.ServiceRuntime`, which supplies
+      the backend `prewarm` callable.
+    - Status is read by `interfaces.http_routes_health` readiness checks.
+    - `prewarm_converter_count` sizes the converter registry in
+      `infrastructure.runtime_backends`.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Literal
+
+import pymupdf
+from docling.datamodel.accelerator_options import AcceleratorDevice
+
+from scripts.sir_convert_a_lot.domain.specs import BackendStrategy, OcrMode
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import ConversionRequest
+from scripts.sir_convert_a_lot.infrastructure.docling_formula_quality import (
+    FORMULA_PRIMARY_PRESET,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_layout_models import (
+    resolve_layout_model_candidate_keys,
+)
+from scripts.sir_convert_a_lot.infrastructure.runtime_models import ConverterPrewarmProfile
+
+PREWARM_SOURCE_FILENAME = "sir_convert_a_lot_prewarm.pdf"
+
+ConverterPrewarmState = Literal["disabled", "warming", "ready", "failed"]
+
+
+@lru_cache(maxsize=1)
+def prewarm_pdf_bytes() -> bytes:
+    """Return a one-page PDF with a heading, prose, a ruled table and a formula line.
+
+    The mix gives the layout, table-structure and formula models something to
+    detect so their weights and kernels are actually exercised.
+    """
+    document = pymupdf.open()
+    try:
+        page = document.new_page(width=420, height=300)
+        page.insert_text((36, 48), "Converter prewarm", fontsize=16)
+        page.insert_text(
+            (36, 76),
+            "This page warms the conversion models before the service reports ready.",
+            fontsize=9,
+        )
+        left, top, cell_width, cell_height = 36.0, 96.0, 110.0, 22.0
+        cells = (("Model", "Rows", "Score"), ("layout", "3", "0.91"), ("table", "3", "0.87"))
+        for row_index, row in enumerate(cells):
+            for column_index, text in enumerate(row):
+                x0 = left + column_index * cell_width
+                y0 = top + row_index * cell_height
+                page.draw_rect(pymupdf.Rect(x0, y0, x0 + cell_width, y0 + cell_height), width=0.6)
+                page.insert_text((x0 + 6, y0 + 15), text, fontsize=9)
+        page.insert_text((150, 200), "E = m c^2 + sum_i x_i", fontsize=11)
+        return bytes(document.tobytes(garbage=3, deflate=True))
+    finally:
+        document.close()
+
+
+def _first_pass_variants(profile: ConverterPrewarmProfile) -> list[tuple[bool, bool, str]]:
+    """Return `(ocr_enabled, force_full_page_ocr, layout_model_key)` per warmed converter."""
+    ocr_variants = {
+        OcrMode.OFF: [(False, False)],
+        OcrMode.FORCE: [(True, True)],
+        OcrMode.REGIONS: [(True, False)],
+        OcrMode.AUTO: [(False, False), (True, True)],
+    }[profile.ocr_mode]
+    layout_model_keys = profile.layout_model_keys or resolve_layout_model_candidate_keys()
+    return [
+        (ocr_enabled, force_full_page_ocr, layout_model_key)
+        for ocr_enabled, force_full_page_ocr in ocr_variants
+        for layout_model_key in layout_model_keys
+    ]
+
+
+def prewarm_converter_count(profiles: Sequence[ConverterPrewarmProfile]) -> int:
+    """Return how many distinct converters prewarming `profiles` builds."""
+    return len(
+        {
+            (profile.table_mode, *variant)
+            for profile in profiles
+            for variant in _first_pass_variants(profile)
+        }
+    )
+
+
+def warm_docling_passes(
+    profile: ConverterPrewarmProfile,
+    *,
+    convert_with_layout: Callable[..., object],
+    acceleration_device: AcceleratorDevice,
+) -> int:
+    """Run the prewarm PDF through every first-pass converter a job with `profile` may use.
+
+    `convert_with_layout` is the backend's single-layout Docling pass. AUTO
+    OCR warms both the text-layer pass and the forced-OCR retry. Only the
+    unenriched first pass is warmed; formula converters stay lazy and load
+    for documents whose layout stage detected formulas. Returns the number
+    of converters warmed.
+    """
+    request = ConversionRequest(
+        source_filename=PREWARM_SOURCE_FILENAME,
+        source=prewarm_pdf_bytes(),
+        backend_strategy=BackendStrategy.DOCLING,
+        ocr_mode=profile.ocr_mode,
+        table_mode=profile.table_mode,
+        gpu_available=True,
+    )
+    warmed = 0
+    for ocr_enabled, force_full_page_ocr, layout_model_key in _first_pass_variants(profile):
+        convert_with_layout(
+            request=request,
+            ocr_enabled=ocr_enabled,
+            force_full_page_ocr=force_full_page_ocr,
+            acceleration_device=acceleration_device,
+            formula_enrichment=False,
+            formula_preset=FORMULA_PRIMARY_PRESET,
+            layout_model_key=layout_model_key,
+            evaluate_ordering_quality=False,
+        )
+        warmed += 1
+    return warmed
+
+
+@dataclass(frozen=True)
+class ConverterPrewarmStatus:
+    """Snapshot of startup prewarm progress for readiness reporting."""
+
+    state: ConverterPrewarmState
+    profiles_total: int
+    profiles_completed: int
+    converters_warmed: int
+    duration_ms: int | None = None
+    failed_profile: str | None = None
+    error: str | None = None
+
+    def as_details(self) -> dict[str, object]:
+        """Return deterministic details for readiness reasons."""
+        details: dict[str, object] = {
+            "state": self.state,
+            "profiles_total": self.profiles_total,
+            "profiles_completed": self.profiles_completed,
+            "converters_warmed": self.converters_warmed,
+        }
+        if self.failed_profile is not None:
+            details["failed_profile"] = self.failed_profile
+        if self.error is not None:
+            details["error"] = self.error
+        return details
+
+
+class ConverterPrewarmer:
+    """Run declared prewarm profiles once on a background thread.
+
+    `prewarm` builds and exercises every converter of one profile and returns
+    how many converters it warmed. The first failure stops the run and is
+    reported as the final state.
+    """
+
+    def __init__(
+        self,
+        *,
+        profiles: tuple[ConverterPrewarmProfile, ...],
+        prewarm: Callable[[ConverterPrewarmProfile], int],
+    ) -> None:
+        self._profiles = profiles
+        self._prewarm = prewarm
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._status = ConverterPrewarmStatus(
+            state="warming" if profiles else "disabled",
+            profiles_total=len(profiles),
+            profiles_completed=0,
+            converters_warmed=0,
+        )
+        if not profiles:
+            self._done.set()
+
+    def start(self) -> None:
+        """Start the background prewarm run; a no-op without profiles or when started."""
+        with self._lock:
+            if self._thread is not None or not self._profiles:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="ConverterPrewarmer", daemon=True
+            )
+            self._thread.start()
+
+    def status(self) -> ConverterPrewarmStatus:
+        """Return the current prewarm status."""
+        with self._lock:
+            return self._status
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the run finishes; return False if `timeout` elapsed first."""
+        return self._done.wait(timeout)
+
+    def _run(self) -> None:
+        started = time.perf_counter()
+        try:
+            for profile in self._profiles:
+                try:
+                    warmed = self._prewarm(profile)
+                except Exception as exc:
+                    self._finish(
+                        started,
+                        state="failed",
+                        failed_profile=profile.label,
+                        error=f"{type(exc).__name__}: {exc}",
+                    )
+                    return
+                with self._lock:
+                    self._status = ConverterPrewarmStatus(
+                        state="warming",
+                        profiles_total=self._status.profiles_total,
+                        profiles_completed=self._status.profiles_completed + 1,
+                        converters_warmed=self._status.converters_warmed + warmed,
+                    )
+            self._finish(started, state="ready")
+        finally:
+            self._done.set()
+
+    def _finish(
+        self,
+        started: float,
+        *,
+        state: ConverterPrewarmState,
+        failed_profile: str | None = None,
+        error: str | None = None,
+    ) -> None:
+        with self._lock:
+            self._status = ConverterPrewarmStatus(
+                state=state,
+                profiles_total=self._status.profiles_total,
+                profiles_completed=self._status.profiles_completed,
+                converters_warmed=self._status.converters_warmed,
+                duration_ms=max(0, int((time.perf_counter() - started) * 1000)),
+                failed_profile=failed_profile,
+                error=error,
+            )
+
+
+__all__ = [
+    "ConverterPrewarmState",
+    "ConverterPrewarmStatus",
+    "ConverterPrewarmer",
+    "PREWARM_SOURCE_FILENAME",
+    "prewarm_converter_count",
+    "prewarm_pdf_bytes",
+    "warm_docling_passes",
+]
@@ -7,27 +7,26 @@ Purpose:
 Relationships:
     - Implements `infrastructure.conversion_backend.ConversionBackend`.
     - Called by `infrastructure.runtime_engine.ServiceRuntime`.
+    - Converter construction lives in `infrastructure.docling_converter_options`;
+      AUTO OCR page selection and merging in `infrastructure.docling_page_ocr`.
 """
 
 from __future__ import annotations
 
-import threading
 import warnings
-from dataclasses import dataclass, replace
-from io import BytesIO
+from dataclasses import dataclass, field, replace
+from functools import partial
 
 from docling.datamodel.accelerator_options import AcceleratorDevice
-from docling.datamodel.base_models import InputFormat
-from docling.datamodel.pipeline_options import (
-    PdfPipelineOptions,
-    TableFormerMode,
-    TableStructureOptions,
-)
-from docling.document_converter import DocumentConverter, PdfFormatOption
+from docling.document_converter import DocumentConverter
 from docling.exceptions import ConversionError as DoclingConversionError
-from docling_core.types.io import DocumentStream
 
-from scripts.sir_convert_a_lot.domain.specs import BackendStrategy, OcrMode, TableMode
+from scripts.sir_convert_a_lot.domain.specs import (
+    BackendStrategy,
+    FormulaEnrichmentMode,
+    OcrMode,
+    TableMode,
+)
 from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
     BackendExecutionError,
     BackendGpuUnavailableError,
@@ -36,8 +35,31 @@ from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
     ConversionRequest,
     ConversionResultData,
 )
+from scripts.sir_convert_a_lot.infrastructure.converter_prewarm import warm_docling_passes
+from scripts.sir_convert_a_lot.infrastructure.docling_converter_options import (
+    DOCLING_DEPRECATED_TABLE_IMAGES_WARNING as _DOCLING_DEPRECATED_TABLE_IMAGES_WARNING,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_converter_options import (
+    DoclingConverterKey as _ConverterKey,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_converter_options import (
+    build_docling_converter,
+    converter_memory_mb,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_converter_registry import (
+    DoclingConverterRegistry,
+    shared_docling_converter_registry,
+)
 from scripts.sir_convert_a_lot.infrastructure.docling_formula_fallback import (
     convert_once_guarded_formula,
+    formula_enrichment_used,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_formula_quality import (
+    FORMULA_FALLBACK_PRESET,
+    FORMULA_PRIMARY_PRESET,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_formula_regions import (
+    reenrich_converter_formulas,
 )
 from scripts.sir_convert_a_lot.infrastructure.docling_layout_models import (
     DEFAULT_LAYOUT_MODEL_KEY as _DEFAULT_LAYOUT_MODEL_KEY,
@@ -54,39 +76,58 @@ from scripts.sir_convert_a_lot.infrastructure.docling_layout_models import (
 from scripts.sir_convert_a_lot.infrastructure.docling_layout_models import (
     resolve_layout_model_candidate_keys as _resolve_layout_model_candidate_keys,
 )
-from scripts.sir_convert_a_lot.infrastructure.docling_layout_models import (
-    resolve_layout_model_config as _resolve_layout_model_config,
-)
 from scripts.sir_convert_a_lot.infrastructure.docling_ordering import (
     OrderingQualityReport,
     evaluate_docling_ordering_quality,
     install_docling_form_ordering_patch,
 )
 from scripts.sir_convert_a_lot.infrastructure.docling_ordering_fallback import (
+    convert_with_layout_fallback,
     ordering_warnings_for_attempt,
-    select_best_ordering_attempt,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_page_cache import (
+    docling_pass_source,
+    job_page_cache,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_page_layout_fallback import (
+    rerun_failing_pages,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_page_ocr import (
+    convert_auto_ocr,
+    is_low_confidence_result,
+    low_confidence_page_indexes,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_table_escalation import (
+    TableDecision,
+    escalate_adaptive_tables,
+    first_pass_table_mode,
+    table_decision_warnings,
 )
 from scripts.sir_convert_a_lot.infrastructure.gpu_runtime_probe import (
     GpuRuntimeProbeResult,
     probe_torch_gpu_runtime,
 )
+from scripts.sir_convert_a_lot.infrastructure.ocr_language_selection import (
+    DOCLING_OCR_LANGUAGE_DETECTION_ENV_VAR,
+    ocr_language_engine_available,
+    select_ocr_languages,
+)
+from scripts.sir_convert_a_lot.infrastructure.pdf_inspection import pdf_page_count
+from scripts.sir_convert_a_lot.infrastructure.pdf_preclassification import (
+    DOCLING_PRECLASSIFICATION_ENV_VAR,
+    EXAM_LIKE,
+    FORMULA_HEAVY,
+    SCANNED,
+    convert_with_preclassification,
+)
+from scripts.sir_convert_a_lot.infrastructure.runtime_models import ConverterPrewarmProfile
 
 _AUTO_OCR_CHARS_PER_PAGE_THRESHOLD = 120.0
 _LOW_CONFIDENCE_GRADES = {"poor", "fair"}
-_DOCLING_DEPRECATED_TABLE_IMAGES_WARNING = (
-    r"This field is deprecated\. Use `generate_page_images=True` and call "
-    r"`TableItem\.get_image\(\)` to extract table images from page images\."
-)
 _DOCLING_FORMULA_ENRICHMENT_FALLBACK_WARNING = "docling_formula_enrichment_unavailable_fallback"
-_DOCLING_FORMULA_PRESET_SWITCH_WARNING = "docling_formula_preset_switched_to_granite_docling"
+_DOCLING_FORMULA_PRESET_SWITCH_WARNING_PREFIX = "docling_formula_preset_switched_to_"
 _DOCLING_FORMULA_QUALITY_SWITCH_WARNING = "docling_formula_quality_switch_applied"
 
-warnings.filterwarnings(
-    "ignore",
-    message=_DOCLING_DEPRECATED_TABLE_IMAGES_WARNING,
-    category=DeprecationWarning,
-)
-
 
 @dataclass(frozen=True)
 class _DoclingAttempt:
@@ -96,31 +137,33 @@ class _DoclingAttempt:
     layout_model_key: str = _DEFAULT_LAYOUT_MODEL_KEY
     ordering_quality: OrderingQualityReport | None = None
     ordering_retry_applied: bool = False
-
-
-@dataclass(frozen=True)
-class _ConverterKey:
-    table_mode: TableMode
-    ocr_enabled: bool
-    force_full_page_ocr: bool
-    acceleration_device: AcceleratorDevice
-    layout_model_key: str
-    formula_enrichment: bool
-    formula_preset: str
+    low_confidence_pages: frozenset[int] = frozenset()
+    table_decisions: tuple[TableDecision, ...] = ()
+    table_escalation_ms: int | None = None
+    document: object | None = field(default=None, compare=False, repr=False)
 
 
 class DoclingConversionBackend(ConversionBackend):
     """Docling implementation of the conversion backend protocol."""
 
-    def __init__(self) -> None:
-        self._thread_local = threading.local()
+    def __init__(self, *, converter_registry: DoclingConverterRegistry | None = None) -> None:
+        self._converter_registry = (
+            converter_registry
+            if converter_registry is not None
+            else shared_docling_converter_registry()
+        )
         self._ordering_patch_enabled = _is_env_flag_enabled(
-            env_var=_DOCLING_ORDERING_PATCH_ENV_VAR,
-            default=True,
+            env_var=_DOCLING_ORDERING_PATCH_ENV_VAR, default=True
         )
         self._ordering_quality_gate_enabled = _is_env_flag_enabled(
-            env_var=_DOCLING_ORDERING_QUALITY_GATE_ENV_VAR,
-            default=True,
+            env_var=_DOCLING_ORDERING_QUALITY_GATE_ENV_VAR, default=True
+        )
+        self._preclassification_enabled = _is_env_flag_enabled(
+            env_var=DOCLING_PRECLASSIFICATION_ENV_VAR, default=True
+        )
+        self._ocr_language_detection = (
+            _is_env_flag_enabled(env_var=DOCLING_OCR_LANGUAGE_DETECTION_ENV_VAR, default=False)
+            and ocr_language_engine_available()
         )
         if self._ordering_patch_enabled:
             install_docling_form_ordering_patch()
@@ -128,64 +171,59 @@ class DoclingConversionBackend(ConversionBackend):
     def convert(self, request: ConversionRequest) -> ConversionResultData:
         if request.backend_strategy not in {BackendStrategy.AUTO, BackendStrategy.DOCLING}:
             raise ValueError(f"unsupported backend for docling adapter: {request.backend_strategy}")
+        if self._ocr_language_detection and request.ocr_mode != OcrMode.OFF:
+            request = replace(request, ocr_languages=select_ocr_languages(request.source))
+        # Every pass of this job reuses page parses and renders from one cache.
+        with job_page_cache(request.source) as page_cache:
+            result = convert_with_preclassification(
+                request,
+                enabled=self._preclassification_enabled,
+                layout_fallback_available=self._ordering_quality_gate_enabled
+                and len(_resolve_layout_model_candidate_keys()) > 1,
+                formula_enrichment=request.formula_enrichment != FormulaEnrichmentMode.OFF,
+                convert=self._convert_passes,
+            )
+        return replace(
+            result, phase_timings_ms={**result.phase_timings_ms, **page_cache.phase_timings_ms()}
+        )
 
-        warnings: list[str] = []
-        phase_timings_ms: dict[str, int] = {}
+    def _convert_passes(self, request: ConversionRequest) -> ConversionResultData:
         acceleration_device, acceleration_used = self._resolve_acceleration(
             request.gpu_available,
             request.gpu_runtime_probe,
         )
-
-        if request.ocr_mode == OcrMode.OFF:
-            attempt, attempt_warnings, attempt_timings = self._convert_once_guarded_formula(
-                request,
-                ocr_enabled=False,
-                force_full_page_ocr=False,
-                acceleration_device=acceleration_device,
+        if request.progress is not None:
+            request.report_progress(
+                stage="docling_parse",
+                pages_completed=0,
+                pages_total=pdf_page_count(request.source),
             )
-            warnings.extend(attempt_warnings)
-            phase_timings_ms.update(attempt_timings)
-            ocr_enabled = False
-        elif request.ocr_mode == OcrMode.FORCE:
-            attempt, attempt_warnings, attempt_timings = self._convert_once_guarded_formula(
+
+        if request.ocr_mode == OcrMode.AUTO:
+            attempt, warnings, phase_timings_ms, ocr_enabled = convert_auto_ocr(
                 request,
-                ocr_enabled=True,
-                force_full_page_ocr=True,
-                acceleration_device=acceleration_device,
+                convert_pass=lambda pass_request, ocr_enabled: self._convert_once_guarded_formula(
+                    pass_request,
+                    ocr_enabled=ocr_enabled,
+                    force_full_page_ocr=ocr_enabled,
+                    acceleration_device=acceleration_device,
+                ),
+                with_markdown=lambda attempt, markdown: replace(attempt, markdown_content=markdown),
+                min_chars_per_page=_AUTO_OCR_CHARS_PER_PAGE_THRESHOLD,
+                skip_text_pass=SCANNED in request.preclassified_labels,
             )
-            warnings.extend(attempt_warnings)
-            phase_timings_ms.update(attempt_timings)
-            ocr_enabled = True
         else:
-            first, first_warnings, first_timings = self._convert_once_guarded_formula(
+            # REGIONS lets Docling OCR bitmap regions and keep programmatic text cells.
+            ocr_enabled = request.ocr_mode in {OcrMode.FORCE, OcrMode.REGIONS}
+            attempt, warnings, phase_timings_ms = self._convert_once_guarded_formula(
                 request,
-                ocr_enabled=False,
-                force_full_page_ocr=False,
+                ocr_enabled=ocr_enabled,
+                force_full_page_ocr=request.ocr_mode == OcrMode.FORCE,
                 acceleration_device=acceleration_device,
             )
-            warnings.extend(first_warnings)
-            phase_timings_ms = self._merge_phase_timings(phase_timings_ms, first_timings)
-            stripped = first.markdown_content.strip()
-            chars_per_page = len(stripped) / max(1, first.page_count)
-            needs_ocr_retry = (
-                len(stripped) == 0
-                or chars_per_page < _AUTO_OCR_CHARS_PER_PAGE_THRESHOLD
-                or first.low_confidence
-            )
-            if needs_ocr_retry:
-                attempt, retry_warnings, retry_timings = self._convert_once_guarded_formula(
-                    request,
-                    ocr_enabled=True,
-                    force_full_page_ocr=True,
-                    acceleration_device=acceleration_device,
-                )
-                warnings.extend(retry_warnings)
-                warnings.append("docling_auto_ocr_retry_applied")
-                phase_timings_ms = self._merge_phase_timings(phase_timings_ms, retry_timings)
-                ocr_enabled = True
-            else:
-                attempt = first
-                ocr_enabled = False
+        warnings = [*warnings, *table_decision_warnings(attempt.table_decisions)]
+        if attempt.table_escalation_ms is not None:
+            phase_timings_ms["table_escalation_ms"] = attempt.table_escalation_ms
 
         return ConversionResultData(
             markdown_content=attempt.markdown_content,
@@ -194,6 +232,21 @@ class DoclingConversionBackend(ConversionBackend):
             ocr_enabled=ocr_enabled,
             warnings=warnings,
             phase_timings_ms=phase_timings_ms,
+            formula_enrichment_used=formula_enrichment_used(
+                warnings,
+                phase_timings_ms,
+                unavailable_warning=_DOCLING_FORMULA_ENRICHMENT_FALLBACK_WARNING,
+            ),
+            ocr_languages=request.ocr_languages if ocr_enabled else (),
+        )
+
+    def prewarm(self, profile: ConverterPrewarmProfile) -> int:
+        """Build and exercise every converter a job with `profile` may use."""
+        acceleration_device, _ = self._resolve_acceleration(True, None)
+        return warm_docling_passes(
+            profile,
+            convert_with_layout=self._convert_once_with_layout,
+            acceleration_device=acceleration_device,
         )
 
     def _convert_once_guarded_formula(
@@ -204,6 +257,9 @@ class DoclingConversionBackend(ConversionBackend):
         force_full_page_ocr: bool,
         acceleration_device: AcceleratorDevice,
     ) -> tuple[_DoclingAttempt, list[str], dict[str, int]]:
+        presets = (FORMULA_PRIMARY_PRESET, FORMULA_FALLBACK_PRESET)
+        if FORMULA_HEAVY in request.preclassified_labels:
+            presets = (FORMULA_FALLBACK_PRESET, FORMULA_PRIMARY_PRESET)
         return convert_once_guarded_formula(
             request=request,
             ocr_enabled=ocr_enabled,
@@ -212,60 +268,132 @@ class DoclingConversionBackend(ConversionBackend):
             convert_once=self._convert_once,
             ordering_warnings_resolver=self._ordering_warnings_for_attempt,
             formula_enrichment_fallback_warning=_DOCLING_FORMULA_ENRICHMENT_FALLBACK_WARNING,
-            formula_preset_switch_warning=_DOCLING_FORMULA_PRESET_SWITCH_WARNING,
+            formula_preset_switch_warning=_DOCLING_FORMULA_PRESET_SWITCH_WARNING_PREFIX
+            + presets[1],
             formula_quality_switch_warning=_DOCLING_FORMULA_QUALITY_SWITCH_WARNING,
+            reenrich_formula_regions=lambda attempt, preset: self._reenrich_formula_regions(
+                attempt,
+                request=request,
+                ocr_enabled=ocr_enabled,
+                force_full_page_ocr=force_full_page_ocr,
+                acceleration_device=acceleration_device,
+                formula_preset=preset,
+            ),
+            primary_preset=presets[0],
+            fallback_preset=presets[1],
         )
 
-    def _convert_once(
+    def _reenrich_formula_regions(
         self,
-        request: ConversionRequest,
+        attempt: _DoclingAttempt,
         *,
+        request: ConversionRequest,
         ocr_enabled: bool,
         force_full_page_ocr: bool,
         acceleration_device: AcceleratorDevice,
-        formula_enrichment: bool,
         formula_preset: str,
-    ) -> _DoclingAttempt:
-        candidate_layout_keys = _resolve_layout_model_candidate_keys()
-        primary_layout_key = candidate_layout_keys[0]
-        primary_attempt = self._convert_once_with_layout(
-            request=request,
+    ) -> _DoclingAttempt | None:
+        if attempt.document is None:
+            return None
+        key = _ConverterKey(
+            table_mode=first_pass_table_mode(request.table_mode),
             ocr_enabled=ocr_enabled,
             force_full_page_ocr=force_full_page_ocr,
             acceleration_device=acceleration_device,
-            formula_enrichment=formula_enrichment,
+            layout_model_key=attempt.layout_model_key,
+            formula_enrichment=True,
             formula_preset=formula_preset,
-            layout_model_key=primary_layout_key,
-            evaluate_ordering_quality=self._ordering_quality_gate_enabled,
+            ocr_languages=request.ocr_languages if ocr_enabled else (),
+        )
+        document = reenrich_converter_formulas(
+            self._get_converter(key),
+            document=attempt.document,
+            source=request.source,
+        )
+        if document is None:
+            return None
+        return self._with_document(attempt, document)
+
+    def _with_document(self, attempt: _DoclingAttempt, document: object) -> _DoclingAttempt:
+        """Rebuild `attempt` around an edited copy of its Docling document."""
+        markdown_content = self._export_markdown(document)
+        return replace(
+            attempt,
+            markdown_content=markdown_content,
+            ordering_quality=evaluate_docling_ordering_quality(markdown_content)
+            if attempt.ordering_quality is not None
+            else None,
+            document=document,
         )
-        if not self._ordering_quality_gate_enabled or len(candidate_layout_keys) == 1:
-            return primary_attempt
-
-        primary_quality = primary_attempt.ordering_quality
-        if primary_quality is not None and primary_quality.passes:
-            return primary_attempt
 
-        attempts: list[_DoclingAttempt] = [primary_attempt]
-        for fallback_layout_key in candidate_layout_keys[1:]:
-            fallback_attempt = self._convert_once_with_layout(
-                request=request,
+    def _convert_once(
+        self,
+        request: ConversionRequest,
+        *,
+        ocr_enabled: bool,
+        force_full_page_ocr: bool,
+        acceleration_device: AcceleratorDevice,
+        formula_enrichment: bool,
+        formula_preset: str,
+    ) -> _DoclingAttempt:
+        layout_keys = _resolve_layout_model_candidate_keys()
+        if EXAM_LIKE in request.preclassified_labels and len(layout_keys) > 1:
+            layout_keys = (layout_keys[1], layout_keys[0], *layout_keys[2:])
+
+        def convert_with_layout(
+            pass_request: ConversionRequest, layout_model_key: str, evaluate: bool
+        ) -> _DoclingAttempt:
+            return self._convert_once_with_layout(
+                request=pass_request,
                 ocr_enabled=ocr_enabled,
                 force_full_page_ocr=force_full_page_ocr,
                 acceleration_device=acceleration_device,
                 formula_enrichment=formula_enrichment,
                 formula_preset=formula_preset,
-                layout_model_key=fallback_layout_key,
-                evaluate_ordering_quality=True,
+                layout_model_key=layout_model_key,
+                evaluate_ordering_quality=evaluate,
             )
-            attempts.append(fallback_attempt)
-            fallback_quality = fallback_attempt.ordering_quality
-            if fallback_quality is not None and fallback_quality.passes:
-                return replace(fallback_attempt, ordering_retry_applied=True)
 
-        selected_attempt = select_best_ordering_attempt(attempts)
-        if selected_attempt.layout_model_key != primary_layout_key:
-            return replace(selected_attempt, ordering_retry_applied=True)
-        return selected_attempt
+        attempt = convert_with_layout_fallback(
+            candidate_layout_keys=layout_keys,
+            quality_gate_enabled=self._ordering_quality_gate_enabled,
+            convert_with_layout=partial(convert_with_layout, request),
+            mark_retry_applied=lambda attempt: replace(attempt, ordering_retry_applied=True),
+            rerun_failing_pages=lambda primary, fallback_layout_keys: rerun_failing_pages(
+                primary,
+                source=request.source,
+                primary_layout_key=layout_keys[0],
+                fallback_layout_keys=fallback_layout_keys,
+                convert_pages=lambda pages_pdf, layout_model_key: convert_with_layout(
+                    replace(request, source=pages_pdf), layout_model_key, False
+                ),
+                with_pages=lambda attempt, document, markdown: replace(
+                    attempt,
+                    markdown_content=markdown,
+                    ordering_quality=evaluate_docling_ordering_quality(markdown),
+                    ordering_retry_applied=True,
+                    document=document,
+                ),
+            ),
+        )
+        if request.table_mode != TableMode.ADAPTIVE:
+            return attempt
+        attempt, decisions, escalation_ms = escalate_adaptive_tables(
+            attempt,
+            source=request.source,
+            convert_pages=lambda pages_pdf: self._convert_once_with_layout(
+                request=replace(request, source=pages_pdf, table_mode=TableMode.ACCURATE),
+                ocr_enabled=ocr_enabled,
+                force_full_page_ocr=force_full_page_ocr,
+                acceleration_device=acceleration_device,
+                formula_enrichment=False,
+                formula_preset=formula_preset,
+                layout_model_key=attempt.layout_model_key,
+                evaluate_ordering_quality=False,
+            ),
+            with_document=self._with_document,
+        )
+        return replace(attempt, table_decisions=decisions, table_escalation_ms=escalation_ms)
 
     def _convert_once_with_layout(
         self,
@@ -280,36 +408,42 @@ class DoclingConversionBackend(ConversionBackend):
         evaluate_ordering_quality: bool,
     ) -> _DoclingAttempt:
         key = _ConverterKey(
-            table_mode=request.table_mode,
+            table_mode=first_pass_table_mode(request.table_mode),
             ocr_enabled=ocr_enabled,
             force_full_page_ocr=force_full_page_ocr,
             acceleration_device=acceleration_device,
             layout_model_key=layout_model_key,
             formula_enrichment=formula_enrichment,
             formula_preset=formula_preset,
+            ocr_languages=request.ocr_languages if ocr_enabled else (),
         )
         converter = self._get_converter(key)
-        document_stream = DocumentStream(
-            name=request.source_filename,
-            stream=BytesIO(request.source_bytes),
-        )
-        try:
-            with warnings.catch_warnings():
-                warnings.filterwarnings(
-                    "ignore",
-                    message=_DOCLING_DEPRECATED_TABLE_IMAGES_WARNING,
-                    category=DeprecationWarning,
-                )
-                result = converter.convert(document_stream)
-        except DoclingConversionError as exc:
-            raise BackendInputError(str(exc)) from exc
-        except Exception as exc:  # pragma: no cover - defensive guard for backend runtime issues.
-            raise BackendExecutionError(f"Docling backend execution failed: {exc}") from exc
+        progress_stage = "docling_ocr" if ocr_enabled else "docling_convert"
+        request.report_progress(stage=progress_stage, pages_completed=0, pages_total=None)
+        with docling_pass_source(request, stage=progress_stage) as document_source:
+            try:
+                with warnings.catch_warnings():
+                    warnings.filterwarnings(
+                        "ignore",
+                        message=_DOCLING_DEPRECATED_TABLE_IMAGES_WARNING,
+                        category=DeprecationWarning,
+                    )
+                    result = converter.convert(document_source)
+            except DoclingConversionError as exc:
+                raise BackendInputError(str(exc)) from exc
+            except Exception as exc:  # pragma: no cover - defensive guard for runtime issues.
+                raise BackendExecutionError(f"Docling backend execution failed: {exc}") from exc
         markdown_content = self._export_markdown(result.document)
 
         raw_pages = getattr(result, "pages", None)
         page_count = len(raw_pages) if raw_pages is not None else 1
-        low_confidence = self._is_low_confidence(result)
+        request.report_progress(
+            stage=progress_stage, pages_completed=max(1, page_count), pages_total=max(1, page_count)
+        )
+        low_confidence = is_low_confidence_result(result, low_grades=_LOW_CONFIDENCE_GRADES)
+        low_confidence_pages = low_confidence_page_indexes(
+            result, low_grades=_LOW_CONFIDENCE_GRADES
+        )
         ordering_quality: OrderingQualityReport | None = None
         if evaluate_ordering_quality:
             ordering_quality = evaluate_docling_ordering_quality(markdown_content)
@@ -319,21 +453,10 @@ class DoclingConversionBackend(ConversionBackend):
             low_confidence=low_confidence,
             layout_model_key=layout_model_key,
             ordering_quality=ordering_quality,
+            low_confidence_pages=low_confidence_pages,
+            document=result.document,
         )
 
-    def _is_low_confidence(self, result: object) -> bool:
-        confidence = getattr(result, "confidence", None)
-        if confidence is None:
-            return False
-        low_grade = getattr(confidence, "low_grade", None)
-        if low_grade is None:
-            return False
-        if hasattr(low_grade, "value"):
-            grade_value = str(low_grade.value).lower()
-        else:
-            grade_value = str(low_grade).lower()
-        return grade_value in _LOW_CONFIDENCE_GRADES
-
     def _resolve_acceleration(
         self,
         gpu_available: bool,
@@ -345,71 +468,14 @@ class DoclingConversionBackend(ConversionBackend):
             return AcceleratorDevice.CUDA, "cuda"
         raise BackendGpuUnavailableError(backend="docling", probe=probe)
 
-    def _merge_phase_timings(
-        self,
-        current: dict[str, int],
-        next_timings: dict[str, int],
-    ) -> dict[str, int]:
-        merged = dict(current)
-        for key, value in next_timings.items():
-            merged[key] = merged.get(key, 0) + value
-        return merged
-
     def _ordering_warnings_for_attempt(self, attempt: _DoclingAttempt) -> list[str]:
         del self
         return ordering_warnings_for_attempt(attempt)
 
     def _get_converter(self, key: _ConverterKey) -> DocumentConverter:
-        cache = self._converter_cache()
-        converter = cache.get(key)
-        if converter is None:
-            converter = self._build_converter(key)
-            cache[key] = converter
-        return converter
-
-    def _converter_cache(self) -> dict[_ConverterKey, DocumentConverter]:
-        cache = getattr(self._thread_local, "converter_cache", None)
-        if cache is None:
-            cache = {}
-            self._thread_local.converter_cache = cache
-        return cache
-
-    def _build_converter(self, key: _ConverterKey) -> DocumentConverter:
-        pipeline_options = PdfPipelineOptions()
-        layout_options = pipeline_options.layout_options
-        if hasattr(layout_options, "model_spec"):
-            setattr(
-                layout_options,
-                "model_spec",
-                _resolve_layout_model_config(layout_model_key=key.layout_model_key),
-            )
-        pipeline_options.do_ocr = key.ocr_enabled
-        pipeline_options.do_table_structure = True
-        pipeline_options.do_formula_enrichment = key.formula_enrichment
-        if key.formula_enrichment:
-            pipeline_options.code_formula_options = (
-                pipeline_options.code_formula_options.from_preset(key.formula_preset)
-            )
-            pipeline_options.code_formula_options.extract_formulas = True
-            pipeline_options.code_formula_options.extract_code = False
-        pipeline_options.table_structure_options = TableStructureOptions(
-            mode=TableFormerMode(key.table_mode.value),
-            do_cell_matching=key.table_mode == TableMode.ACCURATE,
+        return self._converter_registry.get_or_build(
+            key, build=lambda: build_docling_converter(key), cost_mb=converter_memory_mb(key)
         )
-        pipeline_options.accelerator_options.device = key.acceleration_device
-        if hasattr(pipeline_options.ocr_options, "force_full_page_ocr"):
-            pipeline_options.ocr_options.force_full_page_ocr = key.force_full_page_ocr
-        with warnings.catch_warnings():
-            warnings.filterwarnings(
-                "ignore",
-                message=_DOCLING_DEPRECATED_TABLE_IMAGES_WARNING,
-                category=DeprecationWarning,
-            )
-            return DocumentConverter(
-                format_options={
-                    InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options),
-                }
-            )
 
     def _export_markdown(self, document: object) -> str:
         """Export markdown with deterministic escaping policy.
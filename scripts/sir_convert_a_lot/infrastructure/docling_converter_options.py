@@ -0,0 +1,129 @@
+"""Docling converter configuration keys and pipeline construction.
+
+Purpose:
+    Describe one Docling converter configuration as a hashable key and build
+    the matching `DocumentConverter` with v1 table/OCR/formula semantics
+    mapped onto Docling pipeline options. PDFs load through
+    `CachedDoclingParseBackend` so passes within one job share page parses.
+
+Relationships:
+    - Used by `infrastructure.docling_backend.DoclingConversionBackend`.
+    - Keys index `infrastructure.docling_converter_registry`.
+"""
+
+from __future__ import annotations
+
+import warnings
+from dataclasses import dataclass
+
+from docling.datamodel.accelerator_options import AcceleratorDevice
+from docling.datamodel.base_models import InputFormat
+from docling.datamodel.pipeline_options import (
+    EasyOcrOptions,
+    PdfPipelineOptions,
+    TableFormerMode,
+    TableStructureOptions,
+)
+from docling.document_converter import DocumentConverter, PdfFormatOption
+
+from scripts.sir_convert_a_lot.domain.specs import TableMode
+from scripts.sir_convert_a_lot.infrastructure.docling_converter_registry import (
+    estimate_converter_memory_mb,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_layout_models import (
+    resolve_layout_model_config,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_page_cache import (
+    CachedDoclingParseBackend,
+)
+
+DOCLING_DEPRECATED_TABLE_IMAGES_WARNING = (
+    r"This field is deprecated\. Use `generate_page_images=True` and call "
+    r"`TableItem\.get_image\(\)` to extract table images from page images\."
+)
+
+warnings.filterwarnings(
+    "ignore",
+    message=DOCLING_DEPRECATED_TABLE_IMAGES_WARNING,
+    category=DeprecationWarning,
+)
+
+
+@dataclass(frozen=True)
+class DoclingConverterKey:
+    """Every option that changes how a Docling converter is built."""
+
+    table_mode: TableMode
+    ocr_enabled: bool
+    force_full_page_ocr: bool
+    acceleration_device: AcceleratorDevice
+    layout_model_key: str
+    formula_enrichment: bool
+    formula_preset: str
+    ocr_languages: tuple[str, ...] = ()
+
+
+def build_docling_converter(key: DoclingConverterKey) -> DocumentConverter:
+    """Build a Docling PDF converter configured for `key`."""
+    pipeline_options = PdfPipelineOptions()
+    layout_options = pipeline_options.layout_options
+    if hasattr(layout_options, "model_spec"):
+        setattr(
+            layout_options,
+            "model_spec",
+            resolve_layout_model_config(layout_model_key=key.layout_model_key),
+        )
+    pipeline_options.do_ocr = key.ocr_enabled
+    pipeline_options.do_table_structure = True
+    pipeline_options.do_formula_enrichment = key.formula_enrichment
+    if key.formula_enrichment:
+        pipeline_options.code_formula_options = pipeline_options.code_formula_options.from_preset(
+            key.formula_preset
+        )
+        pipeline_options.code_formula_options.extract_formulas = True
+        pipeline_options.code_formula_options.extract_code = False
+    pipeline_options.table_structure_options = TableStructureOptions(
+        mode=TableFormerMode.ACCURATE
+        if key.table_mode == TableMode.ACCURATE
+        else TableFormerMode.FAST,
+        do_cell_matching=key.table_mode == TableMode.ACCURATE,
+    )
+    pipeline_options.accelerator_options.device = key.acceleration_device
+    if key.ocr_enabled and key.ocr_languages:
+        # EasyOCR loads recognition models for exactly the requested languages.
+        pipeline_options.ocr_options = EasyOcrOptions(lang=list(key.ocr_languages))
+    if hasattr(pipeline_options.ocr_options, "force_full_page_ocr"):
+        pipeline_options.ocr_options.force_full_page_ocr = key.force_full_page_ocr
+    with warnings.catch_warnings():
+        warnings.filterwarnings(
+            "ignore",
+            message=DOCLING_DEPRECATED_TABLE_IMAGES_WARNING,
+            category=DeprecationWarning,
+        )
+        return DocumentConverter(
+            format_options={
+                InputFormat.PDF: PdfFormatOption(
+                    pipeline_options=pipeline_options,
+                    backend=CachedDoclingParseBackend,
+                ),
+            }
+        )
+
+
+def converter_memory_mb(key: DoclingConverterKey) -> int:
+    """Return the approximate registry cost of the converter built for `key`."""
+    return estimate_converter_memory_mb(
+        layout_model_key=key.layout_model_key,
+        table_mode=key.table_mode.value,
+        ocr_enabled=key.ocr_enabled,
+        formula_enrichment=key.formula_enrichment,
+        formula_preset=key.formula_preset,
+    )
+
+
+__all__ = [
+    "DOCLING_DEPRECATED_TABLE_IMAGES_WARNING",
+    "DoclingConverterKey",
+    "build_docling_converter",
+    "converter_memory_mb",
+]
@@ -0,0 +1,261 @@
+"""Process-wide Docling converter registry with LRU eviction.
+
+Purpose:
+    Share built `DocumentConverter` instances across every worker thread and
+    runtime in the process, bounded by a maximum entry count and an
+    approximate accelerator/host memory budget. Least-recently-used
+    converters are evicted first and hit/miss/eviction counters are kept for
+    observability. The entry limit is sized so every prewarmed converter
+    fits alongside the per-job variants jobs build on demand.
+
+Relationships:
+    - Used by `infrastructure.docling_backend.DoclingConversionBackend` to
+      resolve converters by `_ConverterKey`.
+    - Read by `interfaces.http_metrics` to export cache counters.
+    - Sized by `infrastructure.runtime_backends` and the conversion worker
+      initializer from the declared converter prewarm profiles.
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+
+from docling.document_converter import DocumentConverter
+
+DOCLING_CONVERTER_CACHE_MAX_ENTRIES_ENV_VAR = "SIR_CONVERT_A_LOT_DOCLING_CACHE_MAX_ENTRIES"
+DOCLING_CONVERTER_CACHE_BUDGET_MB_ENV_VAR = "SIR_CONVERT_A_LOT_DOCLING_CACHE_BUDGET_MB"
+# Headroom for per-job variants (OCR retries, formula presets, fallback layouts,
+# accurate-table escalation) on top of the prewarmed first-pass converters.
+DEFAULT_CONVERTER_CACHE_MAX_ENTRIES = 4
+
+# Rough resident footprint per model family (weights + activation headroom), in MB.
+_LAYOUT_MODEL_MEMORY_MB: dict[str, int] = {
+    "docling_layout_v2": 300,
+    "docling_layout_heron": 350,
+    "docling_layout_heron_101": 450,
+    "docling_layout_egret_medium": 400,
+    "docling_layout_egret_large": 600,
+    "docling_layout_egret_xlarge": 900,
+}
+_DEFAULT_LAYOUT_MODEL_MEMORY_MB = 600
+_TABLE_MODEL_MEMORY_MB = {"fast": 250, "accurate": 400}
+_OCR_MODEL_MEMORY_MB = 400
+_FORMULA_MODEL_MEMORY_MB: dict[str, int] = {"codeformulav2": 1500, "granite_docling": 1200}
+_DEFAULT_FORMULA_MODEL_MEMORY_MB = 1500
+
+
+def estimate_converter_memory_mb(
+    *,
+    layout_model_key: str,
+    table_mode: str,
+    ocr_enabled: bool,
+    formula_enrichment: bool,
+    formula_preset: str,
+) -> int:
+    """Return an approximate memory cost for one converter configuration."""
+    total = _LAYOUT_MODEL_MEMORY_MB.get(layout_model_key, _DEFAULT_LAYOUT_MODEL_MEMORY_MB)
+    total += _TABLE_MODEL_MEMORY_MB.get(table_mode, _TABLE_MODEL_MEMORY_MB["accurate"])
+    if ocr_enabled:
+        total += _OCR_MODEL_MEMORY_MB
+    if formula_enrichment:
+        total += _FORMULA_MODEL_MEMORY_MB.get(formula_preset, _DEFAULT_FORMULA_MODEL_MEMORY_MB)
+    return total
+
+
+@dataclass(frozen=True)
+class ConverterRegistryStats:
+    """Snapshot of registry occupancy and lifetime counters."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    estimated_memory_mb: int
+    max_entries: int
+    memory_budget_mb: int | None
+
+
+@dataclass
+class _RegistryEntry:
+    converter: DocumentConverter
+    cost_mb: int
+
+
+class DoclingConverterRegistry:
+    """Thread-safe LRU registry of built Docling converters.
+
+    Builds happen outside the registry lock; concurrent requests for the same
+    key wait on a per-key lock so each configuration is built once.
+    """
+
+    def __init__(self, *, max_entries: int, memory_budget_mb: int | None) -> None:
+        self._max_entries = max(1, max_entries)
+        self._memory_budget_mb = memory_budget_mb
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, _RegistryEntry] = OrderedDict()
+        self._build_locks: dict[Hashable, threading.Lock] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_or_build(
+        self,
+        key: Hashable,
+        *,
+        build: Callable[[], DocumentConverter],
+        cost_mb: int,
+    ) -> DocumentConverter:
+        """Return the cached converter for `key`, building and admitting it on a miss."""
+        with self._lock:
+            cached = self._lookup_locked(key)
+            if cached is not None:
+                return cached
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+
+        with build_lock:
+            with self._lock:
+                cached = self._lookup_locked(key)
+                if cached is not None:
+                    return cached
+                self._misses += 1
+            converter = build()
+            with self._lock:
+                self._entries[key] = _RegistryEntry(converter=converter, cost_mb=max(0, cost_mb))
+                self._entries.move_to_end(key)
+                evicted = self._evict_locked(keep=key)
+                self._build_locks.pop(key, None)
+        if evicted:
+            _release_accelerator_memory()
+        return converter
+
+    def ensure_capacity(self, max_entries: int) -> None:
+        """Raise the entry limit to at least `max_entries`; never shrinks it."""
+        with self._lock:
+            self._max_entries = max(self._max_entries, max_entries)
+
+    def stats(self) -> ConverterRegistryStats:
+        """Return a consistent snapshot of counters and occupancy."""
+        with self._lock:
+            return ConverterRegistryStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                estimated_memory_mb=self._estimated_memory_locked(),
+                max_entries=self._max_entries,
+                memory_budget_mb=self._memory_budget_mb,
+            )
+
+    def clear(self) -> None:
+        """Drop every cached converter (counted as evictions)."""
+        with self._lock:
+            evicted = len(self._entries)
+            self._evictions += evicted
+            self._entries.clear()
+        if evicted:
+            _release_accelerator_memory()
+
+    def _lookup_locked(self, key: Hashable) -> DocumentConverter | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry.converter
+
+    def _estimated_memory_locked(self) -> int:
+        return sum(entry.cost_mb for entry in self._entries.values())
+
+    def _over_capacity_locked(self) -> bool:
+        if len(self._entries) > self._max_entries:
+            return True
+        if self._memory_budget_mb is None:
+            return False
+        return self._estimated_memory_locked() > self._memory_budget_mb
+
+    def _evict_locked(self, *, keep: Hashable) -> bool:
+        evicted = False
+        while self._over_capacity_locked() and len(self._entries) > 1:
+            oldest_key = next(iter(self._entries))
+            if oldest_key == keep:
+                break
+            del self._entries[oldest_key]
+            self._evictions += 1
+            evicted = True
+        return evicted
+
+
+def _release_accelerator_memory() -> None:
+    """Best-effort return of freed model memory to the allocator after eviction."""
+    gc.collect()
+    torch_module = sys.modules.get("torch")
+    if torch_module is None:
+        return
+    try:
+        if torch_module.cuda.is_available():
+            torch_module.cuda.empty_cache()
+    except Exception:
+        return
+
+
+def _positive_int_from_env(env_var: str) -> int | None:
+    raw = os.getenv(env_var)
+    if raw is None or raw.strip() == "":
+        return None
+    try:
+        value = int(raw.strip())
+    except ValueError:
+        return None
+    return value if value > 0 else None
+
+
+def converter_cache_max_entries(*, prewarm_converters: int) -> int:
+    """Return the registry entry limit for a process prewarming `prewarm_converters`.
+
+    Without an explicit limit this is the prewarmed set plus headroom for
+    per-job variants. An explicit limit that cannot hold every prewarmed
+    converter is rejected, since prewarming would only evict itself.
+    """
+    configured = _positive_int_from_env(DOCLING_CONVERTER_CACHE_MAX_ENTRIES_ENV_VAR)
+    if configured is None:
+        return prewarm_converters + DEFAULT_CONVERTER_CACHE_MAX_ENTRIES
+    if configured < prewarm_converters:
+        raise ValueError(
+            f"{DOCLING_CONVERTER_CACHE_MAX_ENTRIES_ENV_VAR}={configured} cannot hold the "
+            f"{prewarm_converters} converters declared for prewarm."
+        )
+    return configured
+
+
+_shared_registry: DoclingConverterRegistry | None = None
+_shared_registry_lock = threading.Lock()
+
+
+def shared_docling_converter_registry() -> DoclingConverterRegistry:
+    """Return the process-wide registry, configured from env on first use."""
+    global _shared_registry
+    with _shared_registry_lock:
+        if _shared_registry is None:
+            max_entries = _positive_int_from_env(DOCLING_CONVERTER_CACHE_MAX_ENTRIES_ENV_VAR)
+            _shared_registry = DoclingConverterRegistry(
+                max_entries=max_entries or DEFAULT_CONVERTER_CACHE_MAX_ENTRIES,
+                memory_budget_mb=_positive_int_from_env(DOCLING_CONVERTER_CACHE_BUDGET_MB_ENV_VAR),
+            )
+        return _shared_registry
+
+
+__all__ = [
+    "ConverterRegistryStats",
+    "DOCLING_CONVERTER_CACHE_BUDGET_MB_ENV_VAR",
+    "DOCLING_CONVERTER_CACHE_MAX_ENTRIES_ENV_VAR",
+    "DoclingConverterRegistry",
+    "converter_cache_max_entries",
+    "estimate_converter_memory_mb",
+    "shared_docling_converter_registry",
+]
@@ -1,8 +1,11 @@
 """Docling formula-enrichment fallback orchestration.
 
 Purpose:
-    Isolate formula preset fallback control flow from the core Docling backend
-    class while preserving deterministic warning and timing behavior.
+    Isolate formula enrichment gating and preset fallback control flow from
+    the core Docling backend class while preserving deterministic warning and
+    timing behavior. In AUTO mode the formula model only runs when the layout
+    stage detected formula clusters. When the backend can decode just the
+    formula regions, that spliced candidate replaces a whole-document pass.
 
 Relationships:
     - Called by `infrastructure.docling_backend` during each conversion pass.
@@ -12,11 +15,12 @@ Relationships:
 from __future__ import annotations
 
 import time
+from collections.abc import Mapping, Sequence
 from typing import Callable, Protocol, TypeVar
 
 from docling.datamodel.accelerator_options import AcceleratorDevice
 
-from scripts.sir_convert_a_lot.domain.specs import TableMode
+from scripts.sir_convert_a_lot.domain.specs import FormulaEnrichmentMode
 from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
     BackendExecutionError,
     ConversionRequest,
@@ -39,6 +43,8 @@ class FormulaAttempt(Protocol):
 
 AttemptT = TypeVar("AttemptT", bound=FormulaAttempt)
 
+FORMULA_ENRICHMENT_DETECTED_WARNING = "docling_formula_enrichment_applied_formulas_detected"
+
 
 def convert_once_guarded_formula(
     *,
@@ -51,54 +57,99 @@ def convert_once_guarded_formula(
     formula_enrichment_fallback_warning: str,
     formula_preset_switch_warning: str,
     formula_quality_switch_warning: str,
+    reenrich_formula_regions: Callable[[AttemptT, str], AttemptT | None] | None = None,
+    primary_preset: str = FORMULA_PRIMARY_PRESET,
+    fallback_preset: str = FORMULA_FALLBACK_PRESET,
 ) -> tuple[AttemptT, list[str], dict[str, int]]:
-    """Execute conversion with deterministic formula-preset fallback policy."""
-    formula_enrichment = request.table_mode == TableMode.ACCURATE
-    formula_enrichment_ms = 0
-    if not formula_enrichment:
-        attempt = convert_once(
+    """Execute conversion with deterministic formula-preset fallback policy.
+
+    With `FormulaEnrichmentMode.AUTO` the first pass runs without the formula
+    model, and formulas are decoded only when its layout stage detected
+    formula clusters (left as placeholders). `ON` enriches the first pass and
+    `OFF` never enriches. Callers that already expect the primary preset to
+    fail may swap `primary_preset` and `fallback_preset`; the switch warning
+    must then name the preset actually switched to.
+
+    `reenrich_formula_regions(attempt, preset)` may return the attempt with
+    only its failing formulas decoded by `preset`; it returns None when
+    regions cannot be scoped, and the whole document is converted with
+    enrichment instead. Either way candidates go through the same selection
+    rules.
+    """
+    if request.formula_enrichment == FormulaEnrichmentMode.OFF:
+        attempt = _convert_without_formulas(
             request=request,
             ocr_enabled=ocr_enabled,
             force_full_page_ocr=force_full_page_ocr,
             acceleration_device=acceleration_device,
-            formula_enrichment=False,
-            formula_preset=FORMULA_PRIMARY_PRESET,
-        )
-        return (
-            attempt,
-            ordering_warnings_resolver(attempt),
-            {},
+            convert_once=convert_once,
         )
+        return attempt, ordering_warnings_resolver(attempt), {}
 
     warnings: list[str] = []
+    formula_enrichment_ms = 0
+    region_reenrich_ms: int | None = None
+    unenriched_attempt: AttemptT | None = None
     primary_error: BackendExecutionError | None = None
-    primary_quality_penalty = 0
-    try:
-        primary_attempt, primary_timing_ms = _timed_convert_once(
+    primary_attempt: AttemptT | None = None
+    if request.formula_enrichment == FormulaEnrichmentMode.AUTO:
+        unenriched_attempt = _convert_without_formulas(
             request=request,
             ocr_enabled=ocr_enabled,
             force_full_page_ocr=force_full_page_ocr,
             acceleration_device=acceleration_device,
-            formula_enrichment=True,
-            formula_preset=FORMULA_PRIMARY_PRESET,
             convert_once=convert_once,
         )
-        formula_enrichment_ms += primary_timing_ms
-        primary_quality_penalty = markdown_quality_penalty(primary_attempt.markdown_content)
-    except BackendExecutionError as exc:
-        if not is_formula_runtime_unavailable(str(exc)):
-            raise
-        primary_error = exc
-        primary_attempt = None
+        if formula_placeholder_count(unenriched_attempt.markdown_content) == 0:
+            return unenriched_attempt, ordering_warnings_resolver(unenriched_attempt), {}
+        warnings.append(FORMULA_ENRICHMENT_DETECTED_WARNING)
+        if reenrich_formula_regions is not None:
+            start = time.perf_counter()
+            try:
+                primary_attempt = reenrich_formula_regions(unenriched_attempt, primary_preset)
+            except BackendExecutionError as exc:
+                if not is_formula_runtime_unavailable(str(exc)):
+                    raise
+                primary_error = exc
+            region_reenrich_ms = max(0, int((time.perf_counter() - start) * 1000))
+            formula_enrichment_ms += region_reenrich_ms
+
+    if primary_attempt is None and primary_error is None:
+        try:
+            primary_attempt, primary_timing_ms = _timed_convert_once(
+                request=request,
+                ocr_enabled=ocr_enabled,
+                force_full_page_ocr=force_full_page_ocr,
+                acceleration_device=acceleration_device,
+                formula_enrichment=True,
+                formula_preset=primary_preset,
+                convert_once=convert_once,
+            )
+            formula_enrichment_ms += primary_timing_ms
+        except BackendExecutionError as exc:
+            if not is_formula_runtime_unavailable(str(exc)):
+                raise
+            primary_error = exc
 
     fallback_error: BackendExecutionError | None = None
     fallback_attempt: AttemptT | None = None
     needs_fallback_attempt = (
         primary_attempt is None
         or (formula_placeholder_count(primary_attempt.markdown_content) > 0)
-        or primary_quality_penalty > 0
+        or markdown_quality_penalty(primary_attempt.markdown_content) > 0
     )
-    if needs_fallback_attempt:
+    if needs_fallback_attempt and primary_attempt is not None and reenrich_formula_regions:
+        start = time.perf_counter()
+        try:
+            fallback_attempt = reenrich_formula_regions(primary_attempt, fallback_preset)
+        except BackendExecutionError as exc:
+            if not is_formula_runtime_unavailable(str(exc)):
+                raise
+            fallback_error = exc
+        elapsed_ms = max(0, int((time.perf_counter() - start) * 1000))
+        region_reenrich_ms = (region_reenrich_ms or 0) + elapsed_ms
+        formula_enrichment_ms += elapsed_ms
+    if needs_fallback_attempt and fallback_attempt is None and fallback_error is None:
         try:
             fallback_attempt, fallback_timing_ms = _timed_convert_once(
                 request=request,
@@ -106,7 +157,7 @@ def convert_once_guarded_formula(
                 force_full_page_ocr=force_full_page_ocr,
                 acceleration_device=acceleration_device,
                 formula_enrichment=True,
-                formula_preset=FORMULA_FALLBACK_PRESET,
+                formula_preset=fallback_preset,
                 convert_once=convert_once,
             )
             formula_enrichment_ms += fallback_timing_ms
@@ -115,6 +166,8 @@ def convert_once_guarded_formula(
                 raise
             fallback_error = exc
     timings = {"formula_enrichment_ms": formula_enrichment_ms}
+    if region_reenrich_ms is not None:
+        timings["formula_region_reenrich_ms"] = region_reenrich_ms
 
     if primary_attempt is None and fallback_attempt is not None:
         warnings.append(formula_preset_switch_warning)
@@ -146,23 +199,44 @@ def convert_once_guarded_formula(
         return primary_attempt, warnings, timings
 
     if primary_error is not None or fallback_error is not None:
-        attempt = convert_once(
+        attempt = unenriched_attempt or _convert_without_formulas(
             request=request,
             ocr_enabled=ocr_enabled,
             force_full_page_ocr=force_full_page_ocr,
             acceleration_device=acceleration_device,
-            formula_enrichment=False,
-            formula_preset=FORMULA_PRIMARY_PRESET,
-        )
-        return (
-            attempt,
-            [formula_enrichment_fallback_warning] + ordering_warnings_resolver(attempt),
-            timings,
+            convert_once=convert_once,
         )
+        warnings.append(formula_enrichment_fallback_warning)
+        return attempt, warnings + ordering_warnings_resolver(attempt), timings
 
     raise BackendExecutionError("Docling formula enrichment failed without runtime diagnostics.")
 
 
+def formula_enrichment_used(
+    warnings: Sequence[str], phase_timings_ms: Mapping[str, int], *, unavailable_warning: str
+) -> bool:
+    """Return true when a guarded pass decoded formulas with the formula model."""
+    return "formula_enrichment_ms" in phase_timings_ms and unavailable_warning not in warnings
+
+
+def _convert_without_formulas(
+    *,
+    request: ConversionRequest,
+    ocr_enabled: bool,
+    force_full_page_ocr: bool,
+    acceleration_device: AcceleratorDevice,
+    convert_once: Callable[..., AttemptT],
+) -> AttemptT:
+    return convert_once(
+        request=request,
+        ocr_enabled=ocr_enabled,
+        force_full_page_ocr=force_full_page_ocr,
+        acceleration_device=acceleration_device,
+        formula_enrichment=False,
+        formula_preset=FORMULA_PRIMARY_PRESET,
+    )
+
+
 def _timed_convert_once(
     *,
     request: ConversionRequest,
@@ -0,0 +1,215 @@
+"""Region-scoped formula re-enrichment for Docling documents.
+
+Purpose:
+    Re-run the fallback formula model only on the formula items of a finished
+    Docling document that failed decoding or render with structural quality
+    penalties, and splice the improved items back into a copy of that
+    document. This replaces a whole-document rerun with the fallback preset
+    on math-heavy papers.
+
+Relationships:
+    - Called by `infrastructure.docling_formula_fallback` through the
+      `reenrich_formula_regions` hook wired in `infrastructure.docling_backend`.
+    - Item scoring reuses `infrastructure.docling_formula_quality`.
+    - The formula model is read from the converter's cached PDF pipeline
+      through Docling 2's private `_get_pipeline`; on any other Docling major
+      version regions are reported as not scopable and the caller reruns the
+      whole document with enrichment.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import cache
+from importlib.metadata import PackageNotFoundError, version
+from typing import Protocol
+
+import pymupdf
+from docling.datamodel.base_models import InputFormat, ItemAndImageEnrichmentElement
+from docling.document_converter import DocumentConverter
+from docling.models.stages.code_formula.code_formula_vlm_model import CodeFormulaVlmModel
+from docling_core.types.doc import BoundingBox, CoordOrigin
+from docling_core.types.doc.document import DoclingDocument, FormulaItem, NodeItem
+from PIL import Image
+
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
+    BackendExecutionError,
+    PdfSource,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_formula_quality import (
+    markdown_quality_penalty,
+)
+from scripts.sir_convert_a_lot.infrastructure.pdf_inspection import open_pdf
+
+
+class FormulaEnricher(Protocol):
+    """Docling item-and-image enrichment model used for formula decoding."""
+
+    images_scale: float
+    expansion_factor: float
+
+    def __call__(
+        self, doc: DoclingDocument, element_batch: Iterable[ItemAndImageEnrichmentElement]
+    ) -> Iterable[NodeItem]: ...
+
+
+_PIPELINE_ACCESSOR_DOCLING_MAJOR = 2
+
+
+@cache
+def _docling_major_version() -> int | None:
+    try:
+        return int(version("docling").split(".", 1)[0])
+    except (PackageNotFoundError, ValueError):
+        return None
+
+
+def _pdf_pipeline(converter: DocumentConverter) -> object | None:
+    """Return the converter's initialized PDF pipeline, or None when it is not reachable.
+
+    `DocumentConverter._get_pipeline` is private; it is only used on the
+    Docling major version it was verified against.
+    """
+    if _docling_major_version() != _PIPELINE_ACCESSOR_DOCLING_MAJOR:
+        return None
+    get_pipeline = getattr(converter, "_get_pipeline", None)
+    if not callable(get_pipeline):
+        return None
+    pipeline: object | None = get_pipeline(InputFormat.PDF)
+    return pipeline
+
+
+def formula_enricher_from_converter(converter: DocumentConverter) -> FormulaEnricher | None:
+    """Return the enabled formula enrichment model of a converter's PDF pipeline, if any."""
+    pipeline = _pdf_pipeline(converter)
+    for model in getattr(pipeline, "enrichment_pipe", []):
+        if isinstance(model, CodeFormulaVlmModel) and model.enabled:
+            return model
+    return None
+
+
+def reenrich_converter_formulas(
+    converter: DocumentConverter, *, document: object, source: PdfSource
+) -> DoclingDocument | None:
+    """Re-enrich failing formulas with `converter`'s formula model; None when not scopable.
+
+    Raises:
+        BackendExecutionError: If the formula model cannot be loaded or run.
+    """
+    try:
+        enricher = formula_enricher_from_converter(converter)
+        if enricher is None:
+            return None
+        reenriched = reenrich_formula_regions(document=document, source=source, enricher=enricher)
+    except Exception as exc:  # pragma: no cover - defensive guard for backend runtime issues.
+        raise BackendExecutionError(f"Docling formula re-enrichment failed: {exc}") from exc
+    return None if reenriched is None else reenriched[0]
+
+
+def formula_item_penalty(text: str) -> int:
+    """Return the markdown quality penalty of one display formula."""
+    return markdown_quality_penalty(f"$${text}$$")
+
+
+def formula_needs_reenrichment(item: FormulaItem) -> bool:
+    """Return true when the formula was not decoded or renders with quality penalties."""
+    if not item.text:
+        return bool(item.orig)
+    return formula_item_penalty(item.text) > 0
+
+
+def reenrich_formula_regions(
+    *, document: object, source: PdfSource, enricher: FormulaEnricher
+) -> tuple[DoclingDocument, int] | None:
+    """Re-enrich failing formula items and return the spliced copy and replaced-item count.
+
+    Only regions whose new text resolves a placeholder or lowers the item's
+    quality penalty are replaced; other items keep their primary text.
+    Returns None when the document has no failing formula that can be located
+    on a page, in which case the caller falls back to a whole-document rerun.
+    """
+    if not isinstance(document, DoclingDocument):
+        return None
+    targets = [
+        item
+        for item, _level in document.iterate_items()
+        if isinstance(item, FormulaItem) and item.prov and formula_needs_reenrichment(item)
+    ]
+    if not targets:
+        return None
+
+    spliced = document.model_copy(deep=True)
+    elements: list[ItemAndImageEnrichmentElement] = []
+    previous_texts: list[str] = []
+    with open_pdf(source) as pdf:
+        for target in targets:
+            item = target.get_ref().resolve(spliced)
+            image = _crop_formula(pdf, spliced, item, enricher)
+            if image is None:
+                continue
+            elements.append(ItemAndImageEnrichmentElement(item=item, image=image))
+            previous_texts.append(item.text)
+    if not elements:
+        return None
+
+    for _ in enricher(spliced, elements):
+        pass
+    replaced = 0
+    for element, previous_text in zip(elements, previous_texts, strict=True):
+        item = element.item
+        if not isinstance(item, FormulaItem):
+            continue
+        if _is_improvement(previous_text, item.text):
+            replaced += 1
+        else:
+            item.text = previous_text
+    return spliced, replaced
+
+
+def _is_improvement(previous_text: str, new_text: str) -> bool:
+    if not new_text:
+        return False
+    if not previous_text:
+        return True
+    return formula_item_penalty(new_text) < formula_item_penalty(previous_text)
+
+
+def _crop_formula(
+    pdf: pymupdf.Document,
+    document: DoclingDocument,
+    item: FormulaItem,
+    enricher: FormulaEnricher,
+) -> Image.Image | None:
+    prov = item.prov[0]
+    page_info = document.pages.get(prov.page_no)
+    if page_info is None or not 1 <= prov.page_no <= pdf.page_count:
+        return None
+    bbox = prov.bbox
+    if bbox.coord_origin != CoordOrigin.TOPLEFT:
+        bbox = bbox.to_top_left_origin(page_height=page_info.size.height)
+    width = bbox.r - bbox.l
+    height = bbox.b - bbox.t
+    expanded = BoundingBox(
+        l=bbox.l - width * enricher.expansion_factor,
+        t=bbox.t - height * enricher.expansion_factor,
+        r=bbox.r + width * enricher.expansion_factor,
+        b=bbox.b + height * enricher.expansion_factor,
+        coord_origin=CoordOrigin.TOPLEFT,
+    )
+    page = pdf[prov.page_no - 1]
+    clip = pymupdf.Rect(expanded.l, expanded.t, expanded.r, expanded.b) & page.rect
+    if clip.is_empty:
+        return None
+    scale = enricher.images_scale
+    pixmap = page.get_pixmap(matrix=pymupdf.Matrix(scale, scale), clip=clip, alpha=False)
+    return Image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples)
+
+
+__all__ = [
+    "FormulaEnricher",
+    "formula_enricher_from_converter",
+    "formula_item_penalty",
+    "formula_needs_reenrichment",
+    "reenrich_converter_formulas",
+    "reenrich_formula_regions",
+]
@@ -16,7 +16,7 @@ from __future__ import annotations
 import re
 import threading
 from dataclasses import dataclass
-from typing import Callable
+from typing import Callable, Sequence
 
 from docling.datamodel.base_models import Cluster
 from docling.utils.layout_postprocessor import LayoutPostprocessor
@@ -178,6 +178,43 @@ def evaluate_docling_ordering_quality(markdown_content: str) -> OrderingQualityR
     )
 
 
+def attribute_ordering_failures(page_markdowns: Sequence[str]) -> list[int]:
+    """Return sorted zero-based pages that carry the signals failing the ordering gate.
+
+    Trailing and standalone number signals belong to the page they appear on.
+    An option line before the first question belongs to the option's page. A
+    missing question number is charged to the pages holding the nearest
+    question numbers below and above it, since a misordered question usually
+    lands across a page boundary.
+    """
+    pages: set[int] = set()
+    question_pages: dict[int, int] = {}
+    first_option_page: int | None = None
+    first_question_page: int | None = None
+    for page_index, page_markdown in enumerate(page_markdowns):
+        for line in page_markdown.splitlines():
+            if (
+                _TRAILING_NUMBER_SIGNAL_RE.match(line) is not None
+                or _STANDALONE_BULLET_SIGNAL_RE.match(line) is not None
+            ):
+                pages.add(page_index)
+            if first_option_page is None and _OPTION_LINE_RE.match(line) is not None:
+                if first_question_page is None:
+                    first_option_page = page_index
+            question_match = _QUESTION_NUMBER_LINE_RE.match(line.strip())
+            if question_match is not None:
+                question_pages.setdefault(int(question_match.group(1)), page_index)
+                if first_question_page is None:
+                    first_question_page = page_index
+    if first_option_page is not None and first_question_page is not None:
+        pages.add(first_option_page)
+    numbers = sorted(question_pages)
+    for lower, upper in zip(numbers, numbers[1:]):
+        if upper - lower > 1:
+            pages.update({question_pages[lower], question_pages[upper]})
+    return sorted(pages)
+
+
 def _is_form_like_cluster_group(clusters: list[Cluster]) -> bool:
     for cluster in clusters:
         if cluster.label in _FORM_CLUSTER_LABELS:
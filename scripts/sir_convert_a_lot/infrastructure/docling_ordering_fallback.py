@@ -13,6 +13,7 @@ Relationships:
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Protocol, Sequence, TypeVar
 
 from scripts.sir_convert_a_lot.infrastructure.docling_ordering import OrderingQualityReport
@@ -62,6 +63,51 @@ def select_best_ordering_attempt(attempts: Sequence[AttemptT]) -> AttemptT:
     return best_attempt
 
 
+def convert_with_layout_fallback(
+    *,
+    candidate_layout_keys: Sequence[str],
+    quality_gate_enabled: bool,
+    convert_with_layout: Callable[[str, bool], AttemptT],
+    mark_retry_applied: Callable[[AttemptT], AttemptT],
+    rerun_failing_pages: Callable[[AttemptT, Sequence[str]], AttemptT | None] | None = None,
+) -> AttemptT:
+    """Convert with the primary layout model, falling back while the ordering gate fails.
+
+    `convert_with_layout(layout_model_key, evaluate_ordering_quality)` runs one
+    pass. When `rerun_failing_pages(primary, fallback_layout_keys)` can pin the
+    failure to some pages, its page-level result is returned as is. Otherwise
+    fallback layouts rerun the whole document in order until one passes the
+    ordering gate, or the best-scoring attempt is returned. Attempts from a
+    non-primary layout are passed through `mark_retry_applied`.
+    """
+    primary_layout_key = candidate_layout_keys[0]
+    primary_attempt = convert_with_layout(primary_layout_key, quality_gate_enabled)
+    if not quality_gate_enabled or len(candidate_layout_keys) == 1:
+        return primary_attempt
+
+    primary_quality = primary_attempt.ordering_quality
+    if primary_quality is not None and primary_quality.passes:
+        return primary_attempt
+
+    if rerun_failing_pages is not None:
+        page_attempt = rerun_failing_pages(primary_attempt, candidate_layout_keys[1:])
+        if page_attempt is not None:
+            return page_attempt
+
+    attempts: list[AttemptT] = [primary_attempt]
+    for fallback_layout_key in candidate_layout_keys[1:]:
+        fallback_attempt = convert_with_layout(fallback_layout_key, True)
+        attempts.append(fallback_attempt)
+        fallback_quality = fallback_attempt.ordering_quality
+        if fallback_quality is not None and fallback_quality.passes:
+            return mark_retry_applied(fallback_attempt)
+
+    selected_attempt = select_best_ordering_attempt(attempts)
+    if selected_attempt.layout_model_key != primary_layout_key:
+        return mark_retry_applied(selected_attempt)
+    return selected_attempt
+
+
 def _ordering_score(
     attempt: OrderingAttempt,
     *,
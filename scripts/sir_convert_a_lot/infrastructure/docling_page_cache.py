@@ -0,0 +1,345 @@
+"""Per-job cache of parsed PDF pages and rendered page images for Docling.
+
+Purpose:
+    One job can run several Docling passes over the same PDF (auto-OCR
+    retry, layout-model fallbacks, formula preset fallback). Each pass would
+    otherwise re-parse text cells and re-rasterize every page. A
+    `DoclingPageCache` activated for the duration of one job lets every pass
+    reuse the first pass's segmented pages and page images, so retries only
+    pay for the model stages that differ. The same page-load hook reports
+    per-page progress for a pass registered with `docling_pass_source`.
+
+Relationships:
+    - `CachedDoclingParseBackend` is installed as the PDF backend by
+      `infrastructure.docling_converter_options.build_docling_converter`.
+    - `infrastructure.docling_backend.DoclingConversionBackend.convert`
+      activates a cache per job with `job_page_cache` and reports its savings
+      in `phase_timings_ms`; each Docling pass reports page progress through
+      `docling_pass_source`.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from functools import partial
+from io import BytesIO
+from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar
+
+from docling.backend.docling_parse_v4_backend import (
+    DoclingParseV4DocumentBackend,
+    DoclingParseV4PageBackend,
+)
+from docling.utils.locks import pypdfium2_lock
+from docling_core.types.doc import BoundingBox
+from docling_core.types.doc.page import SegmentedPdfPage
+from docling_core.types.io import DocumentStream
+from docling_parse.pdf_parser import PdfDocument
+from pypdfium2 import PdfPage
+
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
+    ConversionCanceledError,
+    ConversionRequest,
+    PdfSource,
+)
+from scripts.sir_convert_a_lot.infrastructure.pdf_inspection import pdf_source_sha256
+
+if TYPE_CHECKING:
+    from PIL.Image import Image
+
+DOCLING_PAGE_CACHE_BUDGET_MB_ENV_VAR = "SIR_CONVERT_A_LOT_DOCLING_PAGE_CACHE_BUDGET_MB"
+DEFAULT_PAGE_CACHE_BUDGET_MB = 1024
+
+_T = TypeVar("_T")
+
+
+def _page_cache_budget_bytes() -> int:
+    raw = os.getenv(DOCLING_PAGE_CACHE_BUDGET_MB_ENV_VAR, "").strip()
+    if raw == "":
+        return DEFAULT_PAGE_CACHE_BUDGET_MB * 1024 * 1024
+    try:
+        value = int(raw)
+    except ValueError as exc:
+        raise ValueError(
+            f"{DOCLING_PAGE_CACHE_BUDGET_MB_ENV_VAR} must be a non-negative integer, got {raw!r}."
+        ) from exc
+    if value < 0:
+        raise ValueError(
+            f"{DOCLING_PAGE_CACHE_BUDGET_MB_ENV_VAR} must be a non-negative integer, got {raw!r}."
+        )
+    return value * 1024 * 1024
+
+
+class DoclingPageCache:
+    """Segmented pages and page images of one document, shared by every pass of a job.
+
+    Cached values are handed out as copies because Docling's OCR and layout
+    stages rewrite `parsed_page` cells in place. Page images stop being
+    stored once `budget_bytes` is reached; parsed pages are always kept.
+    """
+
+    def __init__(self, *, budget_bytes: int) -> None:
+        self._budget_bytes = budget_bytes
+        self._lock = threading.Lock()
+        self._pages: dict[Hashable, SegmentedPdfPage] = {}
+        self._images: dict[Hashable, Image] = {}
+        self._build_ms: dict[Hashable, float] = {}
+        self._stored_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._prepare_ms = 0.0
+        self._saved_ms = 0.0
+
+    def segmented_page(
+        self, key: Hashable, build: Callable[[], SegmentedPdfPage]
+    ) -> SegmentedPdfPage:
+        """Return the parsed page for `key`, parsing it only on first use."""
+        return self._get_or_build(
+            self._pages,
+            key,
+            build,
+            copy=lambda page: page.model_copy(deep=True),
+            size=lambda page: 0,
+        )
+
+    def page_image(self, key: Hashable, build: Callable[[], Image]) -> Image:
+        """Return the rendered page image for `key`, rendering it only on first use."""
+        return self._get_or_build(
+            self._images,
+            key,
+            build,
+            copy=lambda image: image.copy(),
+            size=lambda image: image.width * image.height * len(image.getbands()),
+        )
+
+    def _get_or_build(
+        self,
+        store: dict[Hashable, _T],
+        key: Hashable,
+        build: Callable[[], _T],
+        *,
+        copy: Callable[[_T], _T],
+        size: Callable[[_T], int],
+    ) -> _T:
+        with self._lock:
+            cached = store.get(key)
+        if cached is not None:
+            started = time.perf_counter()
+            value = copy(cached)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            with self._lock:
+                self.hits += 1
+                self._saved_ms += max(0.0, self._build_ms.get(key, 0.0) - elapsed_ms)
+            return value
+
+        started = time.perf_counter()
+        value = build()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        value_size = size(value)
+        with self._lock:
+            self.misses += 1
+            self._prepare_ms += elapsed_ms
+            fits = self._stored_bytes + value_size <= self._budget_bytes
+        if fits:
+            stored = copy(value)
+            with self._lock:
+                if key not in store:
+                    store[key] = stored
+                    self._build_ms[key] = elapsed_ms
+                    self._stored_bytes += value_size
+        return value
+
+    def phase_timings_ms(self) -> dict[str, int]:
+        """Return page preparation time spent and time saved by cache hits."""
+        with self._lock:
+            if self.misses == 0:
+                return {}
+            return {
+                "docling_page_prepare_ms": int(self._prepare_ms),
+                "docling_page_cache_saved_ms": int(self._saved_ms),
+            }
+
+
+_active_lock = threading.Lock()
+_active_caches: dict[str, tuple[DoclingPageCache, int]] = {}
+
+
+@contextmanager
+def job_page_cache(
+    source: PdfSource, *, budget_bytes: int | None = None
+) -> Iterator[DoclingPageCache]:
+    """Activate a page cache for `source` for the duration of one job.
+
+    Docling identifies documents by the SHA-256 of their bytes, which is how
+    `CachedDoclingParseBackend` finds the active cache. Concurrent jobs over
+    identical bytes share one cache.
+    """
+    document_hash = pdf_source_sha256(source)
+    with _active_lock:
+        active = _active_caches.get(document_hash)
+        if active is None:
+            budget = budget_bytes if budget_bytes is not None else _page_cache_budget_bytes()
+            active = (DoclingPageCache(budget_bytes=budget), 0)
+        cache, users = active
+        _active_caches[document_hash] = (cache, users + 1)
+    try:
+        yield cache
+    finally:
+        with _active_lock:
+            cache, users = _active_caches[document_hash]
+            if users <= 1:
+                del _active_caches[document_hash]
+            else:
+                _active_caches[document_hash] = (cache, users - 1)
+
+
+def active_page_cache(document_hash: str) -> DoclingPageCache | None:
+    """Return the cache activated for `document_hash`, if any."""
+    with _active_lock:
+        active = _active_caches.get(document_hash)
+    return active[0] if active is not None else None
+
+
+_listeners_lock = threading.Lock()
+_page_listeners: dict[int, Callable[[int, int], None]] = {}
+
+
+@contextmanager
+def docling_pass_source(
+    request: ConversionRequest, *, stage: str
+) -> Iterator[Path | DocumentStream]:
+    """Yield the Docling source for one pass over `request`, reporting per-page progress.
+
+    On-disk uploads are read by path rather than from a memory copy. Docling's
+    PDF pipeline loads each page of the yielded source through
+    `CachedDoclingParseBackend` as the page enters preprocessing, and every
+    newly loaded page reports the pages ahead of it as completed. Once
+    `request` is canceled that report raises inside the pipeline, which fails
+    the remaining pages fast, and the pass ends in `ConversionCanceledError`.
+    """
+    document_source: Path | DocumentStream
+    if isinstance(request.source, Path):
+        document_source = request.source
+        key = id(document_source)
+    else:
+        stream = BytesIO(request.source)
+        document_source = DocumentStream(name=request.source_filename, stream=stream)
+        key = id(stream)
+    lock = threading.Lock()
+    loaded: set[int] = set()
+
+    def _on_page_loaded(page_no: int, page_count: int) -> None:
+        with lock:
+            loaded.add(page_no)
+            pages_completed = len(loaded) - 1
+        request.report_progress(
+            stage=stage, pages_completed=pages_completed, pages_total=page_count
+        )
+
+    with _listeners_lock:
+        _page_listeners[key] = _on_page_loaded
+    try:
+        yield document_source
+    except Exception as exc:
+        if isinstance(exc, ConversionCanceledError) or not _canceled(request):
+            raise
+        raise ConversionCanceledError("conversion canceled during a Docling pass") from exc
+    else:
+        if _canceled(request):
+            raise ConversionCanceledError("conversion canceled during a Docling pass")
+    finally:
+        with _listeners_lock:
+            _page_listeners.pop(key, None)
+
+
+def _canceled(request: ConversionRequest) -> bool:
+    return request.cancel is not None and request.cancel.canceled
+
+
+class _CachedPageBackend(DoclingParseV4PageBackend):
+    """docling-parse page backend that resolves parses and renders through a job cache."""
+
+    def __init__(
+        self,
+        *,
+        cache: DoclingPageCache,
+        dp_doc: PdfDocument,
+        page_obj: PdfPage,
+        page_no: int,
+        create_words: bool,
+        create_textlines: bool,
+    ) -> None:
+        super().__init__(
+            dp_doc=dp_doc,
+            page_obj=page_obj,
+            page_no=page_no,
+            create_words=create_words,
+            create_textlines=create_textlines,
+        )
+        self._cache = cache
+
+    def _ensure_parsed(self) -> None:
+        if self._dpage is not None:
+            return
+        self._dpage = self._cache.segmented_page(
+            ("page", self._page_no, self._create_words, self._create_textlines),
+            self._parse_uncached,
+        )
+
+    def _parse_uncached(self) -> SegmentedPdfPage:
+        super()._ensure_parsed()
+        assert self._dpage is not None
+        return self._dpage
+
+    def get_page_image(self, scale: float = 1, cropbox: BoundingBox | None = None) -> Image:
+        cropbox_key = None if cropbox is None else cropbox.model_dump_json()
+        return self._cache.page_image(
+            ("image", self._page_no, scale, cropbox_key),
+            partial(DoclingParseV4PageBackend.get_page_image, self, scale, cropbox),
+        )
+
+
+class CachedDoclingParseBackend(DoclingParseV4DocumentBackend):
+    """Default docling-parse PDF backend, routed through the active job page cache.
+
+    Page loads are also reported to the pass registered for this document's
+    source with `docling_pass_source`.
+    """
+
+    def load_page(
+        self, page_no: int, create_words: bool = True, create_textlines: bool = True
+    ) -> DoclingParseV4PageBackend:
+        with _listeners_lock:
+            listener = _page_listeners.get(id(self.path_or_stream))
+        if listener is not None:
+            listener(page_no, self.page_count())
+        cache = active_page_cache(self.document_hash)
+        if cache is None:
+            return super().load_page(
+                page_no, create_words=create_words, create_textlines=create_textlines
+            )
+        with pypdfium2_lock:
+            page_obj = self._pdoc[page_no]
+        return _CachedPageBackend(
+            cache=cache,
+            dp_doc=self.dp_doc,
+            page_obj=page_obj,
+            page_no=page_no,
+            create_words=create_words,
+            create_textlines=create_textlines,
+        )
+
+
+__all__ = [
+    "DEFAULT_PAGE_CACHE_BUDGET_MB",
+    "DOCLING_PAGE_CACHE_BUDGET_MB_ENV_VAR",
+    "CachedDoclingParseBackend",
+    "DoclingPageCache",
+    "active_page_cache",
+    "docling_pass_source",
+    "job_page_cache",
+]
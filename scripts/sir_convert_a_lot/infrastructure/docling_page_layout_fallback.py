@@ -0,0 +1,165 @@
+"""Per-page layout-model fallback for the Docling ordering quality gate.
+
+Purpose:
+    When the primary layout model fails the ordering gate, attribute the
+    failing signals to pages, reconvert only those pages with each fallback
+    layout model, and choose per page the layout whose page gives the best
+    whole-document ordering score. Exam-like PDFs then pay for a few pages
+    per fallback model instead of full reconversions.
+
+Relationships:
+    - Hooked into `infrastructure.docling_ordering_fallback.convert_with_layout_fallback`
+      by `infrastructure.docling_backend`.
+    - Page attribution and scoring come from `infrastructure.docling_ordering`
+      and `select_best_ordering_attempt`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Protocol, TypeVar
+
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import PdfSource
+from scripts.sir_convert_a_lot.infrastructure.docling_ordering import (
+    OrderingQualityReport,
+    attribute_ordering_failures,
+    evaluate_docling_ordering_quality,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_ordering_fallback import (
+    select_best_ordering_attempt,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_page_ocr import (
+    export_pages_markdown,
+    merge_document_pages,
+    splice_document_pages,
+)
+from scripts.sir_convert_a_lot.infrastructure.pdf_inspection import extract_pdf_pages
+
+
+class PageLayoutAttempt(Protocol):
+    """Subset of the Docling attempt consumed by per-page layout fallback."""
+
+    @property
+    def page_count(self) -> int: ...
+
+    @property
+    def document(self) -> object | None: ...
+
+
+AttemptT = TypeVar("AttemptT", bound=PageLayoutAttempt)
+
+
+@dataclass(frozen=True)
+class _PageCandidate:
+    layout_model_key: str
+    ordering_quality: OrderingQualityReport | None
+    ordering_retry_applied: bool = False
+
+
+def select_page_layouts(
+    *,
+    page_markdowns: Sequence[str],
+    primary_layout_key: str,
+    fallback_pages: Sequence[tuple[str, Mapping[int, str]]],
+) -> dict[int, str]:
+    """Return `{page_index: layout_model_key}` for pages whose fallback markdown wins.
+
+    Pages are decided in ascending order. For each page the current choice and
+    every fallback rendering of that page are scored on the whole document with
+    `select_best_ordering_attempt`, so ties keep the current choice and earlier
+    fallback models win over later ones.
+    """
+    current = list(page_markdowns)
+    chosen: dict[int, str] = {}
+    rerun_pages = sorted({page for _key, pages in fallback_pages for page in pages})
+    for page in rerun_pages:
+        options: list[tuple[_PageCandidate, str]] = [
+            (_page_candidate(chosen.get(page, primary_layout_key), current), current[page])
+        ]
+        for layout_model_key, pages in fallback_pages:
+            if page not in pages:
+                continue
+            trial = [*current[:page], pages[page], *current[page + 1 :]]
+            options.append((_page_candidate(layout_model_key, trial), pages[page]))
+        best = select_best_ordering_attempt([candidate for candidate, _ in options])
+        if best is options[0][0]:
+            continue
+        current[page] = next(markdown for candidate, markdown in options if candidate is best)
+        chosen[page] = best.layout_model_key
+    return chosen
+
+
+def rerun_failing_pages(
+    primary: AttemptT,
+    *,
+    source: PdfSource,
+    primary_layout_key: str,
+    fallback_layout_keys: Sequence[str],
+    convert_pages: Callable[[bytes, str], AttemptT],
+    with_pages: Callable[[AttemptT, object, str], AttemptT],
+) -> AttemptT | None:
+    """Reconvert only the pages failing the ordering gate with each fallback layout.
+
+    `convert_pages(pdf_bytes, layout_model_key)` converts a sub-PDF holding the
+    failing pages. Returns the primary attempt unchanged when no fallback page
+    wins, and `with_pages(primary, document, markdown)` when some do, where
+    `document` is a copy of the primary document with the winning pages
+    spliced in and `markdown` its stitched export. Returns None when failures
+    cannot be pinned to a strict subset of pages, in which case the caller
+    reconverts whole documents.
+    """
+    document = primary.document
+    if document is None or primary.page_count < 2:
+        return None
+    page_markdowns = [
+        export_pages_markdown(document, {page + 1}) for page in range(primary.page_count)
+    ]
+    failing = attribute_ordering_failures(page_markdowns)
+    if not failing or len(failing) >= primary.page_count:
+        return None
+
+    pages_pdf = extract_pdf_pages(source, failing)
+    fallback_documents: dict[str, object] = {}
+    fallback_pages: list[tuple[str, Mapping[int, str]]] = []
+    for layout_model_key in fallback_layout_keys:
+        fallback_document = convert_pages(pages_pdf, layout_model_key).document
+        if fallback_document is None:
+            continue
+        fallback_documents[layout_model_key] = fallback_document
+        fallback_pages.append(
+            (
+                layout_model_key,
+                {
+                    page: export_pages_markdown(fallback_document, {position + 1})
+                    for position, page in enumerate(failing)
+                },
+            )
+        )
+    chosen = select_page_layouts(
+        page_markdowns=page_markdowns,
+        primary_layout_key=primary_layout_key,
+        fallback_pages=fallback_pages,
+    )
+    if not chosen:
+        return primary
+    position_by_page = {page: position for position, page in enumerate(failing)}
+    page_sources = [
+        (fallback_documents[chosen[page]], position_by_page[page] + 1)
+        if page in chosen
+        else (document, page + 1)
+        for page in range(primary.page_count)
+    ]
+    return with_pages(
+        primary, splice_document_pages(page_sources), merge_document_pages(page_sources)
+    )
+
+
+def _page_candidate(layout_model_key: str, page_markdowns: Sequence[str]) -> _PageCandidate:
+    return _PageCandidate(
+        layout_model_key=layout_model_key,
+        ordering_quality=evaluate_docling_ordering_quality("\n\n".join(page_markdowns)),
+    )
+
+
+__all__ = ["PageLayoutAttempt", "rerun_failing_pages", "select_page_layouts"]
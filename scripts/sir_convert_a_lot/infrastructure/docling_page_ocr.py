@@ -0,0 +1,267 @@
+"""Per-page OCR planning and merging for Docling AUTO OCR mode.
+
+Purpose:
+    Decide which pages of a first (non-OCR) Docling pass need OCR, and splice
+    the markdown of an OCR pass over just those pages back into the
+    first-pass document in page order, so one scanned appendix does not force
+    OCR over an otherwise born-digital paper.
+
+Relationships:
+    - `convert_auto_ocr` drives `OcrMode.AUTO` for
+      `infrastructure.docling_backend.DoclingConversionBackend`.
+    - Page text-layer analysis comes from `infrastructure.pdf_inspection`;
+      cross-page joins reuse `infrastructure.page_sharding`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import replace
+from typing import Protocol, TypeVar
+
+from docling_core.transforms.serializer.markdown import MarkdownDocSerializer, MarkdownParams
+from docling_core.types.doc.document import (
+    DEFAULT_CONTENT_LAYERS,
+    DOCUMENT_TOKENS_EXPORT_LABELS,
+    DoclingDocument,
+)
+
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
+    ConversionRequest,
+    PdfSource,
+)
+from scripts.sir_convert_a_lot.infrastructure.page_sharding import stitch_shard_markdown
+from scripts.sir_convert_a_lot.infrastructure.pdf_inspection import (
+    extract_pdf_pages,
+    pages_lacking_text_layer,
+)
+
+AUTO_OCR_PAGES_WARNING_PREFIX = "docling_auto_ocr_pages_applied:"
+AUTO_OCR_RETRY_WARNING = "docling_auto_ocr_retry_applied"
+
+
+class PageOcrAttempt(Protocol):
+    """Subset of the Docling attempt consumed by page OCR planning."""
+
+    @property
+    def page_count(self) -> int: ...
+
+    @property
+    def low_confidence(self) -> bool: ...
+
+    @property
+    def low_confidence_pages(self) -> frozenset[int]: ...
+
+    @property
+    def document(self) -> object | None: ...
+
+    @property
+    def markdown_content(self) -> str: ...
+
+
+AttemptT = TypeVar("AttemptT", bound=PageOcrAttempt)
+
+
+def is_low_confidence_result(result: object, *, low_grades: set[str]) -> bool:
+    """Return true when Docling graded the whole document with one of `low_grades`."""
+    confidence = getattr(result, "confidence", None)
+    low_grade = getattr(confidence, "low_grade", None)
+    if low_grade is None:
+        return False
+    return str(getattr(low_grade, "value", low_grade)).lower() in low_grades
+
+
+def low_confidence_page_indexes(result: object, *, low_grades: set[str]) -> frozenset[int]:
+    """Return zero-based indexes of pages whose Docling confidence grade is in `low_grades`."""
+    confidence = getattr(result, "confidence", None)
+    pages = getattr(confidence, "pages", None)
+    if not isinstance(pages, dict):
+        return frozenset()
+    indexes: set[int] = set()
+    for page_index, scores in pages.items():
+        grade = getattr(scores, "low_grade", None)
+        grade_value = str(getattr(grade, "value", grade)).lower()
+        if grade_value in low_grades:
+            indexes.add(int(page_index))
+    return frozenset(indexes)
+
+
+def plan_page_ocr(source: PdfSource, first: PageOcrAttempt, *, min_chars: int) -> list[int] | None:
+    """Return sorted zero-based pages that need OCR, or None when pages cannot be told apart.
+
+    Pages qualify when PyMuPDF finds no usable text layer on them or Docling
+    graded them low-confidence. None means the caller should fall back to a
+    whole-document decision: the PDF could not be analysed, the first pass
+    kept no document to splice into, or Docling flagged the document as
+    low-confidence without saying which pages.
+    """
+    if first.document is None:
+        return None
+    if first.low_confidence and not first.low_confidence_pages:
+        return None
+    lacking = pages_lacking_text_layer(source, min_chars=min_chars)
+    if lacking is None:
+        return None
+    return sorted(
+        index for index in set(lacking) | first.low_confidence_pages if index < first.page_count
+    )
+
+
+def export_pages_markdown(document: object, page_numbers: set[int]) -> str:
+    """Export markdown of one-based `page_numbers` with the backend's export options."""
+    if not isinstance(document, DoclingDocument):
+        raise TypeError(f"expected DoclingDocument, got {type(document).__name__}")
+    serializer = MarkdownDocSerializer(
+        doc=document,
+        params=MarkdownParams(
+            labels=DOCUMENT_TOKENS_EXPORT_LABELS,
+            layers=DEFAULT_CONTENT_LAYERS,
+            pages=page_numbers,
+            escape_html=False,
+            compact_tables=True,
+        ),
+    )
+    return serializer.serialize().text
+
+
+def merge_document_pages(page_sources: Sequence[tuple[object, int]]) -> str:
+    """Export and stitch output pages, each taken from `(document, one-based page_no)`.
+
+    Consecutive pages of the same document are exported together so
+    constructs spanning them serialize as usual; boundaries between sources
+    are joined with the shard stitching rules.
+    """
+    return stitch_shard_markdown(
+        [export_pages_markdown(document, pages) for document, pages in _page_runs(page_sources)]
+    )
+
+
+def splice_document_pages(page_sources: Sequence[tuple[object, int]]) -> DoclingDocument:
+    """Build one document from output pages, each taken from `(document, one-based page_no)`.
+
+    Pages are renumbered consecutively from 1, so the result lines up with
+    the source PDF when every source page is covered in order.
+    """
+    parts: list[DoclingDocument] = []
+    for document, pages in _page_runs(page_sources):
+        if not isinstance(document, DoclingDocument):
+            raise TypeError(f"expected DoclingDocument, got {type(document).__name__}")
+        parts.append(document.filter(page_nrs=pages))
+    return DoclingDocument.concatenate(parts)
+
+
+def _page_runs(page_sources: Sequence[tuple[object, int]]) -> list[tuple[object, set[int]]]:
+    runs: list[tuple[object, set[int]]] = []
+    previous_page_no = 0
+    for document, page_no in page_sources:
+        if not runs or document is not runs[-1][0] or page_no != previous_page_no + 1:
+            runs.append((document, set()))
+        runs[-1][1].add(page_no)
+        previous_page_no = page_no
+    return runs
+
+
+def merge_ocr_pages(
+    *,
+    text_document: object | None,
+    ocr_document: object | None,
+    ocr_page_indexes: Sequence[int],
+    page_count: int,
+) -> str | None:
+    """Splice OCR pages into the first-pass document and return the stitched markdown.
+
+    `ocr_document` holds only the OCR'd pages, in the order of
+    `ocr_page_indexes`. Returns None when either pass kept no Docling
+    document to splice, so the caller can OCR the whole document instead.
+    """
+    if not isinstance(text_document, DoclingDocument) or not isinstance(
+        ocr_document, DoclingDocument
+    ):
+        return None
+    ocr_position = {page_index: position for position, page_index in enumerate(ocr_page_indexes)}
+    return merge_document_pages(
+        [
+            (ocr_document, ocr_position[index] + 1)
+            if index in ocr_position
+            else (text_document, index + 1)
+            for index in range(page_count)
+        ]
+    )
+
+
+def convert_auto_ocr(
+    request: ConversionRequest,
+    *,
+    convert_pass: Callable[[ConversionRequest, bool], tuple[AttemptT, list[str], dict[str, int]]],
+    with_markdown: Callable[[AttemptT, str], AttemptT],
+    min_chars_per_page: float,
+    skip_text_pass: bool = False,
+) -> tuple[AttemptT, list[str], dict[str, int], bool]:
+    """Run the text-layer pass, then OCR only the pages that lack usable text.
+
+    `convert_pass(request, ocr_enabled)` runs one guarded Docling pass. Falls
+    back to one whole-document OCR retry when every page needs OCR, the
+    pages cannot be told apart, or the OCR pages cannot be spliced back.
+    `skip_text_pass` OCRs the whole document up front for PDFs already known
+    to be scanned. Returns the attempt, warnings, phase timings and whether
+    OCR ran.
+    """
+    if skip_text_pass:
+        return (*convert_pass(request, True), True)
+    first, warnings, phase_timings_ms = convert_pass(request, False)
+    phase_timings_ms = dict(phase_timings_ms)
+    ocr_pages = plan_page_ocr(request.source, first, min_chars=int(min_chars_per_page))
+    if ocr_pages is None:
+        stripped = first.markdown_content.strip()
+        chars_per_page = len(stripped) / max(1, first.page_count)
+        sparse_or_unsure = (
+            len(stripped) == 0 or chars_per_page < min_chars_per_page or first.low_confidence
+        )
+        ocr_pages = list(range(first.page_count)) if sparse_or_unsure else []
+    if not ocr_pages:
+        return first, warnings, phase_timings_ms, False
+
+    def ocr_pass(ocr_request: ConversionRequest) -> AttemptT:
+        ocr_attempt, ocr_warnings, ocr_timings = convert_pass(ocr_request, True)
+        warnings.extend(ocr_warnings)
+        for key, value in ocr_timings.items():
+            phase_timings_ms[key] = phase_timings_ms.get(key, 0) + value
+        return ocr_attempt
+
+    if len(ocr_pages) < first.page_count:
+        ocr_attempt = ocr_pass(
+            replace(request, source=extract_pdf_pages(request.source, ocr_pages))
+        )
+        markdown_content = merge_ocr_pages(
+            text_document=first.document,
+            ocr_document=ocr_attempt.document,
+            ocr_page_indexes=ocr_pages,
+            page_count=first.page_count,
+        )
+        if markdown_content is not None:
+            warnings.append(page_ocr_warning(ocr_pages))
+            return with_markdown(first, markdown_content), warnings, phase_timings_ms, True
+    ocr_attempt = ocr_pass(request)
+    warnings.append(AUTO_OCR_RETRY_WARNING)
+    return ocr_attempt, warnings, phase_timings_ms, True
+
+
+def page_ocr_warning(ocr_page_indexes: Sequence[int]) -> str:
+    """Return the warning listing OCR'd pages as one-based page numbers."""
+    return AUTO_OCR_PAGES_WARNING_PREFIX + ",".join(str(index + 1) for index in ocr_page_indexes)
+
+
+__all__ = [
+    "AUTO_OCR_PAGES_WARNING_PREFIX",
+    "AUTO_OCR_RETRY_WARNING",
+    "PageOcrAttempt",
+    "convert_auto_ocr",
+    "export_pages_markdown",
+    "is_low_confidence_result",
+    "low_confidence_page_indexes",
+    "merge_document_pages",
+    "merge_ocr_pages",
+    "page_ocr_warning",
+    "plan_page_ocr",
+    "splice_document_pages",
+]
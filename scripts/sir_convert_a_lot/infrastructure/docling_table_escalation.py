@@ -0,0 +1,231 @@
+"""Per-table TableFormer escalation for the adaptive table mode.
+
+Purpose:
+    Run Docling with the FAST TableFormer model first, then decide per table
+    whether its structure warrants the ACCURATE model: merged cells, large
+    grids, or a grid that looks poorly recovered. Only the pages holding
+    escalated tables are reconverted with ACCURATE, and their table data is
+    spliced into a copy of the FAST document.
+
+Relationships:
+    - Hooked into `infrastructure.docling_backend` after the first layout pass
+      when the request uses `TableMode.ADAPTIVE`.
+    - Sub-PDF extraction comes from `infrastructure.pdf_inspection`.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Protocol, TypeVar
+
+from docling_core.types.doc import BoundingBox
+from docling_core.types.doc.document import DoclingDocument, TableItem
+
+from scripts.sir_convert_a_lot.domain.specs import TableMode
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import PdfSource
+from scripts.sir_convert_a_lot.infrastructure.pdf_inspection import extract_pdf_pages
+
+REASON_MERGED_CELLS = "merged_cells"
+REASON_CELL_COUNT = "cell_count"
+REASON_LOW_STRUCTURE_CONFIDENCE = "low_structure_confidence"
+
+TABLE_ESCALATED_WARNING_PREFIX = "docling_table_escalated_to_accurate:"
+TABLE_ESCALATION_UNMATCHED_WARNING_PREFIX = "docling_table_escalation_unmatched:"
+TABLE_KEPT_FAST_WARNING_PREFIX = "docling_table_adaptive_kept_fast:"
+
+_ESCALATION_CELL_COUNT = 60
+_MIN_GRID_COVERAGE = 0.9
+_MAX_EMPTY_CELL_RATIO = 0.4
+_MIN_MATCH_IOU = 0.5
+
+
+class TableEscalationAttempt(Protocol):
+    """Subset of the Docling attempt consumed by table escalation."""
+
+    @property
+    def document(self) -> object | None: ...
+
+
+AttemptT = TypeVar("AttemptT", bound=TableEscalationAttempt)
+
+
+@dataclass(frozen=True)
+class TableDecision:
+    """Adaptive-mode verdict for one table of the FAST pass."""
+
+    table_index: int
+    page_no: int
+    cell_count: int
+    reason: str | None
+    escalated: bool = False
+
+    def warning(self) -> str:
+        """Return the job warning recording an escalation attempt for this table."""
+        prefix = (
+            TABLE_ESCALATED_WARNING_PREFIX
+            if self.escalated
+            else TABLE_ESCALATION_UNMATCHED_WARNING_PREFIX
+        )
+        return (
+            f"{prefix}page={self.page_no},table={self.table_index},"
+            f"reason={self.reason},cells={self.cell_count}"
+        )
+
+
+def first_pass_table_mode(table_mode: TableMode) -> TableMode:
+    """Return the TableFormer mode of the first Docling pass for `table_mode`."""
+    return TableMode.FAST if table_mode == TableMode.ADAPTIVE else table_mode
+
+
+def escalation_reason(table: TableItem) -> str | None:
+    """Return why `table` should be rerun with ACCURATE TableFormer, or None.
+
+    TableFormer exposes no per-table confidence, so grid coverage (cell spans
+    covering the declared grid once) and the empty-cell ratio stand in for
+    structure confidence.
+    """
+    data = table.data
+    grid_size = data.num_rows * data.num_cols
+    cells = data.table_cells
+    if grid_size == 0 or not cells:
+        return None
+    if any(cell.row_span > 1 or cell.col_span > 1 for cell in cells):
+        return REASON_MERGED_CELLS
+    if grid_size >= _ESCALATION_CELL_COUNT:
+        return REASON_CELL_COUNT
+    coverage = sum(cell.row_span * cell.col_span for cell in cells) / grid_size
+    empty_ratio = sum(1 for cell in cells if not cell.text.strip()) / len(cells)
+    if not _MIN_GRID_COVERAGE <= coverage <= 1.0 or empty_ratio >= _MAX_EMPTY_CELL_RATIO:
+        return REASON_LOW_STRUCTURE_CONFIDENCE
+    return None
+
+
+def decide_tables(document: DoclingDocument) -> list[TableDecision]:
+    """Return one decision per provenanced table of `document`, in document order."""
+    decisions: list[TableDecision] = []
+    for index, table in enumerate(document.tables):
+        if not table.prov:
+            continue
+        decisions.append(
+            TableDecision(
+                table_index=index,
+                page_no=table.prov[0].page_no,
+                cell_count=table.data.num_rows * table.data.num_cols,
+                reason=escalation_reason(table),
+            )
+        )
+    return decisions
+
+
+def escalate_adaptive_tables(
+    attempt: AttemptT,
+    *,
+    source: PdfSource,
+    convert_pages: Callable[[bytes], AttemptT],
+    with_document: Callable[[AttemptT, DoclingDocument], AttemptT],
+) -> tuple[AttemptT, tuple[TableDecision, ...], int | None]:
+    """Rerun tables that need it with ACCURATE TableFormer and splice the results.
+
+    `convert_pages(pdf_bytes)` converts a sub-PDF with ACCURATE TableFormer;
+    `with_document` rebuilds the attempt around the spliced document. Returns
+    the attempt, every table decision, and the escalation time in ms (None
+    when no table was escalated).
+    """
+    document = attempt.document
+    if not isinstance(document, DoclingDocument):
+        return attempt, (), None
+    decisions = decide_tables(document)
+    pages = sorted({decision.page_no for decision in decisions if decision.reason is not None})
+    if not pages:
+        return attempt, tuple(decisions), None
+
+    started = time.perf_counter()
+    accurate = convert_pages(extract_pdf_pages(source, [page - 1 for page in pages]))
+    accurate_document = accurate.document
+    spliced = document.model_copy(deep=True)
+    resolved: list[TableDecision] = []
+    for decision in decisions:
+        replacement = None
+        if decision.reason is not None and isinstance(accurate_document, DoclingDocument):
+            replacement = _matching_table(
+                spliced.tables[decision.table_index],
+                page_no=decision.page_no,
+                sub_page_no=pages.index(decision.page_no) + 1,
+                document=spliced,
+                candidates=accurate_document,
+            )
+        if replacement is not None:
+            spliced.tables[decision.table_index].data = replacement.data.model_copy(deep=True)
+            decision = TableDecision(
+                table_index=decision.table_index,
+                page_no=decision.page_no,
+                cell_count=replacement.data.num_rows * replacement.data.num_cols,
+                reason=decision.reason,
+                escalated=True,
+            )
+        resolved.append(decision)
+    elapsed_ms = int((time.perf_counter() - started) * 1000)
+    if not any(decision.escalated for decision in resolved):
+        return attempt, tuple(resolved), elapsed_ms
+    return with_document(attempt, spliced), tuple(resolved), elapsed_ms
+
+
+def table_decision_warnings(decisions: Sequence[TableDecision]) -> list[str]:
+    """Return job warnings summarising adaptive table decisions."""
+    if not decisions:
+        return []
+    warnings = [decision.warning() for decision in decisions if decision.reason is not None]
+    kept_fast = sum(1 for decision in decisions if decision.reason is None)
+    return [*warnings, f"{TABLE_KEPT_FAST_WARNING_PREFIX}{kept_fast}"]
+
+
+def _matching_table(
+    table: TableItem,
+    *,
+    page_no: int,
+    sub_page_no: int,
+    document: DoclingDocument,
+    candidates: DoclingDocument,
+) -> TableItem | None:
+    bbox = _top_left_bbox(table, document=document, page_no=page_no)
+    if bbox is None:
+        return None
+    best: tuple[float, TableItem] | None = None
+    for candidate in candidates.tables:
+        if not candidate.prov or candidate.prov[0].page_no != sub_page_no:
+            continue
+        candidate_bbox = _top_left_bbox(candidate, document=candidates, page_no=sub_page_no)
+        if candidate_bbox is None:
+            continue
+        overlap = bbox.intersection_over_union(candidate_bbox)
+        if overlap >= _MIN_MATCH_IOU and (best is None or overlap > best[0]):
+            best = (overlap, candidate)
+    return best[1] if best is not None else None
+
+
+def _top_left_bbox(
+    table: TableItem, *, document: DoclingDocument, page_no: int
+) -> BoundingBox | None:
+    page = document.pages.get(page_no)
+    if page is None:
+        return None
+    return table.prov[0].bbox.to_top_left_origin(page.size.height)
+
+
+__all__ = [
+    "REASON_CELL_COUNT",
+    "REASON_LOW_STRUCTURE_CONFIDENCE",
+    "REASON_MERGED_CELLS",
+    "TABLE_ESCALATED_WARNING_PREFIX",
+    "TABLE_ESCALATION_UNMATCHED_WARNING_PREFIX",
+    "TABLE_KEPT_FAST_WARNING_PREFIX",
+    "TableDecision",
+    "TableEscalationAttempt",
+    "decide_tables",
+    "escalate_adaptive_tables",
+    "escalation_reason",
+    "first_pass_table_mode",
+    "table_decision_warnings",
+]
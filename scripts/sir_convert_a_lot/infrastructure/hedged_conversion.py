@@ -0,0 +1,220 @@
+"""Hedged PyMuPDF/Docling conversion for latency-sensitive jobs.
+
+Purpose:
+    Race a cheap CPU PyMuPDF conversion against Docling. When the PyMuPDF
+    markdown passes the markdown quality report and the ordering checks, the
+    job completes with it and the Docling attempt is canceled; otherwise the
+    job waits for Docling. PyMuPDF runs in-process so it never queues behind
+    Docling for a conversion worker. Cancellation goes through the attempt's
+    `CancelToken`: an in-process Docling attempt stops at its next progress
+    checkpoint and a process-isolated one has its worker terminated. The
+    Docling thread is joined before the hedge returns, and no wait on it
+    outlasts the job's document timeout.
+
+Relationships:
+    - Used by `infrastructure.runtime_conversion.execute_job_conversion` for
+      HIGH priority `backend_strategy=auto` jobs when
+      `ServiceConfig.hedged_high_priority` is enabled.
+    - Acceptance reuses `infrastructure.markdown_quality_report` and
+      `infrastructure.docling_ordering`.
+    - Outcome counters are exported by `interfaces.http_metrics`.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import replace
+
+from scripts.sir_convert_a_lot.domain.specs import BackendStrategy, OcrMode
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
+    BackendExecutionError,
+    BackendInputError,
+    CancelToken,
+    ConversionBackend,
+    ConversionCanceledError,
+    ConversionRequest,
+    ConversionResultData,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_ordering import (
+    evaluate_docling_ordering_quality,
+)
+from scripts.sir_convert_a_lot.infrastructure.markdown_quality_report import (
+    build_markdown_quality_report,
+)
+from scripts.sir_convert_a_lot.infrastructure.pdf_inspection import pdf_page_count
+
+HEDGE_WARNING_PREFIX = "hedged_conversion_winner:"
+WINNER_PYMUPDF = "pymupdf"
+WINNER_DOCLING = "docling"
+REASON_ACCEPTED = "accepted"
+REASON_PYMUPDF_FAILED = "pymupdf_failed"
+REASON_SPARSE_OUTPUT = "sparse_output"
+REASON_RESERVED_TOKENS = "reserved_tokens"
+REASON_EXTREME_LINES = "extreme_lines"
+REASON_ORDERING = "ordering_check_failed"
+REASON_DOCLING_FINISHED_FIRST = "docling_finished_first"
+
+_MIN_CHARS_PER_PAGE = 100
+
+
+def pymupdf_rejection_reason(markdown_content: str, *, page_count: int) -> str | None:
+    """Return why a PyMuPDF result cannot stand in for Docling, or None to accept it.
+
+    Sparse output (under 100 characters per page) usually means scanned
+    pages without a text layer.
+    """
+    if len(markdown_content.strip()) < _MIN_CHARS_PER_PAGE * max(1, page_count):
+        return REASON_SPARSE_OUTPUT
+    report = build_markdown_quality_report(markdown_content)
+    if report.reserved_token_count > 0:
+        return REASON_RESERVED_TOKENS
+    if report.lines_gt_1000 > 0:
+        return REASON_EXTREME_LINES
+    if not evaluate_docling_ordering_quality(markdown_content).passes:
+        return REASON_ORDERING
+    return None
+
+
+def hedge_warning(winner: str, reason: str) -> str:
+    """Return the job warning recording which hedged candidate won and why."""
+    return f"{HEDGE_WARNING_PREFIX}{winner},reason={reason}"
+
+
+def pymupdf_won_hedge(warnings: list[str]) -> bool:
+    """Return True when a job's warnings record a hedge won by PyMuPDF."""
+    winner_prefix = f"{HEDGE_WARNING_PREFIX}{WINNER_PYMUPDF},"
+    return any(warning.startswith(winner_prefix) for warning in warnings)
+
+
+def convert_hedged(
+    request: ConversionRequest,
+    *,
+    docling_backend: ConversionBackend,
+    pymupdf_backend: ConversionBackend,
+    stats: HedgedConversionStats | None = None,
+    timeout_seconds: float | None = None,
+) -> ConversionResultData:
+    """Race PyMuPDF against Docling and return the accepted candidate.
+
+    Docling runs on a daemon thread under a child of the request's cancel
+    token while `pymupdf_backend`, which should be an in-process backend,
+    converts on the caller's thread. A Docling result that is already
+    complete wins over PyMuPDF. Adds a winner warning and `hedge_pymupdf_ms`;
+    Docling errors are raised only when Docling is the winner.
+
+    `timeout_seconds` is what remains of the job's document timeout. A
+    canceled Docling attempt is joined for at most that long, and a Docling
+    winner that has not finished by then is canceled and reported as
+    `ConversionCanceledError`.
+    """
+    deadline = None if timeout_seconds is None else time.perf_counter() + timeout_seconds
+    docling_cancel = CancelToken(parent=request.cancel)
+    docling_future: Future[ConversionResultData] = Future()
+    docling_request = replace(request, cancel=docling_cancel)
+
+    def _run_docling() -> None:
+        try:
+            docling_future.set_result(docling_backend.convert(docling_request))
+        except BaseException as exc:
+            docling_future.set_exception(exc)
+
+    docling_thread = threading.Thread(target=_run_docling, name="hedged-docling", daemon=True)
+    docling_thread.start()
+
+    started = time.perf_counter()
+    cheap: ConversionResultData | None = None
+    try:
+        cheap = pymupdf_backend.convert(
+            replace(
+                request,
+                backend_strategy=BackendStrategy.PYMUPDF,
+                ocr_mode=OcrMode.OFF,
+                progress=None,
+            )
+        )
+    except (BackendInputError, BackendExecutionError):
+        reason: str | None = REASON_PYMUPDF_FAILED
+    else:
+        page_count = pdf_page_count(request.source) or 1
+        reason = pymupdf_rejection_reason(cheap.markdown_content, page_count=page_count)
+    pymupdf_ms = max(0, int((time.perf_counter() - started) * 1000))
+    if reason is None and docling_future.done() and docling_future.exception() is None:
+        reason = REASON_DOCLING_FINISHED_FIRST
+
+    if cheap is not None and reason is None:
+        docling_cancel.cancel()
+        docling_thread.join(timeout=_remaining_seconds(deadline))
+        winner, result, decision = WINNER_PYMUPDF, cheap, REASON_ACCEPTED
+    else:
+        try:
+            result = docling_future.result(timeout=_remaining_seconds(deadline))
+        except FutureTimeoutError:
+            docling_cancel.cancel()
+            raise ConversionCanceledError(
+                f"hedged Docling attempt exceeded the {timeout_seconds}s document timeout"
+            ) from None
+        finally:
+            if docling_future.done():
+                docling_thread.join()
+        winner, decision = WINNER_DOCLING, reason or REASON_PYMUPDF_FAILED
+    (stats or shared_hedged_conversion_stats()).record(winner=winner, reason=decision)
+    return replace(
+        result,
+        warnings=[*result.warnings, hedge_warning(winner, decision)],
+        phase_timings_ms={**result.phase_timings_ms, "hedge_pymupdf_ms": pymupdf_ms},
+    )
+
+
+def _remaining_seconds(deadline: float | None) -> float | None:
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.perf_counter())
+
+
+class HedgedConversionStats:
+    """Thread-safe process-wide counters of hedged conversion outcomes."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts: dict[tuple[str, str], int] = {}
+
+    def record(self, *, winner: str, reason: str) -> None:
+        """Count one hedged conversion won by `winner` for `reason`."""
+        with self._lock:
+            self._counts[(winner, reason)] = self._counts.get((winner, reason), 0) + 1
+
+    def snapshot(self) -> dict[tuple[str, str], int]:
+        """Return a consistent copy of the counters keyed by `(winner, reason)`."""
+        with self._lock:
+            return dict(self._counts)
+
+
+_SHARED_STATS = HedgedConversionStats()
+
+
+def shared_hedged_conversion_stats() -> HedgedConversionStats:
+    """Return the process-wide hedged conversion counters."""
+    return _SHARED_STATS
+
+
+__all__ = [
+    "HEDGE_WARNING_PREFIX",
+    "REASON_ACCEPTED",
+    "REASON_DOCLING_FINISHED_FIRST",
+    "REASON_EXTREME_LINES",
+    "REASON_ORDERING",
+    "REASON_PYMUPDF_FAILED",
+    "REASON_RESERVED_TOKENS",
+    "REASON_SPARSE_OUTPUT",
+    "WINNER_DOCLING",
+    "WINNER_PYMUPDF",
+    "HedgedConversionStats",
+    "convert_hedged",
+    "hedge_warning",
+    "pymupdf_rejection_reason",
+    "pymupdf_won_hedge",
+    "shared_hedged_conversion_stats",
+]
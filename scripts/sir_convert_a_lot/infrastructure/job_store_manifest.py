@@ -61,6 +61,35 @@ def merge_phase_timings(
     return merged
 
 
+def apply_conversion_progress(
+    payload: dict[str, object],
+    *,
+    stage: str,
+    pages_processed: int,
+    pages_total: int | None,
+    now: datetime,
+) -> None:
+    """Record backend page progress; a new stage restarts the current-phase clock."""
+    stamp = dt_to_rfc3339(now)
+    progress = payload.get("progress")
+    if not isinstance(progress, dict):
+        progress = {}
+        payload["progress"] = progress
+    diagnostics = ensure_diagnostics(payload)
+    if progress.get("stage") != stage:
+        diagnostics["current_phase_started_at"] = stamp
+    progress["stage"] = stage
+    progress["pages_processed"] = pages_processed
+    if pages_total is not None:
+        progress["pages_total"] = pages_total
+    diagnostics["last_heartbeat_at"] = stamp
+    timestamps = payload.get("timestamps")
+    if not isinstance(timestamps, dict):
+        timestamps = {}
+        payload["timestamps"] = timestamps
+    timestamps["updated_at"] = stamp
+
+
 def build_initial_manifest(
     *,
     job_id: str,
@@ -70,6 +99,7 @@ def build_initial_manifest(
     pinned: bool,
     raw_expires_at: datetime,
     artifact_expires_at: datetime,
+    source_sha256: str | None = None,
 ) -> dict[str, object]:
     """Build initial on-disk manifest structure for a newly created job."""
     return {
@@ -77,6 +107,7 @@ def build_initial_manifest(
         "job_spec": spec.model_dump(mode="json"),
         "status": JobStatus.QUEUED.value,
         "source_filename": source_filename,
+        "source_sha256": source_sha256,
         "progress": {"stage": "queued", "pages_total": None, "pages_processed": None},
         "timestamps": {
             "created_at": dt_to_rfc3339(now),
@@ -143,6 +174,7 @@ def parse_stored_job_record(
     source_filename = payload.get("source_filename")
     if not isinstance(source_filename, str) or source_filename.strip() == "":
         raise ValueError(f"manifest missing source_filename: {manifest_path}")
+    source_sha256_obj = payload.get("source_sha256")
 
     progress = payload.get("progress")
     if not isinstance(progress, dict):
@@ -159,6 +191,9 @@ def parse_stored_job_record(
     last_heartbeat_at = dt_from_rfc3339(diagnostics_obj.get("last_heartbeat_at"))
     current_phase_started_at = dt_from_rfc3339(diagnostics_obj.get("current_phase_started_at"))
     phase_timings_ms = parse_phase_timings(diagnostics_obj)
+    cache_hit = diagnostics_obj.get("cache_hit") is True
+    coalesced_with_obj = diagnostics_obj.get("coalesced_with_job_id")
+    coalesced_with_job_id = coalesced_with_obj if isinstance(coalesced_with_obj, str) else None
     if status in {JobStatus.SUCCEEDED, JobStatus.FAILED} and "persist_ms" not in phase_timings_ms:
         phase_timings_ms["persist_ms"] = 0
 
@@ -172,6 +207,11 @@ def parse_stored_job_record(
     acceleration_used: str | None = None
     ocr_enabled: bool | None = None
     options_fingerprint: str | None = None
+    formula_enrichment_used: bool | None = None
+    ocr_languages: list[str] | None = None
+    backend_route_reasons: list[str] | None = None
+    preclassification_labels: list[str] | None = None
+    preclassification_hits: dict[str, bool] | None = None
     failure_code: str | None = None
     failure_message: str | None = None
     failure_retryable = False
@@ -199,6 +239,24 @@ def parse_stored_job_record(
             acceleration_used = accel_obj if isinstance(accel_obj, str) else None
             ocr_enabled = ocr_obj if isinstance(ocr_obj, bool) else None
             options_fingerprint = options_obj if isinstance(options_obj, str) else None
+            formula_obj = meta_obj.get("formula_enrichment_used")
+            formula_enrichment_used = formula_obj if isinstance(formula_obj, bool) else None
+            languages_obj = meta_obj.get("ocr_languages")
+            if isinstance(languages_obj, list):
+                ocr_languages = [item for item in languages_obj if isinstance(item, str)]
+            route_obj = meta_obj.get("backend_route_reasons")
+            if isinstance(route_obj, list):
+                backend_route_reasons = [item for item in route_obj if isinstance(item, str)]
+            labels_obj = meta_obj.get("preclassification_labels")
+            if isinstance(labels_obj, list):
+                preclassification_labels = [item for item in labels_obj if isinstance(item, str)]
+            hits_obj = meta_obj.get("preclassification_hits")
+            if isinstance(hits_obj, dict):
+                preclassification_hits = {
+                    label: hit
+                    for label, hit in hits_obj.items()
+                    if isinstance(label, str) and isinstance(hit, bool)
+                }
 
     if isinstance(error_obj, dict):
         code_obj = error_obj.get("code")
@@ -240,4 +298,12 @@ def parse_stored_job_record(
         failure_message=failure_message,
         failure_retryable=failure_retryable,
         failure_details=failure_details,
+        cache_hit=cache_hit,
+        coalesced_with_job_id=coalesced_with_job_id,
+        formula_enrichment_used=formula_enrichment_used,
+        ocr_languages=ocr_languages,
+        backend_route_reasons=backend_route_reasons,
+        preclassification_labels=preclassification_labels,
+        preclassification_hits=preclassification_hits,
+        source_sha256=source_sha256_obj if isinstance(source_sha256_obj, str) else None,
     )
@@ -16,7 +16,7 @@ from datetime import datetime
 from pathlib import Path
 
 from scripts.sir_convert_a_lot.domain.specs import JobStatus
-from scripts.sir_convert_a_lot.domain.specs_v2 import JobSpecV2
+from scripts.sir_convert_a_lot.domain.specs_v2 import JobSpecV2, OutputFormatV2
 from scripts.sir_convert_a_lot.infrastructure.filesystem_journal import (
     dt_from_rfc3339,
     dt_to_rfc3339,
@@ -24,6 +24,15 @@ from scripts.sir_convert_a_lot.infrastructure.filesystem_journal import (
 from scripts.sir_convert_a_lot.infrastructure.job_store_models_v2 import StoredJobRecordV2
 
 
+def artifact_content_type(output_format: OutputFormatV2) -> str:
+    """Return the manifest content type recorded for an artifact format."""
+    if output_format == OutputFormatV2.PDF:
+        return "application/pdf"
+    if output_format == OutputFormatV2.DOCX:
+        return "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+    raise AssertionError(f"Unsupported output_format: {output_format}")
+
+
 def ensure_diagnostics(payload: dict[str, object]) -> dict[str, object]:
     """Return diagnostics object, creating an empty one when missing."""
     diagnostics = payload.get("diagnostics")
@@ -63,6 +72,35 @@ def merge_phase_timings(
     return merged
 
 
+def apply_conversion_progress(
+    payload: dict[str, object],
+    *,
+    stage: str,
+    pages_processed: int,
+    pages_total: int | None,
+    now: datetime,
+) -> None:
+    """Record backend page progress; a new stage restarts the current-phase clock."""
+    stamp = dt_to_rfc3339(now)
+    progress = payload.get("progress")
+    if not isinstance(progress, dict):
+        progress = {}
+        payload["progress"] = progress
+    diagnostics = ensure_diagnostics(payload)
+    if progress.get("stage") != stage:
+        diagnostics["current_phase_started_at"] = stamp
+    progress["stage"] = stage
+    progress["pages_processed"] = pages_processed
+    if pages_total is not None:
+        progress["pages_total"] = pages_total
+    diagnostics["last_heartbeat_at"] = stamp
+    timestamps = payload.get("timestamps")
+    if not isinstance(timestamps, dict):
+        timestamps = {}
+        payload["timestamps"] = timestamps
+    timestamps["updated_at"] = stamp
+
+
 def build_initial_manifest(
     *,
     job_id: str,
@@ -150,6 +188,10 @@ def parse_stored_job_record(
         raise ValueError(f"manifest missing progress: {manifest_path}")
     stage_obj = progress.get("stage")
     stage = stage_obj if isinstance(stage_obj, str) else "unknown"
+    pages_total = progress.get("pages_total")
+    pages_processed = progress.get("pages_processed")
+    pages_total_val = pages_total if isinstance(pages_total, int) else None
+    pages_processed_val = pages_processed if isinstance(pages_processed, int) else None
 
     diagnostics = payload.get("diagnostics")
     diagnostics_obj = diagnostics if isinstance(diagnostics, dict) else {}
@@ -239,4 +281,6 @@ def parse_stored_job_record(
         failure_message=failure_message,
         failure_retryable=failure_retryable,
         failure_details=failure_details,
+        pages_total=pages_total_val,
+        pages_processed=pages_processed_val,
     )
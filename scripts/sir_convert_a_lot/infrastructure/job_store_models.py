@@ -51,6 +51,14 @@ class StoredJobRecord:
     failure_message: str | None
     failure_retryable: bool
     failure_details: dict[str, object] | None
+    cache_hit: bool = False
+    coalesced_with_job_id: str | None = None
+    formula_enrichment_used: bool | None = None
+    ocr_languages: list[str] | None = None
+    backend_route_reasons: list[str] | None = None
+    preclassification_labels: list[str] | None = None
+    preclassification_hits: dict[str, bool] | None = None
+    source_sha256: str | None = None
 
     @property
     def expires_at(self) -> datetime | None:
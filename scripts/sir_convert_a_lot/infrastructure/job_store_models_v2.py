@@ -54,6 +54,8 @@ class StoredJobRecordV2:
     failure_message: str | None
     failure_retryable: bool
     failure_details: dict[str, object] | None
+    pages_total: int | None = None
+    pages_processed: int | None = None
 
     @property
     def expires_at(self) -> datetime | None:
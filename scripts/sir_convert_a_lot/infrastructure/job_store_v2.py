@@ -22,11 +22,14 @@ from scripts.sir_convert_a_lot.infrastructure.filesystem_journal import (
     read_json,
     utc_now,
 )
+from scripts.sir_convert_a_lot.infrastructure.job_store_manifest_v2 import apply_conversion_progress
 from scripts.sir_convert_a_lot.infrastructure.job_store_models_v2 import (
     JobExpiredV2,
     JobMissingV2,
+    StoredJobRecordV2,
 )
 from scripts.sir_convert_a_lot.infrastructure.job_store_v2_core import JobStoreV2Core
+from scripts.sir_convert_a_lot.infrastructure.upload_staging import sweep_stale_uploads
 
 
 class JobStoreV2(JobStoreV2Core):
@@ -35,6 +38,42 @@ class JobStoreV2(JobStoreV2Core):
     def list_job_ids(self) -> list[str]:
         return sorted(path.name for path in self.jobs_dir.iterdir() if path.is_dir())
 
+    def list_queued_jobs(self) -> list[StoredJobRecordV2]:
+        """Return all loadable v2 jobs currently in queued state (full scan)."""
+        queued: list[StoredJobRecordV2] = []
+        for job_id in self.list_job_ids():
+            try:
+                record = self.get_job(job_id)
+            except (JobMissingV2, JobExpiredV2):
+                continue
+            if record.status == JobStatus.QUEUED:
+                queued.append(record)
+        return queued
+
+    def report_conversion_progress(
+        self,
+        job_id: str,
+        *,
+        stage: str,
+        pages_processed: int,
+        pages_total: int | None,
+    ) -> bool:
+        """Persist backend page progress for a running job; return False when not running."""
+        manifest_path = self._manifest_path(job_id)
+        with self._job_manifest_lock(job_id):
+            payload = self._read_manifest_locked(job_id)
+            if payload.get("status") != JobStatus.RUNNING.value:
+                return False
+            apply_conversion_progress(
+                payload,
+                stage=stage,
+                pages_processed=pages_processed,
+                pages_total=pages_total,
+                now=utc_now(),
+            )
+            atomic_write_json(manifest_path, payload)
+            return True
+
     def recover_running_jobs_to_queued(self, *, active_job_ids: set[str]) -> list[str]:
         """Convert orphaned running v2 jobs to queued."""
         recovered: list[str] = []
@@ -50,9 +89,36 @@ class JobStoreV2(JobStoreV2Core):
                 recovered.append(job_id)
         return recovered
 
+    def requeue_running_job(self, job_id: str) -> bool:
+        """Return one RUNNING job to QUEUED; False when it already left RUNNING."""
+        manifest_path = self._manifest_path(job_id)
+        with self._job_manifest_lock(job_id):
+            payload = self._read_manifest_locked(job_id)
+            status_obj = payload.get("status")
+            if not isinstance(status_obj, str):
+                raise ValueError(f"manifest missing status for job_id={job_id}")
+            if JobStatus(status_obj) != JobStatus.RUNNING:
+                return False
+
+            payload["status"] = JobStatus.QUEUED.value
+            progress = payload.get("progress")
+            if not isinstance(progress, dict):
+                progress = {}
+                payload["progress"] = progress
+            progress["stage"] = "queued"
+            timestamps = payload.get("timestamps")
+            if not isinstance(timestamps, dict):
+                timestamps = {}
+                payload["timestamps"] = timestamps
+            timestamps["updated_at"] = dt_to_rfc3339(utc_now())
+
+            atomic_write_json(manifest_path, payload)
+            return True
+
     def sweep_expired(self) -> None:
         """Sweep expired v2 jobs and retain tombstones so the API can return job_expired."""
         now = utc_now()
+        sweep_stale_uploads(self.staging_dir, older_than_seconds=self.raw_ttl_seconds)
 
         tombstone_ttl = timedelta(seconds=self.tombstone_ttl_seconds)
         for tombstone in self.expired_dir.glob("*.json"):
@@ -30,6 +30,7 @@ from scripts.sir_convert_a_lot.infrastructure.filesystem_journal import (
     utc_now,
 )
 from scripts.sir_convert_a_lot.infrastructure.job_store_manifest_v2 import (
+    artifact_content_type,
     build_initial_manifest,
     ensure_diagnostics,
     merge_phase_timings,
@@ -41,14 +42,7 @@ from scripts.sir_convert_a_lot.infrastructure.job_store_models_v2 import (
     JobStateConflictV2,
     StoredJobRecordV2,
 )
-
-
-def _artifact_content_type(output_format: OutputFormatV2) -> str:
-    if output_format == OutputFormatV2.PDF:
-        return "application/pdf"
-    if output_format == OutputFormatV2.DOCX:
-        return "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-    raise AssertionError(f"Unsupported output_format: {output_format}")
+from scripts.sir_convert_a_lot.infrastructure.upload_staging import StagedUpload
 
 
 class JobStoreV2Core:
@@ -65,6 +59,7 @@ class JobStoreV2Core:
         self.data_root = data_root
         self.jobs_dir = data_root / "jobs_v2"
         self.expired_dir = data_root / "expired_v2"
+        self.staging_dir = data_root / "staging_v2"
         self.jobs_dir.mkdir(parents=True, exist_ok=True)
         self.expired_dir.mkdir(parents=True, exist_ok=True)
         self.raw_ttl_seconds = raw_ttl_seconds
@@ -149,7 +144,7 @@ class JobStoreV2Core:
         *,
         job_id: str,
         spec: JobSpecV2,
-        upload_bytes: bytes,
+        upload: StagedUpload,
         resources_zip_bytes: bytes | None,
         reference_docx_bytes: bytes | None,
     ) -> StoredJobRecordV2:
@@ -164,7 +159,7 @@ class JobStoreV2Core:
         resources_path: Path | None = None
         reference_docx_path: Path | None = None
 
-        upload_path.write_bytes(upload_bytes)
+        upload.commit(upload_path)
         if resources_zip_bytes is not None:
             resources_path = self._resources_zip_path(job_id)
             resources_path.write_bytes(resources_zip_bytes)
@@ -350,7 +345,7 @@ class JobStoreV2Core:
             artifact_path = self._artifact_path(job_id, output_format)
             artifact_path.write_bytes(artifact_bytes)
             sha = hashlib.sha256(artifact_bytes).hexdigest()
-            content_type = _artifact_content_type(output_format)
+            content_type = artifact_content_type(output_format)
 
             now = utc_now()
             payload["status"] = JobStatus.SUCCEEDED.value
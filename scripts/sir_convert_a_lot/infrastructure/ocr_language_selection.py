@@ -0,0 +1,100 @@
+"""Per-job OCR language selection for Docling.
+
+Purpose:
+    Narrow the OCR languages of a job to the corpus languages actually found
+    in the PDF's text layer, so OCR engines that load one recognition model
+    per language (EasyOCR) only load and run what the document needs.
+    Detection scores function-word frequencies and special letters; it needs
+    no language-identification dependency.
+
+Relationships:
+    - Applied by `infrastructure.docling_backend` before the first Docling
+      pass; the chosen languages become part of `DoclingConverterKey`.
+    - Text-layer extraction uses PyMuPDF, like `infrastructure.pdf_inspection`.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import re
+from collections.abc import Sequence
+
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import PdfSource
+from scripts.sir_convert_a_lot.infrastructure.pdf_inspection import open_pdf
+
+DOCLING_OCR_LANGUAGE_DETECTION_ENV_VAR = "SIR_CONVERT_A_LOT_DOCLING_OCR_LANGUAGE_DETECTION"
+OCR_LANGUAGE_CANDIDATES: tuple[str, ...] = ("sv", "en")
+
+_FUNCTION_WORDS: dict[str, frozenset[str]] = {
+    "sv": frozenset(
+        "och att det som är på för med av till inte har ett men var eller också från vid".split()
+    ),
+    "en": frozenset(
+        "the and of to is that for with as on are be this by from which or was not have".split()
+    ),
+}
+_SPECIAL_LETTERS: dict[str, str] = {"sv": "åäö"}
+_WORD_PATTERN = re.compile(r"[^\W\d_]+", re.UNICODE)
+_SAMPLE_PAGES = 5
+_MIN_SCORED_WORDS = 20
+_MIN_LANGUAGE_SHARE = 0.15
+
+
+def ocr_language_engine_available() -> bool:
+    """Return whether the language-aware Docling OCR engine (EasyOCR) is installed."""
+    return importlib.util.find_spec("easyocr") is not None
+
+
+def detect_text_languages(
+    text: str, *, candidates: Sequence[str] = OCR_LANGUAGE_CANDIDATES
+) -> tuple[str, ...]:
+    """Return the `candidates` that make up a meaningful share of `text`, in candidate order.
+
+    Each function word and each special letter counts as a vote for its
+    language. Returns an empty tuple when `text` holds too few votes to
+    decide.
+    """
+    lowered = text.lower()
+    votes = {language: 0 for language in candidates}
+    for word in _WORD_PATTERN.findall(lowered):
+        for language in candidates:
+            if word in _FUNCTION_WORDS.get(language, frozenset()):
+                votes[language] += 1
+    for language in candidates:
+        votes[language] += sum(
+            lowered.count(letter) for letter in _SPECIAL_LETTERS.get(language, "")
+        )
+    total = sum(votes.values())
+    if total < _MIN_SCORED_WORDS:
+        return ()
+    return tuple(
+        language for language in candidates if votes[language] / total >= _MIN_LANGUAGE_SHARE
+    )
+
+
+def select_ocr_languages(
+    source: PdfSource, *, candidates: Sequence[str] = OCR_LANGUAGE_CANDIDATES
+) -> tuple[str, ...]:
+    """Return the OCR languages for a PDF, from the text layer of its first pages.
+
+    Falls back to every candidate when the text layer is missing, too short,
+    or unreadable, so scanned PDFs still OCR with the full corpus set.
+    """
+    try:
+        with open_pdf(source) as document:
+            text = " ".join(
+                document[index].get_text("text")
+                for index in range(min(_SAMPLE_PAGES, document.page_count))
+            )
+    except Exception:
+        return tuple(candidates)
+    return detect_text_languages(text, candidates=candidates) or tuple(candidates)
+
+
+__all__ = [
+    "DOCLING_OCR_LANGUAGE_DETECTION_ENV_VAR",
+    "OCR_LANGUAGE_CANDIDATES",
+    "detect_text_languages",
+    "ocr_language_engine_available",
+    "select_ocr_languages",
+]
@@ -0,0 +1,403 @@
+"""Page-range sharding of large PDFs for parallel conversion.
+
+Purpose:
+    Split a large PDF into contiguous page ranges, convert the shards
+    concurrently through one backend, and stitch the shard markdown back into
+    a single document in page order. Constructs that continue across a shard
+    boundary (pipe tables and paragraphs) are rejoined explicitly so the
+    stitched result reads like a single-pass conversion. Every shard takes a
+    slot from one process-wide `ShardSlots` budget, sized by
+    `ServiceConfig.page_sharding_max_concurrency` independently of
+    `max_workers`, so concurrent sharded jobs cannot multiply the number of
+    conversions sharing the process and GPU.
+
+Relationships:
+    - Used by `infrastructure.runtime_conversion.execute_job_conversion` when
+      `ServiceConfig.page_sharding_min_pages` enables sharding.
+    - Shards run on threads; with `conversion_isolation="process"` each shard
+      occupies its own `ConversionWorkerPool` slot.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+
+import pymupdf
+
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
+    BackendInputError,
+    ConversionBackend,
+    ConversionProgress,
+    ConversionRequest,
+    ConversionResultData,
+    PdfSource,
+)
+from scripts.sir_convert_a_lot.infrastructure.pdf_inspection import extract_pdf_pages
+from scripts.sir_convert_a_lot.infrastructure.runtime_models import ServiceConfig
+
+_TABLE_SEPARATOR_ROW = re.compile(r"^\|(\s*:?-{3,}:?\s*\|)+\s*$")
+_PARAGRAPH_TERMINATORS = ".!?:;)]\"'”’"
+_BLOCK_MARKERS = ("#", "|", "```", "~~~", ">", "- ", "* ", "+ ", "$$", "<!--")
+
+
+class ShardSlots:
+    """Budget of shard conversions running at once across every job of a process.
+
+    Like the converter registry, the budget only grows, so runtimes built
+    with different settings in one process never strand a waiting shard.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._condition = threading.Condition()
+        self._capacity = max(1, capacity)
+        self._in_use = 0
+
+    @property
+    def capacity(self) -> int:
+        with self._condition:
+            return self._capacity
+
+    def ensure_capacity(self, capacity: int) -> None:
+        """Raise the budget to at least `capacity` slots; never shrink it."""
+        with self._condition:
+            if capacity > self._capacity:
+                self._capacity = capacity
+                self._condition.notify_all()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one slot for the duration of a shard conversion."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._in_use < self._capacity)
+            self._in_use += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._in_use -= 1
+                self._condition.notify()
+
+
+_shared_slots_lock = threading.Lock()
+_shared_slots: ShardSlots | None = None
+
+
+def shared_shard_slots(capacity: int) -> ShardSlots:
+    """Return the process-wide shard budget, grown to at least `capacity` slots."""
+    global _shared_slots
+    with _shared_slots_lock:
+        if _shared_slots is None:
+            _shared_slots = ShardSlots(capacity)
+        else:
+            _shared_slots.ensure_capacity(capacity)
+        return _shared_slots
+
+
+@dataclass(frozen=True)
+class PageShardingPolicy:
+    """When and how widely to shard PDFs.
+
+    Documents with at least `min_pages` pages are split into at most
+    `max_shards` ranges of at least `min_pages_per_shard` pages each. Shards
+    convert once they hold one of `slots`, or all at once when unset.
+    """
+
+    min_pages: int
+    max_shards: int
+    min_pages_per_shard: int
+    slots: ShardSlots | None = field(default=None, compare=False, repr=False)
+
+    @property
+    def fingerprint(self) -> str:
+        """Return a stable label for cache keys, since sharded output may differ."""
+        return f"page_sharding:{self.min_pages}/{self.max_shards}/{self.min_pages_per_shard}"
+
+    @classmethod
+    def from_config(cls, config: ServiceConfig) -> PageShardingPolicy | None:
+        """Return the configured policy, or None when sharding is disabled."""
+        if config.page_sharding_min_pages <= 0 or config.page_sharding_max_shards < 2:
+            return None
+        return cls(
+            min_pages=config.page_sharding_min_pages,
+            max_shards=config.page_sharding_max_shards,
+            min_pages_per_shard=max(1, config.page_sharding_min_pages_per_shard),
+            slots=shared_shard_slots(max(1, config.page_sharding_max_concurrency)),
+        )
+
+
+@dataclass(frozen=True)
+class PageRange:
+    """Zero-based inclusive page range of one shard."""
+
+    first_page: int
+    last_page: int
+
+    @property
+    def page_count(self) -> int:
+        return self.last_page - self.first_page + 1
+
+    @property
+    def label(self) -> str:
+        """Return the one-based page label used in timing keys, e.g. `1-100`."""
+        return f"{self.first_page + 1}-{self.last_page + 1}"
+
+
+def plan_page_shards(page_count: int | None, policy: PageShardingPolicy) -> list[PageRange]:
+    """Return balanced contiguous shards, or an empty list when sharding does not apply."""
+    if page_count is None or page_count < policy.min_pages:
+        return []
+    shard_count = min(policy.max_shards, page_count // policy.min_pages_per_shard)
+    if shard_count < 2:
+        return []
+    base, remainder = divmod(page_count, shard_count)
+    shards: list[PageRange] = []
+    first_page = 0
+    for index in range(shard_count):
+        size = base + (1 if index < remainder else 0)
+        shards.append(PageRange(first_page=first_page, last_page=first_page + size - 1))
+        first_page += size
+    return shards
+
+
+def extract_page_range(source: PdfSource, page_range: PageRange) -> bytes:
+    """Return a standalone PDF holding only the pages of `page_range`."""
+    try:
+        return extract_pdf_pages(source, range(page_range.first_page, page_range.last_page + 1))
+    except (pymupdf.EmptyFileError, pymupdf.FileDataError, ValueError) as exc:
+        raise BackendInputError(str(exc)) from exc
+
+
+_BLANK_LINE = re.compile(r"\n[ \t]*\n")
+_LEADING_BLANK_LINES = re.compile(r"\A(?:[ \t]*\n)+")
+_FENCE_LINE = re.compile(r"^[ \t]*(?:```|~~~)", re.MULTILINE)
+
+
+def _split_last_block(markdown: str) -> tuple[str, str]:
+    separators = list(_BLANK_LINE.finditer(markdown))
+    if not separators:
+        return "", markdown
+    return markdown[: separators[-1].end()], markdown[separators[-1].end() :]
+
+
+def _split_first_block(markdown: str) -> tuple[str, str]:
+    separator = _BLANK_LINE.search(markdown)
+    if separator is None:
+        return markdown, ""
+    return markdown[: separator.start()], markdown[separator.start() :]
+
+
+def _is_table(block: str) -> bool:
+    return all(line.lstrip().startswith("|") for line in block.splitlines())
+
+
+def _table_columns(block: str) -> int:
+    first_line = block.splitlines()[0].strip()
+    return first_line.strip("|").count("|") + 1
+
+
+def _table_header(block: str) -> list[str] | None:
+    lines = block.splitlines()
+    if len(lines) < 2 or not _TABLE_SEPARATOR_ROW.match(lines[1].strip()):
+        return None
+    return [cell.strip() for cell in lines[0].strip().strip("|").split("|")]
+
+
+def _is_paragraph(block: str) -> bool:
+    return not block.lstrip().startswith(_BLOCK_MARKERS)
+
+
+def _join_boundary(previous: str, following: str) -> tuple[str, str] | None:
+    """Return `(separator, following)` when the boundary continues a construct."""
+    if _is_table(previous) and _is_table(following):
+        if _table_columns(previous) != _table_columns(following):
+            return None
+        header = _table_header(following)
+        if header is None:
+            return "\n", following
+        if header != _table_header(previous):
+            return None
+        # The shard repeated the continued table's header; keep only its rows.
+        rows = following.splitlines()[2:]
+        return ("\n", "\n".join(rows)) if rows else ("", "")
+    if _is_paragraph(previous) and _is_paragraph(following):
+        tail = previous.rstrip()
+        if tail.endswith(tuple(_PARAGRAPH_TERMINATORS)) or not following.lstrip()[:1].islower():
+            return None
+        return ("" if tail.endswith("-") else " "), following.lstrip()
+    return None
+
+
+def stitch_shard_markdown(parts: Sequence[str]) -> str:
+    """Concatenate shard markdown in page order, rejoining cross-boundary constructs.
+
+    A pipe table continues across a boundary only when the next shard's
+    table has the same column count and either no header row or a repeat of
+    the previous table's header, which is dropped. A paragraph that ends
+    without terminal punctuation and continues with a lowercase word is
+    merged into one paragraph.
+    Everything else, including anything after an unclosed code fence, is
+    separated by a blank line.
+    """
+    document = ""
+    for part in parts:
+        part = _LEADING_BLANK_LINES.sub("", part).rstrip()
+        if part == "":
+            continue
+        if document == "":
+            document = part
+            continue
+        before, last_block = _split_last_block(document)
+        first_block, after = _split_first_block(part)
+        inside_fence = len(_FENCE_LINE.findall(document)) % 2 == 1
+        joined = None if inside_fence else _join_boundary(last_block, first_block)
+        if joined is None:
+            document = f"{document}\n\n{part}"
+        else:
+            separator, following = joined
+            document = before + last_block.rstrip() + separator + following + after
+    return document + "\n" if document else ""
+
+
+class _ShardProgress:
+    """Fold per-shard progress reports into one whole-document report."""
+
+    def __init__(self, request: ConversionRequest, *, shard_count: int, pages_total: int) -> None:
+        self._request = request
+        self._pages_total = pages_total
+        self._completed = [0] * shard_count
+        self._lock = threading.Lock()
+
+    def for_shard(self, index: int) -> ConversionRequest:
+        if self._request.progress is None:
+            return replace(self._request, progress=None)
+
+        def _report(progress: ConversionProgress) -> None:
+            with self._lock:
+                self._completed[index] = progress.pages_completed
+                self._request.report_progress(
+                    stage=progress.stage,
+                    pages_completed=sum(self._completed),
+                    pages_total=self._pages_total,
+                )
+
+        return replace(self._request, progress=_report)
+
+
+def _timed_convert(
+    backend: ConversionBackend, request: ConversionRequest, slots: ShardSlots | None
+) -> tuple[ConversionResultData, int]:
+    if slots is None:
+        started = time.perf_counter()
+        result = backend.convert(request)
+    else:
+        with slots.slot():
+            started = time.perf_counter()
+            result = backend.convert(request)
+    return result, max(0, int((time.perf_counter() - started) * 1000))
+
+
+def convert_page_shards(
+    backend: ConversionBackend,
+    request: ConversionRequest,
+    shards: Sequence[PageRange],
+    *,
+    slots: ShardSlots | None = None,
+) -> ConversionResultData:
+    """Convert `shards` of `request.source` concurrently and stitch the results.
+
+    Each shard converts while holding one of `slots`, shared with every other
+    sharded job, or without a bound when `slots` is None.
+
+    Backend phase timings are summed across shards; each shard also reports
+    its own wall time as `shard_<n>_pages_<first>-<last>_ms`. The first
+    failing shard in page order determines the raised error.
+    """
+    phase_timings_ms: dict[str, int] = {}
+    split_started = time.perf_counter()
+    shard_sources = [extract_page_range(request.source, shard) for shard in shards]
+    phase_timings_ms["shard_split_ms"] = max(0, int((time.perf_counter() - split_started) * 1000))
+
+    progress = _ShardProgress(
+        request,
+        shard_count=len(shards),
+        pages_total=sum(shard.page_count for shard in shards),
+    )
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(len(shards), slots.capacity if slots else len(shards))),
+        thread_name_prefix="page-shard",
+    )
+    try:
+        futures: list[Future[tuple[ConversionResultData, int]]] = [
+            executor.submit(
+                _timed_convert,
+                backend,
+                replace(progress.for_shard(index), source=shard_source),
+                slots,
+            )
+            for index, shard_source in enumerate(shard_sources)
+        ]
+        outcomes = [future.result() for future in futures]
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    warnings: list[str] = []
+    for index, (shard, (result, elapsed_ms)) in enumerate(zip(shards, outcomes, strict=True)):
+        phase_timings_ms[f"shard_{index}_pages_{shard.label}_ms"] = elapsed_ms
+        for key, value in result.phase_timings_ms.items():
+            phase_timings_ms[key] = phase_timings_ms.get(key, 0) + int(value)
+        warnings.extend(warning for warning in result.warnings if warning not in warnings)
+
+    stitch_started = time.perf_counter()
+    markdown_content = stitch_shard_markdown([result.markdown_content for result, _ in outcomes])
+    phase_timings_ms["shard_stitch_ms"] = max(0, int((time.perf_counter() - stitch_started) * 1000))
+
+    first = outcomes[0][0]
+    labels, hits = _merged_preclassification([result for result, _ in outcomes])
+    return ConversionResultData(
+        markdown_content=markdown_content,
+        backend_used=first.backend_used,
+        acceleration_used=first.acceleration_used,
+        ocr_enabled=any(result.ocr_enabled for result, _ in outcomes),
+        formula_enrichment_used=any(result.formula_enrichment_used for result, _ in outcomes),
+        ocr_languages=tuple(
+            sorted({language for result, _ in outcomes for language in result.ocr_languages})
+        ),
+        warnings=warnings,
+        phase_timings_ms=phase_timings_ms,
+        preclassification_labels=labels,
+        preclassification_hits=hits,
+    )
+
+
+def _merged_preclassification(
+    results: list[ConversionResultData],
+) -> tuple[tuple[str, ...] | None, dict[str, bool] | None]:
+    """Combine shard predictions: labels predicted for any shard, hits only if every shard hit."""
+    classified = [result for result in results if result.preclassification_labels is not None]
+    if not classified:
+        return None, None
+    labels: dict[str, None] = {}
+    hits: dict[str, bool] = {}
+    for result in classified:
+        labels.update(dict.fromkeys(result.preclassification_labels or ()))
+        for label, hit in (result.preclassification_hits or {}).items():
+            hits[label] = hits.get(label, True) and hit
+    return tuple(labels), hits
+
+
+__all__ = [
+    "PageRange",
+    "PageShardingPolicy",
+    "ShardSlots",
+    "convert_page_shards",
+    "extract_page_range",
+    "plan_page_shards",
+    "shared_shard_slots",
+    "stitch_shard_markdown",
+]
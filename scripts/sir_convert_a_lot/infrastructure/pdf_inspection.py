@@ -0,0 +1,109 @@
+"""Cheap PyMuPDF inspection of uploaded PDFs.
+
+Purpose:
+    Answer structural questions about a PDF (header, page count, which pages
+    lack a usable text layer) and cut page subsets out of it, without running
+    a conversion pipeline. Every helper accepts a `PdfSource`; on-disk PDFs
+    are opened by path rather than read into memory.
+
+Relationships:
+    - Used by `infrastructure.docling_backend` for progress reporting and
+      per-page OCR decisions, and by `infrastructure.page_sharding`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Sequence
+from pathlib import Path
+
+import pymupdf
+
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import PdfSource
+
+_PDF_HEADER = b"%PDF"
+_UNREADABLE_CHARACTER = "�"
+_MIN_IMAGE_COVERAGE_FOR_OCR = 0.5
+_MAX_UNREADABLE_RATIO = 0.3
+
+
+def open_pdf(source: PdfSource) -> pymupdf.Document:
+    """Open `source` with PyMuPDF, by filename when it is on disk."""
+    if isinstance(source, Path):
+        return pymupdf.open(source, filetype="pdf")
+    return pymupdf.open(stream=source, filetype="pdf")
+
+
+def has_pdf_header(path: Path) -> bool:
+    """Return whether the file at `path` starts with the PDF header, reading only the header."""
+    with path.open("rb") as handle:
+        return handle.read(len(_PDF_HEADER)) == _PDF_HEADER
+
+
+def pdf_source_sha256(source: PdfSource) -> str:
+    """Return the SHA-256 hex digest of `source`, streaming on-disk PDFs in chunks."""
+    if isinstance(source, Path):
+        with source.open("rb") as handle:
+            return hashlib.file_digest(handle, "sha256").hexdigest()
+    return hashlib.sha256(source).hexdigest()
+
+
+def pdf_page_count(source: PdfSource) -> int | None:
+    """Return the page count of a PDF, or None when PyMuPDF cannot open it."""
+    try:
+        with open_pdf(source) as document:
+            return int(document.page_count)
+    except Exception:
+        return None
+
+
+def _image_coverage(page: pymupdf.Page) -> float:
+    page_area = abs(page.rect)
+    if page_area <= 0:
+        return 0.0
+    covered = 0.0
+    for image in page.get_image_info():
+        covered += abs(pymupdf.Rect(image["bbox"]) & page.rect)
+    return float(min(1.0, covered / page_area))
+
+
+def pages_lacking_text_layer(source: PdfSource, *, min_chars: int) -> list[int] | None:
+    """Return zero-based indexes of pages whose text layer is unusable.
+
+    A page qualifies when it carries fewer than `min_chars` non-whitespace
+    characters while images cover at least half of it (a scan), or when a
+    large share of its extracted characters are unreadable replacement
+    glyphs. Blank and vector-only pages never qualify, since OCR cannot
+    recover text from them. Returns None when PyMuPDF cannot open the PDF.
+    """
+    try:
+        with open_pdf(source) as document:
+            indexes: list[int] = []
+            for page in document:
+                text = "".join(page.get_text("text").split())
+                unreadable_ratio = text.count(_UNREADABLE_CHARACTER) / max(1, len(text))
+                scanned = (
+                    len(text) < min_chars and _image_coverage(page) >= _MIN_IMAGE_COVERAGE_FOR_OCR
+                )
+                if scanned or unreadable_ratio >= _MAX_UNREADABLE_RATIO:
+                    indexes.append(int(page.number))
+            return indexes
+    except Exception:
+        return None
+
+
+def extract_pdf_pages(source: PdfSource, page_indexes: Sequence[int]) -> bytes:
+    """Return a standalone PDF holding `page_indexes` (zero-based) in the given order."""
+    with open_pdf(source) as document:
+        document.select(list(page_indexes))
+        return bytes(document.tobytes(garbage=1))
+
+
+__all__ = [
+    "extract_pdf_pages",
+    "has_pdf_header",
+    "open_pdf",
+    "pages_lacking_text_layer",
+    "pdf_page_count",
+    "pdf_source_sha256",
+]
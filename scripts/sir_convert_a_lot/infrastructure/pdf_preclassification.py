@@ -0,0 +1,365 @@
+"""Cheap PyMuPDF pre-classification of PDFs before Docling conversion.
+
+Purpose:
+    Predict from the text layer and vector drawings, in milliseconds on CPU,
+    whether a PDF is exam-like, formula-heavy, fully scanned or contains
+    ruled tables, so the first Docling attempt can start with the layout
+    model, formula preset and OCR mode that later retries would otherwise
+    land on. Predictions are compared with what conversion actually produced,
+    and process-wide hit counters are kept for tuning the heuristics.
+
+Relationships:
+    - `convert_with_preclassification` wraps the passes of
+      `infrastructure.docling_backend`; applied labels travel on
+      `ConversionRequest.preclassified_labels`.
+    - Predicted labels and per-label hits travel on `ConversionResultData`
+      into the job's `conversion_metadata`.
+    - Hit counters are exported by `interfaces.http_metrics`.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+
+import pymupdf
+
+from scripts.sir_convert_a_lot.domain.specs import OcrMode
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
+    ConversionRequest,
+    ConversionResultData,
+    PdfSource,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_formula_quality import (
+    FORMULA_PLACEHOLDER_MARKER,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_ordering import (
+    evaluate_docling_ordering_quality,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_page_ocr import AUTO_OCR_RETRY_WARNING
+from scripts.sir_convert_a_lot.infrastructure.pdf_inspection import (
+    open_pdf,
+    pages_lacking_text_layer,
+)
+
+DOCLING_PRECLASSIFICATION_ENV_VAR = "SIR_CONVERT_A_LOT_DOCLING_PRECLASSIFICATION"
+EXAM_LIKE = "exam_like"
+FORMULA_HEAVY = "formula_heavy"
+SCANNED = "scanned"
+TABLES = "tables"
+PRECLASSIFICATION_LABELS: tuple[str, ...] = (EXAM_LIKE, FORMULA_HEAVY, SCANNED, TABLES)
+PRECLASSIFICATION_WARNING_PREFIX = "docling_preclassification_applied:"
+
+_MAX_SAMPLED_PAGES = 40
+_SCANNED_MIN_CHARS = 120
+_OPTION_LINE_RE = re.compile(r"^\s*(?:[☐□○◯❍]|\(?[A-Da-d]\)|[A-D][.:])\s+\S")
+_QUESTION_LINE_RE = re.compile(r"^\s*(?:(?:Question|Fråga|Uppgift)\s+)?\d{1,3}[.)]\s+\S")
+_MATH_FONT_RE = re.compile(r"CMMI|CMSY|CMEX|MSBM|MSAM|Math|STIX|Symbol|Euclid", re.IGNORECASE)
+_MATH_GLYPHS = frozenset("∑∏∫∮√∂∇∞≈≠≡≤≥±∓×÷∈∉⊂⊆∪∩∀∃→⇒⇔αβγδεζηθκλμνξπρστφχψωΓΔΘΛΞΠΣΦΨΩ")
+_MIN_OCR_CHARS_PER_PAGE = 120
+_MIN_OPTION_LINES = 8
+_MIN_QUESTION_LINES = 4
+_MIN_MATH_CHARS = 60
+_MIN_MATH_RATIO = 0.01
+_MIN_RULINGS_PER_TABLE_PAGE = 4
+_MIN_RULING_LENGTH = 20.0
+_MIN_DISPLAY_FORMULAS = 5
+_TABLE_SEPARATOR_RE = re.compile(r"^\s*\|?\s*:?-{3,}:?\s*\|")
+
+
+@dataclass(frozen=True)
+class PdfPreclassification:
+    """Text-layer features of a PDF and the labels predicted from them."""
+
+    page_count: int
+    option_lines: int
+    question_lines: int
+    math_chars: int
+    text_chars: int
+    scanned_pages: int
+    ruled_pages: int
+    image_area_ratio: float = 0.0
+
+    @property
+    def labels(self) -> frozenset[str]:
+        """Return the predicted labels."""
+        labels: set[str] = set()
+        if self.option_lines >= _MIN_OPTION_LINES and self.question_lines >= _MIN_QUESTION_LINES:
+            labels.add(EXAM_LIKE)
+        if (
+            self.math_chars >= _MIN_MATH_CHARS
+            and self.math_chars >= self.text_chars * _MIN_MATH_RATIO
+        ):
+            labels.add(FORMULA_HEAVY)
+        if self.page_count > 0 and self.scanned_pages >= self.page_count:
+            labels.add(SCANNED)
+        if self.ruled_pages > 0:
+            labels.add(TABLES)
+        return frozenset(labels)
+
+
+def preclassify_pdf(source: PdfSource) -> PdfPreclassification | None:
+    """Extract pre-classification features, or None when PyMuPDF cannot open the PDF.
+
+    Text, drawings and image placements are read from at most the first 40
+    pages; `image_area_ratio` is the share of that page area covered by
+    images. Scanned pages are counted over the whole document.
+    """
+    scanned = pages_lacking_text_layer(source, min_chars=_SCANNED_MIN_CHARS)
+    if scanned is None:
+        return None
+    option_lines = question_lines = math_chars = text_chars = ruled_pages = 0
+    image_area = page_area = 0.0
+    try:
+        with open_pdf(source) as document:
+            page_count = int(document.page_count)
+            for page_index in range(min(page_count, _MAX_SAMPLED_PAGES)):
+                page = document[page_index]
+                for line in page.get_text("text").splitlines():
+                    option_lines += _OPTION_LINE_RE.match(line) is not None
+                    question_lines += _QUESTION_LINE_RE.match(line) is not None
+                page_math, page_text = _math_and_text_chars(page)
+                math_chars += page_math
+                text_chars += page_text
+                ruled_pages += _ruling_count(page) >= _MIN_RULINGS_PER_TABLE_PAGE
+                image_area += _image_area(page)
+                page_area += abs(page.rect)
+    except Exception:
+        return None
+    return PdfPreclassification(
+        page_count=page_count,
+        option_lines=option_lines,
+        question_lines=question_lines,
+        math_chars=math_chars,
+        text_chars=text_chars,
+        scanned_pages=len(scanned),
+        ruled_pages=ruled_pages,
+        image_area_ratio=image_area / page_area if page_area > 0 else 0.0,
+    )
+
+
+def observed_labels(markdown_content: str, *, ocr_whole_document: bool) -> frozenset[str]:
+    """Return the labels the converted markdown actually exhibits.
+
+    `ocr_whole_document` says whether the document turned out to need OCR on
+    every page, which the markdown alone cannot tell.
+    """
+    labels: set[str] = set()
+    if evaluate_docling_ordering_quality(markdown_content).is_exam_like:
+        labels.add(EXAM_LIKE)
+    formulas = markdown_content.count("$$") // 2 + markdown_content.count(
+        FORMULA_PLACEHOLDER_MARKER
+    )
+    if formulas >= _MIN_DISPLAY_FORMULAS:
+        labels.add(FORMULA_HEAVY)
+    if ocr_whole_document:
+        labels.add(SCANNED)
+    if any(_TABLE_SEPARATOR_RE.match(line) for line in markdown_content.splitlines()):
+        labels.add(TABLES)
+    return frozenset(labels)
+
+
+def first_attempt_labels(
+    predicted: frozenset[str],
+    *,
+    layout_fallback_available: bool,
+    formula_enrichment: bool,
+    ocr_mode: OcrMode,
+) -> frozenset[str]:
+    """Return the predicted labels that change how the first Docling attempt is configured.
+
+    Exam-like documents start with the first fallback layout model,
+    formula-heavy ones with the fallback formula preset, and fully scanned
+    ones skip the text-layer pass in AUTO OCR mode. Table predictions are
+    recorded only.
+    """
+    applied: set[str] = set()
+    if EXAM_LIKE in predicted and layout_fallback_available:
+        applied.add(EXAM_LIKE)
+    if FORMULA_HEAVY in predicted and formula_enrichment:
+        applied.add(FORMULA_HEAVY)
+    if SCANNED in predicted and ocr_mode == OcrMode.AUTO:
+        applied.add(SCANNED)
+    return frozenset(applied)
+
+
+def convert_with_preclassification(
+    request: ConversionRequest,
+    *,
+    enabled: bool,
+    layout_fallback_available: bool,
+    formula_enrichment: bool,
+    convert: Callable[[ConversionRequest], ConversionResultData],
+    stats: PreclassificationStats | None = None,
+) -> ConversionResultData:
+    """Pre-classify the PDF, convert with the applied labels, and record prediction hits.
+
+    Applied labels travel on `ConversionRequest.preclassified_labels`, are
+    listed in a warning, and `preclassify_ms` is added to phase timings.
+    The result carries every predicted label in `preclassification_labels`
+    and, per scored label, whether the prediction matched the outcome in
+    `preclassification_hits`. Whether the document needed OCR everywhere is
+    only scored in AUTO mode.
+    """
+    if not enabled:
+        return convert(request)
+    started = time.perf_counter()
+    preclassification = preclassify_pdf(request.source)
+    if preclassification is None:
+        return convert(request)
+    predicted = preclassification.labels
+    applied = first_attempt_labels(
+        predicted,
+        layout_fallback_available=layout_fallback_available,
+        formula_enrichment=formula_enrichment,
+        ocr_mode=request.ocr_mode,
+    )
+    preclassify_ms = max(0, int((time.perf_counter() - started) * 1000))
+    result = convert(replace(request, preclassified_labels=applied))
+
+    ocr_whole_document = AUTO_OCR_RETRY_WARNING in result.warnings
+    if SCANNED in applied:
+        chars_per_page = len(result.markdown_content.strip()) / max(1, preclassification.page_count)
+        ocr_whole_document = chars_per_page >= _MIN_OCR_CHARS_PER_PAGE
+    evaluated = [
+        label
+        for label in PRECLASSIFICATION_LABELS
+        if label != SCANNED or request.ocr_mode == OcrMode.AUTO
+    ]
+    observed = observed_labels(result.markdown_content, ocr_whole_document=ocr_whole_document)
+    (stats or shared_preclassification_stats()).record(
+        predicted=predicted, observed=observed, evaluated=frozenset(evaluated)
+    )
+    warnings = list(result.warnings)
+    if applied:
+        warnings.append(preclassification_warning(applied))
+    return replace(
+        result,
+        warnings=warnings,
+        phase_timings_ms={**result.phase_timings_ms, "preclassify_ms": preclassify_ms},
+        preclassification_labels=tuple(
+            label for label in PRECLASSIFICATION_LABELS if label in predicted
+        ),
+        preclassification_hits={
+            label: (label in predicted) == (label in observed) for label in evaluated
+        },
+    )
+
+
+def preclassification_warning(applied_labels: frozenset[str]) -> str:
+    """Return the warning listing labels that configured the first attempt."""
+    ordered = [label for label in PRECLASSIFICATION_LABELS if label in applied_labels]
+    return PRECLASSIFICATION_WARNING_PREFIX + ",".join(ordered)
+
+
+@dataclass(frozen=True)
+class PreclassificationLabelStats:
+    """Prediction counters for one label."""
+
+    predicted: int
+    observed: int
+    hits: int
+    total: int
+
+
+class PreclassificationStats:
+    """Thread-safe process-wide counters comparing predictions with outcomes."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts = {label: [0, 0, 0, 0] for label in PRECLASSIFICATION_LABELS}
+
+    def record(
+        self,
+        *,
+        predicted: frozenset[str],
+        observed: frozenset[str],
+        evaluated: frozenset[str] = frozenset(PRECLASSIFICATION_LABELS),
+    ) -> None:
+        """Count one classified document; a hit is a prediction matching the outcome."""
+        with self._lock:
+            for label, counts in self._counts.items():
+                if label not in evaluated:
+                    continue
+                counts[0] += label in predicted
+                counts[1] += label in observed
+                counts[2] += (label in predicted) == (label in observed)
+                counts[3] += 1
+
+    def snapshot(self) -> dict[str, PreclassificationLabelStats]:
+        """Return a consistent copy of the counters per label."""
+        with self._lock:
+            return {
+                label: PreclassificationLabelStats(*counts)
+                for label, counts in self._counts.items()
+            }
+
+
+_SHARED_STATS = PreclassificationStats()
+
+
+def shared_preclassification_stats() -> PreclassificationStats:
+    """Return the process-wide pre-classification counters."""
+    return _SHARED_STATS
+
+
+def _math_and_text_chars(page: pymupdf.Page) -> tuple[int, int]:
+    math_chars = text_chars = 0
+    for block in page.get_text("dict")["blocks"]:
+        for line in block.get("lines", []):
+            for span in line["spans"]:
+                text = "".join(span["text"].split())
+                text_chars += len(text)
+                if _MATH_FONT_RE.search(span["font"]) is not None:
+                    math_chars += len(text)
+                else:
+                    math_chars += sum(1 for char in text if char in _MATH_GLYPHS)
+    return math_chars, text_chars
+
+
+def _image_area(page: pymupdf.Page) -> float:
+    area = 0.0
+    for image in page.get_image_info():
+        area += abs(pymupdf.Rect(image["bbox"]) & page.rect)
+    return float(min(area, abs(page.rect)))
+
+
+def _ruling_count(page: pymupdf.Page) -> int:
+    rulings = 0
+    for path in page.get_drawings():
+        for item in path["items"]:
+            if item[0] == "l":
+                start, end = item[1], item[2]
+                dx, dy = abs(end.x - start.x), abs(end.y - start.y)
+                rulings += (dy < 1.0 and dx >= _MIN_RULING_LENGTH) or (
+                    dx < 1.0 and dy >= _MIN_RULING_LENGTH
+                )
+            elif item[0] == "re":
+                rect = item[1]
+                rulings += (rect.height < 2.0 and rect.width >= _MIN_RULING_LENGTH) or (
+                    rect.width < 2.0 and rect.height >= _MIN_RULING_LENGTH
+                )
+    return rulings
+
+
+__all__ = [
+    "DOCLING_PRECLASSIFICATION_ENV_VAR",
+    "EXAM_LIKE",
+    "FORMULA_HEAVY",
+    "PRECLASSIFICATION_LABELS",
+    "PRECLASSIFICATION_WARNING_PREFIX",
+    "SCANNED",
+    "TABLES",
+    "PdfPreclassification",
+    "PreclassificationLabelStats",
+    "PreclassificationStats",
+    "convert_with_preclassification",
+    "first_attempt_labels",
+    "observed_labels",
+    "preclassification_warning",
+    "preclassify_pdf",
+    "shared_preclassification_stats",
+]
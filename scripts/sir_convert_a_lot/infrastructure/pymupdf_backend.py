@@ -2,7 +2,10 @@
 
 Purpose:
     Execute deterministic CPU-based PDF-to-markdown conversion using PyMuPDF4LLM
-    while honoring canonical v1 conversion request semantics.
+    while honoring canonical v1 conversion request semantics. Documents with
+    at least `parallel_min_pages` pages are split into contiguous page ranges
+    converted in a process pool; header levels are identified once for the
+    whole document, so the concatenated ranges match a single-pass conversion.
 
 Relationships:
     - Implements `infrastructure.conversion_backend.ConversionBackend`.
@@ -14,6 +17,12 @@ from __future__ import annotations
 
 import contextlib
 import io
+import multiprocessing
+import os
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 
 import pymupdf
 
@@ -27,17 +36,84 @@ from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
     ConversionBackend,
     ConversionRequest,
     ConversionResultData,
+    PdfSource,
 )
+from scripts.sir_convert_a_lot.infrastructure.pdf_inspection import open_pdf
 
 _TABLE_STRATEGY_BY_MODE: dict[TableMode, str] = {
     TableMode.FAST: "lines",
     TableMode.ACCURATE: "lines_strict",
+    TableMode.ADAPTIVE: "lines_strict",
 }
 _USE_GLYPHS_FOR_INVALID_UNICODE = True
+_PROGRESS_STAGE = "pymupdf_extract"
+
+
+def _markdown_for_pages(
+    document: pymupdf.Document,
+    table_strategy: str,
+    *,
+    pages: Iterable[int] | None = None,
+    hdr_info: object | None = None,
+) -> str:
+    return str(
+        pymupdf4llm.to_markdown(
+            document,
+            pages=pages,
+            hdr_info=hdr_info,
+            page_chunks=False,
+            table_strategy=table_strategy,
+            use_glyphs=_USE_GLYPHS_FOR_INVALID_UNICODE,
+        )
+    )
+
+
+def _convert_page_range_in_worker(
+    source: PdfSource, pages: Sequence[int], table_strategy: str, hdr_info: object
+) -> str:
+    with open_pdf(source) as document:
+        return _markdown_for_pages(document, table_strategy, pages=pages, hdr_info=hdr_info)
+
+
+def split_page_ranges(page_count: int, range_count: int) -> list[range]:
+    """Split `page_count` pages into at most `range_count` contiguous, balanced ranges."""
+    range_count = max(1, min(range_count, page_count))
+    size, remainder = divmod(page_count, range_count)
+    ranges: list[range] = []
+    start = 0
+    for index in range(range_count):
+        stop = start + size + (1 if index < remainder else 0)
+        ranges.append(range(start, stop))
+        start = stop
+    return ranges
+
+
+def _report_page_progress(request: ConversionRequest, *, page_count: int) -> Iterator[int]:
+    """Yield page numbers for PyMuPDF4LLM, reporting each page once it is rendered.
+
+    PyMuPDF4LLM pulls the next page number only after finishing the previous
+    page, so resuming this generator marks that page as completed.
+    """
+    request.report_progress(stage=_PROGRESS_STAGE, pages_completed=0, pages_total=page_count)
+    for page_number in range(page_count):
+        yield page_number
+        request.report_progress(
+            stage=_PROGRESS_STAGE, pages_completed=page_number + 1, pages_total=page_count
+        )
 
 
 class PyMuPdfConversionBackend(ConversionBackend):
-    """PyMuPDF4LLM implementation of the conversion backend protocol."""
+    """PyMuPDF4LLM implementation of the conversion backend protocol.
+
+    `parallel_min_pages=0` keeps every conversion in the calling thread;
+    `parallel_max_processes=0` sizes the process pool to the CPU count.
+    """
+
+    def __init__(self, *, parallel_min_pages: int = 0, parallel_max_processes: int = 0) -> None:
+        self._parallel_min_pages = max(0, parallel_min_pages)
+        self._parallel_max_processes = parallel_max_processes or os.cpu_count() or 1
+        self._executor: ProcessPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
 
     def convert(self, request: ConversionRequest) -> ConversionResultData:
         if request.backend_strategy != BackendStrategy.PYMUPDF:
@@ -48,7 +124,7 @@ class PyMuPdfConversionBackend(ConversionBackend):
         table_strategy = _TABLE_STRATEGY_BY_MODE[request.table_mode]
 
         try:
-            document = self._open_document(request.source_bytes)
+            document = self._open_document(request.source)
         except (pymupdf.EmptyFileError, pymupdf.FileDataError, pymupdf.FileNotFoundError) as exc:
             raise BackendInputError(str(exc)) from exc
         except ValueError as exc:
@@ -58,7 +134,18 @@ class PyMuPdfConversionBackend(ConversionBackend):
 
         try:
             with document:
-                markdown_content = self._to_markdown(document, table_strategy)
+                if self._use_parallel(document):
+                    markdown_content = self._to_markdown_parallel(
+                        document, table_strategy, request=request
+                    )
+                elif request.progress is None:
+                    markdown_content = self._to_markdown(document, table_strategy)
+                else:
+                    markdown_content = self._to_markdown(
+                        document,
+                        table_strategy,
+                        pages=_report_page_progress(request, page_count=document.page_count),
+                    )
         except Exception as exc:  # pragma: no cover - defensive backend runtime guard.
             raise BackendExecutionError(f"PyMuPDF backend execution failed: {exc}") from exc
 
@@ -73,15 +160,70 @@ class PyMuPdfConversionBackend(ConversionBackend):
             warnings=[],
         )
 
-    def _open_document(self, source_bytes: bytes) -> pymupdf.Document:
-        return pymupdf.open(stream=source_bytes, filetype="pdf")
-
-    def _to_markdown(self, document: pymupdf.Document, table_strategy: str) -> str:
-        return str(
-            pymupdf4llm.to_markdown(
-                document,
-                page_chunks=False,
-                table_strategy=table_strategy,
-                use_glyphs=_USE_GLYPHS_FOR_INVALID_UNICODE,
-            )
+    def shutdown(self) -> None:
+        """Stop the page-range process pool, if one was started."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _open_document(self, source: PdfSource) -> pymupdf.Document:
+        return open_pdf(source)
+
+    def _use_parallel(self, document: pymupdf.Document) -> bool:
+        return (
+            self._parallel_min_pages > 0
+            and self._parallel_max_processes > 1
+            and document.page_count >= self._parallel_min_pages
         )
+
+    def _to_markdown(
+        self,
+        document: pymupdf.Document,
+        table_strategy: str,
+        *,
+        pages: Iterable[int] | None = None,
+    ) -> str:
+        return _markdown_for_pages(document, table_strategy, pages=pages)
+
+    def _to_markdown_parallel(
+        self, document: pymupdf.Document, table_strategy: str, *, request: ConversionRequest
+    ) -> str:
+        """Convert contiguous page ranges in the process pool and join them in page order."""
+        page_count = document.page_count
+        hdr_info = pymupdf4llm.IdentifyHeaders(document)
+        page_ranges = split_page_ranges(page_count, self._parallel_max_processes)
+        executor = self._page_range_executor()
+        request.report_progress(stage=_PROGRESS_STAGE, pages_completed=0, pages_total=page_count)
+        futures: dict[Future[str], int] = {
+            executor.submit(
+                _convert_page_range_in_worker,
+                request.source,
+                list(page_range),
+                table_strategy,
+                hdr_info,
+            ): len(page_range)
+            for page_range in page_ranges
+        }
+        pages_completed = 0
+        try:
+            for future in as_completed(futures):
+                future.result()
+                pages_completed += futures[future]
+                request.report_progress(
+                    stage=_PROGRESS_STAGE, pages_completed=pages_completed, pages_total=page_count
+                )
+        except BrokenProcessPool:
+            self.shutdown()
+            raise
+        return "".join(future.result() for future in futures)
+
+    def _page_range_executor(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                # Spawn (not fork) so worker threads of the service never leak into children.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._parallel_max_processes,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
@@ -0,0 +1,282 @@
+"""Content-addressed conversion result cache for Sir Convert-a-Lot v1.
+
+Purpose:
+    Persist successful conversion artifacts keyed by source SHA-256, the
+    canonical conversion options, and the service revision, so resubmitting
+    an identical PDF completes from disk instead of reconverting on the GPU.
+    Entries expire after a TTL and least-recently-used entries are evicted
+    once the cache exceeds its size budget.
+
+Relationships:
+    - Used by `infrastructure.runtime_engine.ServiceRuntime` on job creation
+      (lookup) and after successful conversions (store).
+    - Entries live under `<data_root>/result_cache` next to the job store.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from scripts.sir_convert_a_lot.domain.specs import JobSpec
+from scripts.sir_convert_a_lot.infrastructure.filesystem_journal import (
+    atomic_write_json,
+    dt_from_rfc3339,
+    dt_to_rfc3339,
+    read_json,
+    utc_now,
+)
+
+RESULT_CACHE_DIRNAME = "result_cache"
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def file_sha256(path: Path) -> str:
+    """Return the hex SHA-256 of a file without loading it into memory at once."""
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def result_cache_key(
+    *,
+    source_sha256: str,
+    spec: JobSpec,
+    service_revision: str,
+    output_variant: str | None = None,
+) -> str:
+    """Build the cache key from content, output-affecting options, and revision.
+
+    Only fields that change the produced markdown participate; retention,
+    priority, timeouts and the source filename do not. `output_variant`
+    names service-side settings that change output (such as page sharding)
+    and is omitted when unset so default keys stay stable.
+    """
+    canonical = {
+        "source_sha256": source_sha256,
+        "conversion": spec.conversion.model_dump(mode="json"),
+        "acceleration_policy": spec.execution.acceleration_policy.value,
+        "service_revision": service_revision,
+    }
+    if output_variant is not None:
+        canonical["output_variant"] = output_variant
+    normalized = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedConversionResult:
+    """Artifact and conversion metadata replayed into jobs on a cache hit."""
+
+    markdown_bytes: bytes
+    backend_used: str
+    acceleration_used: str
+    ocr_enabled: bool
+    warnings: tuple[str, ...]
+    source_job_id: str
+    formula_enrichment_used: bool | None = None
+    ocr_languages: list[str] | None = None
+    backend_route_reasons: list[str] | None = None
+    preclassification_labels: list[str] | None = None
+    preclassification_hits: dict[str, bool] | None = None
+
+
+@dataclass(frozen=True)
+class _CacheEntryStat:
+    key: str
+    created_at: datetime | None
+    last_access: float
+    size_bytes: int
+
+
+class ConversionResultCache:
+    """Filesystem-backed result cache with TTL expiry and LRU size eviction.
+
+    The artifact file's mtime doubles as the last-access time used for LRU
+    ordering, so hits cost one `utime` instead of a metadata rewrite. An
+    in-memory LRU index of entry sizes, loaded from disk once at startup and
+    rebuilt by `sweep`, lets `put` enforce the size budget without scanning
+    the cache directory.
+    """
+
+    def __init__(self, *, data_root: Path, ttl_seconds: int, max_bytes: int) -> None:
+        self.dir = data_root / RESULT_CACHE_DIRNAME
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.max_bytes = max(0, max_bytes)
+        self._index_lock = threading.Lock()
+        self._index: OrderedDict[str, int] = OrderedDict()
+        self._indexed_bytes = 0
+        self._rebuild_index(self._scan())
+
+    def _entry_paths(self, key: str) -> tuple[Path, Path]:
+        shard = self.dir / key[:2]
+        return shard / f"{key}.json", shard / f"{key}.md"
+
+    def get(self, key: str) -> CachedConversionResult | None:
+        """Return the cached result for `key`, dropping it when expired or damaged."""
+        entry_path, artifact_path = self._entry_paths(key)
+        try:
+            payload = read_json(entry_path)
+            markdown_bytes = artifact_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        created_at = dt_from_rfc3339(payload.get("created_at"))
+        backend_used = payload.get("backend_used")
+        acceleration_used = payload.get("acceleration_used")
+        ocr_enabled = payload.get("ocr_enabled")
+        warnings = payload.get("warnings")
+        source_job_id = payload.get("source_job_id")
+        formula_obj = payload.get("formula_enrichment_used")
+        languages_obj = payload.get("ocr_languages")
+        route_obj = payload.get("backend_route_reasons")
+        labels_obj = payload.get("preclassification_labels")
+        hits_obj = payload.get("preclassification_hits")
+        artifact_sha256 = payload.get("artifact_sha256")
+        if (
+            created_at is None
+            or utc_now() - created_at > self.ttl
+            or not isinstance(backend_used, str)
+            or not isinstance(acceleration_used, str)
+            or not isinstance(ocr_enabled, bool)
+            or not isinstance(warnings, list)
+            or not isinstance(source_job_id, str)
+            or artifact_sha256 != hashlib.sha256(markdown_bytes).hexdigest()
+        ):
+            self._remove(key)
+            return None
+        try:
+            os.utime(artifact_path)
+        except OSError:
+            pass
+        self._touch(key, len(markdown_bytes))
+        return CachedConversionResult(
+            markdown_bytes=markdown_bytes,
+            backend_used=backend_used,
+            acceleration_used=acceleration_used,
+            ocr_enabled=ocr_enabled,
+            warnings=tuple(warning for warning in warnings if isinstance(warning, str)),
+            source_job_id=source_job_id,
+            formula_enrichment_used=formula_obj if isinstance(formula_obj, bool) else None,
+            ocr_languages=[item for item in languages_obj if isinstance(item, str)]
+            if isinstance(languages_obj, list)
+            else None,
+            backend_route_reasons=[item for item in route_obj if isinstance(item, str)]
+            if isinstance(route_obj, list)
+            else None,
+            preclassification_labels=[item for item in labels_obj if isinstance(item, str)]
+            if isinstance(labels_obj, list)
+            else None,
+            preclassification_hits={
+                label: hit
+                for label, hit in hits_obj.items()
+                if isinstance(label, str) and isinstance(hit, bool)
+            }
+            if isinstance(hits_obj, dict)
+            else None,
+        )
+
+    def put(self, key: str, result: CachedConversionResult) -> None:
+        """Store one result, then evict LRU entries beyond the size budget."""
+        if self.max_bytes == 0 or len(result.markdown_bytes) > self.max_bytes:
+            return
+        entry_path, artifact_path = self._entry_paths(key)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_artifact = artifact_path.with_name(f"{artifact_path.name}.{uuid.uuid4().hex}.tmp")
+        tmp_artifact.write_bytes(result.markdown_bytes)
+        tmp_artifact.replace(artifact_path)
+        payload: dict[str, object] = {
+            "created_at": dt_to_rfc3339(utc_now()),
+            "artifact_sha256": hashlib.sha256(result.markdown_bytes).hexdigest(),
+            "size_bytes": len(result.markdown_bytes),
+            "backend_used": result.backend_used,
+            "acceleration_used": result.acceleration_used,
+            "ocr_enabled": result.ocr_enabled,
+            "warnings": list(result.warnings),
+            "source_job_id": result.source_job_id,
+            "formula_enrichment_used": result.formula_enrichment_used,
+            "ocr_languages": result.ocr_languages,
+            "backend_route_reasons": result.backend_route_reasons,
+            "preclassification_labels": result.preclassification_labels,
+            "preclassification_hits": result.preclassification_hits,
+        }
+        atomic_write_json(entry_path, payload)
+        self._touch(key, len(result.markdown_bytes))
+        self._evict_over_budget()
+
+    def sweep(self) -> int:
+        """Remove expired or damaged entries, resync the index, and enforce the size budget."""
+        removed = 0
+        live: list[_CacheEntryStat] = []
+        for entry in self._scan():
+            if entry.created_at is None or utc_now() - entry.created_at > self.ttl:
+                self._remove(entry.key)
+                removed += 1
+            else:
+                live.append(entry)
+        self._rebuild_index(live)
+        return removed + self._evict_over_budget()
+
+    def _scan(self) -> list[_CacheEntryStat]:
+        entries: list[_CacheEntryStat] = []
+        for entry_path in self.dir.glob("*/*.json"):
+            try:
+                created_at = dt_from_rfc3339(read_json(entry_path).get("created_at"))
+                stat = entry_path.with_suffix(".md").stat()
+            except (OSError, ValueError):
+                entries.append(_CacheEntryStat(entry_path.stem, None, 0.0, 0))
+                continue
+            entries.append(
+                _CacheEntryStat(entry_path.stem, created_at, stat.st_mtime, stat.st_size)
+            )
+        return entries
+
+    def _rebuild_index(self, entries: list[_CacheEntryStat]) -> None:
+        live = [entry for entry in entries if entry.created_at is not None]
+        with self._index_lock:
+            self._index = OrderedDict(
+                (entry.key, entry.size_bytes)
+                for entry in sorted(live, key=lambda item: item.last_access)
+            )
+            self._indexed_bytes = sum(self._index.values())
+
+    def _touch(self, key: str, size_bytes: int) -> None:
+        with self._index_lock:
+            self._indexed_bytes += size_bytes - self._index.pop(key, 0)
+            self._index[key] = size_bytes
+
+    def _evict_over_budget(self) -> int:
+        with self._index_lock:
+            victims: list[str] = []
+            while self._indexed_bytes > self.max_bytes and self._index:
+                key, size_bytes = self._index.popitem(last=False)
+                self._indexed_bytes -= size_bytes
+                victims.append(key)
+        for key in victims:
+            self._remove(key)
+        return len(victims)
+
+    def _remove(self, key: str) -> None:
+        with self._index_lock:
+            self._indexed_bytes -= self._index.pop(key, 0)
+        entry_path, artifact_path = self._entry_paths(key)
+        entry_path.unlink(missing_ok=True)
+        artifact_path.unlink(missing_ok=True)
+
+
+__all__ = [
+    "CachedConversionResult",
+    "ConversionResultCache",
+    "RESULT_CACHE_DIRNAME",
+    "file_sha256",
+    "result_cache_key",
+]
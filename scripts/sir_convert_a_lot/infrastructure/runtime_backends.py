@@ -0,0 +1,85 @@
+"""Conversion backend wiring for runtime engines.
+
+Purpose:
+    Build the Docling/PyMuPDF backends a runtime converts with, either
+    in-process or proxied through a process-isolated worker pool, according to
+    `ServiceConfig.conversion_isolation`, with the Docling converter registry
+    of each converting process sized to hold every prewarmed converter.
+
+Relationships:
+    - Used by `infrastructure.runtime_engine.ServiceRuntime` and
+      `infrastructure.runtime_engine_v2.ServiceRuntimeV2`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from scripts.sir_convert_a_lot.infrastructure.conversion_worker_pool import (
+    ConversionWorkerPool,
+    ProcessIsolatedBackend,
+)
+from scripts.sir_convert_a_lot.infrastructure.converter_prewarm import prewarm_converter_count
+from scripts.sir_convert_a_lot.infrastructure.docling_backend import DoclingConversionBackend
+from scripts.sir_convert_a_lot.infrastructure.docling_converter_registry import (
+    converter_cache_max_entries,
+    shared_docling_converter_registry,
+)
+from scripts.sir_convert_a_lot.infrastructure.pymupdf_backend import PyMuPdfConversionBackend
+from scripts.sir_convert_a_lot.infrastructure.runtime_models import ServiceConfig
+
+
+@dataclass(frozen=True)
+class RuntimeBackends:
+    """Backends owned by one runtime plus the worker pool backing them, if any.
+
+    `pymupdf_local` always converts in-process; it is the same backend as
+    `pymupdf` unless conversions are process-isolated. Hedged conversions use
+    it so the cheap candidate never waits for a worker busy with Docling.
+    """
+
+    docling: DoclingConversionBackend | ProcessIsolatedBackend
+    pymupdf: PyMuPdfConversionBackend | ProcessIsolatedBackend
+    pymupdf_local: PyMuPdfConversionBackend
+    worker_pool: ConversionWorkerPool | None = None
+
+    def shutdown(self) -> None:
+        """Stop the worker pool and the in-process PyMuPDF page-range pool."""
+        if self.worker_pool is not None:
+            self.worker_pool.shutdown()
+        self.pymupdf_local.shutdown()
+
+
+def build_runtime_backends(config: ServiceConfig) -> RuntimeBackends:
+    """Create backends honoring the configured conversion isolation mode.
+
+    Raises `ValueError` when an explicit converter cache limit cannot hold the
+    declared prewarm profiles.
+    """
+    cache_max_entries = converter_cache_max_entries(
+        prewarm_converters=prewarm_converter_count(config.converter_prewarm_profiles)
+    )
+    pymupdf_local = PyMuPdfConversionBackend(
+        parallel_min_pages=config.pymupdf_parallel_min_pages,
+        parallel_max_processes=config.pymupdf_parallel_max_processes,
+    )
+    if config.conversion_isolation != "process":
+        shared_docling_converter_registry().ensure_capacity(cache_max_entries)
+        return RuntimeBackends(
+            docling=DoclingConversionBackend(), pymupdf=pymupdf_local, pymupdf_local=pymupdf_local
+        )
+    worker_pool = ConversionWorkerPool(
+        max_workers=config.max_workers,
+        pymupdf_parallel_min_pages=config.pymupdf_parallel_min_pages,
+        pymupdf_parallel_max_processes=config.pymupdf_parallel_max_processes,
+        converter_cache_max_entries=cache_max_entries,
+    )
+    return RuntimeBackends(
+        docling=ProcessIsolatedBackend(pool=worker_pool, backend_name="docling"),
+        pymupdf=ProcessIsolatedBackend(pool=worker_pool, backend_name="pymupdf"),
+        pymupdf_local=pymupdf_local,
+        worker_pool=worker_pool,
+    )
+
+
+__all__ = ["RuntimeBackends", "build_runtime_backends"]
@@ -0,0 +1,312 @@
+"""Single-flight coalescing of identical in-flight v1 conversions.
+
+Purpose:
+    Let jobs whose source bytes and output-affecting options match a job that
+    is already queued or running attach to that leader instead of claiming
+    their own worker. When the leader's conversion finishes, every attached
+    follower is completed from the same artifact (or failed with the same
+    deterministic error). Followers keep their own job id, status record and
+    cancel semantics; a canceled follower is simply skipped. A group is
+    dispatched at the highest priority of its members, so a HIGH follower
+    boosts a queued NORMAL leader.
+
+Relationships:
+    - Owned by `infrastructure.runtime_engine.ServiceRuntime`.
+    - Groups are keyed with `infrastructure.result_cache.result_cache_key` and
+      the result cache's output variant, so coalescing and the result cache
+      agree on what "identical" means; hedged jobs never share a group with
+      jobs that always get Docling output.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from scripts.sir_convert_a_lot.application.contracts import ConversionMetadata
+from scripts.sir_convert_a_lot.domain.specs import JobSpec, JobStatus, Priority
+from scripts.sir_convert_a_lot.infrastructure.job_store import (
+    JobExpired,
+    JobMissing,
+    JobStateConflict,
+    JobStore,
+)
+from scripts.sir_convert_a_lot.infrastructure.result_cache import file_sha256, result_cache_key
+from scripts.sir_convert_a_lot.infrastructure.runtime_conversion import (
+    options_fingerprint_for_spec,
+)
+from scripts.sir_convert_a_lot.infrastructure.runtime_models import (
+    ServiceError,
+    StoredJob,
+    stored_job_from_record,
+)
+
+COALESCED_STAGE = "coalesced"
+
+
+@dataclass
+class _FlightGroup:
+    key: str
+    leader_id: str
+    leader_timeout_seconds: int
+    leader_priority: Priority
+    follower_ids: list[str] = field(default_factory=list)
+    attached_at: dict[str, float] = field(default_factory=dict)
+    follower_priorities: dict[str, Priority] = field(default_factory=dict)
+
+    @property
+    def priority(self) -> Priority:
+        if Priority.HIGH in {self.leader_priority, *self.follower_priorities.values()}:
+            return Priority.HIGH
+        return Priority.NORMAL
+
+
+class JobCoalescer:
+    """In-memory leader/follower registry for identical v1 jobs.
+
+    Only the leader is dispatched to a worker. Groups are rebuilt from QUEUED
+    jobs at runtime startup, so followers survive a restart. `boost_leader`
+    is called with a leader id and priority when a follower raises the
+    group's priority, so the caller can reprioritize the queued leader.
+    """
+
+    def __init__(
+        self,
+        *,
+        job_store: JobStore,
+        service_revision: str,
+        output_variant: Callable[[JobSpec], str | None] | None = None,
+        boost_leader: Callable[[str, Priority], object] | None = None,
+    ) -> None:
+        self._job_store = job_store
+        self._service_revision = service_revision
+        self._output_variant = output_variant
+        self._boost_leader = boost_leader
+        self._lock = threading.Lock()
+        self._groups_by_key: dict[str, _FlightGroup] = {}
+        self._groups_by_leader: dict[str, _FlightGroup] = {}
+        self._leader_by_follower: dict[str, str] = {}
+        self._leader_failures: dict[str, ServiceError] = {}
+
+    def attach(self, job: StoredJob, source_sha256: str) -> str | None:
+        """Register `job`; return the leader id when it joined an in-flight group."""
+        key = result_cache_key(
+            source_sha256=source_sha256,
+            spec=job.spec,
+            service_revision=self._service_revision,
+            output_variant=self._output_variant(job.spec) if self._output_variant else None,
+        )
+        with self._lock:
+            group = self._groups_by_key.get(key)
+            if group is None:
+                group = _FlightGroup(
+                    key=key,
+                    leader_id=job.job_id,
+                    leader_timeout_seconds=job.spec.execution.document_timeout_seconds,
+                    leader_priority=job.spec.execution.priority,
+                )
+                self._groups_by_key[key] = group
+                self._groups_by_leader[job.job_id] = group
+                return None
+            previous_priority = group.priority
+            group.follower_ids.append(job.job_id)
+            group.attached_at[job.job_id] = time.perf_counter()
+            group.follower_priorities[job.job_id] = job.spec.execution.priority
+            self._leader_by_follower[job.job_id] = group.leader_id
+            leader_id = group.leader_id
+            boosted = group.priority if group.priority != previous_priority else None
+        if boosted is not None and self._boost_leader is not None:
+            self._boost_leader(leader_id, boosted)
+        try:
+            self._job_store.update_progress(
+                job.job_id, status=JobStatus.QUEUED, stage=COALESCED_STAGE
+            )
+        except (JobMissing, JobExpired):
+            pass
+        return leader_id
+
+    def attach_upload(self, job: StoredJob) -> str | None:
+        """Re-register a queued job from its persisted upload, e.g. after a restart."""
+        try:
+            source_sha256 = job.source_sha256 or file_sha256(job.upload_path)
+        except OSError:
+            return None
+        return self.attach(job, source_sha256)
+
+    def dispatch_priority(self, job_id: str, priority: Priority) -> Priority:
+        """Return the priority to dispatch `job_id` at, raised by any HIGH follower."""
+        with self._lock:
+            group = self._groups_by_leader.get(job_id)
+            if group is not None and group.priority == Priority.HIGH:
+                return Priority.HIGH
+            return priority
+
+    def is_follower(self, job_id: str) -> bool:
+        """Return True when `job_id` waits on another job's conversion."""
+        with self._lock:
+            return job_id in self._leader_by_follower
+
+    def complete_followers(
+        self,
+        leader_id: str,
+        *,
+        markdown_bytes: bytes,
+        metadata: ConversionMetadata,
+        warnings: list[str],
+    ) -> list[str]:
+        """Complete every live follower of `leader_id` from the leader's artifact."""
+        group = self._pop_group(leader_id)
+        completed: list[str] = []
+        if group is None:
+            return completed
+        for follower_id in group.follower_ids:
+            job = self._claim(follower_id)
+            if job is None:
+                continue
+            try:
+                self._job_store.mark_succeeded(
+                    follower_id,
+                    markdown_bytes=markdown_bytes,
+                    backend_used=metadata.backend_used,
+                    acceleration_used=metadata.acceleration_used,
+                    ocr_enabled=metadata.ocr_enabled,
+                    formula_enrichment_used=metadata.formula_enrichment_used,
+                    ocr_languages=metadata.ocr_languages,
+                    backend_route_reasons=metadata.backend_route_reasons,
+                    preclassification_labels=metadata.preclassification_labels,
+                    preclassification_hits=metadata.preclassification_hits,
+                    options_fingerprint=options_fingerprint_for_spec(job.spec),
+                    warnings=list(warnings),
+                    phase_timings_ms=_coalesced_wait_timing(group, follower_id),
+                    coalesced_with=leader_id,
+                )
+            except (JobMissing, JobExpired, JobStateConflict):
+                continue
+            completed.append(follower_id)
+        return completed
+
+    def is_leader(self, job_id: str) -> bool:
+        """Return True when followers wait on `job_id`'s conversion."""
+        with self._lock:
+            return job_id in self._groups_by_leader
+
+    def record_leader_failure(self, leader_id: str, error: ServiceError) -> None:
+        """Remember how a leader failed until `settle_leader` runs after its conversion returns."""
+        with self._lock:
+            if leader_id in self._groups_by_leader:
+                self._leader_failures[leader_id] = error
+
+    def settle_leader(self, leader_id: str) -> str | None:
+        """Resolve followers after the leader ended without a usable artifact.
+
+        Deterministic failures recorded with `record_leader_failure` are
+        shared with every follower. Retryable failures, cancellations, and
+        timeouts that a follower's longer `document_timeout_seconds` might
+        survive promote the next follower to leader instead; its id is
+        returned so the caller can dispatch it.
+        """
+        with self._lock:
+            error = self._leader_failures.pop(leader_id, None)
+        group = self._pop_group(leader_id)
+        if group is None:
+            return None
+        survivors: list[str] = []
+        for follower_id in group.follower_ids:
+            if error is not None and self._shares_failure(group, follower_id, error):
+                self._fail(group, follower_id, error, leader_id=leader_id)
+            else:
+                survivors.append(follower_id)
+        return self._promote(group, survivors)
+
+    def _shares_failure(self, group: _FlightGroup, follower_id: str, error: ServiceError) -> bool:
+        if error.retryable:
+            return False
+        if error.code != "conversion_timeout":
+            return True
+        try:
+            record = self._job_store.get_job(follower_id)
+        except (JobMissing, JobExpired):
+            return True
+        return record.spec.execution.document_timeout_seconds <= group.leader_timeout_seconds
+
+    def _fail(
+        self, group: _FlightGroup, follower_id: str, error: ServiceError, *, leader_id: str
+    ) -> None:
+        if self._claim(follower_id) is None:
+            return
+        try:
+            self._job_store.mark_failed(
+                follower_id,
+                code=error.code,
+                message=error.message,
+                retryable=error.retryable,
+                details=error.details,
+                phase_timings_ms=_coalesced_wait_timing(group, follower_id),
+                coalesced_with=leader_id,
+            )
+        except (JobMissing, JobExpired, JobStateConflict):
+            return
+
+    def _promote(self, group: _FlightGroup, survivors: list[str]) -> str | None:
+        live_ids = [follower_id for follower_id in survivors if self._is_queued(follower_id)]
+        if not live_ids:
+            return None
+        new_leader_id, *followers = live_ids
+        try:
+            new_leader = self._job_store.get_job(new_leader_id)
+        except (JobMissing, JobExpired):
+            return None
+        promoted = _FlightGroup(
+            key=group.key,
+            leader_id=new_leader_id,
+            leader_timeout_seconds=new_leader.spec.execution.document_timeout_seconds,
+            leader_priority=new_leader.spec.execution.priority,
+            follower_ids=followers,
+            attached_at={job_id: group.attached_at[job_id] for job_id in followers},
+            follower_priorities={job_id: group.follower_priorities[job_id] for job_id in followers},
+        )
+        with self._lock:
+            self._groups_by_key.setdefault(group.key, promoted)
+            if self._groups_by_key[group.key] is promoted:
+                self._groups_by_leader[new_leader_id] = promoted
+                for follower_id in followers:
+                    self._leader_by_follower[follower_id] = new_leader_id
+        return new_leader_id
+
+    def _is_queued(self, job_id: str) -> bool:
+        try:
+            return self._job_store.get_job(job_id).status == JobStatus.QUEUED
+        except (JobMissing, JobExpired):
+            return False
+
+    def _pop_group(self, leader_id: str) -> _FlightGroup | None:
+        with self._lock:
+            group = self._groups_by_leader.pop(leader_id, None)
+            if group is None:
+                return None
+            if self._groups_by_key.get(group.key) is group:
+                del self._groups_by_key[group.key]
+            for follower_id in group.follower_ids:
+                self._leader_by_follower.pop(follower_id, None)
+            return group
+
+    def _claim(self, follower_id: str) -> StoredJob | None:
+        try:
+            if not self._job_store.claim_queued_job(follower_id):
+                return None
+            record = self._job_store.get_job(follower_id)
+        except (JobMissing, JobExpired):
+            return None
+        return stored_job_from_record(record)
+
+
+def _coalesced_wait_timing(group: _FlightGroup, follower_id: str) -> dict[str, int]:
+    attached = group.attached_at.get(follower_id)
+    if attached is None:
+        return {}
+    return {"coalesced_wait_ms": max(0, int((time.perf_counter() - attached) * 1000))}
+
+
+__all__ = ["COALESCED_STAGE", "JobCoalescer"]
@@ -15,13 +15,20 @@ import hashlib
 import json
 import os
 from pathlib import Path
+from typing import Literal
 
-from scripts.sir_convert_a_lot.infrastructure.runtime_models import ServiceConfig
+from scripts.sir_convert_a_lot.domain.specs import OcrMode, TableMode
+from scripts.sir_convert_a_lot.infrastructure.runtime_models import (
+    ConverterPrewarmProfile,
+    ServiceConfig,
+)
 
 CPU_UNLOCK_ENV_VARS: tuple[str, str] = (
     "SIR_CONVERT_A_LOT_ALLOW_CPU_ONLY",
     "SIR_CONVERT_A_LOT_ALLOW_CPU_FALLBACK",
 )
+CONVERTER_PREWARM_PROFILES_ENV_VAR = "SIR_CONVERT_A_LOT_DOCLING_PREWARM_PROFILES"
+_LAYOUT_MODEL_KEY_PREFIX = "docling_layout_"
 
 
 def fingerprint_for_request(spec_payload: dict[str, object], file_sha256: str) -> str:
@@ -30,6 +37,58 @@ def fingerprint_for_request(spec_payload: dict[str, object], file_sha256: str) -
     return hashlib.sha256(f"{normalized}:{file_sha256}".encode("utf-8")).hexdigest()
 
 
+def _non_negative_int_from_env(env_var: str, *, default: int) -> int:
+    raw = os.getenv(env_var, "").strip()
+    if raw == "":
+        return default
+    try:
+        value = int(raw)
+    except ValueError as exc:
+        raise ValueError(f"{env_var} must be a non-negative integer, got {raw!r}.") from exc
+    if value < 0:
+        raise ValueError(f"{env_var} must be a non-negative integer, got {raw!r}.")
+    return value
+
+
+def parse_converter_prewarm_profiles(raw: str) -> tuple[ConverterPrewarmProfile, ...]:
+    """Parse `;`-separated `ocr/table[:layout+layout]` prewarm profile declarations.
+
+    Layout keys may omit the `docling_layout_` prefix, so
+    `auto/accurate:egret_large+heron` declares AUTO OCR with ACCURATE tables on
+    `docling_layout_egret_large` and `docling_layout_heron`.
+    """
+    profiles: list[ConverterPrewarmProfile] = []
+    for declaration in raw.split(";"):
+        declaration = declaration.strip()
+        if declaration == "":
+            continue
+        modes, _, layouts = declaration.partition(":")
+        ocr_raw, separator, table_raw = modes.partition("/")
+        try:
+            if separator == "":
+                raise ValueError("missing '/'")
+            ocr_mode = OcrMode(ocr_raw.strip().lower())
+            table_mode = TableMode(table_raw.strip().lower())
+        except ValueError as exc:
+            raise ValueError(
+                f"{CONVERTER_PREWARM_PROFILES_ENV_VAR} entry {declaration!r} must look like "
+                "'<off|auto|force|regions>/<fast|accurate|adaptive>[:<layout>+<layout>]'."
+            ) from exc
+        layout_model_keys = tuple(
+            key if key.startswith(_LAYOUT_MODEL_KEY_PREFIX) else _LAYOUT_MODEL_KEY_PREFIX + key
+            for key in (part.strip().lower() for part in layouts.split("+"))
+            if key != ""
+        )
+        profile = ConverterPrewarmProfile(
+            ocr_mode=ocr_mode,
+            table_mode=table_mode,
+            layout_model_keys=layout_model_keys,
+        )
+        if profile not in profiles:
+            profiles.append(profile)
+    return tuple(profiles)
+
+
 def service_config_from_env() -> ServiceConfig:
     """Load runtime configuration from environment variables."""
     api_key = os.getenv("SIR_CONVERT_A_LOT_API_KEY", "dev-only-key")
@@ -48,8 +107,51 @@ def service_config_from_env() -> ServiceConfig:
             f"{joined_names}. Use explicit ServiceConfig test overrides instead."
         )
 
+    isolation_env = os.getenv("SIR_CONVERT_A_LOT_CONVERSION_ISOLATION", "thread").strip().lower()
+    if isolation_env == "thread":
+        conversion_isolation: Literal["thread", "process"] = "thread"
+    elif isolation_env == "process":
+        conversion_isolation = "process"
+    else:
+        raise ValueError(
+            "SIR_CONVERT_A_LOT_CONVERSION_ISOLATION must be 'thread' or 'process', "
+            f"got {isolation_env!r}."
+        )
+
     return ServiceConfig(
         api_key=api_key,
         data_root=data_root,
         gpu_available=gpu_available,
+        conversion_isolation=conversion_isolation,
+        converter_prewarm_profiles=parse_converter_prewarm_profiles(
+            os.getenv(CONVERTER_PREWARM_PROFILES_ENV_VAR, "")
+        ),
+        result_cache_ttl_seconds=_non_negative_int_from_env(
+            "SIR_CONVERT_A_LOT_RESULT_CACHE_TTL_SECONDS", default=7 * 24 * 3600
+        ),
+        result_cache_max_bytes=_non_negative_int_from_env(
+            "SIR_CONVERT_A_LOT_RESULT_CACHE_MAX_MB", default=2048
+        )
+        * 1024
+        * 1024,
+        page_sharding_min_pages=_non_negative_int_from_env(
+            "SIR_CONVERT_A_LOT_PAGE_SHARDING_MIN_PAGES", default=0
+        ),
+        page_sharding_max_shards=_non_negative_int_from_env(
+            "SIR_CONVERT_A_LOT_PAGE_SHARDING_MAX_SHARDS", default=4
+        ),
+        page_sharding_min_pages_per_shard=_non_negative_int_from_env(
+            "SIR_CONVERT_A_LOT_PAGE_SHARDING_MIN_PAGES_PER_SHARD", default=25
+        ),
+        page_sharding_max_concurrency=_non_negative_int_from_env(
+            "SIR_CONVERT_A_LOT_PAGE_SHARDING_MAX_CONCURRENCY", default=4
+        ),
+        auto_backend_triage=os.getenv("SIR_CONVERT_A_LOT_AUTO_BACKEND_TRIAGE", "0") == "1",
+        hedged_high_priority=os.getenv("SIR_CONVERT_A_LOT_HEDGED_HIGH_PRIORITY", "0") == "1",
+        pymupdf_parallel_min_pages=_non_negative_int_from_env(
+            "SIR_CONVERT_A_LOT_PYMUPDF_PARALLEL_MIN_PAGES", default=0
+        ),
+        pymupdf_parallel_max_processes=_non_negative_int_from_env(
+            "SIR_CONVERT_A_LOT_PYMUPDF_PARALLEL_MAX_PROCESSES", default=0
+        ),
     )
@@ -7,6 +7,10 @@ Purpose:
 Relationships:
     - Used by `infrastructure.runtime_engine` during `_execute_conversion`.
     - Depends on backend contracts and routing modules in infrastructure.
+    - Delegates large PDFs to `infrastructure.page_sharding` when enabled.
+    - Resolves `backend_strategy=auto` through `infrastructure.backend_routing`
+      triage when enabled, and races HIGH priority Docling jobs against
+      PyMuPDF through `infrastructure.hedged_conversion` when enabled.
 """
 
 from __future__ import annotations
@@ -14,21 +18,44 @@ from __future__ import annotations
 import hashlib
 import json
 import time
+from dataclasses import replace
 
 from scripts.sir_convert_a_lot.application.contracts import ConversionMetadata
-from scripts.sir_convert_a_lot.domain.specs import JobSpec, NormalizeMode
-from scripts.sir_convert_a_lot.infrastructure.backend_routing import select_backend
+from scripts.sir_convert_a_lot.domain.specs import (
+    BackendStrategy,
+    FormulaEnrichmentMode,
+    JobSpec,
+    NormalizeMode,
+    OcrMode,
+    Priority,
+)
+from scripts.sir_convert_a_lot.infrastructure.backend_routing import (
+    auto_route_policy_reasons,
+    route_auto_backend,
+    select_backend,
+)
 from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
+    CancelToken,
     ConversionBackend,
     ConversionRequest,
+    PdfSource,
+    ProgressCallback,
 )
 from scripts.sir_convert_a_lot.infrastructure.gpu_runtime_probe import GpuRuntimeProbeResult
+from scripts.sir_convert_a_lot.infrastructure.hedged_conversion import convert_hedged
 from scripts.sir_convert_a_lot.infrastructure.markdown_normalizer import normalize_markdown
 from scripts.sir_convert_a_lot.infrastructure.markdown_quality_report import (
     build_markdown_quality_report,
     format_extreme_line_warning,
     format_reserved_token_warning,
 )
+from scripts.sir_convert_a_lot.infrastructure.page_sharding import (
+    PageShardingPolicy,
+    convert_page_shards,
+    plan_page_shards,
+)
+from scripts.sir_convert_a_lot.infrastructure.pdf_inspection import pdf_page_count
+from scripts.sir_convert_a_lot.infrastructure.runtime_models import ServiceError
 
 
 def merge_phase_timings(current: dict[str, int], additional: dict[str, int]) -> dict[str, int]:
@@ -39,35 +66,136 @@ def merge_phase_timings(current: dict[str, int], additional: dict[str, int]) ->
     return merged
 
 
+def options_fingerprint_for_spec(spec: JobSpec) -> str:
+    """Return the `sha256:`-prefixed fingerprint of a full job specification.
+
+    `conversion.formula_enrichment` is left out while it holds its default so
+    specs that predate the field keep their fingerprint.
+    """
+    payload = spec.model_dump(mode="json")
+    if spec.conversion.formula_enrichment == FormulaEnrichmentMode.AUTO:
+        del payload["conversion"]["formula_enrichment"]
+    digest = hashlib.sha256(
+        json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    ).hexdigest()
+    return f"sha256:{digest}"
+
+
+def gpu_not_available_error(probe: GpuRuntimeProbeResult) -> ServiceError:
+    """Build the retryable error for Docling work without a usable GPU runtime."""
+    return ServiceError(
+        status_code=503,
+        code="gpu_not_available",
+        message="GPU runtime is unavailable for the selected backend under GPU-required policy.",
+        retryable=True,
+        details={
+            "reason": "backend_gpu_runtime_unavailable",
+            "backend": "docling",
+            "runtime_kind": probe.runtime_kind,
+            "hip_version": probe.hip_version,
+            "cuda_version": probe.cuda_version,
+        },
+    )
+
+
+def hedging_applies(spec: JobSpec, *, hedged_high_priority: bool, allow_cpu_fallback: bool) -> bool:
+    """Return True when `spec` may race PyMuPDF against Docling under the config.
+
+    Jobs that qualify can complete with PyMuPDF output, so their results must
+    not be shared with jobs that always get Docling output.
+    """
+    return (
+        hedged_high_priority
+        and spec.execution.priority == Priority.HIGH
+        and spec.conversion.backend_strategy == BackendStrategy.AUTO
+        and not auto_route_policy_reasons(spec, allow_cpu_fallback=allow_cpu_fallback)
+    )
+
+
 def execute_job_conversion(
     *,
     spec: JobSpec,
     source_filename: str,
-    source_bytes: bytes,
+    source: PdfSource,
     gpu_available: bool,
     gpu_runtime_probe: GpuRuntimeProbeResult | None,
     docling_backend: ConversionBackend,
     pymupdf_backend: ConversionBackend,
+    progress: ProgressCallback | None = None,
+    cancel: CancelToken | None = None,
+    page_sharding: PageShardingPolicy | None = None,
+    auto_backend_triage: bool = False,
+    allow_cpu_fallback: bool = False,
+    hedged_high_priority: bool = False,
+    hedge_pymupdf_backend: ConversionBackend | None = None,
 ) -> tuple[str, ConversionMetadata, list[str], dict[str, int]]:
-    """Execute one conversion and return markdown, metadata, warnings, and timings."""
+    """Execute one conversion and return markdown, metadata, warnings, and timings.
+
+    `source` is normally the job upload's path, which backends open in place;
+    `cancel` is the job's watchdog token.
+    With a `page_sharding` policy, PDFs long enough to qualify are converted
+    as concurrent page-range shards and stitched before normalization. With
+    `auto_backend_triage`, `backend_strategy=auto` jobs are routed by
+    `route_auto_backend` and its reason codes land in the metadata. With
+    `hedged_high_priority`, unsharded HIGH priority `auto` jobs still bound
+    for Docling race a PyMuPDF conversion when policy permits CPU execution,
+    run on `hedge_pymupdf_backend` (an in-process backend) when given, and
+    never wait on Docling past the spec's `document_timeout_seconds`.
+    """
+    started = time.perf_counter()
     request = ConversionRequest(
         source_filename=source_filename,
-        source_bytes=source_bytes,
+        source=source,
         backend_strategy=spec.conversion.backend_strategy,
         ocr_mode=spec.conversion.ocr_mode,
         table_mode=spec.conversion.table_mode,
         gpu_available=gpu_available,
         gpu_runtime_probe=gpu_runtime_probe,
+        formula_enrichment=spec.conversion.formula_enrichment,
+        progress=progress,
+        cancel=cancel,
     )
+    phase_timings_ms: dict[str, int] = {}
+    route_reasons: list[str] | None = None
+    if auto_backend_triage and spec.conversion.backend_strategy == BackendStrategy.AUTO:
+        triage_started = time.perf_counter()
+        route = route_auto_backend(spec, source, allow_cpu_fallback=allow_cpu_fallback)
+        phase_timings_ms["backend_triage_ms"] = max(
+            0, int((time.perf_counter() - triage_started) * 1000)
+        )
+        route_reasons = list(route.reasons)
+        if route.backend_strategy == BackendStrategy.PYMUPDF:
+            request = replace(
+                request, backend_strategy=BackendStrategy.PYMUPDF, ocr_mode=OcrMode.OFF
+            )
     backend = select_backend(
-        backend_strategy=spec.conversion.backend_strategy,
+        backend_strategy=request.backend_strategy,
         docling_backend=docling_backend,
         pymupdf_backend=pymupdf_backend,
     )
-    phase_timings_ms: dict[str, int] = {}
 
     backend_started = time.perf_counter()
-    backend_result = backend.convert(request)
+    shards = (
+        plan_page_shards(pdf_page_count(source), page_sharding) if page_sharding is not None else []
+    )
+    hedged = request.backend_strategy == BackendStrategy.AUTO and hedging_applies(
+        spec,
+        hedged_high_priority=hedged_high_priority,
+        allow_cpu_fallback=allow_cpu_fallback,
+    )
+    if shards and page_sharding is not None:
+        backend_result = convert_page_shards(backend, request, shards, slots=page_sharding.slots)
+    elif hedged:
+        backend_result = convert_hedged(
+            request,
+            docling_backend=docling_backend,
+            pymupdf_backend=hedge_pymupdf_backend or pymupdf_backend,
+            timeout_seconds=max(
+                0.0, spec.execution.document_timeout_seconds - (time.perf_counter() - started)
+            ),
+        )
+    else:
+        backend_result = backend.convert(request)
     phase_timings_ms["backend_convert_ms"] = max(
         0, int((time.perf_counter() - backend_started) * 1000)
     )
@@ -81,18 +209,19 @@ def execute_job_conversion(
     phase_timings_ms["normalize_ms"] = max(0, int((time.perf_counter() - normalize_started) * 1000))
     normalized_quality = build_markdown_quality_report(markdown_content)
 
-    options_fingerprint = hashlib.sha256(
-        json.dumps(spec.model_dump(mode="json"), sort_keys=True, separators=(",", ":")).encode(
-            "utf-8"
-        )
-    ).hexdigest()
-
     metadata = ConversionMetadata(
         backend_used=backend_result.backend_used,
         acceleration_used=backend_result.acceleration_used,
         ocr_enabled=backend_result.ocr_enabled,
         table_mode=spec.conversion.table_mode,
-        options_fingerprint=f"sha256:{options_fingerprint}",
+        options_fingerprint=options_fingerprint_for_spec(spec),
+        formula_enrichment_used=backend_result.formula_enrichment_used,
+        ocr_languages=list(backend_result.ocr_languages) or None,
+        backend_route_reasons=route_reasons,
+        preclassification_labels=list(backend_result.preclassification_labels)
+        if backend_result.preclassification_labels is not None
+        else None,
+        preclassification_hits=backend_result.preclassification_hits,
     )
     warnings: list[str] = list(backend_result.warnings)
     if spec.conversion.normalize == NormalizeMode.STRICT:
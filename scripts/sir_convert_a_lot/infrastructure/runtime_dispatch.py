@@ -0,0 +1,136 @@
+"""In-memory dispatch queue for runtime job execution.
+
+Purpose:
+    Hold the ids of jobs awaiting a worker slot so runtime supervisors can
+    dispatch work the instant it arrives instead of re-scanning the job store
+    on a poll interval. Jobs are ordered by `ExecutionSpec.priority` first and
+    `created_at` second, with aging so NORMAL jobs cannot starve behind a
+    steady stream of HIGH jobs.
+
+Relationships:
+    - Owned by `infrastructure.runtime_engine.ServiceRuntime` and
+      `infrastructure.runtime_engine_v2.ServiceRuntimeV2`.
+    - Rebuilt from the filesystem job store once at runtime startup.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime
+
+from scripts.sir_convert_a_lot.domain.specs import Priority
+
+_QueueEntry = tuple[float, int, str]
+
+
+class JobDispatchQueue:
+    """Thread-safe priority/FIFO queue of job ids with condition-variable wakeups.
+
+    Each priority has its own heap keyed by `(created_at, insertion order)`.
+    A NORMAL job that has waited at least `aging_seconds` competes with HIGH
+    jobs on `created_at` alone, which bounds how long it can be overtaken.
+    """
+
+    def __init__(
+        self,
+        *,
+        aging_seconds: float = 300.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._condition = threading.Condition()
+        self._heaps: dict[Priority, list[_QueueEntry]] = {
+            Priority.HIGH: [],
+            Priority.NORMAL: [],
+        }
+        self._pending_ids: set[str] = set()
+        self._sequence = itertools.count()
+        self._aging_seconds = max(0.0, aging_seconds)
+        self._clock = clock
+        self._closed = False
+
+    def push(
+        self,
+        job_id: str,
+        *,
+        priority: Priority = Priority.NORMAL,
+        created_at: datetime | None = None,
+    ) -> bool:
+        """Enqueue a job id; return False when it is already pending or closed.
+
+        `created_at` defaults to the current time.
+        """
+        created_ts = created_at.timestamp() if created_at is not None else self._clock()
+        with self._condition:
+            if self._closed or job_id in self._pending_ids:
+                return False
+            heapq.heappush(self._heaps[priority], (created_ts, next(self._sequence), job_id))
+            self._pending_ids.add(job_id)
+            self._condition.notify()
+            return True
+
+    def promote(self, job_id: str, *, priority: Priority) -> bool:
+        """Move a pending NORMAL job to HIGH, keeping its `created_at` position.
+
+        Returns False when `priority` is not HIGH or the job is not pending at
+        NORMAL priority, e.g. because it was already dispatched.
+        """
+        with self._condition:
+            if priority != Priority.HIGH or job_id not in self._pending_ids:
+                return False
+            normal = self._heaps[Priority.NORMAL]
+            index = next((i for i, entry in enumerate(normal) if entry[2] == job_id), None)
+            if index is None:
+                return False
+            entry = normal.pop(index)
+            heapq.heapify(normal)
+            heapq.heappush(self._heaps[Priority.HIGH], entry)
+            return True
+
+    def pop(self, *, timeout: float | None) -> str | None:
+        """Return the next job id to dispatch, waiting up to `timeout` seconds for one."""
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._closed or self._has_pending(), timeout):
+                return None
+            if not self._has_pending():
+                return None
+            entry = heapq.heappop(self._heaps[self._next_priority()])
+            job_id = entry[2]
+            self._pending_ids.discard(job_id)
+            return job_id
+
+    def close(self) -> None:
+        """Reject new work and wake every waiter."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def _has_pending(self) -> bool:
+        return bool(self._pending_ids)
+
+    def _next_priority(self) -> Priority:
+        high = self._heaps[Priority.HIGH]
+        normal = self._heaps[Priority.NORMAL]
+        if not normal:
+            return Priority.HIGH
+        if not high:
+            return Priority.NORMAL
+        normal_head = normal[0]
+        aged = self._clock() - normal_head[0] >= self._aging_seconds
+        if aged and normal_head[0] < high[0][0]:
+            return Priority.NORMAL
+        return Priority.HIGH
+
+    def __contains__(self, job_id: object) -> bool:
+        with self._condition:
+            return job_id in self._pending_ids
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._pending_ids)
+
+
+__all__ = ["JobDispatchQueue"]
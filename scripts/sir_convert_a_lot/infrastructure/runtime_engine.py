@@ -11,7 +11,6 @@ Relationships:
 
 from __future__ import annotations
 
-import threading
 import time
 from typing import Literal
 from uuid import uuid4
@@ -33,8 +32,13 @@ from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
     BackendExecutionError,
     BackendGpuUnavailableError,
     BackendInputError,
+    BackendWorkerCrashedError,
+    ConversionBackend,
+)
+from scripts.sir_convert_a_lot.infrastructure.converter_prewarm import (
+    ConverterPrewarmer,
+    ConverterPrewarmStatus,
 )
-from scripts.sir_convert_a_lot.infrastructure.docling_backend import DoclingConversionBackend
 from scripts.sir_convert_a_lot.infrastructure.gpu_runtime_probe import (
     GpuRuntimeProbeResult,
     probe_torch_gpu_runtime,
@@ -46,19 +50,33 @@ from scripts.sir_convert_a_lot.infrastructure.job_store import (
     JobStateConflict,
     JobStore,
 )
-from scripts.sir_convert_a_lot.infrastructure.pymupdf_backend import PyMuPdfConversionBackend
+from scripts.sir_convert_a_lot.infrastructure.page_sharding import PageShardingPolicy
+from scripts.sir_convert_a_lot.infrastructure.pdf_inspection import has_pdf_header
+from scripts.sir_convert_a_lot.infrastructure.runtime_backends import build_runtime_backends
+from scripts.sir_convert_a_lot.infrastructure.runtime_coalescing import (
+    COALESCED_STAGE,
+    JobCoalescer,
+)
 from scripts.sir_convert_a_lot.infrastructure.runtime_config import (
     fingerprint_for_request,
     service_config_from_env,
 )
-from scripts.sir_convert_a_lot.infrastructure.runtime_conversion import execute_job_conversion
+from scripts.sir_convert_a_lot.infrastructure.runtime_conversion import (
+    execute_job_conversion,
+    gpu_not_available_error,
+)
 from scripts.sir_convert_a_lot.infrastructure.runtime_heartbeat import start_conversion_heartbeat
 from scripts.sir_convert_a_lot.infrastructure.runtime_models import (
     ServiceConfig,
     ServiceError,
     StoredJob,
+    stored_job_from_record,
     utc_now,
 )
+from scripts.sir_convert_a_lot.infrastructure.runtime_progress import job_progress_writer
+from scripts.sir_convert_a_lot.infrastructure.runtime_result_cache import JobResultCache
+from scripts.sir_convert_a_lot.infrastructure.runtime_supervisor import SupervisedJobRuntime
+from scripts.sir_convert_a_lot.infrastructure.upload_staging import StagedUpload, stage_upload_bytes
 
 __all__ = [
     "ServiceConfig",
@@ -71,7 +89,7 @@ __all__ = [
 ]
 
 
-class ServiceRuntime:
+class ServiceRuntime(SupervisedJobRuntime):
     """Thread-safe runtime state and execution for Sir Convert-a-Lot jobs."""
 
     def __init__(self, config: ServiceConfig) -> None:
@@ -85,59 +103,54 @@ class ServiceRuntime:
             data_root=config.data_root,
             ttl_seconds=config.idempotency_ttl_seconds,
         )
-        self.docling_backend = DoclingConversionBackend()
-        self.pymupdf_backend = PyMuPdfConversionBackend()
-        self._lock = threading.Lock()
-        self._shutdown_event = threading.Event()
-        self._supervisor_thread: threading.Thread | None = None
-        self._active_job_ids: set[str] = set()
+        self.backends = backends = build_runtime_backends(config)
+        self.docling_backend: ConversionBackend = backends.docling
+        self.pymupdf_backend: ConversionBackend = backends.pymupdf
+        self.result_cache = JobResultCache(config=config, job_store=self.job_store)
+        self.page_sharding = PageShardingPolicy.from_config(config)
+        self.coalescer = JobCoalescer(
+            job_store=self.job_store,
+            service_revision=config.service_revision,
+            output_variant=self.result_cache.output_variant,
+            boost_leader=lambda job_id, priority: self._dispatch_queue.promote(
+                job_id, priority=priority
+            ),
+        )
+        self._converter_prewarmer = ConverterPrewarmer(
+            profiles=config.converter_prewarm_profiles,
+            prewarm=backends.docling.prewarm,
+        )
+        self._init_supervision()
 
         self.job_store.sweep_expired()
         self.job_store.recover_running_jobs_to_queued(active_job_ids=self._active_job_ids)
+        queued_jobs = sorted(
+            self.job_store.list_queued_jobs(),
+            key=lambda record: (record.progress_stage == COALESCED_STAGE, record.created_at),
+        )
+        for queued in queued_jobs:
+            if self.coalescer.attach_upload(stored_job_from_record(queued)) is not None:
+                continue
+            self._dispatch_queue.push(
+                queued.job_id,
+                priority=queued.spec.execution.priority,
+                created_at=queued.created_at,
+            )
+        self._start_supervisor()
+        self._converter_prewarmer.start()
 
-        if self.config.enable_supervisor:
-            self._supervisor_thread = threading.Thread(target=self._supervisor_loop, daemon=True)
-            self._supervisor_thread.start()
+    def converter_prewarm_status(self) -> ConverterPrewarmStatus:
+        """Return startup converter prewarm progress for readiness checks."""
+        return self._converter_prewarmer.status()
 
-    def _supervisor_loop(self) -> None:
-        """Background supervisor that runs queued jobs and re-runs recovered jobs."""
-        while not self._shutdown_event.is_set():
-            try:
-                self.job_store.sweep_expired()
-                self.job_store.recover_running_jobs_to_queued(active_job_ids=self._active_job_ids)
-
-                with self._lock:
-                    active_count = len(self._active_job_ids)
-                    max_workers = max(1, self.config.max_workers)
-                if active_count < max_workers:
-                    for job_id in self.job_store.list_job_ids():
-                        with self._lock:
-                            if len(self._active_job_ids) >= max_workers:
-                                break
-                            if job_id in self._active_job_ids:
-                                continue
-                        try:
-                            record = self.job_store.get_job(job_id)
-                        except (JobMissing, JobExpired):
-                            continue
-                        if record.status != JobStatus.QUEUED:
-                            continue
-                        self.run_job_async(job_id)
-            except Exception:
-                # Defensive: keep supervisor alive.
-                pass
-
-            self._shutdown_event.wait(timeout=max(0.05, self.config.supervisor_poll_seconds))
+    def _sweep_expired_jobs(self) -> None:
+        self.job_store.sweep_expired()
+        self.result_cache.sweep()
 
     def shutdown(self) -> None:
         """Stop background supervisor loops and release runtime resources."""
-        self._shutdown_event.set()
-        if self._supervisor_thread is None:
-            return
-        if not self._supervisor_thread.is_alive():
-            return
-        join_timeout_seconds = max(1.0, self.config.supervisor_poll_seconds * 4)
-        self._supervisor_thread.join(timeout=join_timeout_seconds)
+        super().shutdown()
+        self.backends.shutdown()
 
     def _new_job_id(self) -> str:
         return f"job_{uuid4().hex[:26]}"
@@ -157,34 +170,7 @@ class ServiceRuntime:
         except JobMissing:
             return None
 
-        return StoredJob(
-            job_id=record.job_id,
-            spec=record.spec,
-            source_filename=record.source_filename,
-            upload_path=record.upload_path,
-            artifact_path=record.artifact_path,
-            status=record.status,
-            created_at=record.created_at,
-            updated_at=record.updated_at,
-            expires_at=record.expires_at,
-            progress_stage=record.progress_stage,
-            pages_total=record.pages_total,
-            pages_processed=record.pages_processed,
-            last_heartbeat_at=record.last_heartbeat_at,
-            current_phase_started_at=record.current_phase_started_at,
-            phase_timings_ms=dict(record.phase_timings_ms),
-            warnings=list(record.warnings),
-            artifact_sha256=record.artifact_sha256,
-            artifact_size_bytes=record.artifact_size_bytes,
-            backend_used=record.backend_used,
-            acceleration_used=record.acceleration_used,
-            ocr_enabled=record.ocr_enabled,
-            options_fingerprint=record.options_fingerprint,
-            failure_code=record.failure_code,
-            failure_message=record.failure_message,
-            failure_retryable=record.failure_retryable,
-            failure_details=record.failure_details,
-        )
+        return stored_job_from_record(record)
 
     def get_idempotency(self, scope_key: str):
         return self.idempotency_store.get(scope_key)
@@ -193,18 +179,28 @@ class ServiceRuntime:
         self.idempotency_store.put(scope_key, fingerprint, job_id)
 
     def create_job(self, spec: JobSpec, upload_bytes: bytes, source_filename: str) -> StoredJob:
+        with stage_upload_bytes(upload_bytes, self.job_store.staging_dir) as staged:
+            return self.create_staged_job(spec, staged, source_filename)
+
+    def create_staged_job(
+        self, spec: JobSpec, upload: StagedUpload, source_filename: str
+    ) -> StoredJob:
+        """Create a job from a staged upload; the caller schedules it with `run_job_async`."""
         self.validate_backend_strategy(spec)
         self.validate_acceleration_policy(spec)
         job_id = self._new_job_id()
         record = self.job_store.create_job(
-            job_id=job_id,
-            spec=spec,
-            source_filename=source_filename,
-            upload_bytes=upload_bytes,
+            job_id=job_id, spec=spec, source_filename=source_filename, upload=upload
         )
         stored = self.get_job(record.job_id)
         if stored is None:
             raise RuntimeError("created job must be loadable immediately")
+        if self.result_cache.complete_from_cache(stored, upload.sha256):
+            completed = self.get_job(stored.job_id)
+            if completed is not None:
+                return completed
+        if self.coalescer.attach(stored, upload.sha256) is not None:
+            return self.get_job(stored.job_id) or stored
         return stored
 
     def _set_job_status(
@@ -283,22 +279,7 @@ class ServiceRuntime:
         ):
             probe = probe_torch_gpu_runtime()
             if not (probe.is_available and probe.runtime_kind in {"rocm", "cuda"}):
-                raise ServiceError(
-                    status_code=503,
-                    code="gpu_not_available",
-                    message=(
-                        "GPU runtime is unavailable for the selected backend "
-                        "under GPU-required policy."
-                    ),
-                    retryable=True,
-                    details={
-                        "reason": "backend_gpu_runtime_unavailable",
-                        "backend": "docling",
-                        "runtime_kind": probe.runtime_kind,
-                        "hip_version": probe.hip_version,
-                        "cuda_version": probe.cuda_version,
-                    },
-                )
+                raise gpu_not_available_error(probe)
         return probe
 
     def _execute_conversion(
@@ -307,40 +288,37 @@ class ServiceRuntime:
         self.validate_backend_strategy(job.spec)
         runtime_probe = self.validate_acceleration_policy(job.spec)
 
-        source_bytes = job.upload_path.read_bytes()
-        if not source_bytes.startswith(b"%PDF"):
+        if not has_pdf_header(job.upload_path):
             raise ServiceError(
                 status_code=422,
                 code="pdf_unreadable",
                 message="Uploaded file is not a readable PDF.",
                 retryable=False,
             )
+        progress = job_progress_writer(
+            self.job_store,
+            job.job_id,
+            min_interval_seconds=self.config.progress_persist_interval_seconds,
+        )
         try:
             return execute_job_conversion(
                 spec=job.spec,
                 source_filename=job.source_filename,
-                source_bytes=source_bytes,
+                source=job.upload_path,
                 gpu_available=self.config.gpu_available,
                 gpu_runtime_probe=runtime_probe,
                 docling_backend=self.docling_backend,
                 pymupdf_backend=self.pymupdf_backend,
+                progress=progress,
+                cancel=self._conversion_cancel(job.job_id),
+                page_sharding=self.page_sharding,
+                auto_backend_triage=self.config.auto_backend_triage,
+                allow_cpu_fallback=self.config.allow_cpu_fallback,
+                hedged_high_priority=self.config.hedged_high_priority,
+                hedge_pymupdf_backend=self.backends.pymupdf_local,
             )
         except BackendGpuUnavailableError as exc:
-            raise ServiceError(
-                status_code=503,
-                code="gpu_not_available",
-                message=(
-                    "GPU runtime is unavailable for the selected backend under GPU-required policy."
-                ),
-                retryable=True,
-                details={
-                    "reason": "backend_gpu_runtime_unavailable",
-                    "backend": "docling",
-                    "runtime_kind": exc.probe.runtime_kind,
-                    "hip_version": exc.probe.hip_version,
-                    "cuda_version": exc.probe.cuda_version,
-                },
-            ) from exc
+            raise gpu_not_available_error(exc.probe) from exc
         except BackendInputError as exc:
             raise ServiceError(
                 status_code=422,
@@ -355,104 +333,148 @@ class ServiceRuntime:
                 message=f"Unexpected backend conversion failure: {exc}",
                 retryable=True,
             ) from exc
+        finally:
+            progress.flush()
 
-    def run_job_async(self, job_id: str) -> None:
-        """Run a conversion job asynchronously in a background thread."""
+    def _enqueue(self, job_id: str) -> None:
+        if self.coalescer.is_follower(job_id):
+            return
+        try:
+            record = self.job_store.get_job(job_id)
+        except (JobMissing, JobExpired):
+            return
+        if record.status != JobStatus.QUEUED:
+            return
+        self._dispatch_queue.push(
+            job_id,
+            priority=self.coalescer.dispatch_priority(job_id, record.spec.execution.priority),
+            created_at=record.created_at,
+        )
+
+    def _requeue_running_job(self, job_id: str) -> bool:
+        try:
+            return self.job_store.requeue_running_job(job_id)
+        except (JobMissing, JobExpired):
+            return False
+
+    def _mark_job_failed(self, job_id: str, error: ServiceError, elapsed_ms: int) -> bool:
+        try:
+            self.job_store.mark_failed(
+                job_id,
+                code=error.code,
+                message=error.message,
+                retryable=error.retryable,
+                details=error.details,
+                phase_timings_ms={"conversion_attempt_ms": elapsed_ms},
+            )
+        except (JobMissing, JobExpired, JobStateConflict):
+            return False
+        self.coalescer.record_leader_failure(job_id, error)
+        return True
+
+    def _settle_followers(self, job_id: str) -> None:
+        """Share a finished leader's failure with its followers or hand the work to one.
+
+        Runs once the leader's own `_run_job` is done, so a follower is never
+        promoted while a timed-out leader's conversion is still running.
+        Leaders that were requeued or are running on another worker keep
+        their group.
+        """
+        if not self.coalescer.is_leader(job_id):
+            return
         with self._lock:
-            if job_id in self._active_job_ids:
-                return
-            self._active_job_ids.add(job_id)
-        thread = threading.Thread(target=self._run_job, args=(job_id,), daemon=True)
-        thread.start()
+            requeued = job_id in self._requeue_on_release
+        job = self.get_job(job_id)
+        if requeued or (job is not None and job.status == JobStatus.RUNNING):
+            return
+        promoted_job_id = self.coalescer.settle_leader(job_id)
+        if promoted_job_id is not None:
+            self.run_job_async(promoted_job_id)
 
     def _run_job(self, job_id: str) -> None:
         try:
-            try:
-                claimed = self.job_store.claim_queued_job(job_id)
-            except (JobMissing, JobExpired):
-                return
-            if not claimed:
+            if self.coalescer.is_follower(job_id):
                 return
+            try:
+                self._run_claimed_job(job_id)
+            finally:
+                self._settle_followers(job_id)
+        finally:
+            self._release_slot(job_id)
 
-            job = self.get_job(job_id)
-            if job is None:
+    def _run_claimed_job(self, job_id: str) -> None:
+        try:
+            if not self.job_store.claim_queued_job(job_id):
                 return
+        except (JobMissing, JobExpired):
+            return
+        time.sleep(self.config.processing_delay_seconds)
+        job = self.get_job(job_id)
+        if job is None or job.status == JobStatus.CANCELED:
+            return
+
+        self._set_job_status(job_id, JobStatus.RUNNING, "converting")
+        self.job_store.touch_heartbeat(job_id)
+        heartbeat_stop, heartbeat_thread = start_conversion_heartbeat(
+            job_store=self.job_store,
+            job_id=job_id,
+            heartbeat_interval_seconds=self.config.heartbeat_interval_seconds,
+        )
 
-            time.sleep(self.config.processing_delay_seconds)
+        conversion_started = time.perf_counter()
 
-            job = self.get_job(job_id)
-            if job is None:
-                return
-            if job.status == JobStatus.CANCELED:
-                return
+        def _stop_heartbeat() -> int:
+            heartbeat_stop.set()
+            heartbeat_thread.join(timeout=max(0.5, self.config.heartbeat_interval_seconds))
+            return max(0, int((time.perf_counter() - conversion_started) * 1000))
 
-            self._set_job_status(
-                job_id, JobStatus.RUNNING, "converting", pages_processed=1, pages_total=1
-            )
-            self.job_store.touch_heartbeat(job_id)
-            heartbeat_stop, heartbeat_thread = start_conversion_heartbeat(
-                job_store=self.job_store,
-                job_id=job_id,
-                heartbeat_interval_seconds=self.config.heartbeat_interval_seconds,
+        watchdog = self._start_conversion_watchdog(
+            job_id,
+            timeout_seconds=job.spec.execution.document_timeout_seconds,
+            conversion_started=conversion_started,
+        )
+        try:
+            markdown_content, metadata, warnings, phase_timings_ms = self._execute_conversion(job)
+            phase_timings_ms["conversion_attempt_ms"] = max(
+                0, int((time.perf_counter() - conversion_started) * 1000)
             )
-
+            artifact_bytes = markdown_content.encode("utf-8")
+            _stop_heartbeat()
             try:
-                conversion_started = time.perf_counter()
-                markdown_content, metadata, warnings, phase_timings_ms = self._execute_conversion(
-                    job
-                )
-                phase_timings_ms["conversion_attempt_ms"] = max(
-                    0, int((time.perf_counter() - conversion_started) * 1000)
-                )
-                artifact_bytes = markdown_content.encode("utf-8")
-                heartbeat_stop.set()
-                heartbeat_thread.join(timeout=max(0.5, self.config.heartbeat_interval_seconds))
                 self.job_store.mark_succeeded(
                     job_id,
                     markdown_bytes=artifact_bytes,
                     backend_used=metadata.backend_used,
                     acceleration_used=metadata.acceleration_used,
                     ocr_enabled=metadata.ocr_enabled,
+                    formula_enrichment_used=metadata.formula_enrichment_used,
+                    ocr_languages=metadata.ocr_languages,
+                    backend_route_reasons=metadata.backend_route_reasons,
+                    preclassification_labels=metadata.preclassification_labels,
+                    preclassification_hits=metadata.preclassification_hits,
                     options_fingerprint=metadata.options_fingerprint,
                     warnings=warnings,
                     phase_timings_ms=phase_timings_ms,
                 )
-            except JobStateConflict:
-                return
-            except ServiceError as exc:
-                conversion_elapsed_ms = max(
-                    0, int((time.perf_counter() - conversion_started) * 1000)
-                )
-                heartbeat_stop.set()
-                heartbeat_thread.join(timeout=max(0.5, self.config.heartbeat_interval_seconds))
-                try:
-                    self.job_store.mark_failed(
-                        job_id,
-                        code=exc.code,
-                        message=exc.message,
-                        retryable=exc.retryable,
-                        details=exc.details,
-                        phase_timings_ms={"conversion_attempt_ms": conversion_elapsed_ms},
-                    )
-                except (JobMissing, JobExpired, JobStateConflict):
-                    return
-            except Exception as exc:  # pragma: no cover - defensive fallback
-                conversion_elapsed_ms = max(
-                    0, int((time.perf_counter() - conversion_started) * 1000)
+                self.result_cache.store(job, artifact_bytes, metadata, warnings)
+            finally:
+                # Followers get the artifact even if the leader was canceled mid-run.
+                self.coalescer.complete_followers(
+                    job_id, markdown_bytes=artifact_bytes, metadata=metadata, warnings=warnings
                 )
-                heartbeat_stop.set()
-                heartbeat_thread.join(timeout=max(0.5, self.config.heartbeat_interval_seconds))
-                try:
-                    self.job_store.mark_failed(
-                        job_id,
-                        code="conversion_internal_error",
-                        message=f"Unexpected conversion error: {exc}",
-                        retryable=True,
-                        details=None,
-                        phase_timings_ms={"conversion_attempt_ms": conversion_elapsed_ms},
-                    )
-                except (JobMissing, JobExpired, JobStateConflict):
-                    return
+        except JobStateConflict:
+            return
+        except BackendWorkerCrashedError:
+            self._handle_worker_crash(job_id, elapsed_ms=_stop_heartbeat())
+        except ServiceError as exc:
+            self._mark_job_failed(job_id, exc, _stop_heartbeat())
+        except Exception as exc:  # pragma: no cover - defensive fallback
+            error = ServiceError(
+                status_code=500,
+                code="conversion_internal_error",
+                message=f"Unexpected conversion error: {exc}",
+                retryable=True,
+            )
+            self._mark_job_failed(job_id, error, _stop_heartbeat())
         finally:
-            with self._lock:
-                self._active_job_ids.discard(job_id)
+            watchdog.cancel()
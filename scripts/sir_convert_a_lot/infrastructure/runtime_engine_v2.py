@@ -14,14 +14,16 @@ Relationships:
 
 from __future__ import annotations
 
-import threading
 import time
 from typing import Literal
 from uuid import uuid4
 
-from scripts.sir_convert_a_lot.domain.specs import JobStatus
+from scripts.sir_convert_a_lot.domain.specs import JobStatus, Priority
 from scripts.sir_convert_a_lot.domain.specs_v2 import JobSpecV2
-from scripts.sir_convert_a_lot.infrastructure.docling_backend import DoclingConversionBackend
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
+    BackendWorkerCrashedError,
+    ConversionBackend,
+)
 from scripts.sir_convert_a_lot.infrastructure.idempotency_store import IdempotencyStore
 from scripts.sir_convert_a_lot.infrastructure.job_store_models_v2 import (
     JobExpiredV2,
@@ -29,12 +31,18 @@ from scripts.sir_convert_a_lot.infrastructure.job_store_models_v2 import (
     JobStateConflictV2,
 )
 from scripts.sir_convert_a_lot.infrastructure.job_store_v2 import JobStoreV2
-from scripts.sir_convert_a_lot.infrastructure.pymupdf_backend import PyMuPdfConversionBackend
+from scripts.sir_convert_a_lot.infrastructure.runtime_backends import (
+    RuntimeBackends,
+    build_runtime_backends,
+)
 from scripts.sir_convert_a_lot.infrastructure.runtime_heartbeat_v2 import (
     start_conversion_heartbeat_v2,
 )
 from scripts.sir_convert_a_lot.infrastructure.runtime_models import ServiceConfig, ServiceError
 from scripts.sir_convert_a_lot.infrastructure.runtime_models_v2 import StoredJobV2
+from scripts.sir_convert_a_lot.infrastructure.runtime_progress import job_progress_writer
+from scripts.sir_convert_a_lot.infrastructure.runtime_supervisor import SupervisedJobRuntime
+from scripts.sir_convert_a_lot.infrastructure.upload_staging import StagedUpload, stage_upload_bytes
 from scripts.sir_convert_a_lot.infrastructure.v2_conversion_executor import (
     V2ExecutionResult,
     execute_v2_job_conversion,
@@ -43,10 +51,30 @@ from scripts.sir_convert_a_lot.infrastructure.v2_conversion_executor import (
 __all__ = ["JobStoreV2", "ServiceRuntimeV2", "StoredJobV2"]
 
 
-class ServiceRuntimeV2:
-    """Thread-safe runtime state and execution for Sir Convert-a-Lot v2 jobs."""
+_DEFAULT_DOCUMENT_TIMEOUT_SECONDS = 1800
+
+
+def _dispatch_priority(spec: JobSpecV2) -> Priority:
+    """Return scheduling priority; routes without an execution section run as NORMAL."""
+    return spec.execution.priority if spec.execution is not None else Priority.NORMAL
+
+
+def _document_timeout_seconds(spec: JobSpecV2) -> int:
+    """Return the watchdog deadline; routes without an execution section use the spec default."""
+    execution = spec.execution
+    if execution is None:
+        return _DEFAULT_DOCUMENT_TIMEOUT_SECONDS
+    return execution.document_timeout_seconds
 
-    def __init__(self, config: ServiceConfig) -> None:
+
+class ServiceRuntimeV2(SupervisedJobRuntime):
+    """Thread-safe runtime state and execution for Sir Convert-a-Lot v2 jobs.
+
+    Passing `backends` borrows another runtime's backends (and its worker
+    pool); borrowed backends are left running on shutdown.
+    """
+
+    def __init__(self, config: ServiceConfig, *, backends: RuntimeBackends | None = None) -> None:
         self.config = config
         self.job_store = JobStoreV2(
             data_root=config.data_root,
@@ -57,58 +85,30 @@ class ServiceRuntimeV2:
             data_root=config.data_root,
             ttl_seconds=config.idempotency_ttl_seconds,
         )
-        self.docling_backend = DoclingConversionBackend()
-        self.pymupdf_backend = PyMuPdfConversionBackend()
-        self._lock = threading.Lock()
-        self._shutdown_event = threading.Event()
-        self._supervisor_thread: threading.Thread | None = None
-        self._active_job_ids: set[str] = set()
+        self._owns_backends = backends is None
+        self.backends = backends = backends or build_runtime_backends(config)
+        self.docling_backend: ConversionBackend = backends.docling
+        self.pymupdf_backend: ConversionBackend = backends.pymupdf
+        self._init_supervision()
 
         self.job_store.sweep_expired()
         self.job_store.recover_running_jobs_to_queued(active_job_ids=self._active_job_ids)
+        for queued in self.job_store.list_queued_jobs():
+            self._dispatch_queue.push(
+                queued.job_id,
+                priority=_dispatch_priority(queued.spec),
+                created_at=queued.created_at,
+            )
+        self._start_supervisor()
 
-        if self.config.enable_supervisor:
-            self._supervisor_thread = threading.Thread(target=self._supervisor_loop, daemon=True)
-            self._supervisor_thread.start()
-
-    def _supervisor_loop(self) -> None:
-        """Background supervisor that runs queued jobs and re-runs recovered jobs."""
-        while not self._shutdown_event.is_set():
-            try:
-                self.job_store.sweep_expired()
-                self.job_store.recover_running_jobs_to_queued(active_job_ids=self._active_job_ids)
-
-                with self._lock:
-                    active_count = len(self._active_job_ids)
-                    max_workers = max(1, self.config.max_workers)
-                if active_count < max_workers:
-                    for job_id in self.job_store.list_job_ids():
-                        with self._lock:
-                            if len(self._active_job_ids) >= max_workers:
-                                break
-                            if job_id in self._active_job_ids:
-                                continue
-                        try:
-                            record = self.job_store.get_job(job_id)
-                        except (JobMissingV2, JobExpiredV2):
-                            continue
-                        if record.status != JobStatus.QUEUED:
-                            continue
-                        self.run_job_async(job_id)
-            except Exception:
-                pass
-
-            self._shutdown_event.wait(timeout=max(0.05, self.config.supervisor_poll_seconds))
+    def _sweep_expired_jobs(self) -> None:
+        self.job_store.sweep_expired()
 
     def shutdown(self) -> None:
         """Stop background supervisor loops and release runtime resources."""
-        self._shutdown_event.set()
-        if self._supervisor_thread is None:
-            return
-        if not self._supervisor_thread.is_alive():
-            return
-        join_timeout_seconds = max(1.0, self.config.supervisor_poll_seconds * 4)
-        self._supervisor_thread.join(timeout=join_timeout_seconds)
+        super().shutdown()
+        if self._owns_backends:
+            self.backends.shutdown()
 
     def _new_job_id(self) -> str:
         return f"jobv2_{uuid4().hex[:26]}"
@@ -143,6 +143,8 @@ class ServiceRuntimeV2:
             updated_at=record.updated_at,
             expires_at=record.expires_at,
             progress_stage=record.progress_stage,
+            pages_total=record.pages_total,
+            pages_processed=record.pages_processed,
             last_heartbeat_at=record.last_heartbeat_at,
             current_phase_started_at=record.current_phase_started_at,
             phase_timings_ms=dict(record.phase_timings_ms),
@@ -173,11 +175,28 @@ class ServiceRuntimeV2:
         resources_zip_bytes: bytes | None,
         reference_docx_bytes: bytes | None,
     ) -> StoredJobV2:
+        with stage_upload_bytes(upload_bytes, self.job_store.staging_dir) as staged:
+            return self.create_staged_job(
+                spec=spec,
+                upload=staged,
+                resources_zip_bytes=resources_zip_bytes,
+                reference_docx_bytes=reference_docx_bytes,
+            )
+
+    def create_staged_job(
+        self,
+        *,
+        spec: JobSpecV2,
+        upload: StagedUpload,
+        resources_zip_bytes: bytes | None,
+        reference_docx_bytes: bytes | None,
+    ) -> StoredJobV2:
+        """Create a job from a staged upload; the caller schedules it with `run_job_async`."""
         job_id = self._new_job_id()
         record = self.job_store.create_job(
             job_id=job_id,
             spec=spec,
-            upload_bytes=upload_bytes,
+            upload=upload,
             resources_zip_bytes=resources_zip_bytes,
             reference_docx_bytes=reference_docx_bytes,
         )
@@ -204,14 +223,36 @@ class ServiceRuntimeV2:
             return "already_canceled"
         return "conflict"
 
-    def run_job_async(self, job_id: str) -> None:
-        """Run a v2 conversion job asynchronously in a background thread."""
-        with self._lock:
-            if job_id in self._active_job_ids:
-                return
-            self._active_job_ids.add(job_id)
-        thread = threading.Thread(target=self._run_job, args=(job_id,), daemon=True)
-        thread.start()
+    def _enqueue(self, job_id: str) -> None:
+        try:
+            record = self.job_store.get_job(job_id)
+        except (JobMissingV2, JobExpiredV2):
+            return
+        self._dispatch_queue.push(
+            job_id,
+            priority=_dispatch_priority(record.spec),
+            created_at=record.created_at,
+        )
+
+    def _requeue_running_job(self, job_id: str) -> bool:
+        try:
+            return self.job_store.requeue_running_job(job_id)
+        except (JobMissingV2, JobExpiredV2):
+            return False
+
+    def _mark_job_failed(self, job_id: str, error: ServiceError, elapsed_ms: int) -> bool:
+        try:
+            self.job_store.mark_failed(
+                job_id,
+                code=error.code,
+                message=error.message,
+                retryable=error.retryable,
+                details=error.details,
+                phase_timings_ms={"conversion_attempt_ms": elapsed_ms},
+            )
+        except (JobMissingV2, JobExpiredV2, JobStateConflictV2):
+            return False
+        return True
 
     def _run_job(self, job_id: str) -> None:
         try:
@@ -242,14 +283,30 @@ class ServiceRuntimeV2:
                 heartbeat_interval_seconds=self.config.heartbeat_interval_seconds,
             )
 
+            conversion_started = time.perf_counter()
+            watchdog = self._start_conversion_watchdog(
+                job_id,
+                timeout_seconds=_document_timeout_seconds(job.spec),
+                conversion_started=conversion_started,
+            )
+            progress = job_progress_writer(
+                self.job_store,
+                job_id,
+                min_interval_seconds=self.config.progress_persist_interval_seconds,
+            )
             try:
-                conversion_started = time.perf_counter()
-                result: V2ExecutionResult = execute_v2_job_conversion(
-                    job=job,
-                    config=self.config,
-                    docling_backend=self.docling_backend,
-                    pymupdf_backend=self.pymupdf_backend,
-                )
+                try:
+                    result: V2ExecutionResult = execute_v2_job_conversion(
+                        job=job,
+                        config=self.config,
+                        docling_backend=self.docling_backend,
+                        pymupdf_backend=self.pymupdf_backend,
+                        progress=progress,
+                        cancel=self._conversion_cancel(job_id),
+                        hedge_pymupdf_backend=self.backends.pymupdf_local,
+                    )
+                finally:
+                    progress.flush()
                 phase_timings_ms = dict(result.phase_timings_ms)
                 phase_timings_ms["conversion_attempt_ms"] = max(
                     0, int((time.perf_counter() - conversion_started) * 1000)
@@ -268,6 +325,13 @@ class ServiceRuntimeV2:
                 )
             except JobStateConflictV2:
                 return
+            except BackendWorkerCrashedError:
+                heartbeat_stop.set()
+                heartbeat_thread.join(timeout=max(0.5, self.config.heartbeat_interval_seconds))
+                self._handle_worker_crash(
+                    job_id,
+                    elapsed_ms=max(0, int((time.perf_counter() - conversion_started) * 1000)),
+                )
             except ServiceError as exc:
                 conversion_elapsed_ms = max(
                     0, int((time.perf_counter() - conversion_started) * 1000)
@@ -302,6 +366,7 @@ class ServiceRuntimeV2:
                     )
                 except (JobMissingV2, JobExpiredV2, JobStateConflictV2):
                     return
+            finally:
+                watchdog.cancel()
         finally:
-            with self._lock:
-                self._active_job_ids.discard(job_id)
+            self._release_slot(job_id)
@@ -14,8 +14,10 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Literal
 
-from scripts.sir_convert_a_lot.domain.specs import JobSpec, JobStatus
+from scripts.sir_convert_a_lot.domain.specs import JobSpec, JobStatus, OcrMode, TableMode
+from scripts.sir_convert_a_lot.infrastructure.job_store_models import StoredJobRecord
 
 
 def utc_now() -> datetime:
@@ -23,6 +25,27 @@ def utc_now() -> datetime:
     return datetime.now(UTC)
 
 
+@dataclass(frozen=True)
+class ConverterPrewarmProfile:
+    """One OCR/table combination whose Docling converters are built at startup.
+
+    Empty `layout_model_keys` means the configured primary layout model plus
+    its ordering fallbacks.
+    """
+
+    ocr_mode: OcrMode
+    table_mode: TableMode
+    layout_model_keys: tuple[str, ...] = ()
+
+    @property
+    def label(self) -> str:
+        """Return the profile in its declaration syntax (`ocr/table[:layout+layout]`)."""
+        label = f"{self.ocr_mode.value}/{self.table_mode.value}"
+        if self.layout_model_keys:
+            label += ":" + "+".join(self.layout_model_keys)
+        return label
+
+
 @dataclass(frozen=True)
 class ServiceConfig:
     """Runtime configuration values for Sir Convert-a-Lot service."""
@@ -36,12 +59,29 @@ class ServiceConfig:
     result_ttl_seconds: int = 7 * 24 * 3600
     max_workers: int = 1
     supervisor_poll_seconds: float = 0.2
+    sweep_interval_seconds: float = 60.0
+    priority_aging_seconds: float = 300.0
     enable_supervisor: bool = True
     gpu_available: bool = True
     allow_cpu_only: bool = False
     allow_cpu_fallback: bool = False
     processing_delay_seconds: float = 0.2
     heartbeat_interval_seconds: float = 5.0
+    progress_persist_interval_seconds: float = 1.0
+    conversion_isolation: Literal["thread", "process"] = "thread"
+    max_worker_crash_requeues: int = 1
+    converter_prewarm_profiles: tuple[ConverterPrewarmProfile, ...] = ()
+    service_revision: str = "unknown"
+    result_cache_ttl_seconds: int = 7 * 24 * 3600
+    result_cache_max_bytes: int = 2 * 1024 * 1024 * 1024
+    page_sharding_min_pages: int = 0
+    page_sharding_max_shards: int = 4
+    page_sharding_min_pages_per_shard: int = 25
+    page_sharding_max_concurrency: int = 4
+    auto_backend_triage: bool = False
+    hedged_high_priority: bool = False
+    pymupdf_parallel_min_pages: int = 0
+    pymupdf_parallel_max_processes: int = 0
 
 
 @dataclass(frozen=True)
@@ -95,3 +135,51 @@ class StoredJob:
     failure_message: str | None = None
     failure_retryable: bool = False
     failure_details: dict[str, object] | None = None
+    cache_hit: bool = False
+    coalesced_with_job_id: str | None = None
+    formula_enrichment_used: bool | None = None
+    ocr_languages: list[str] | None = None
+    backend_route_reasons: list[str] | None = None
+    preclassification_labels: list[str] | None = None
+    preclassification_hits: dict[str, bool] | None = None
+    source_sha256: str | None = None
+
+
+def stored_job_from_record(record: StoredJobRecord) -> StoredJob:
+    """Project a durable job-store record into runtime job state."""
+    return StoredJob(
+        job_id=record.job_id,
+        spec=record.spec,
+        source_filename=record.source_filename,
+        upload_path=record.upload_path,
+        artifact_path=record.artifact_path,
+        status=record.status,
+        created_at=record.created_at,
+        updated_at=record.updated_at,
+        expires_at=record.expires_at,
+        progress_stage=record.progress_stage,
+        pages_total=record.pages_total,
+        pages_processed=record.pages_processed,
+        last_heartbeat_at=record.last_heartbeat_at,
+        current_phase_started_at=record.current_phase_started_at,
+        phase_timings_ms=dict(record.phase_timings_ms),
+        warnings=list(record.warnings),
+        artifact_sha256=record.artifact_sha256,
+        artifact_size_bytes=record.artifact_size_bytes,
+        backend_used=record.backend_used,
+        acceleration_used=record.acceleration_used,
+        ocr_enabled=record.ocr_enabled,
+        options_fingerprint=record.options_fingerprint,
+        failure_code=record.failure_code,
+        failure_message=record.failure_message,
+        failure_retryable=record.failure_retryable,
+        failure_details=record.failure_details,
+        cache_hit=record.cache_hit,
+        coalesced_with_job_id=record.coalesced_with_job_id,
+        formula_enrichment_used=record.formula_enrichment_used,
+        ocr_languages=record.ocr_languages,
+        backend_route_reasons=record.backend_route_reasons,
+        preclassification_labels=record.preclassification_labels,
+        preclassification_hits=record.preclassification_hits,
+        source_sha256=record.source_sha256,
+    )
@@ -0,0 +1,119 @@
+"""Throttled persistence of backend conversion progress.
+
+Purpose:
+    Turn the per-page progress callbacks emitted by conversion backends into
+    job-store progress updates without letting manifest writes dominate fast
+    conversions: reports are coalesced to at most one write per interval,
+    except that stage changes and stage completion are always written.
+
+Relationships:
+    - Created per job by `infrastructure.runtime_engine` and
+      `infrastructure.runtime_engine_v2` and passed to backends through
+      `conversion_backend.ConversionRequest.progress`.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Protocol
+
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import ConversionProgress
+
+PersistProgress = Callable[[ConversionProgress], bool]
+
+
+class ConversionProgressStore(Protocol):
+    """Job-store surface used to persist backend progress (v1 and v2 stores)."""
+
+    def report_conversion_progress(
+        self, job_id: str, *, stage: str, pages_processed: int, pages_total: int | None
+    ) -> bool: ...
+
+
+class ThrottledProgressWriter:
+    """Progress callback that writes through to the job store at a bounded rate.
+
+    `persist` returns False once the job is no longer running, after which
+    further reports are dropped. Progress is advisory, so persistence errors
+    never propagate into the conversion.
+    """
+
+    def __init__(
+        self,
+        *,
+        persist: PersistProgress,
+        min_interval_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._persist = persist
+        self._min_interval_seconds = max(0.0, min_interval_seconds)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._last_written: ConversionProgress | None = None
+        self._last_written_at = 0.0
+        self._pending: ConversionProgress | None = None
+        self._stopped = False
+        self.writes = 0
+
+    def __call__(self, progress: ConversionProgress) -> None:
+        with self._lock:
+            if self._stopped:
+                return
+            now = self._clock()
+            if self._is_due(progress, now):
+                self._write_locked(progress, now)
+            else:
+                self._pending = progress
+
+    def flush(self) -> None:
+        """Write the most recent coalesced report, if any."""
+        with self._lock:
+            if self._stopped or self._pending is None:
+                return
+            self._write_locked(self._pending, self._clock())
+
+    def _is_due(self, progress: ConversionProgress, now: float) -> bool:
+        last = self._last_written
+        if last is None or progress.stage != last.stage:
+            return True
+        if progress.pages_total is not None and progress.pages_completed >= progress.pages_total:
+            return True
+        return now - self._last_written_at >= self._min_interval_seconds
+
+    def _write_locked(self, progress: ConversionProgress, now: float) -> None:
+        self._pending = None
+        self._last_written = progress
+        self._last_written_at = now
+        try:
+            still_running = self._persist(progress)
+        except Exception:
+            still_running = False
+        self.writes += 1
+        if not still_running:
+            self._stopped = True
+
+
+def job_progress_writer(
+    job_store: ConversionProgressStore, job_id: str, *, min_interval_seconds: float
+) -> ThrottledProgressWriter:
+    """Build the throttled progress callback for one job's conversion."""
+
+    def _persist(progress: ConversionProgress) -> bool:
+        return job_store.report_conversion_progress(
+            job_id,
+            stage=progress.stage,
+            pages_processed=progress.pages_completed,
+            pages_total=progress.pages_total,
+        )
+
+    return ThrottledProgressWriter(persist=_persist, min_interval_seconds=min_interval_seconds)
+
+
+__all__ = [
+    "ConversionProgressStore",
+    "PersistProgress",
+    "ThrottledProgressWriter",
+    "job_progress_writer",
+]
@@ -0,0 +1,210 @@
+"""Result-cache integration for the v1 runtime.
+
+Purpose:
+    Bind the content-addressed `ConversionResultCache` to the v1 job store:
+    derive cache keys for jobs, complete new jobs straight from a cached
+    artifact, and record successful conversions for later reuse. Service
+    settings that change output (page sharding, auto-backend triage, OCR
+    language detection, PyMuPDF page-range parallelism, the Docling layout
+    models, ordering patch and quality gate, and preclassification) form each
+    job's output variant. Jobs that may be answered by a hedged PyMuPDF conversion
+    get their own variant, and results PyMuPDF won are never stored.
+
+Relationships:
+    - Owned by `infrastructure.runtime_engine.ServiceRuntime`.
+    - Keys and storage come from `infrastructure.result_cache`.
+"""
+
+from __future__ import annotations
+
+import time
+
+from scripts.sir_convert_a_lot.application.contracts import ConversionMetadata
+from scripts.sir_convert_a_lot.domain.specs import JobSpec
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import BackendExecutionError
+from scripts.sir_convert_a_lot.infrastructure.docling_layout_models import (
+    DOCLING_ORDERING_PATCH_ENV_VAR,
+    DOCLING_ORDERING_QUALITY_GATE_ENV_VAR,
+    is_env_flag_enabled,
+    resolve_layout_model_candidate_keys,
+)
+from scripts.sir_convert_a_lot.infrastructure.hedged_conversion import pymupdf_won_hedge
+from scripts.sir_convert_a_lot.infrastructure.job_store import (
+    JobExpired,
+    JobMissing,
+    JobStateConflict,
+    JobStore,
+)
+from scripts.sir_convert_a_lot.infrastructure.ocr_language_selection import (
+    DOCLING_OCR_LANGUAGE_DETECTION_ENV_VAR,
+    ocr_language_engine_available,
+)
+from scripts.sir_convert_a_lot.infrastructure.page_sharding import PageShardingPolicy
+from scripts.sir_convert_a_lot.infrastructure.pdf_preclassification import (
+    DOCLING_PRECLASSIFICATION_ENV_VAR,
+)
+from scripts.sir_convert_a_lot.infrastructure.result_cache import (
+    CachedConversionResult,
+    ConversionResultCache,
+    file_sha256,
+    result_cache_key,
+)
+from scripts.sir_convert_a_lot.infrastructure.runtime_conversion import (
+    hedging_applies,
+    options_fingerprint_for_spec,
+)
+from scripts.sir_convert_a_lot.infrastructure.runtime_models import ServiceConfig, StoredJob
+
+
+class JobResultCache:
+    """Result cache scoped to one job store and service revision.
+
+    Caching is disabled when the size budget is zero or the service revision
+    is unknown, since results from different code revisions must not mix.
+    """
+
+    def __init__(self, *, config: ServiceConfig, job_store: JobStore) -> None:
+        self._service_revision = config.service_revision
+        self._settings_variant = _service_settings_variant(config)
+        self._hedged_high_priority = config.hedged_high_priority
+        self._allow_cpu_fallback = config.allow_cpu_fallback
+        self._job_store = job_store
+        self.enabled = config.result_cache_max_bytes > 0 and config.service_revision != "unknown"
+        self.cache = ConversionResultCache(
+            data_root=config.data_root,
+            ttl_seconds=config.result_cache_ttl_seconds,
+            max_bytes=config.result_cache_max_bytes,
+        )
+
+    def output_variant(self, spec: JobSpec) -> str:
+        """Return the service-side output variant of `spec`."""
+        hedged = hedging_applies(
+            spec,
+            hedged_high_priority=self._hedged_high_priority,
+            allow_cpu_fallback=self._allow_cpu_fallback,
+        )
+        return f"{self._settings_variant};hedged" if hedged else self._settings_variant
+
+    def key_for(self, spec: JobSpec, source_sha256: str) -> str | None:
+        """Return the cache key for a job, or None when caching is disabled."""
+        if not self.enabled:
+            return None
+        return result_cache_key(
+            source_sha256=source_sha256,
+            spec=spec,
+            service_revision=self._service_revision,
+            output_variant=self.output_variant(spec),
+        )
+
+    def complete_from_cache(self, job: StoredJob, source_sha256: str) -> bool:
+        """Move a QUEUED job straight to SUCCEEDED from a cached artifact when one exists."""
+        lookup_started = time.perf_counter()
+        cache_key = self.key_for(job.spec, source_sha256)
+        cached = self.cache.get(cache_key) if cache_key is not None else None
+        if cached is None:
+            return False
+        try:
+            if not self._job_store.claim_queued_job(job.job_id):
+                return False
+            self._job_store.mark_succeeded(
+                job.job_id,
+                markdown_bytes=cached.markdown_bytes,
+                backend_used=cached.backend_used,
+                acceleration_used=cached.acceleration_used,
+                ocr_enabled=cached.ocr_enabled,
+                formula_enrichment_used=cached.formula_enrichment_used,
+                ocr_languages=cached.ocr_languages,
+                backend_route_reasons=cached.backend_route_reasons,
+                preclassification_labels=cached.preclassification_labels,
+                preclassification_hits=cached.preclassification_hits,
+                options_fingerprint=options_fingerprint_for_spec(job.spec),
+                warnings=list(cached.warnings),
+                phase_timings_ms={
+                    "result_cache_lookup_ms": max(
+                        0, int((time.perf_counter() - lookup_started) * 1000)
+                    )
+                },
+                cache_hit=True,
+            )
+        except (JobMissing, JobExpired, JobStateConflict):
+            return False
+        return True
+
+    def store(
+        self,
+        job: StoredJob,
+        markdown_bytes: bytes,
+        metadata: ConversionMetadata,
+        warnings: list[str],
+    ) -> None:
+        """Record a successful conversion; cache write failures never fail the job."""
+        if not self.enabled or pymupdf_won_hedge(warnings):
+            return
+        try:
+            cache_key = self.key_for(job.spec, job.source_sha256 or file_sha256(job.upload_path))
+            if cache_key is None:
+                return
+            self.cache.put(
+                cache_key,
+                CachedConversionResult(
+                    markdown_bytes=markdown_bytes,
+                    backend_used=metadata.backend_used,
+                    acceleration_used=metadata.acceleration_used,
+                    ocr_enabled=metadata.ocr_enabled,
+                    warnings=tuple(warnings),
+                    source_job_id=job.job_id,
+                    formula_enrichment_used=metadata.formula_enrichment_used,
+                    ocr_languages=metadata.ocr_languages,
+                    backend_route_reasons=metadata.backend_route_reasons,
+                    preclassification_labels=metadata.preclassification_labels,
+                    preclassification_hits=metadata.preclassification_hits,
+                ),
+            )
+        except OSError:
+            return
+
+    def sweep(self) -> int:
+        """Drop expired entries and enforce the size budget."""
+        return self.cache.sweep()
+
+
+def _service_settings_variant(config: ServiceConfig) -> str:
+    sharding = PageShardingPolicy.from_config(config)
+    ocr_language_detection = (
+        is_env_flag_enabled(env_var=DOCLING_OCR_LANGUAGE_DETECTION_ENV_VAR, default=False)
+        and ocr_language_engine_available()
+    )
+    pymupdf_parallel = (
+        f"{config.pymupdf_parallel_min_pages}/{config.pymupdf_parallel_max_processes}"
+        if config.pymupdf_parallel_min_pages > 0 and config.pymupdf_parallel_max_processes > 1
+        else "off"
+    )
+    return ";".join(
+        [
+            sharding.fingerprint if sharding is not None else "page_sharding:off",
+            f"auto_backend_triage:{int(config.auto_backend_triage)}",
+            f"ocr_language_detection:{int(ocr_language_detection)}",
+            f"pymupdf_parallel:{pymupdf_parallel}",
+            *_docling_settings_variant(),
+        ]
+    )
+
+
+def _docling_settings_variant() -> list[str]:
+    """Return the Docling env settings, resolved as `DoclingConversionBackend` reads them."""
+    try:
+        layout_models = ",".join(resolve_layout_model_candidate_keys())
+    except BackendExecutionError:
+        layout_models = "invalid"  # every Docling job fails until the setting is fixed
+    flags = {
+        "ordering_patch": (DOCLING_ORDERING_PATCH_ENV_VAR, True),
+        "ordering_quality_gate": (DOCLING_ORDERING_QUALITY_GATE_ENV_VAR, True),
+        "preclassification": (DOCLING_PRECLASSIFICATION_ENV_VAR, True),
+    }
+    return [f"docling_layout_models:{layout_models}"] + [
+        f"docling_{name}:{int(is_env_flag_enabled(env_var=env_var, default=default))}"
+        for name, (env_var, default) in flags.items()
+    ]
+
+
+__all__ = ["JobResultCache"]
@@ -0,0 +1,244 @@
+"""Shared job supervision for the v1 and v2 runtimes.
+
+Purpose:
+    Own worker-slot accounting, the dispatch supervisor loop, the per-job
+    conversion watchdog, and worker-crash requeueing so both runtime engines
+    schedule and reclaim work identically.
+
+Relationships:
+    - Base class of `infrastructure.runtime_engine.ServiceRuntime` and
+      `infrastructure.runtime_engine_v2.ServiceRuntimeV2`.
+    - Dispatches through `infrastructure.runtime_dispatch.JobDispatchQueue`
+      onto `infrastructure.runtime_workers.JobWorkerPool` threads.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import CancelToken
+from scripts.sir_convert_a_lot.infrastructure.runtime_dispatch import JobDispatchQueue
+from scripts.sir_convert_a_lot.infrastructure.runtime_models import ServiceConfig, ServiceError
+from scripts.sir_convert_a_lot.infrastructure.runtime_workers import JobWorkerPool
+
+
+def conversion_timeout_error(*, timeout_seconds: int, elapsed_ms: int) -> ServiceError:
+    """Build the typed failure recorded when a job exceeds its document timeout."""
+    return ServiceError(
+        status_code=504,
+        code="conversion_timeout",
+        message=(
+            f"Conversion exceeded execution.document_timeout_seconds={timeout_seconds} "
+            "and was canceled."
+        ),
+        retryable=False,
+        details={"document_timeout_seconds": timeout_seconds, "elapsed_ms": elapsed_ms},
+    )
+
+
+def worker_crashed_error(*, crash_count: int) -> ServiceError:
+    """Build the failure recorded once a job exhausts its worker-crash requeues."""
+    return ServiceError(
+        status_code=500,
+        code="conversion_worker_crashed",
+        message=f"Conversion worker process crashed {crash_count} times while converting this job.",
+        retryable=False,
+        details={"worker_crashes": crash_count},
+    )
+
+
+class SupervisedJobRuntime:
+    """Worker-slot, dispatch, and watchdog plumbing shared by runtime engines.
+
+    Subclasses call `_init_supervision` before touching the job store, then
+    `_start_supervisor` once queued work has been loaded, and implement the
+    store-specific hooks (`_sweep_expired_jobs`, `_enqueue`, `_run_job`,
+    `_mark_job_failed`, `_requeue_running_job`).
+    """
+
+    config: ServiceConfig
+
+    def _init_supervision(self) -> None:
+        self._lock = threading.Lock()
+        self._slot_released = threading.Condition(self._lock)
+        self._shutdown_event = threading.Event()
+        self._supervisor_thread: threading.Thread | None = None
+        self._active_job_ids: set[str] = set()
+        self._worker_crash_counts: dict[str, int] = {}
+        self._requeue_on_release: set[str] = set()
+        self._conversion_cancels: dict[str, CancelToken] = {}
+        self._dispatch_queue = JobDispatchQueue(aging_seconds=self.config.priority_aging_seconds)
+        self._last_sweep_monotonic = time.monotonic()
+        self._job_workers = JobWorkerPool(
+            size=self.config.max_workers,
+            handler=self._execute_claimed_slot,
+            name=f"{type(self).__name__}-worker",
+        )
+
+    def _start_supervisor(self) -> None:
+        if not self.config.enable_supervisor:
+            return
+        self._supervisor_thread = threading.Thread(target=self._supervisor_loop, daemon=True)
+        self._supervisor_thread.start()
+
+    def _sweep_expired_jobs(self) -> None:
+        raise NotImplementedError
+
+    def _enqueue(self, job_id: str) -> None:
+        raise NotImplementedError
+
+    def _run_job(self, job_id: str) -> None:
+        raise NotImplementedError
+
+    def _mark_job_failed(self, job_id: str, error: ServiceError, elapsed_ms: int) -> bool:
+        """Persist a runtime-detected failure; return False when the job already left RUNNING."""
+        raise NotImplementedError
+
+    def _requeue_running_job(self, job_id: str) -> bool:
+        raise NotImplementedError
+
+    def _supervisor_loop(self) -> None:
+        """Background supervisor that dispatches queued jobs as soon as a slot frees up."""
+        while not self._shutdown_event.is_set():
+            try:
+                self._sweep_if_due()
+                if not self._wait_for_free_slot(timeout=self._seconds_until_sweep()):
+                    continue
+                job_id = self._dispatch_queue.pop(timeout=self._seconds_until_sweep())
+                if job_id is None:
+                    continue
+                self._start_job(job_id)
+            except Exception:
+                # Defensive: keep supervisor alive.
+                self._shutdown_event.wait(timeout=max(0.05, self.config.supervisor_poll_seconds))
+
+    def _seconds_until_sweep(self) -> float:
+        elapsed = time.monotonic() - self._last_sweep_monotonic
+        return max(0.05, self.config.sweep_interval_seconds - elapsed)
+
+    def _sweep_if_due(self) -> None:
+        if time.monotonic() - self._last_sweep_monotonic < self.config.sweep_interval_seconds:
+            return
+        self._last_sweep_monotonic = time.monotonic()
+        self._sweep_expired_jobs()
+
+    def _wait_for_free_slot(self, *, timeout: float) -> bool:
+        max_workers = max(1, self.config.max_workers)
+        with self._slot_released:
+            self._slot_released.wait_for(
+                lambda: self._shutdown_event.is_set() or len(self._active_job_ids) < max_workers,
+                timeout=timeout,
+            )
+            if self._shutdown_event.is_set():
+                return False
+            return len(self._active_job_ids) < max_workers
+
+    def shutdown(self) -> None:
+        """Stop background supervisor loops and release runtime resources."""
+        self._shutdown_event.set()
+        self._dispatch_queue.close()
+        self._job_workers.shutdown()
+        with self._slot_released:
+            self._slot_released.notify_all()
+        if self._supervisor_thread is None:
+            return
+        if not self._supervisor_thread.is_alive():
+            return
+        join_timeout_seconds = max(1.0, self.config.supervisor_poll_seconds * 4)
+        self._supervisor_thread.join(timeout=join_timeout_seconds)
+
+    def run_job_async(self, job_id: str) -> None:
+        """Schedule a conversion job for asynchronous execution.
+
+        With the supervisor enabled the job is handed to the dispatch queue so
+        worker-slot limits apply; otherwise it starts immediately.
+        """
+        with self._lock:
+            if job_id in self._active_job_ids:
+                return
+        if self._supervisor_thread is not None:
+            self._enqueue(job_id)
+            return
+        self._start_job(job_id)
+
+    def _start_job(self, job_id: str) -> None:
+        with self._lock:
+            if job_id in self._active_job_ids:
+                return
+            self._active_job_ids.add(job_id)
+        self._job_workers.submit(job_id)
+
+    def _execute_claimed_slot(self, job_id: str) -> None:
+        # Resolved per call so tests and subclasses can replace `_run_job`.
+        self._run_job(job_id)
+
+    def _release_slot(self, job_id: str) -> None:
+        with self._slot_released:
+            self._active_job_ids.discard(job_id)
+            self._conversion_cancels.pop(job_id, None)
+            requeue = job_id in self._requeue_on_release
+            self._requeue_on_release.discard(job_id)
+            if not requeue:
+                self._worker_crash_counts.pop(job_id, None)
+            self._slot_released.notify_all()
+        if requeue:
+            self.run_job_async(job_id)
+
+    def _handle_worker_crash(self, job_id: str, *, elapsed_ms: int) -> None:
+        """Requeue a job whose worker process died, failing it once requeues are exhausted.
+
+        The requeue is dispatched from `_release_slot` so the job is never
+        re-offered while it still holds its current slot.
+        """
+        with self._lock:
+            crash_count = self._worker_crash_counts.get(job_id, 0) + 1
+            self._worker_crash_counts[job_id] = crash_count
+        if crash_count > max(0, self.config.max_worker_crash_requeues):
+            self._mark_job_failed(job_id, worker_crashed_error(crash_count=crash_count), elapsed_ms)
+            return
+        if self._requeue_running_job(job_id):
+            with self._lock:
+                self._requeue_on_release.add(job_id)
+
+    def _start_conversion_watchdog(
+        self,
+        job_id: str,
+        *,
+        timeout_seconds: int,
+        conversion_started: float,
+    ) -> threading.Timer:
+        """Arm a deadline that fails the job and cancels its conversion if it overruns.
+
+        The conversion sees the cancellation through `_conversion_cancel` at its
+        next progress checkpoint. Its worker slot stays held until it actually
+        returns, so overrunning conversions never push concurrency past
+        `max_workers`; a late result is rejected by the job store's
+        RUNNING-state guard.
+        """
+        cancel = CancelToken()
+        with self._lock:
+            self._conversion_cancels[job_id] = cancel
+
+        def _on_deadline() -> None:
+            elapsed_ms = max(0, int((time.perf_counter() - conversion_started) * 1000))
+            error = conversion_timeout_error(timeout_seconds=timeout_seconds, elapsed_ms=elapsed_ms)
+            try:
+                timed_out = self._mark_job_failed(job_id, error, elapsed_ms)
+            except Exception:
+                return
+            if timed_out:
+                cancel.cancel()
+
+        watchdog = threading.Timer(max(0.0, float(timeout_seconds)), _on_deadline)
+        watchdog.daemon = True
+        watchdog.start()
+        return watchdog
+
+    def _conversion_cancel(self, job_id: str) -> CancelToken | None:
+        """Return the cancel token the watchdog trips for `job_id`'s running conversion."""
+        with self._lock:
+            return self._conversion_cancels.get(job_id)
+
+
+__all__ = ["SupervisedJobRuntime", "conversion_timeout_error", "worker_crashed_error"]
@@ -0,0 +1,80 @@
+"""Long-lived job worker threads for runtime execution.
+
+Purpose:
+    Execute claimed jobs on a fixed set of reusable threads sized by
+    `ServiceConfig.max_workers` instead of starting a thread per job, so
+    per-thread backend state survives across jobs.
+
+Relationships:
+    - Owned by `infrastructure.runtime_supervisor.SupervisedJobRuntime`.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from collections.abc import Callable
+
+
+class JobWorkerPool:
+    """Fixed-size pool of daemon threads that run one job id at a time."""
+
+    def __init__(self, *, size: int, handler: Callable[[str], None], name: str) -> None:
+        self._size = max(1, size)
+        self._handler = handler
+        self._name = name
+        self._tasks: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._workers: set[threading.Thread] = set()
+        self._spawned_total = 0
+        self._closed = False
+
+    @property
+    def spawned_total(self) -> int:
+        """Number of worker threads started over the pool lifetime."""
+        with self._lock:
+            return self._spawned_total
+
+    def submit(self, job_id: str) -> None:
+        """Queue a job id for the next idle worker, growing the pool up to its size."""
+        with self._lock:
+            if self._closed:
+                return
+            if len(self._workers) < self._size:
+                self._spawn_locked()
+        self._tasks.put(job_id)
+
+    def shutdown(self) -> None:
+        """Stop idle workers; busy workers exit after their current job."""
+        with self._lock:
+            self._closed = True
+            worker_count = len(self._workers)
+        for _ in range(worker_count):
+            self._tasks.put(None)
+
+    def _spawn_locked(self) -> None:
+        self._spawned_total += 1
+        worker = threading.Thread(
+            target=self._worker_loop,
+            name=f"{self._name}-{self._spawned_total}",
+            daemon=True,
+        )
+        self._workers.add(worker)
+        worker.start()
+
+    def _worker_loop(self) -> None:
+        current = threading.current_thread()
+        while True:
+            job_id = self._tasks.get()
+            if job_id is None:
+                with self._lock:
+                    self._workers.discard(current)
+                return
+            try:
+                self._handler(job_id)
+            except Exception:
+                # Defensive: a failing handler must not shrink the pool.
+                pass
+
+
+__all__ = ["JobWorkerPool"]
@@ -0,0 +1,129 @@
+"""Streamed staging of job uploads on disk.
+
+Purpose:
+    Write an upload into a staging file chunk by chunk, hashing it and
+    enforcing the size limit as bytes arrive, so no request holds the whole
+    payload in memory. A finished staging file is committed into a job's
+    `raw/` directory with an atomic rename.
+
+Relationships:
+    - Staging directories belong to `infrastructure.job_store_core` and
+      `infrastructure.job_store_v2_core`, under the same data root as the job
+      directories so the commit rename never crosses filesystems.
+    - Fed from multipart uploads by `interfaces.http_upload_staging`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+_STAGING_SUFFIX = ".part"
+
+
+class UploadTooLargeError(Exception):
+    """Raised when a staged upload grows past its size limit."""
+
+    def __init__(self, *, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        super().__init__(f"upload exceeds {max_bytes} bytes")
+
+
+@dataclass(frozen=True)
+class StagedUpload:
+    """A fully written staging file with its size and SHA-256 digest.
+
+    Used as a context manager, the staging file is discarded on exit unless
+    it was committed by then.
+    """
+
+    path: Path
+    size_bytes: int
+    sha256: str
+
+    def commit(self, destination: Path) -> None:
+        """Atomically move the staging file to `destination`."""
+        os.replace(self.path, destination)
+
+    def discard(self) -> None:
+        """Remove the staging file unless it was committed."""
+        self.path.unlink(missing_ok=True)
+
+    def __enter__(self) -> StagedUpload:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.discard()
+
+
+class UploadStager:
+    """Incremental writer of one upload into a fresh staging file."""
+
+    def __init__(self, staging_dir: Path, *, max_bytes: int | None = None) -> None:
+        staging_dir.mkdir(parents=True, exist_ok=True)
+        fd, name = tempfile.mkstemp(dir=staging_dir, suffix=_STAGING_SUFFIX)
+        self._path = Path(name)
+        self._handle = os.fdopen(fd, "wb")
+        self._digest = hashlib.sha256()
+        self._size_bytes = 0
+        self._max_bytes = max_bytes
+
+    def write(self, chunk: bytes) -> None:
+        """Append `chunk`; aborts and raises `UploadTooLargeError` past the limit."""
+        self._size_bytes += len(chunk)
+        if self._max_bytes is not None and self._size_bytes > self._max_bytes:
+            self.abort()
+            raise UploadTooLargeError(max_bytes=self._max_bytes)
+        self._digest.update(chunk)
+        self._handle.write(chunk)
+
+    def finish(self) -> StagedUpload:
+        """Close the staging file and return it as a `StagedUpload`."""
+        self._handle.close()
+        return StagedUpload(
+            path=self._path, size_bytes=self._size_bytes, sha256=self._digest.hexdigest()
+        )
+
+    def abort(self) -> None:
+        """Close and remove the staging file; safe to call more than once."""
+        self._handle.close()
+        self._path.unlink(missing_ok=True)
+
+
+def stage_upload_bytes(payload: bytes, staging_dir: Path) -> StagedUpload:
+    """Stage an upload that is already in memory (internal and test callers)."""
+    stager = UploadStager(staging_dir)
+    try:
+        stager.write(payload)
+    except BaseException:
+        stager.abort()
+        raise
+    return stager.finish()
+
+
+def sweep_stale_uploads(staging_dir: Path, *, older_than_seconds: int) -> None:
+    """Remove staging files abandoned by crashed requests (best-effort)."""
+    if not staging_dir.exists():
+        return
+    cutoff = time.time() - older_than_seconds
+    for path in staging_dir.glob(f"*{_STAGING_SUFFIX}"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink(missing_ok=True)
+        except OSError:
+            continue
+
+
+__all__ = [
+    "UPLOAD_CHUNK_BYTES",
+    "StagedUpload",
+    "UploadStager",
+    "UploadTooLargeError",
+    "stage_upload_bytes",
+    "sweep_stale_uploads",
+]
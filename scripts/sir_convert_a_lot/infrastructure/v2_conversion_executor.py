@@ -15,6 +15,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+import shutil
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -39,12 +40,15 @@ from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
     BackendExecutionError,
     BackendGpuUnavailableError,
     BackendInputError,
+    CancelToken,
     ConversionBackend,
+    ProgressCallback,
 )
 from scripts.sir_convert_a_lot.infrastructure.gpu_runtime_probe import (
     GpuRuntimeProbeResult,
     probe_torch_gpu_runtime,
 )
+from scripts.sir_convert_a_lot.infrastructure.page_sharding import PageShardingPolicy
 from scripts.sir_convert_a_lot.infrastructure.pandoc_html_to_docx import (
     HtmlToDocxConversionError,
     convert_html_to_docx,
@@ -53,6 +57,7 @@ from scripts.sir_convert_a_lot.infrastructure.pandoc_markdown_to_html import (
     MarkdownToHtmlConversionError,
     convert_markdown_to_html,
 )
+from scripts.sir_convert_a_lot.infrastructure.pdf_inspection import has_pdf_header
 from scripts.sir_convert_a_lot.infrastructure.resources_zip import (
     ResourcesZipError,
     extract_resources_zip,
@@ -172,7 +177,7 @@ def _prepare_workdir(job: StoredJobV2) -> tuple[Path, Path]:
 
     source_name = Path(job.source_filename).name
     input_path = workdir / source_name
-    input_path.write_bytes(job.upload_path.read_bytes())
+    shutil.copyfile(job.upload_path, input_path)
     return workdir, input_path
 
 
@@ -210,6 +215,9 @@ def execute_v2_job_conversion(
     config: ServiceConfig,
     docling_backend: ConversionBackend,
     pymupdf_backend: ConversionBackend,
+    progress: ProgressCallback | None = None,
+    cancel: CancelToken | None = None,
+    hedge_pymupdf_backend: ConversionBackend | None = None,
 ) -> V2ExecutionResult:
     """Execute one v2 job conversion and return artifact bytes + metadata."""
     workdir, input_path = _prepare_workdir(job)
@@ -325,6 +333,7 @@ def execute_v2_job_conversion(
                 ocr_mode=job.spec.pdf_options.ocr_mode,
                 table_mode=job.spec.pdf_options.table_mode,
                 normalize=job.spec.pdf_options.normalize,
+                formula_enrichment=job.spec.pdf_options.formula_enrichment,
             ),
             execution=ExecutionSpec(
                 acceleration_policy=job.spec.execution.acceleration_policy,
@@ -336,8 +345,7 @@ def execute_v2_job_conversion(
         _validate_backend_strategy_v1(v1_spec)
         probe = _validate_acceleration_policy_v1(spec=v1_spec, config=config)
 
-        source_bytes = job.upload_path.read_bytes()
-        if not source_bytes.startswith(b"%PDF"):
+        if not has_pdf_header(job.upload_path):
             raise ServiceError(
                 status_code=422,
                 code="pdf_unreadable",
@@ -349,11 +357,18 @@ def execute_v2_job_conversion(
             markdown_content, pdf_metadata, pdf_warnings, pdf_timings = execute_job_conversion(
                 spec=v1_spec,
                 source_filename=job.source_filename,
-                source_bytes=source_bytes,
+                source=job.upload_path,
                 gpu_available=config.gpu_available,
                 gpu_runtime_probe=probe,
                 docling_backend=docling_backend,
                 pymupdf_backend=pymupdf_backend,
+                progress=progress,
+                cancel=cancel,
+                page_sharding=PageShardingPolicy.from_config(config),
+                auto_backend_triage=config.auto_backend_triage,
+                allow_cpu_fallback=config.allow_cpu_fallback,
+                hedged_high_priority=config.hedged_high_priority,
+                hedge_pymupdf_backend=hedge_pymupdf_backend,
             )
         except BackendGpuUnavailableError as exc:
             raise ServiceError(
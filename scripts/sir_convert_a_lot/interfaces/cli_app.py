@@ -148,12 +148,17 @@ def convert_command(
     ocr_mode: str = typer.Option(
         "auto",
         "--ocr-mode",
-        help="OCR mode: off, force, or auto.",
+        help="OCR mode: off, force, regions, or auto.",
     ),
     table_mode: str = typer.Option(
         "accurate",
         "--table-mode",
-        help="Table extraction mode: fast or accurate.",
+        help="Table extraction mode: fast, accurate, or adaptive.",
+    ),
+    formula_enrichment: str = typer.Option(
+        "auto",
+        "--formula-enrichment",
+        help="Formula enrichment: auto (only when formulas are detected), on, or off.",
     ),
     normalize: str = typer.Option(
         "strict",
@@ -245,6 +250,7 @@ def convert_command(
                     ocr_mode=ocr_mode,
                     table_mode=table_mode,
                     normalize=normalize,
+                    formula_enrichment=formula_enrichment,
                 )
                 idempotency_key = idempotency_key_for_file(pdf_path, job_spec)
                 correlation_id = (
@@ -382,6 +388,7 @@ def convert_command(
                     ocr_mode=ocr_mode,
                     table_mode=table_mode,
                     normalize=normalize,
+                    formula_enrichment=formula_enrichment,
                 )
 
                 file_sha256 = sha256_bytes(source_path.read_bytes())
@@ -119,6 +119,7 @@ def default_job_spec_v1(
     ocr_mode: str,
     table_mode: str,
     normalize: str,
+    formula_enrichment: str = "auto",
 ) -> dict[str, object]:
     """Return the default v1 job_spec payload."""
     return {
@@ -130,6 +131,7 @@ def default_job_spec_v1(
             "ocr_mode": ocr_mode,
             "table_mode": table_mode,
             "normalize": normalize,
+            "formula_enrichment": formula_enrichment,
         },
         "execution": {
             "acceleration_policy": acceleration_policy,
@@ -162,6 +164,7 @@ def default_job_spec_v2(
     ocr_mode: str,
     table_mode: str,
     normalize: str,
+    formula_enrichment: str = "auto",
 ) -> dict[str, object]:
     """Return the default v2 job_spec payload for the selected route."""
     conversion: dict[str, object] = {
@@ -183,6 +186,7 @@ def default_job_spec_v2(
             "ocr_mode": ocr_mode,
             "table_mode": table_mode,
             "normalize": normalize,
+            "formula_enrichment": formula_enrichment,
         }
         payload["execution"] = {
             "acceleration_policy": acceleration_policy,
@@ -39,6 +39,11 @@ from scripts.sir_convert_a_lot.interfaces.http_app_state import (
     resolve_service_revision,
     shutdown_runtime_state,
 )
+from scripts.sir_convert_a_lot.interfaces.http_metrics import (
+    DoclingConverterCacheCollector,
+    HedgedConversionCollector,
+    PdfPreclassificationCollector,
+)
 from scripts.sir_convert_a_lot.interfaces.http_routes_health import build_health_router
 from scripts.sir_convert_a_lot.interfaces.http_routes_jobs import build_job_router
 from scripts.sir_convert_a_lot.interfaces.http_routes_jobs_v2 import build_job_router_v2
@@ -96,6 +101,9 @@ def create_app(
         ["method", "path"],
         registry=metrics_registry,
     )
+    metrics_registry.register(DoclingConverterCacheCollector())
+    metrics_registry.register(PdfPreclassificationCollector())
+    metrics_registry.register(HedgedConversionCollector())
 
     @asynccontextmanager
     async def _lifespan(lifespan_app: FastAPI):
@@ -14,6 +14,7 @@ from __future__ import annotations
 import os
 import subprocess
 import threading
+from dataclasses import replace
 from pathlib import Path
 
 from fastapi import FastAPI, Request
@@ -130,6 +131,9 @@ def ensure_runtime_state(
         if not isinstance(service_revision_obj, str) or service_revision_obj.strip() == "":
             raise RuntimeError("missing service revision for runtime initialization")
 
+        if runtime_config.service_revision == "unknown":
+            # The result cache is keyed by revision; hand the runtime the resolved one.
+            runtime_config = replace(runtime_config, service_revision=service_revision_obj)
         runtime = ServiceRuntime(runtime_config)
         metadata = ServiceRuntimeMetadata(
             service_profile=service_profile_obj,
@@ -149,9 +153,13 @@ def runtime_for_request(request: Request, *, utc_now_iso: str) -> ServiceRuntime
 
 
 def ensure_runtime_state_v2(app: FastAPI, *, utc_now_iso: str) -> ServiceRuntimeV2:
-    """Initialize v2 runtime exactly once per app instance."""
+    """Initialize v2 runtime exactly once per app instance.
+
+    The v2 runtime converts with the v1 runtime's backends, so both share one
+    conversion worker pool instead of each spawning `max_workers` processes.
+    """
     # Ensure shared metadata + v1 runtime exist first.
-    ensure_runtime_state(app, utc_now_iso=utc_now_iso)
+    runtime, _ = ensure_runtime_state(app, utc_now_iso=utc_now_iso)
 
     runtime_obj = getattr(app.state, "runtime_v2", None)
     if isinstance(runtime_obj, ServiceRuntimeV2):
@@ -169,7 +177,7 @@ def ensure_runtime_state_v2(app: FastAPI, *, utc_now_iso: str) -> ServiceRuntime
         if not isinstance(runtime_config, ServiceConfig):
             raise RuntimeError("missing service config for runtime initialization")
 
-        runtime_v2 = ServiceRuntimeV2(runtime_config)
+        runtime_v2 = ServiceRuntimeV2(runtime_config, backends=runtime.backends)
         app.state.runtime_v2 = runtime_v2
         return runtime_v2
 
@@ -186,10 +194,13 @@ def metadata_for_app(app: FastAPI, *, utc_now_iso: str) -> ServiceRuntimeMetadat
 
 
 def shutdown_runtime_state(app: FastAPI) -> None:
-    """Shutdown runtime resources if runtime was initialized."""
-    runtime_obj = getattr(app.state, "runtime", None)
-    if isinstance(runtime_obj, ServiceRuntime):
-        runtime_obj.shutdown()
+    """Shutdown runtime resources if runtime was initialized.
+
+    The v2 runtime stops first because it borrows the v1 runtime's backends.
+    """
     runtime_v2_obj = getattr(app.state, "runtime_v2", None)
     if isinstance(runtime_v2_obj, ServiceRuntimeV2):
         runtime_v2_obj.shutdown()
+    runtime_obj = getattr(app.state, "runtime", None)
+    if isinstance(runtime_obj, ServiceRuntime):
+        runtime_obj.shutdown()
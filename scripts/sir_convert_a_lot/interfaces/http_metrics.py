@@ -0,0 +1,105 @@
+"""Prometheus collectors for Sir Convert-a-Lot runtime internals.
+
+Purpose:
+    Export process-level runtime state that is not driven by HTTP requests,
+    such as the shared Docling converter cache counters, PDF
+    pre-classification hit counters and hedged conversion outcomes.
+
+Relationships:
+    - Registered on the app metrics registry by `interfaces.http_api`.
+    - Reads `infrastructure.docling_converter_registry`,
+      `infrastructure.pdf_preclassification` and
+      `infrastructure.hedged_conversion` snapshots.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+from prometheus_client.registry import Collector
+
+from scripts.sir_convert_a_lot.infrastructure.docling_converter_registry import (
+    shared_docling_converter_registry,
+)
+from scripts.sir_convert_a_lot.infrastructure.hedged_conversion import (
+    shared_hedged_conversion_stats,
+)
+from scripts.sir_convert_a_lot.infrastructure.pdf_preclassification import (
+    shared_preclassification_stats,
+)
+
+
+class DoclingConverterCacheCollector(Collector):
+    """Expose hit/miss/eviction counters and occupancy of the converter registry."""
+
+    def collect(self) -> Iterable[Metric]:
+        stats = shared_docling_converter_registry().stats()
+        yield CounterMetricFamily(
+            "sir_convert_a_lot_docling_converter_cache_hits",
+            "Docling converter registry lookups served from cache.",
+            value=stats.hits,
+        )
+        yield CounterMetricFamily(
+            "sir_convert_a_lot_docling_converter_cache_misses",
+            "Docling converter registry lookups that built a new converter.",
+            value=stats.misses,
+        )
+        yield CounterMetricFamily(
+            "sir_convert_a_lot_docling_converter_cache_evictions",
+            "Docling converters evicted by the entry limit or memory budget.",
+            value=stats.evictions,
+        )
+        yield GaugeMetricFamily(
+            "sir_convert_a_lot_docling_converter_cache_entries",
+            "Docling converters currently cached.",
+            value=stats.entries,
+        )
+        yield GaugeMetricFamily(
+            "sir_convert_a_lot_docling_converter_cache_estimated_memory_megabytes",
+            "Approximate memory held by cached Docling converters.",
+            value=stats.estimated_memory_mb,
+        )
+
+
+class PdfPreclassificationCollector(Collector):
+    """Expose per-label prediction, outcome and hit counters of PDF pre-classification."""
+
+    def collect(self) -> Iterable[Metric]:
+        stats = shared_preclassification_stats().snapshot()
+        families = (
+            ("predicted", "Documents pre-classified with the label."),
+            ("observed", "Converted documents that turned out to have the label."),
+            ("hits", "Documents whose prediction for the label matched the outcome."),
+            ("total", "Documents whose prediction for the label was scored."),
+        )
+        for field_name, documentation in families:
+            family = CounterMetricFamily(
+                f"sir_convert_a_lot_pdf_preclassification_{field_name}",
+                documentation,
+                labels=["label"],
+            )
+            for label, label_stats in stats.items():
+                family.add_metric([label], getattr(label_stats, field_name))
+            yield family
+
+
+class HedgedConversionCollector(Collector):
+    """Expose hedged conversion outcomes by winning candidate and reason."""
+
+    def collect(self) -> Iterable[Metric]:
+        family = CounterMetricFamily(
+            "sir_convert_a_lot_hedged_conversions",
+            "Hedged PyMuPDF/Docling conversions by winning candidate and decision reason.",
+            labels=["winner", "reason"],
+        )
+        for (winner, reason), count in sorted(shared_hedged_conversion_stats().snapshot().items()):
+            family.add_metric([winner, reason], count)
+        yield family
+
+
+__all__ = [
+    "DoclingConverterCacheCollector",
+    "HedgedConversionCollector",
+    "PdfPreclassificationCollector",
+]
@@ -21,6 +21,7 @@ from scripts.sir_convert_a_lot.application.contracts import (
     ServiceReadinessResponse,
 )
 from scripts.sir_convert_a_lot.interfaces.http_app_state import (
+    ensure_runtime_state,
     metadata_for_app,
     resolve_eval_root_from_env,
     resolve_prod_root_from_env,
@@ -44,7 +45,7 @@ def build_health_router(*, app: FastAPI, service_started_at: str) -> APIRouter:
 
     @router.get("/readyz")
     async def readycheck() -> JSONResponse:
-        metadata = metadata_for_app(app, utc_now_iso=service_started_at)
+        runtime, metadata = ensure_runtime_state(app, utc_now_iso=service_started_at)
         expected_revision_obj = getattr(
             app.state, "expected_service_revision", metadata.service_revision
         )
@@ -131,6 +132,23 @@ def build_health_router(*, app: FastAPI, service_started_at: str) -> APIRouter:
                     },
                 )
             )
+        prewarm_status = runtime.converter_prewarm_status()
+        if prewarm_status.state == "warming":
+            reasons.append(
+                ServiceReadinessReason(
+                    code="converter_prewarm_pending",
+                    message="Declared converter profiles are still being prewarmed.",
+                    details=prewarm_status.as_details(),
+                )
+            )
+        elif prewarm_status.state == "failed":
+            reasons.append(
+                ServiceReadinessReason(
+                    code="converter_prewarm_failed",
+                    message="Prewarming a declared converter profile failed.",
+                    details=prewarm_status.as_details(),
+                )
+            )
 
         is_ready = len(reasons) == 0
         payload = ServiceReadinessResponse(
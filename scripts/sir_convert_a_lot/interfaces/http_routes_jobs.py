@@ -11,7 +11,6 @@ Relationships:
 from __future__ import annotations
 
 import asyncio
-import hashlib
 import json
 import time
 
@@ -40,7 +39,9 @@ from scripts.sir_convert_a_lot.infrastructure.runtime_engine import (
     StoredJob,
     fingerprint_for_request,
 )
+from scripts.sir_convert_a_lot.infrastructure.upload_staging import UploadTooLargeError
 from scripts.sir_convert_a_lot.interfaces.http_app_state import runtime_for_request
+from scripts.sir_convert_a_lot.interfaces.http_upload_staging import stage_upload_file
 
 
 def _make_job_links(job_id: str) -> JobLinks:
@@ -67,6 +68,8 @@ def _job_record_response(job: StoredJob) -> JobRecordResponse:
                 last_heartbeat_at=job.last_heartbeat_at,
                 current_phase_started_at=job.current_phase_started_at,
                 phase_timings_ms=job.phase_timings_ms,
+                cache_hit=job.cache_hit,
+                coalesced_with_job_id=job.coalesced_with_job_id,
             ),
             links=_make_job_links(job.job_id),
         )
@@ -126,121 +129,129 @@ def build_job_router(*, service_started_at: str) -> APIRouter:
                 retryable=False,
             )
 
-        payload_bytes = await file.read()
-        if len(payload_bytes) == 0:
-            raise ServiceError(
-                status_code=422,
-                code="pdf_unreadable",
-                message="Uploaded PDF is empty or unreadable.",
-                retryable=False,
+        try:
+            staged = await stage_upload_file(
+                file,
+                staging_dir=runtime.job_store.staging_dir,
+                max_bytes=runtime.config.max_upload_bytes,
             )
-        if len(payload_bytes) > runtime.config.max_upload_bytes:
+        except UploadTooLargeError as exc:
             raise ServiceError(
                 status_code=413,
                 code="payload_too_large",
                 message="Uploaded PDF exceeds configured size limit.",
                 retryable=False,
-            )
-
-        try:
-            raw_spec_object = json.loads(job_spec)
-        except json.JSONDecodeError as exc:
-            raise ServiceError(
-                status_code=400,
-                code="validation_error",
-                message=f"Invalid job_spec JSON: {exc.msg}",
-                retryable=False,
             ) from exc
 
-        if not isinstance(raw_spec_object, dict):
-            raise ServiceError(
-                status_code=400,
-                code="validation_error",
-                message="job_spec must decode into a JSON object.",
-                retryable=False,
-            )
-
-        raw_spec: dict[str, object] = raw_spec_object
-
         try:
-            spec = JobSpec.model_validate(raw_spec)
-        except ValidationError as exc:
-            raise ServiceError(
-                status_code=422,
-                code="validation_error",
-                message="Job specification failed validation.",
-                retryable=False,
-                details={"errors": exc.errors()},
-            ) from exc
+            if staged.size_bytes == 0:
+                raise ServiceError(
+                    status_code=422,
+                    code="pdf_unreadable",
+                    message="Uploaded PDF is empty or unreadable.",
+                    retryable=False,
+                )
 
-        if spec.source.kind.value != "upload":
-            raise ServiceError(
-                status_code=422,
-                code="validation_error",
-                message="source.kind must be 'upload' in v1.",
-                retryable=False,
-                details={"field": "source.kind"},
-            )
+            try:
+                raw_spec_object = json.loads(job_spec)
+            except json.JSONDecodeError as exc:
+                raise ServiceError(
+                    status_code=400,
+                    code="validation_error",
+                    message=f"Invalid job_spec JSON: {exc.msg}",
+                    retryable=False,
+                ) from exc
 
-        runtime.validate_backend_strategy(spec)
-        runtime.validate_acceleration_policy(spec)
+            if not isinstance(raw_spec_object, dict):
+                raise ServiceError(
+                    status_code=400,
+                    code="validation_error",
+                    message="job_spec must decode into a JSON object.",
+                    retryable=False,
+                )
 
-        api_key = request.headers.get("X-API-Key", "")
-        scope_key = f"{api_key}:POST:/v1/convert/jobs:{idempotency_key}"
-        file_sha256 = hashlib.sha256(payload_bytes).hexdigest()
-        request_fingerprint = fingerprint_for_request(raw_spec, file_sha256)
+            raw_spec: dict[str, object] = raw_spec_object
 
-        existing_record = runtime.get_idempotency(scope_key)
-        if existing_record is not None:
-            if existing_record.fingerprint != request_fingerprint:
+            try:
+                spec = JobSpec.model_validate(raw_spec)
+            except ValidationError as exc:
                 raise ServiceError(
-                    status_code=409,
-                    code="idempotency_key_reused_with_different_payload",
-                    message=(
-                        "Idempotency-Key was already used with a different request payload "
-                        "within the idempotency window."
-                    ),
+                    status_code=422,
+                    code="validation_error",
+                    message="Job specification failed validation.",
                     retryable=False,
+                    details={"errors": exc.errors()},
+                ) from exc
+
+            if spec.source.kind.value != "upload":
+                raise ServiceError(
+                    status_code=422,
+                    code="validation_error",
+                    message="source.kind must be 'upload' in v1.",
+                    retryable=False,
+                    details={"field": "source.kind"},
                 )
-            existing_job = runtime.get_job(existing_record.job_id)
-            if existing_job is None:
+
+            runtime.validate_backend_strategy(spec)
+            runtime.validate_acceleration_policy(spec)
+
+            api_key = request.headers.get("X-API-Key", "")
+            scope_key = f"{api_key}:POST:/v1/convert/jobs:{idempotency_key}"
+            request_fingerprint = fingerprint_for_request(raw_spec, staged.sha256)
+
+            existing_record = runtime.get_idempotency(scope_key)
+            if existing_record is not None:
+                if existing_record.fingerprint != request_fingerprint:
+                    raise ServiceError(
+                        status_code=409,
+                        code="idempotency_key_reused_with_different_payload",
+                        message=(
+                            "Idempotency-Key was already used with a different request payload "
+                            "within the idempotency window."
+                        ),
+                        retryable=False,
+                    )
+                existing_job = runtime.get_job(existing_record.job_id)
+                if existing_job is None:
+                    raise ServiceError(
+                        status_code=404,
+                        code="job_not_found",
+                        message="Idempotent job no longer exists.",
+                        retryable=False,
+                    )
+                body = _job_record_response(existing_job).model_dump(mode="json")
+                replay_status_code = 200 if existing_job.status in TERMINAL_JOB_STATUSES else 202
+                response = JSONResponse(status_code=replay_status_code, content=body)
+                response.headers["X-Idempotent-Replay"] = "true"
+                return response
+
+            job = runtime.create_staged_job(spec=spec, upload=staged, source_filename=file_name)
+            runtime.put_idempotency(scope_key, request_fingerprint, job.job_id)
+            runtime.run_job_async(job.job_id)
+
+            deadline = time.monotonic() + wait_seconds
+            current = runtime.get_job(job.job_id)
+            while (
+                current is not None
+                and current.status not in TERMINAL_JOB_STATUSES
+                and time.monotonic() < deadline
+            ):
+                await asyncio.sleep(0.05)
+                current = runtime.get_job(job.job_id)
+
+            if current is None:
                 raise ServiceError(
                     status_code=404,
                     code="job_not_found",
-                    message="Idempotent job no longer exists.",
+                    message="Job expired or was removed before response could be returned.",
                     retryable=False,
                 )
-            body = _job_record_response(existing_job).model_dump(mode="json")
-            replay_status_code = 200 if existing_job.status in TERMINAL_JOB_STATUSES else 202
-            response = JSONResponse(status_code=replay_status_code, content=body)
-            response.headers["X-Idempotent-Replay"] = "true"
-            return response
-
-        job = runtime.create_job(spec=spec, upload_bytes=payload_bytes, source_filename=file_name)
-        runtime.put_idempotency(scope_key, request_fingerprint, job.job_id)
-        runtime.run_job_async(job.job_id)
-
-        deadline = time.monotonic() + wait_seconds
-        current = runtime.get_job(job.job_id)
-        while (
-            current is not None
-            and current.status not in TERMINAL_JOB_STATUSES
-            and time.monotonic() < deadline
-        ):
-            await asyncio.sleep(0.05)
-            current = runtime.get_job(job.job_id)
-
-        if current is None:
-            raise ServiceError(
-                status_code=404,
-                code="job_not_found",
-                message="Job expired or was removed before response could be returned.",
-                retryable=False,
-            )
 
-        response_status = 200 if current.status in TERMINAL_JOB_STATUSES else 202
-        payload = _job_record_response(current).model_dump(mode="json")
-        return JSONResponse(status_code=response_status, content=payload)
+            response_status = 200 if current.status in TERMINAL_JOB_STATUSES else 202
+            payload = _job_record_response(current).model_dump(mode="json")
+            return JSONResponse(status_code=response_status, content=payload)
+        finally:
+            staged.discard()
 
     @router.get("/v1/convert/jobs/{job_id}")
     async def get_job(job_id: str, request: Request) -> JSONResponse:
@@ -331,6 +342,11 @@ def build_job_router(*, service_started_at: str) -> APIRouter:
                     ocr_enabled=job.ocr_enabled,
                     table_mode=job.spec.conversion.table_mode,
                     options_fingerprint=job.options_fingerprint,
+                    formula_enrichment_used=job.formula_enrichment_used,
+                    ocr_languages=job.ocr_languages,
+                    backend_route_reasons=job.backend_route_reasons,
+                    preclassification_labels=job.preclassification_labels,
+                    preclassification_hits=job.preclassification_hits,
                 ),
                 warnings=job.warnings,
                 markdown_content=markdown_content,
@@ -39,7 +39,9 @@ from scripts.sir_convert_a_lot.domain.specs_v2 import JobSpecV2, OutputFormatV2,
 from scripts.sir_convert_a_lot.infrastructure.runtime_config_v2 import fingerprint_for_request_v2
 from scripts.sir_convert_a_lot.infrastructure.runtime_models import ServiceError
 from scripts.sir_convert_a_lot.infrastructure.runtime_models_v2 import StoredJobV2
+from scripts.sir_convert_a_lot.infrastructure.upload_staging import UploadTooLargeError
 from scripts.sir_convert_a_lot.interfaces.http_app_state import runtime_v2_for_request
+from scripts.sir_convert_a_lot.interfaces.http_upload_staging import stage_upload_file
 
 
 def _make_job_links(job_id: str) -> JobLinksV2:
@@ -72,6 +74,8 @@ def _job_record_response(job: StoredJobV2) -> JobRecordResponseV2:
             output_format=job.output_format,
             progress=JobProgressV2(
                 stage=job.progress_stage,
+                pages_total=job.pages_total,
+                pages_processed=job.pages_processed,
                 last_heartbeat_at=job.last_heartbeat_at,
                 current_phase_started_at=job.current_phase_started_at,
                 phase_timings_ms=job.phase_timings_ms,
@@ -149,180 +153,191 @@ def build_job_router_v2(*, service_started_at: str) -> APIRouter:
                 details={"filename": file_name},
             )
 
-        payload_bytes = await file.read()
-        if len(payload_bytes) == 0:
-            raise ServiceError(
-                status_code=422,
-                code="input_unreadable",
-                message="Uploaded file is empty or unreadable.",
-                retryable=False,
+        try:
+            staged = await stage_upload_file(
+                file,
+                staging_dir=runtime.job_store.staging_dir,
+                max_bytes=runtime.config.max_upload_bytes,
             )
-        if len(payload_bytes) > runtime.config.max_upload_bytes:
+        except UploadTooLargeError as exc:
             raise ServiceError(
                 status_code=413,
                 code="payload_too_large",
                 message="Uploaded file exceeds configured size limit.",
                 retryable=False,
-            )
+            ) from exc
 
-        resources_bytes: bytes | None = None
-        resources_sha256: str | None = None
-        if resources is not None:
-            resources_bytes = await resources.read()
-            if len(resources_bytes) > runtime.config.max_upload_bytes:
+        try:
+            if staged.size_bytes == 0:
                 raise ServiceError(
-                    status_code=413,
-                    code="payload_too_large",
-                    message="Uploaded resources zip exceeds configured size limit.",
+                    status_code=422,
+                    code="input_unreadable",
+                    message="Uploaded file is empty or unreadable.",
                     retryable=False,
                 )
-            resources_sha256 = hashlib.sha256(resources_bytes).hexdigest()
 
-        reference_docx_bytes: bytes | None = None
-        reference_docx_sha256: str | None = None
-        if reference_docx is not None:
-            if reference_docx.filename is None or reference_docx.filename.strip() == "":
+            resources_bytes: bytes | None = None
+            resources_sha256: str | None = None
+            if resources is not None:
+                resources_bytes = await resources.read()
+                if len(resources_bytes) > runtime.config.max_upload_bytes:
+                    raise ServiceError(
+                        status_code=413,
+                        code="payload_too_large",
+                        message="Uploaded resources zip exceeds configured size limit.",
+                        retryable=False,
+                    )
+                resources_sha256 = hashlib.sha256(resources_bytes).hexdigest()
+
+            reference_docx_bytes: bytes | None = None
+            reference_docx_sha256: str | None = None
+            if reference_docx is not None:
+                if reference_docx.filename is None or reference_docx.filename.strip() == "":
+                    raise ServiceError(
+                        status_code=400,
+                        code="validation_error",
+                        message="Uploaded reference_docx must include a filename.",
+                        retryable=False,
+                        details={"field": "reference_docx.filename"},
+                    )
+                if not reference_docx.filename.lower().endswith(".docx"):
+                    raise ServiceError(
+                        status_code=415,
+                        code="unsupported_media_type",
+                        message="reference_docx must be a .docx file.",
+                        retryable=False,
+                    )
+                reference_docx_bytes = await reference_docx.read()
+                if len(reference_docx_bytes) > runtime.config.max_upload_bytes:
+                    raise ServiceError(
+                        status_code=413,
+                        code="payload_too_large",
+                        message="Uploaded reference_docx exceeds configured size limit.",
+                        retryable=False,
+                    )
+                reference_docx_sha256 = hashlib.sha256(reference_docx_bytes).hexdigest()
+
+            try:
+                raw_spec_object = json.loads(job_spec)
+            except json.JSONDecodeError as exc:
                 raise ServiceError(
                     status_code=400,
                     code="validation_error",
-                    message="Uploaded reference_docx must include a filename.",
+                    message=f"Invalid job_spec JSON: {exc.msg}",
+                    retryable=False,
+                ) from exc
+
+            if not isinstance(raw_spec_object, dict):
+                raise ServiceError(
+                    status_code=400,
+                    code="validation_error",
+                    message="job_spec must decode into a JSON object.",
                     retryable=False,
-                    details={"field": "reference_docx.filename"},
                 )
-            if not reference_docx.filename.lower().endswith(".docx"):
+
+            raw_spec: dict[str, object] = raw_spec_object
+
+            try:
+                spec = JobSpecV2.model_validate(raw_spec)
+            except ValidationError as exc:
                 raise ServiceError(
-                    status_code=415,
-                    code="unsupported_media_type",
-                    message="reference_docx must be a .docx file.",
+                    status_code=422,
+                    code="validation_error",
+                    message="Job specification failed validation.",
                     retryable=False,
+                    details={"errors": exc.errors()},
+                ) from exc
+
+            if spec.source.filename != file_name:
+                raise ServiceError(
+                    status_code=422,
+                    code="validation_error",
+                    message="job_spec.source.filename must match the uploaded file name.",
+                    retryable=False,
+                    details={
+                        "job_spec_filename": spec.source.filename,
+                        "upload_filename": file_name,
+                    },
                 )
-            reference_docx_bytes = await reference_docx.read()
-            if len(reference_docx_bytes) > runtime.config.max_upload_bytes:
+            if spec.source.format != inferred_format:
                 raise ServiceError(
-                    status_code=413,
-                    code="payload_too_large",
-                    message="Uploaded reference_docx exceeds configured size limit.",
+                    status_code=422,
+                    code="validation_error",
+                    message="job_spec.source.format must match the uploaded file extension.",
                     retryable=False,
+                    details={
+                        "job_spec_format": spec.source.format.value,
+                        "upload_format": inferred_format.value,
+                    },
                 )
-            reference_docx_sha256 = hashlib.sha256(reference_docx_bytes).hexdigest()
-
-        try:
-            raw_spec_object = json.loads(job_spec)
-        except json.JSONDecodeError as exc:
-            raise ServiceError(
-                status_code=400,
-                code="validation_error",
-                message=f"Invalid job_spec JSON: {exc.msg}",
-                retryable=False,
-            ) from exc
 
-        if not isinstance(raw_spec_object, dict):
-            raise ServiceError(
-                status_code=400,
-                code="validation_error",
-                message="job_spec must decode into a JSON object.",
-                retryable=False,
+            api_key = request.headers.get("X-API-Key", "")
+            scope_key = f"{api_key}:POST:/v2/convert/jobs:{idempotency_key}"
+            request_fingerprint = fingerprint_for_request_v2(
+                spec_payload=raw_spec,
+                file_sha256=staged.sha256,
+                resources_sha256=resources_sha256,
+                reference_docx_sha256=reference_docx_sha256,
             )
 
-        raw_spec: dict[str, object] = raw_spec_object
-
-        try:
-            spec = JobSpecV2.model_validate(raw_spec)
-        except ValidationError as exc:
-            raise ServiceError(
-                status_code=422,
-                code="validation_error",
-                message="Job specification failed validation.",
-                retryable=False,
-                details={"errors": exc.errors()},
-            ) from exc
-
-        if spec.source.filename != file_name:
-            raise ServiceError(
-                status_code=422,
-                code="validation_error",
-                message="job_spec.source.filename must match the uploaded file name.",
-                retryable=False,
-                details={"job_spec_filename": spec.source.filename, "upload_filename": file_name},
-            )
-        if spec.source.format != inferred_format:
-            raise ServiceError(
-                status_code=422,
-                code="validation_error",
-                message="job_spec.source.format must match the uploaded file extension.",
-                retryable=False,
-                details={
-                    "job_spec_format": spec.source.format.value,
-                    "upload_format": inferred_format.value,
-                },
+            existing_record = runtime.get_idempotency(scope_key)
+            if existing_record is not None:
+                if existing_record.fingerprint != request_fingerprint:
+                    raise ServiceError(
+                        status_code=409,
+                        code="idempotency_key_reused_with_different_payload",
+                        message=(
+                            "Idempotency-Key was already used with a different request payload "
+                            "within the idempotency window."
+                        ),
+                        retryable=False,
+                    )
+                existing_job = runtime.get_job(existing_record.job_id)
+                if existing_job is None:
+                    raise ServiceError(
+                        status_code=404,
+                        code="job_not_found",
+                        message="Idempotent job no longer exists.",
+                        retryable=False,
+                    )
+                body = _job_record_response(existing_job).model_dump(mode="json")
+                replay_status_code = 200 if existing_job.status in TERMINAL_JOB_STATUSES else 202
+                response = JSONResponse(status_code=replay_status_code, content=body)
+                response.headers["X-Idempotent-Replay"] = "true"
+                return response
+
+            job = runtime.create_staged_job(
+                spec=spec,
+                upload=staged,
+                resources_zip_bytes=resources_bytes,
+                reference_docx_bytes=reference_docx_bytes,
             )
+            runtime.put_idempotency(scope_key, request_fingerprint, job.job_id)
+            runtime.run_job_async(job.job_id)
 
-        api_key = request.headers.get("X-API-Key", "")
-        scope_key = f"{api_key}:POST:/v2/convert/jobs:{idempotency_key}"
-        file_sha256 = hashlib.sha256(payload_bytes).hexdigest()
-        request_fingerprint = fingerprint_for_request_v2(
-            spec_payload=raw_spec,
-            file_sha256=file_sha256,
-            resources_sha256=resources_sha256,
-            reference_docx_sha256=reference_docx_sha256,
-        )
-
-        existing_record = runtime.get_idempotency(scope_key)
-        if existing_record is not None:
-            if existing_record.fingerprint != request_fingerprint:
-                raise ServiceError(
-                    status_code=409,
-                    code="idempotency_key_reused_with_different_payload",
-                    message=(
-                        "Idempotency-Key was already used with a different request payload "
-                        "within the idempotency window."
-                    ),
-                    retryable=False,
-                )
-            existing_job = runtime.get_job(existing_record.job_id)
-            if existing_job is None:
+            deadline = time.monotonic() + wait_seconds
+            current = runtime.get_job(job.job_id)
+            while (
+                current is not None
+                and current.status not in TERMINAL_JOB_STATUSES
+                and time.monotonic() < deadline
+            ):
+                await asyncio.sleep(0.05)
+                current = runtime.get_job(job.job_id)
+
+            if current is None:
                 raise ServiceError(
                     status_code=404,
                     code="job_not_found",
-                    message="Idempotent job no longer exists.",
+                    message="Job expired or was removed before response could be returned.",
                     retryable=False,
                 )
-            body = _job_record_response(existing_job).model_dump(mode="json")
-            replay_status_code = 200 if existing_job.status in TERMINAL_JOB_STATUSES else 202
-            response = JSONResponse(status_code=replay_status_code, content=body)
-            response.headers["X-Idempotent-Replay"] = "true"
-            return response
-
-        job = runtime.create_job(
-            spec=spec,
-            upload_bytes=payload_bytes,
-            resources_zip_bytes=resources_bytes,
-            reference_docx_bytes=reference_docx_bytes,
-        )
-        runtime.put_idempotency(scope_key, request_fingerprint, job.job_id)
-        runtime.run_job_async(job.job_id)
-
-        deadline = time.monotonic() + wait_seconds
-        current = runtime.get_job(job.job_id)
-        while (
-            current is not None
-            and current.status not in TERMINAL_JOB_STATUSES
-            and time.monotonic() < deadline
-        ):
-            await asyncio.sleep(0.05)
-            current = runtime.get_job(job.job_id)
-
-        if current is None:
-            raise ServiceError(
-                status_code=404,
-                code="job_not_found",
-                message="Job expired or was removed before response could be returned.",
-                retryable=False,
-            )
 
-        response_status = 200 if current.status in TERMINAL_JOB_STATUSES else 202
-        payload = _job_record_response(current).model_dump(mode="json")
-        return JSONResponse(status_code=response_status, content=payload)
+            response_status = 200 if current.status in TERMINAL_JOB_STATUSES else 202
+            payload = _job_record_response(current).model_dump(mode="json")
+            return JSONResponse(status_code=response_status, content=payload)
+        finally:
+            staged.discard()
 
     @router.get("/v2/convert/jobs/{job_id}")
     async def get_job(job_id: str, request: Request) -> JSONResponse:
@@ -0,0 +1,40 @@
+"""Multipart upload streaming into job-store staging files.
+
+Purpose:
+    Copy an `UploadFile` into a staging file in fixed-size chunks so job
+    creation hashes and size-checks the payload without reading it into
+    memory.
+
+Relationships:
+    - Used by `interfaces.http_routes_jobs` and `interfaces.http_routes_jobs_v2`.
+    - Staging files and their commit live in `infrastructure.upload_staging`.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from fastapi import UploadFile
+
+from scripts.sir_convert_a_lot.infrastructure.upload_staging import (
+    UPLOAD_CHUNK_BYTES,
+    StagedUpload,
+    UploadStager,
+)
+
+
+async def stage_upload_file(
+    upload: UploadFile, *, staging_dir: Path, max_bytes: int
+) -> StagedUpload:
+    """Stream `upload` into `staging_dir`; raises `UploadTooLargeError` past `max_bytes`."""
+    stager = UploadStager(staging_dir, max_bytes=max_bytes)
+    try:
+        while chunk := await upload.read(UPLOAD_CHUNK_BYTES):
+            stager.write(chunk)
+    except BaseException:
+        stager.abort()
+        raise
+    return stager.finish()
+
+
+__all__ = ["stage_upload_file"]
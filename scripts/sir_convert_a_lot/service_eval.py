@@ -34,6 +34,9 @@ def eval_service_config_from_env() -> ServiceConfig:
     allow_cpu_fallback = _bool_env("SIR_CONVERT_A_LOT_EVAL_ALLOW_CPU_FALLBACK", default=False)
     max_upload_bytes = int(os.getenv("SIR_CONVERT_A_LOT_MAX_UPLOAD_BYTES", str(50 * 1024 * 1024)))
     inline_max_bytes = int(os.getenv("SIR_CONVERT_A_LOT_INLINE_MAX_BYTES", str(2 * 1024 * 1024)))
+    pymupdf_parallel_min_pages = int(
+        os.getenv("SIR_CONVERT_A_LOT_PYMUPDF_PARALLEL_MIN_PAGES", "64")
+    )
     data_root_raw = os.getenv("SIR_CONVERT_A_LOT_EVAL_DATA_DIR", "build/sir_convert_a_lot_eval")
     data_root = Path(data_root_raw)
     prod_data_root_raw = os.getenv("SIR_CONVERT_A_LOT_DATA_DIR", "build/sir_convert_a_lot")
@@ -50,6 +53,7 @@ def eval_service_config_from_env() -> ServiceConfig:
         gpu_available=gpu_available,
         allow_cpu_only=allow_cpu_only,
         allow_cpu_fallback=allow_cpu_fallback,
+        pymupdf_parallel_min_pages=pymupdf_parallel_min_pages,
     )
 
 
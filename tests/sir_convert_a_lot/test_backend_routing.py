@@ -2,16 +2,27 @@
 
 Purpose:
     Validate deterministic policy checks and backend selection logic extracted
-    from runtime orchestration.
+    from runtime orchestration, including the opt-in structural triage behind
+    `backend_strategy=auto`.
 
 Relationships:
     - Exercises `scripts.sir_convert_a_lot.infrastructure.backend_routing`.
+    - Covers auto routing through `infrastructure.runtime_conversion`.
 """
 
 from __future__ import annotations
 
-from scripts.sir_convert_a_lot.domain.specs import JobSpec
+import pymupdf
+
+from scripts.sir_convert_a_lot.domain.specs import BackendStrategy, JobSpec, OcrMode
 from scripts.sir_convert_a_lot.infrastructure.backend_routing import (
+    ROUTE_IMAGE_HEAVY,
+    ROUTE_OCR_REQUESTED,
+    ROUTE_POLICY_CPU_FALLBACK_DISABLED,
+    ROUTE_POLICY_GPU_REQUIRED,
+    ROUTE_RULED_TABLES,
+    ROUTE_SIMPLE_TEXT_LAYER,
+    route_auto_backend,
     select_backend,
     validate_acceleration_policy,
     validate_backend_strategy,
@@ -21,14 +32,38 @@ from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
     ConversionRequest,
     ConversionResultData,
 )
+from scripts.sir_convert_a_lot.infrastructure.runtime_config import service_config_from_env
+from scripts.sir_convert_a_lot.infrastructure.runtime_conversion import execute_job_conversion
+
+_PARAGRAPH = "This born-digital page carries a plain paragraph of running text. " * 4
 
 
 class _StubBackend(ConversionBackend):
     def __init__(self, label: str) -> None:
         self.label = label
+        self.requests: list[ConversionRequest] = []
+
+    def convert(self, request: ConversionRequest) -> ConversionResultData:
+        self.requests.append(request)
+        return ConversionResultData(
+            markdown_content=f"converted by {self.label}\n",
+            backend_used=self.label,
+            acceleration_used="cpu",
+            ocr_enabled=False,
+        )
 
-    def convert(self, request: ConversionRequest) -> ConversionResultData:  # pragma: no cover
-        raise NotImplementedError(request.source_filename)
+
+def _text_pdf(*, with_table_and_image: bool = False) -> bytes:
+    with pymupdf.open() as document:
+        for _ in range(2):
+            page = document.new_page(width=612, height=792)
+            page.insert_textbox(pymupdf.Rect(72, 72, 540, 300), _PARAGRAPH)
+            if with_table_and_image:
+                for offset in range(0, 100, 20):
+                    page.draw_line((72, 320 + offset), (540, 320 + offset))
+                pixmap = pymupdf.Pixmap(pymupdf.csRGB, pymupdf.IRect(0, 0, 8, 8), False)
+                page.insert_image(pymupdf.Rect(72, 440, 540, 760), pixmap=pixmap)
+        return bytes(document.tobytes())
 
 
 def _job_spec(
@@ -117,3 +152,66 @@ def test_select_backend_routes_explicit_pymupdf() -> None:
     )
     assert isinstance(selected, _StubBackend)
     assert selected.label == "pymupdf"
+
+
+def test_route_auto_backend_sends_simple_pdf_to_pymupdf_when_cpu_is_allowed() -> None:
+    route = route_auto_backend(
+        _job_spec(acceleration_policy="cpu_only"), _text_pdf(), allow_cpu_fallback=False
+    )
+    assert route.backend_strategy == BackendStrategy.PYMUPDF
+    assert route.reasons == (ROUTE_SIMPLE_TEXT_LAYER,)
+
+
+def test_route_auto_backend_keeps_complex_pdf_on_docling() -> None:
+    route = route_auto_backend(
+        _job_spec(acceleration_policy="gpu_prefer"),
+        _text_pdf(with_table_and_image=True),
+        allow_cpu_fallback=True,
+    )
+    assert route.backend_strategy == BackendStrategy.DOCLING
+    assert route.reasons == (ROUTE_IMAGE_HEAVY, ROUTE_RULED_TABLES)
+
+
+def test_route_auto_backend_respects_gpu_first_policy_without_triage() -> None:
+    required = route_auto_backend(
+        _job_spec(acceleration_policy="gpu_required"), b"not a pdf", allow_cpu_fallback=True
+    )
+    preferred = route_auto_backend(
+        _job_spec(ocr_mode="force", acceleration_policy="gpu_prefer"),
+        b"not a pdf",
+        allow_cpu_fallback=False,
+    )
+    assert required.backend_strategy == BackendStrategy.DOCLING
+    assert required.reasons == (ROUTE_POLICY_GPU_REQUIRED,)
+    assert preferred.reasons == (ROUTE_POLICY_CPU_FALLBACK_DISABLED, ROUTE_OCR_REQUESTED)
+
+
+def test_execute_job_conversion_records_auto_route_in_metadata() -> None:
+    docling_backend = _StubBackend("docling")
+    pymupdf_backend = _StubBackend("pymupdf")
+    _, metadata, _, timings = execute_job_conversion(
+        spec=_job_spec(acceleration_policy="cpu_only"),
+        source_filename="paper.pdf",
+        source=_text_pdf(),
+        gpu_available=False,
+        gpu_runtime_probe=None,
+        docling_backend=docling_backend,
+        pymupdf_backend=pymupdf_backend,
+        auto_backend_triage=True,
+    )
+    assert docling_backend.requests == []
+    assert [request.backend_strategy for request in pymupdf_backend.requests] == [
+        BackendStrategy.PYMUPDF
+    ]
+    assert pymupdf_backend.requests[0].ocr_mode == OcrMode.OFF
+    assert metadata.backend_used == "pymupdf"
+    assert metadata.backend_route_reasons == [ROUTE_SIMPLE_TEXT_LAYER]
+    assert "backend_triage_ms" in timings
+
+
+def test_auto_backend_triage_is_opt_in(monkeypatch) -> None:
+    monkeypatch.delenv("SIR_CONVERT_A_LOT_AUTO_BACKEND_TRIAGE", raising=False)
+    assert service_config_from_env().auto_backend_triage is False
+
+    monkeypatch.setenv("SIR_CONVERT_A_LOT_AUTO_BACKEND_TRIAGE", "1")
+    assert service_config_from_env().auto_backend_triage is True
@@ -0,0 +1,92 @@
+"""OCR-mode benchmark runner tests.
+
+Purpose:
+    Validate the payload shape, per-mode summaries and baseline comparison
+    emitted by the OCR-mode benchmark, and the text-layer F1 quality metric.
+
+Relationships:
+    - Exercises `scripts.sir_convert_a_lot.benchmark_ocr_modes.run_benchmark`
+      with a stub backend so no Docling models are loaded.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from scripts.sir_convert_a_lot.benchmark_ocr_modes import (
+    DEFAULT_OUTPUT_JSON,
+    run_benchmark,
+    text_layer_f1,
+    text_layer_words,
+)
+from scripts.sir_convert_a_lot.domain.specs import OcrMode
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
+    ConversionRequest,
+    ConversionResultData,
+)
+from tests.sir_convert_a_lot.pdf_fixtures import copy_fixture_pdf, fixture_pdf_bytes
+
+
+class _TextLayerBackend:
+    """Echo the text layer, dropping every other word under full-page OCR."""
+
+    def __init__(self) -> None:
+        self.modes: list[OcrMode] = []
+
+    def convert(self, request: ConversionRequest) -> ConversionResultData:
+        self.modes.append(request.ocr_mode)
+        words = sorted(text_layer_words(request.source).elements())
+        if request.ocr_mode == OcrMode.FORCE:
+            words = words[::2]
+        return ConversionResultData(
+            markdown_content=" ".join(words),
+            backend_used="docling",
+            acceleration_used="cuda",
+            ocr_enabled=True,
+        )
+
+
+def test_text_layer_f1_scores_word_overlap() -> None:
+    reference = text_layer_words(fixture_pdf_bytes("paper_alpha.pdf"))
+    text = " ".join(reference.elements())
+
+    assert text_layer_f1(text, reference) == 1.0
+    assert text_layer_f1("", reference) is None
+    assert text_layer_f1("zzzunrelated", reference) == 0.0
+
+
+def test_run_benchmark_compares_modes_against_baseline(tmp_path: Path) -> None:
+    fixtures_dir = tmp_path / "fixtures"
+    fixtures_dir.mkdir()
+    copy_fixture_pdf(fixtures_dir / "b.pdf", "paper_beta.pdf")
+    copy_fixture_pdf(fixtures_dir / "a.pdf", "paper_alpha.pdf")
+    backend = _TextLayerBackend()
+
+    output_json = tmp_path / "ocr-modes.json"
+    payload = run_benchmark(
+        fixtures_dir=fixtures_dir,
+        output_json=output_json,
+        stage="local-test",
+        backend=backend,
+    )
+
+    assert output_json.exists()
+    assert backend.modes == [OcrMode.FORCE] * 3 + [OcrMode.REGIONS] * 3
+    assert [(job["source_file"], job["ocr_mode"]) for job in payload["jobs"]] == [
+        ("a.pdf", "force"),
+        ("b.pdf", "force"),
+        ("a.pdf", "regions"),
+        ("b.pdf", "regions"),
+    ]
+    force, regions = payload["modes"]
+    assert regions["mean_text_layer_f1"] == 1.0
+    assert force["mean_text_layer_f1"] is not None and force["mean_text_layer_f1"] < 1.0
+    (comparison,) = payload["comparisons"]
+    assert (comparison["baseline_mode"], comparison["candidate_mode"]) == ("force", "regions")
+    assert comparison["text_layer_f1_delta"] is not None
+    assert comparison["text_layer_f1_delta"] > 0
+    assert comparison["speedup"] is not None
+
+
+def test_default_output_json_path_is_outside_docs_reference() -> None:
+    assert DEFAULT_OUTPUT_JSON.as_posix().startswith("build/")
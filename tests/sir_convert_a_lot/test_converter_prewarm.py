@@ -0,0 +1,212 @@
+"""Tests for startup converter prewarm and its readiness gate.
+
+Purpose:
+    Verify prewarm profile parsing, the Docling backend's per-profile converter
+    coverage, converter registry sizing for the prewarmed set, and that
+    `/readyz` stays not-ready until prewarm succeeds.
+
+Relationships:
+    - Exercises `infrastructure.converter_prewarm`, `runtime_config` profile
+      parsing, `infrastructure.docling_converter_registry` sizing, and
+      `interfaces.http_routes_health` readiness reasons.
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+from docling.datamodel.accelerator_options import AcceleratorDevice
+from fastapi.testclient import TestClient
+
+from scripts.sir_convert_a_lot.domain.specs import OcrMode, TableMode
+from scripts.sir_convert_a_lot.infrastructure.converter_prewarm import (
+    prewarm_converter_count,
+    prewarm_pdf_bytes,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_backend import (
+    DoclingConversionBackend,
+    _DoclingAttempt,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_converter_registry import (
+    DOCLING_CONVERTER_CACHE_MAX_ENTRIES_ENV_VAR,
+    DoclingConverterRegistry,
+    converter_cache_max_entries,
+)
+from scripts.sir_convert_a_lot.infrastructure.runtime_config import (
+    parse_converter_prewarm_profiles,
+)
+from scripts.sir_convert_a_lot.infrastructure.runtime_models import ConverterPrewarmProfile
+from scripts.sir_convert_a_lot.service import ServiceConfig, create_app
+
+
+def _ready_app(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, profiles: str):
+    service_data = tmp_path / "service_data"
+    monkeypatch.setenv("SIR_CONVERT_A_LOT_SERVICE_REVISION", "rev_ready")
+    monkeypatch.setenv("SIR_CONVERT_A_LOT_EXPECTED_REVISION", "rev_ready")
+    monkeypatch.setenv("SIR_CONVERT_A_LOT_DATA_DIR", service_data.as_posix())
+    return create_app(
+        ServiceConfig(
+            api_key="secret-key",
+            data_root=service_data,
+            enable_supervisor=False,
+            gpu_available=False,
+            allow_cpu_only=True,
+            converter_prewarm_profiles=parse_converter_prewarm_profiles(profiles),
+        ),
+        service_profile="prod",
+        expected_service_profile="prod",
+    )
+
+
+def test_parse_prewarm_profiles_expands_layout_shorthand() -> None:
+    profiles = parse_converter_prewarm_profiles(
+        "auto/accurate:egret_large+heron; OFF/fast ;auto/accurate:egret_large+heron"
+    )
+
+    assert profiles == (
+        ConverterPrewarmProfile(
+            ocr_mode=OcrMode.AUTO,
+            table_mode=TableMode.ACCURATE,
+            layout_model_keys=("docling_layout_egret_large", "docling_layout_heron"),
+        ),
+        ConverterPrewarmProfile(ocr_mode=OcrMode.OFF, table_mode=TableMode.FAST),
+    )
+    assert profiles[0].label == "auto/accurate:docling_layout_egret_large+docling_layout_heron"
+    assert parse_converter_prewarm_profiles("  ") == ()
+
+
+@pytest.mark.parametrize("raw", ["auto", "auto/exact", "sometimes/fast"])
+def test_parse_prewarm_profiles_rejects_malformed_entries(raw: str) -> None:
+    with pytest.raises(ValueError, match="SIR_CONVERT_A_LOT_DOCLING_PREWARM_PROFILES"):
+        parse_converter_prewarm_profiles(raw)
+
+
+def test_docling_prewarm_builds_every_ocr_and_layout_variant(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    backend = DoclingConversionBackend()
+    calls: list[tuple[bool, str, bool]] = []
+
+    def _fake_convert_once_with_layout(**kwargs: object) -> _DoclingAttempt:
+        assert kwargs["request"].source == prewarm_pdf_bytes()  # type: ignore[attr-defined]
+        calls.append(
+            (
+                bool(kwargs["ocr_enabled"]),
+                str(kwargs["layout_model_key"]),
+                bool(kwargs["formula_enrichment"]),
+            )
+        )
+        return _DoclingAttempt(markdown_content="warm", page_count=1, low_confidence=False)
+
+    monkeypatch.setattr(
+        backend,
+        "_resolve_acceleration",
+        lambda gpu_available, runtime_probe: (AcceleratorDevice.CUDA, "cuda"),
+    )
+    monkeypatch.setattr(backend, "_convert_once_with_layout", _fake_convert_once_with_layout)
+
+    warmed = backend.prewarm(
+        ConverterPrewarmProfile(
+            ocr_mode=OcrMode.AUTO,
+            table_mode=TableMode.ACCURATE,
+            layout_model_keys=("docling_layout_egret_large", "docling_layout_heron"),
+        )
+    )
+
+    assert warmed == 4
+    assert calls == [
+        (False, "docling_layout_egret_large", False),
+        (False, "docling_layout_heron", False),
+        (True, "docling_layout_egret_large", False),
+        (True, "docling_layout_heron", False),
+    ]
+
+
+def test_converter_registry_is_sized_to_hold_prewarmed_converters(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    profiles = (
+        ConverterPrewarmProfile(
+            ocr_mode=OcrMode.AUTO,
+            table_mode=TableMode.ACCURATE,
+            layout_model_keys=("docling_layout_egret_large", "docling_layout_heron"),
+        ),
+        ConverterPrewarmProfile(
+            ocr_mode=OcrMode.OFF,
+            table_mode=TableMode.ACCURATE,
+            layout_model_keys=("docling_layout_heron",),
+        ),
+        ConverterPrewarmProfile(
+            ocr_mode=OcrMode.OFF,
+            table_mode=TableMode.FAST,
+            layout_model_keys=("docling_layout_heron",),
+        ),
+    )
+    prewarm_converters = prewarm_converter_count(profiles)
+    monkeypatch.delenv(DOCLING_CONVERTER_CACHE_MAX_ENTRIES_ENV_VAR, raising=False)
+    capacity = converter_cache_max_entries(prewarm_converters=prewarm_converters)
+    registry = DoclingConverterRegistry(max_entries=4, memory_budget_mb=None)
+    registry.ensure_capacity(capacity)
+    registry.ensure_capacity(2)
+
+    assert prewarm_converters == 5
+    assert capacity > prewarm_converters
+    assert registry.stats().max_entries == capacity
+    monkeypatch.setenv(DOCLING_CONVERTER_CACHE_MAX_ENTRIES_ENV_VAR, "4")
+    with pytest.raises(ValueError, match="cannot hold the 5 converters"):
+        converter_cache_max_entries(prewarm_converters=prewarm_converters)
+
+
+def test_readyz_waits_for_converter_prewarm(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    release = threading.Event()
+    warmed_profiles: list[str] = []
+
+    def _blocking_prewarm(self: DoclingConversionBackend, profile: ConverterPrewarmProfile) -> int:
+        release.wait(timeout=5.0)
+        warmed_profiles.append(profile.label)
+        return 2
+
+    monkeypatch.setattr(DoclingConversionBackend, "prewarm", _blocking_prewarm)
+    app = _ready_app(monkeypatch, tmp_path, "auto/accurate:egret_large+heron")
+
+    with TestClient(app) as client:
+        pending = client.get("/readyz")
+        assert pending.status_code == 503
+        reason = pending.json()["reasons"][0]
+        assert reason["code"] == "converter_prewarm_pending"
+        assert reason["details"]["profiles_total"] == 1
+
+        release.set()
+        assert app.state.runtime._converter_prewarmer.wait(timeout=5.0)
+        ready = client.get("/readyz")
+
+    assert ready.status_code == 200
+    assert ready.json()["reasons"] == []
+    assert warmed_profiles == ["auto/accurate:docling_layout_egret_large+docling_layout_heron"]
+    status = app.state.runtime.converter_prewarm_status()
+    assert status.state == "ready"
+    assert status.converters_warmed == 2
+
+
+def test_readyz_fails_closed_when_converter_prewarm_fails(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    def _failing_prewarm(self: DoclingConversionBackend, profile: ConverterPrewarmProfile) -> int:
+        raise RuntimeError("weights unavailable")
+
+    monkeypatch.setattr(DoclingConversionBackend, "prewarm", _failing_prewarm)
+    app = _ready_app(monkeypatch, tmp_path, "off/fast")
+
+    with TestClient(app) as client:
+        assert app.state.runtime._converter_prewarmer.wait(timeout=5.0)
+        response = client.get("/readyz")
+
+    assert response.status_code == 503
+    reason = response.json()["reasons"][0]
+    assert reason["code"] == "converter_prewarm_failed"
+    assert reason["details"]["failed_profile"] == "off/fast"
+    assert reason["details"]["error"] == "RuntimeError: weights unavailable"
@@ -10,11 +10,17 @@ Relationships:
 
 from __future__ import annotations
 
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
 
-from scripts.sir_convert_a_lot.domain.specs import BackendStrategy, OcrMode, TableMode
+from scripts.sir_convert_a_lot.domain.specs import (
+    BackendStrategy,
+    FormulaEnrichmentMode,
+    OcrMode,
+    TableMode,
+)
 from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
     BackendExecutionError,
     BackendGpuUnavailableError,
@@ -24,7 +30,9 @@ from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
 from scripts.sir_convert_a_lot.infrastructure.docling_backend import (
     DoclingConversionBackend,
     _DoclingAttempt,
-    _resolve_layout_model_config,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_layout_models import (
+    resolve_layout_model_config as _resolve_layout_model_config,
 )
 from scripts.sir_convert_a_lot.infrastructure.gpu_runtime_probe import GpuRuntimeProbeResult
 from tests.sir_convert_a_lot.pdf_fixtures import docling_cuda_available, fixture_pdf_bytes
@@ -36,13 +44,17 @@ def _request(
     gpu_available: bool = True,
     table_mode: TableMode = TableMode.FAST,
 ) -> ConversionRequest:
+    # Formula enrichment is pinned explicitly; detection-gated AUTO has its own tests.
     return ConversionRequest(
         source_filename="paper_alpha.pdf",
-        source_bytes=fixture_pdf_bytes("paper_alpha.pdf"),
+        source=fixture_pdf_bytes("paper_alpha.pdf"),
         backend_strategy=BackendStrategy.DOCLING,
         ocr_mode=ocr_mode,
         table_mode=table_mode,
         gpu_available=gpu_available,
+        formula_enrichment=FormulaEnrichmentMode.ON
+        if table_mode == TableMode.ACCURATE
+        else FormulaEnrichmentMode.OFF,
     )
 
 
@@ -158,6 +170,38 @@ def test_auto_mode_skips_retry_when_dense_and_confident(monkeypatch) -> None:
     assert result.warnings == []
 
 
+def test_auto_formula_enrichment_skips_model_without_detected_formulas(monkeypatch) -> None:
+    backend = DoclingConversionBackend()
+    calls: list[bool] = []
+
+    def _fake_convert_once(
+        request: ConversionRequest,
+        *,
+        ocr_enabled: bool,
+        force_full_page_ocr: bool,
+        acceleration_device,
+        formula_enrichment: bool,
+        formula_preset: str,
+    ) -> _DoclingAttempt:
+        del request, ocr_enabled, force_full_page_ocr, acceleration_device, formula_preset
+        calls.append(formula_enrichment)
+        return _DoclingAttempt(
+            markdown_content=" ".join(["prose"] * 200), page_count=1, low_confidence=False
+        )
+
+    monkeypatch.setattr(backend, "_convert_once", _fake_convert_once)
+    request = replace(
+        _request(ocr_mode=OcrMode.OFF, table_mode=TableMode.ACCURATE),
+        formula_enrichment=FormulaEnrichmentMode.AUTO,
+    )
+    result = backend.convert(request)
+
+    assert calls == [False]
+    assert result.warnings == []
+    assert result.formula_enrichment_used is False
+    assert "formula_enrichment_ms" not in result.phase_timings_ms
+
+
 def test_force_mode_runs_single_ocr_pass(monkeypatch) -> None:
     backend = DoclingConversionBackend()
     calls: list[tuple[bool, bool]] = []
@@ -187,6 +231,35 @@ def test_force_mode_runs_single_ocr_pass(monkeypatch) -> None:
     assert result.warnings == []
 
 
+def test_regions_mode_runs_single_ocr_pass_without_forcing_full_pages(monkeypatch) -> None:
+    backend = DoclingConversionBackend()
+    calls: list[tuple[bool, bool]] = []
+
+    def _fake_convert_once(
+        request: ConversionRequest,
+        *,
+        ocr_enabled: bool,
+        force_full_page_ocr: bool,
+        acceleration_device,
+        formula_enrichment: bool,
+        formula_preset: str,
+    ) -> _DoclingAttempt:
+        del request, acceleration_device, formula_enrichment, formula_preset
+        calls.append((ocr_enabled, force_full_page_ocr))
+        return _DoclingAttempt(
+            markdown_content="Text layer kept, figure text OCR'd.",
+            page_count=1,
+            low_confidence=False,
+        )
+
+    monkeypatch.setattr(backend, "_convert_once", _fake_convert_once)
+    result = backend.convert(_request(ocr_mode=OcrMode.REGIONS))
+
+    assert calls == [(True, False)]
+    assert result.ocr_enabled is True
+    assert result.warnings == []
+
+
 def test_auto_mode_retries_when_low_confidence_even_if_dense(monkeypatch) -> None:
     backend = DoclingConversionBackend()
     calls: list[tuple[bool, bool]] = []
@@ -606,7 +679,7 @@ def test_invalid_pdf_raises_backend_input_error() -> None:
     backend = DoclingConversionBackend()
     request = ConversionRequest(
         source_filename="broken.pdf",
-        source_bytes=b"%PDF-1.4\n1 0 obj\n<<>>\nendobj\n%%EOF\n",
+        source=b"%PDF-1.4\n1 0 obj\n<<>>\nendobj\n%%EOF\n",
         backend_strategy=BackendStrategy.DOCLING,
         ocr_mode=OcrMode.OFF,
         table_mode=TableMode.FAST,
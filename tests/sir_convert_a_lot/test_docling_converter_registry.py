@@ -0,0 +1,107 @@
+"""Shared Docling converter registry tests for Sir Convert-a-Lot.
+
+Purpose:
+    Verify LRU eviction by entry count and memory budget, hit/miss/eviction
+    counters, single-build semantics under concurrency, and metrics export.
+
+Relationships:
+    - Exercises `infrastructure.docling_converter_registry`.
+    - Exercises `interfaces.http_metrics.DoclingConverterCacheCollector`.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from docling.document_converter import DocumentConverter
+
+from scripts.sir_convert_a_lot.infrastructure.docling_converter_registry import (
+    DoclingConverterRegistry,
+    estimate_converter_memory_mb,
+)
+from scripts.sir_convert_a_lot.interfaces.http_metrics import DoclingConverterCacheCollector
+
+
+def test_registry_evicts_least_recently_used_entry_at_max_entries() -> None:
+    registry = DoclingConverterRegistry(max_entries=2, memory_budget_mb=None)
+    first = registry.get_or_build("a", build=DocumentConverter, cost_mb=10)
+    registry.get_or_build("b", build=DocumentConverter, cost_mb=10)
+    assert registry.get_or_build("a", build=DocumentConverter, cost_mb=10) is first
+
+    registry.get_or_build("c", build=DocumentConverter, cost_mb=10)
+    assert registry.get_or_build("a", build=DocumentConverter, cost_mb=10) is first
+
+    stats = registry.stats()
+    assert stats.entries == 2
+    assert stats.evictions == 1
+    assert stats.hits == 2
+    assert stats.misses == 3
+
+
+def test_registry_evicts_to_respect_memory_budget_but_keeps_newest() -> None:
+    registry = DoclingConverterRegistry(max_entries=8, memory_budget_mb=1000)
+    registry.get_or_build("small", build=DocumentConverter, cost_mb=400)
+    registry.get_or_build("medium", build=DocumentConverter, cost_mb=500)
+    registry.get_or_build("huge", build=DocumentConverter, cost_mb=1500)
+
+    stats = registry.stats()
+    assert stats.entries == 1
+    assert stats.evictions == 2
+    assert stats.estimated_memory_mb == 1500
+
+
+def test_registry_builds_each_key_once_under_concurrency() -> None:
+    registry = DoclingConverterRegistry(max_entries=4, memory_budget_mb=None)
+    build_count = 0
+    count_lock = threading.Lock()
+
+    def _slow_build() -> DocumentConverter:
+        nonlocal build_count
+        with count_lock:
+            build_count += 1
+        time.sleep(0.05)
+        return DocumentConverter()
+
+    results: list[DocumentConverter] = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(
+                registry.get_or_build("shared", build=_slow_build, cost_mb=10)
+            )
+        )
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=2.0)
+
+    assert build_count == 1
+    assert len({id(converter) for converter in results}) == 1
+    assert registry.stats().misses == 1
+
+
+def test_memory_estimate_grows_with_enabled_models() -> None:
+    base = estimate_converter_memory_mb(
+        layout_model_key="docling_layout_heron",
+        table_mode="fast",
+        ocr_enabled=False,
+        formula_enrichment=False,
+        formula_preset="codeformulav2",
+    )
+    enriched = estimate_converter_memory_mb(
+        layout_model_key="docling_layout_heron",
+        table_mode="accurate",
+        ocr_enabled=True,
+        formula_enrichment=True,
+        formula_preset="codeformulav2",
+    )
+    assert enriched > base > 0
+
+
+def test_cache_collector_exports_counters() -> None:
+    names = {metric.name for metric in DoclingConverterCacheCollector().collect()}
+    assert "sir_convert_a_lot_docling_converter_cache_hits" in names
+    assert "sir_convert_a_lot_docling_converter_cache_evictions" in names
+    assert "sir_convert_a_lot_docling_converter_cache_estimated_memory_megabytes" in names
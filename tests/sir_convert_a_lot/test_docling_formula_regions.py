@@ -0,0 +1,314 @@
+"""Region-scoped formula re-enrichment tests.
+
+Purpose:
+    Verify that only failing formula items are re-decoded by the fallback
+    model, that improvements are spliced into a copy of the primary document,
+    that the backend prefers the spliced candidate over a whole-document
+    rerun with the fallback preset, that a converter whose PDF pipeline cannot
+    be reached falls back to that rerun, that AUTO formula enrichment
+    decodes only formulas the unenriched pass detected, and that the default
+    mode leaves job option fingerprints unchanged.
+
+Relationships:
+    - Exercises `infrastructure.docling_formula_regions` and the formula
+      fallback flow in `infrastructure.docling_formula_fallback`.
+    - Checks `infrastructure.runtime_conversion.options_fingerprint_for_spec`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterable
+from dataclasses import replace
+
+import pymupdf
+import pytest
+from docling.datamodel.base_models import ItemAndImageEnrichmentElement
+from docling_core.types.doc import BoundingBox, CoordOrigin, DocItemLabel, Size
+from docling_core.types.doc.document import DoclingDocument, FormulaItem, NodeItem, ProvenanceItem
+
+from scripts.sir_convert_a_lot.domain.specs import (
+    BackendStrategy,
+    FormulaEnrichmentMode,
+    JobSpec,
+    OcrMode,
+    TableMode,
+)
+from scripts.sir_convert_a_lot.infrastructure import docling_formula_regions
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import ConversionRequest
+from scripts.sir_convert_a_lot.infrastructure.docling_backend import (
+    DoclingConversionBackend,
+    _DoclingAttempt,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_formula_regions import (
+    reenrich_converter_formulas,
+    reenrich_formula_regions,
+)
+from scripts.sir_convert_a_lot.infrastructure.gpu_runtime_probe import GpuRuntimeProbeResult
+from scripts.sir_convert_a_lot.infrastructure.runtime_conversion import (
+    options_fingerprint_for_spec,
+)
+
+
+class _FakeEnricher:
+    images_scale = 1.67
+    expansion_factor = 0.18
+
+    def __init__(self, outputs: list[str]) -> None:
+        self._outputs = outputs
+        self.image_sizes: list[tuple[int, int]] = []
+
+    def __call__(
+        self, doc: DoclingDocument, element_batch: Iterable[ItemAndImageEnrichmentElement]
+    ) -> Iterable[NodeItem]:
+        del doc
+        for element, output in zip(element_batch, self._outputs, strict=True):
+            self.image_sizes.append(element.image.size)
+            assert isinstance(element.item, FormulaItem)
+            element.item.text = output
+            yield element.item
+
+
+def _pdf_bytes() -> bytes:
+    document = pymupdf.open()
+    page = document.new_page(width=612, height=792)
+    page.insert_text((100, 120), "a^2 + b^2 = c^2")
+    page.insert_text((100, 320), "e^{i pi} + 1 = 0")
+    return bytes(document.tobytes())
+
+
+def _formula_document(formulas: list[tuple[str, float]]) -> DoclingDocument:
+    document = DoclingDocument(name="paper")
+    document.add_page(page_no=1, size=Size(width=612, height=792))
+    for text, top in formulas:
+        document.add_text(
+            label=DocItemLabel.FORMULA,
+            text=text,
+            orig="raw formula",
+            prov=ProvenanceItem(
+                page_no=1,
+                bbox=BoundingBox(l=90, t=top, r=300, b=top + 30, coord_origin=CoordOrigin.TOPLEFT),
+                charspan=(0, len(text)),
+            ),
+        )
+    return document
+
+
+def _formula_texts(document: DoclingDocument) -> list[str]:
+    return [item.text for item, _ in document.iterate_items() if isinstance(item, FormulaItem)]
+
+
+def test_reenrich_replaces_only_failing_formulas_in_a_copy() -> None:
+    document = _formula_document([("", 100.0), ("x = 1", 300.0), ("", 500.0)])
+    enricher = _FakeEnricher(["a^2 + b^2 = c^2", ""])
+
+    reenriched = reenrich_formula_regions(document=document, source=_pdf_bytes(), enricher=enricher)
+
+    assert reenriched is not None
+    spliced, replaced = reenriched
+    assert replaced == 1
+    assert _formula_texts(spliced) == ["a^2 + b^2 = c^2", "x = 1", ""]
+    assert _formula_texts(document) == ["", "x = 1", ""]
+    assert len(enricher.image_sizes) == 2
+    assert all(width > 0 and height > 0 for width, height in enricher.image_sizes)
+    clean = _formula_document([("x = 1", 300.0)])
+    assert reenrich_formula_regions(document=clean, source=_pdf_bytes(), enricher=enricher) is None
+
+
+@pytest.fixture
+def _probe_gpu_available(monkeypatch: pytest.MonkeyPatch) -> None:
+    probe = GpuRuntimeProbeResult(
+        runtime_kind="cuda",
+        torch_version="2.10.0",
+        hip_version=None,
+        cuda_version="12.8",
+        is_available=True,
+        device_count=1,
+        device_name="test-gpu",
+    )
+    monkeypatch.setattr(
+        "scripts.sir_convert_a_lot.infrastructure.docling_backend.probe_torch_gpu_runtime",
+        lambda: probe,
+    )
+
+
+@pytest.mark.usefixtures("_probe_gpu_available")
+def test_backend_splices_region_reenrichment_instead_of_whole_document_rerun(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    backend = DoclingConversionBackend()
+    presets: list[str] = []
+
+    def _fake_convert_once(request: ConversionRequest, **kwargs: object) -> _DoclingAttempt:
+        del request
+        presets.append(str(kwargs["formula_preset"]))
+        return _DoclingAttempt(
+            markdown_content="before\n<!-- formula-not-decoded -->\nafter\n",
+            page_count=1,
+            low_confidence=False,
+            document=_formula_document([("", 100.0)]),
+        )
+
+    def _fake_reenrich(attempt: _DoclingAttempt, **kwargs: object) -> _DoclingAttempt:
+        del kwargs
+        return replace(attempt, markdown_content="before\n$$a^2 + b^2 = c^2$$\nafter\n")
+
+    monkeypatch.setattr(backend, "_convert_once", _fake_convert_once)
+    monkeypatch.setattr(backend, "_reenrich_formula_regions", _fake_reenrich)
+    result = backend.convert(
+        ConversionRequest(
+            source_filename="paper.pdf",
+            source=_pdf_bytes(),
+            backend_strategy=BackendStrategy.DOCLING,
+            ocr_mode=OcrMode.OFF,
+            table_mode=TableMode.ACCURATE,
+            gpu_available=True,
+            formula_enrichment=FormulaEnrichmentMode.ON,
+        )
+    )
+
+    assert presets == ["codeformulav2"]
+    assert result.markdown_content == "before\n$$a^2 + b^2 = c^2$$\nafter\n"
+    assert result.warnings == ["docling_formula_preset_switched_to_granite_docling"]
+    assert "formula_region_reenrich_ms" in result.phase_timings_ms
+
+
+class _UnverifiedConverter:
+    """Converter stand-in whose private pipeline accessor must not be called."""
+
+    def _get_pipeline(self, doc_format: object) -> object:
+        raise AssertionError(f"unexpected pipeline lookup for {doc_format}")
+
+
+def test_unreachable_pipeline_is_not_scopable(monkeypatch: pytest.MonkeyPatch) -> None:
+    document = _formula_document([("", 100.0)])
+
+    assert (
+        reenrich_converter_formulas(object(), document=document, source=_pdf_bytes())  # type: ignore[arg-type]
+        is None
+    )
+    monkeypatch.setattr(docling_formula_regions, "_docling_major_version", lambda: 3)
+    assert (
+        reenrich_converter_formulas(
+            _UnverifiedConverter(),  # type: ignore[arg-type]
+            document=document,
+            source=_pdf_bytes(),
+        )
+        is None
+    )
+
+
+@pytest.mark.usefixtures("_probe_gpu_available")
+def test_backend_reruns_whole_document_when_pipeline_is_unreachable(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    backend = DoclingConversionBackend()
+    presets: list[str] = []
+
+    def _fake_convert_once(request: ConversionRequest, **kwargs: object) -> _DoclingAttempt:
+        del request
+        presets.append(str(kwargs["formula_preset"]))
+        if len(presets) == 1:
+            markdown = "before\n<!-- formula-not-decoded -->\nafter\n"
+        else:
+            markdown = "before\n$$a^2 + b^2 = c^2$$\nafter\n"
+        return _DoclingAttempt(
+            markdown_content=markdown,
+            page_count=1,
+            low_confidence=False,
+            document=_formula_document([("", 100.0)]),
+        )
+
+    monkeypatch.setattr(backend, "_convert_once", _fake_convert_once)
+    monkeypatch.setattr(backend, "_get_converter", lambda key: object())
+    result = backend.convert(
+        ConversionRequest(
+            source_filename="paper.pdf",
+            source=_pdf_bytes(),
+            backend_strategy=BackendStrategy.DOCLING,
+            ocr_mode=OcrMode.OFF,
+            table_mode=TableMode.ACCURATE,
+            gpu_available=True,
+            formula_enrichment=FormulaEnrichmentMode.ON,
+        )
+    )
+
+    assert presets == ["codeformulav2", "granite_docling"]
+    assert result.markdown_content == "before\n$$a^2 + b^2 = c^2$$\nafter\n"
+    assert result.warnings == ["docling_formula_preset_switched_to_granite_docling"]
+
+
+@pytest.mark.usefixtures("_probe_gpu_available")
+def test_auto_formula_enrichment_decodes_only_detected_formula_regions(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    backend = DoclingConversionBackend()
+    passes: list[bool] = []
+    region_presets: list[str] = []
+
+    def _fake_convert_once(request: ConversionRequest, **kwargs: object) -> _DoclingAttempt:
+        del request
+        passes.append(bool(kwargs["formula_enrichment"]))
+        return _DoclingAttempt(
+            markdown_content="before\n<!-- formula-not-decoded -->\nafter\n",
+            page_count=1,
+            low_confidence=False,
+            document=_formula_document([("", 100.0)]),
+        )
+
+    def _fake_reenrich(attempt: _DoclingAttempt, **kwargs: object) -> _DoclingAttempt:
+        region_presets.append(str(kwargs["formula_preset"]))
+        return replace(attempt, markdown_content="before\n$$E = mc^2$$\nafter\n")
+
+    monkeypatch.setattr(backend, "_convert_once", _fake_convert_once)
+    monkeypatch.setattr(backend, "_reenrich_formula_regions", _fake_reenrich)
+    result = backend.convert(
+        ConversionRequest(
+            source_filename="paper.pdf",
+            source=_pdf_bytes(),
+            backend_strategy=BackendStrategy.DOCLING,
+            ocr_mode=OcrMode.OFF,
+            table_mode=TableMode.FAST,
+            gpu_available=True,
+        )
+    )
+
+    assert passes == [False]
+    assert region_presets == ["codeformulav2"]
+    assert result.markdown_content == "before\n$$E = mc^2$$\nafter\n"
+    assert result.warnings == ["docling_formula_enrichment_applied_formulas_detected"]
+    assert result.formula_enrichment_used is True
+
+
+def test_default_formula_enrichment_keeps_prior_options_fingerprint() -> None:
+    payload: dict[str, object] = {
+        "api_version": "v1",
+        "source": {"kind": "upload", "filename": "paper.pdf"},
+        "conversion": {
+            "output_format": "md",
+            "backend_strategy": "auto",
+            "ocr_mode": "auto",
+            "table_mode": "fast",
+            "normalize": "standard",
+        },
+        "execution": {"acceleration_policy": "gpu_required"},
+        "retention": {"pin": False},
+    }
+    prior = JobSpec.model_validate(payload).model_dump(mode="json")
+    del prior["conversion"]["formula_enrichment"]
+    prior_digest = hashlib.sha256(
+        json.dumps(prior, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    ).hexdigest()
+
+    auto_spec = JobSpec.model_validate(payload)
+    on_spec = auto_spec.model_copy(
+        update={
+            "conversion": auto_spec.conversion.model_copy(
+                update={"formula_enrichment": FormulaEnrichmentMode.ON}
+            )
+        }
+    )
+
+    assert options_fingerprint_for_spec(auto_spec) == f"sha256:{prior_digest}"
+    assert options_fingerprint_for_spec(on_spec) != options_fingerprint_for_spec(auto_spec)
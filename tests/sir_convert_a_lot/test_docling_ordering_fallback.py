@@ -12,8 +12,11 @@ Relationships:
 
 from __future__ import annotations
 
+import pymupdf
 import pytest
 from docling.datamodel.accelerator_options import AcceleratorDevice
+from docling_core.types.doc import BoundingBox, DocItemLabel, Size
+from docling_core.types.doc.document import DoclingDocument, ProvenanceItem
 
 from scripts.sir_convert_a_lot.domain.specs import BackendStrategy, OcrMode, TableMode
 from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
@@ -25,7 +28,17 @@ from scripts.sir_convert_a_lot.infrastructure.docling_backend import (
     _DoclingAttempt,
     _resolve_layout_model_candidate_keys,
 )
-from scripts.sir_convert_a_lot.infrastructure.docling_ordering import OrderingQualityReport
+from scripts.sir_convert_a_lot.infrastructure.docling_ordering import (
+    OrderingQualityReport,
+    attribute_ordering_failures,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_ordering import (
+    evaluate_docling_ordering_quality as backend_ordering_report,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_page_layout_fallback import (
+    select_page_layouts,
+)
+from scripts.sir_convert_a_lot.infrastructure.pdf_inspection import pdf_page_count
 from tests.sir_convert_a_lot.pdf_fixtures import fixture_pdf_bytes
 
 
@@ -37,7 +50,7 @@ def _request(
 ) -> ConversionRequest:
     return ConversionRequest(
         source_filename="paper_alpha.pdf",
-        source_bytes=fixture_pdf_bytes("paper_alpha.pdf"),
+        source=fixture_pdf_bytes("paper_alpha.pdf"),
         backend_strategy=BackendStrategy.DOCLING,
         ocr_mode=ocr_mode,
         table_mode=table_mode,
@@ -312,3 +325,121 @@ def test_ordering_quality_gate_disabled_skips_layout_fallback(
     assert calls == [("docling_layout_egret_large", False)]
     assert attempt.layout_model_key == "docling_layout_egret_large"
     assert attempt.ordering_retry_applied is False
+
+
+def _exam_page(first_question: int, *, misordered: bool = False) -> list[str]:
+    lines: list[str] = []
+    for number in (first_question, first_question + 1):
+        options = ["- [ ] yes", "- [ ] no"]
+        if misordered and number == first_question + 1:
+            lines.extend([*options, f"- {number}.", "Which option applies?"])
+        else:
+            lines.extend([f"{number}. Which option applies?", *options])
+    return lines
+
+
+def _exam_document(pages: list[list[str]]) -> DoclingDocument:
+    document = DoclingDocument(name="exam")
+    for page_no, lines in enumerate(pages, start=1):
+        document.add_page(page_no=page_no, size=Size(width=612, height=792))
+        for line in lines:
+            document.add_text(
+                label=DocItemLabel.TEXT,
+                text=line,
+                prov=ProvenanceItem(
+                    page_no=page_no,
+                    bbox=BoundingBox(l=0, t=0, r=10, b=10),
+                    charspan=(0, len(line)),
+                ),
+            )
+    return document
+
+
+def test_ordering_failures_are_attributed_to_pages() -> None:
+    pages = ["\n".join(_exam_page(1)), "\n".join(_exam_page(3, misordered=True))]
+    pages.append("\n".join(_exam_page(5)))
+
+    assert attribute_ordering_failures(pages) == [1, 2]
+    assert attribute_ordering_failures(["1. a\n- [ ] x", "3. c\n- [ ] y", "4. d"]) == [0, 1]
+    assert attribute_ordering_failures(["- [ ] x", "1. a"]) == [0]
+
+
+def test_page_layout_selection_prefers_earliest_fallback_that_fixes_page() -> None:
+    clean = "\n".join(_exam_page(3))
+    pages = ["\n".join(_exam_page(1)), "\n".join(_exam_page(3, misordered=True))]
+    pages.extend(["\n".join(_exam_page(5)), "\n".join(_exam_page(7))])
+
+    chosen = select_page_layouts(
+        page_markdowns=pages,
+        primary_layout_key="docling_layout_egret_large",
+        fallback_pages=[
+            ("docling_layout_heron", {1: pages[1]}),
+            ("docling_layout_egret_medium", {1: clean}),
+            ("docling_layout_v2", {1: clean}),
+        ],
+    )
+
+    assert chosen == {1: "docling_layout_egret_medium"}
+
+
+def test_ordering_quality_gate_reruns_only_failing_pages(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("SIR_CONVERT_A_LOT_DOCLING_LAYOUT_MODEL", "docling_layout_egret_large")
+    monkeypatch.setenv("SIR_CONVERT_A_LOT_DOCLING_LAYOUT_FALLBACK_MODELS", "docling_layout_heron")
+    monkeypatch.setenv("SIR_CONVERT_A_LOT_DOCLING_ORDERING_QUALITY_GATE", "1")
+    backend = DoclingConversionBackend()
+    pdf = pymupdf.open()
+    for _ in range(4):
+        pdf.new_page()
+    source = bytes(pdf.tobytes())
+    calls: list[tuple[str, int | None, bool]] = []
+
+    def _fake_convert_once_with_layout(
+        *, request: ConversionRequest, layout_model_key: str, evaluate_ordering_quality: bool, **_
+    ) -> _DoclingAttempt:
+        calls.append((layout_model_key, pdf_page_count(request.source), evaluate_ordering_quality))
+        if layout_model_key == "docling_layout_egret_large":
+            pages = [_exam_page(1), _exam_page(3, misordered=True), _exam_page(5), _exam_page(7)]
+        else:
+            pages = [_exam_page(3), _exam_page(5)]
+        document = _exam_document(pages)
+        markdown = document.export_to_markdown(escape_html=False, compact_tables=True)
+        return _DoclingAttempt(
+            markdown_content=markdown,
+            page_count=len(pages),
+            low_confidence=False,
+            layout_model_key=layout_model_key,
+            ordering_quality=backend_ordering_report(markdown)
+            if evaluate_ordering_quality
+            else None,
+            document=document,
+        )
+
+    monkeypatch.setattr(backend, "_convert_once_with_layout", _fake_convert_once_with_layout)
+    attempt = backend._convert_once(
+        ConversionRequest(
+            source_filename="exam.pdf",
+            source=source,
+            backend_strategy=BackendStrategy.DOCLING,
+            ocr_mode=OcrMode.OFF,
+            table_mode=TableMode.FAST,
+            gpu_available=True,
+        ),
+        ocr_enabled=False,
+        force_full_page_ocr=False,
+        acceleration_device=AcceleratorDevice.CUDA,
+        formula_enrichment=False,
+        formula_preset="codeformulav2",
+    )
+
+    assert calls == [
+        ("docling_layout_egret_large", 4, True),
+        ("docling_layout_heron", 2, False),
+    ]
+    assert attempt.ordering_retry_applied is True
+    assert attempt.ordering_quality is not None and attempt.ordering_quality.passes
+    assert "- 4." not in attempt.markdown_content
+    assert [line for line in attempt.markdown_content.splitlines() if line[:1].isdigit()] == [
+        f"{number}. Which option applies?" for number in range(1, 9)
+    ]
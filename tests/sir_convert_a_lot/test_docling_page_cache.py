@@ -0,0 +1,163 @@
+"""Per-job Docling page cache tests.
+
+Purpose:
+    Verify that page parses and renders are shared across Docling passes of
+    one job, handed out as independent copies, bounded by the image budget,
+    and only active while a job holds the cache, and that page loads report
+    per-page progress and stop a canceled pass.
+
+Relationships:
+    - Exercises `infrastructure.docling_page_cache`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+
+import pymupdf
+import pytest
+from docling.datamodel.base_models import InputFormat
+from docling.datamodel.document import InputDocument
+from docling_core.types.io import DocumentStream
+from PIL import Image
+
+from scripts.sir_convert_a_lot.domain.specs import BackendStrategy, OcrMode, TableMode
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
+    CancelToken,
+    ConversionCanceledError,
+    ConversionProgress,
+    ConversionRequest,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_page_cache import (
+    CachedDoclingParseBackend,
+    DoclingPageCache,
+    active_page_cache,
+    docling_pass_source,
+    job_page_cache,
+)
+
+
+def _single_page_pdf(text: str) -> bytes:
+    return _pdf([text])
+
+
+def _pdf(texts: list[str]) -> bytes:
+    document = pymupdf.open()
+    for text in texts:
+        page = document.new_page()
+        page.insert_text((72, 72), text)
+    return bytes(document.tobytes())
+
+
+def test_page_cache_builds_once_and_hands_out_copies() -> None:
+    cache = DoclingPageCache(budget_bytes=10 * 1024 * 1024)
+    builds: list[int] = []
+
+    def _render() -> Image.Image:
+        builds.append(1)
+        return Image.new("RGB", (20, 10), "white")
+
+    first = cache.page_image(("image", 0), _render)
+    first.putpixel((0, 0), (0, 0, 0))
+    second = cache.page_image(("image", 0), _render)
+
+    assert len(builds) == 1
+    assert second.getpixel((0, 0)) == (255, 255, 255)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert set(cache.phase_timings_ms()) == {
+        "docling_page_prepare_ms",
+        "docling_page_cache_saved_ms",
+    }
+
+
+def test_page_cache_stops_storing_images_over_budget() -> None:
+    cache = DoclingPageCache(budget_bytes=100)
+    builds: list[int] = []
+
+    def _render() -> Image.Image:
+        builds.append(1)
+        return Image.new("RGB", (20, 10), "white")
+
+    cache.page_image(("image", 0), _render)
+    cache.page_image(("image", 0), _render)
+
+    assert len(builds) == 2
+    assert cache.hits == 0
+    assert DoclingPageCache(budget_bytes=0).phase_timings_ms() == {}
+
+
+def test_cached_backend_shares_pages_only_while_job_cache_is_active() -> None:
+    source = _single_page_pdf("Shared across passes")
+    document_hash = hashlib.sha256(source).hexdigest()
+    input_document = InputDocument(
+        path_or_stream=io.BytesIO(source),
+        format=InputFormat.PDF,
+        backend=CachedDoclingParseBackend,
+        filename="paper.pdf",
+    )
+    backend = input_document._backend
+    assert isinstance(backend, CachedDoclingParseBackend)
+
+    try:
+        with job_page_cache(source, budget_bytes=64 * 1024 * 1024) as cache:
+            with job_page_cache(source) as nested:
+                assert nested is cache
+            assert active_page_cache(document_hash) is cache
+            for _ in range(2):
+                page = backend.load_page(0)
+                segmented = page.get_segmented_page()
+                assert segmented is not None
+                texts = [cell.text for cell in segmented.textline_cells]
+                assert texts == ["Shared across passes"]
+                assert page.get_page_image(scale=1).size == (595, 842)
+                page.unload()
+            assert (cache.hits, cache.misses) == (2, 2)
+
+        assert active_page_cache(document_hash) is None
+        page = backend.load_page(0)
+        assert type(page).__name__ == "DoclingParseV4PageBackend"
+        page.unload()
+    finally:
+        backend.unload()
+
+
+def test_pass_source_reports_page_loads_and_stops_when_canceled() -> None:
+    reports: list[ConversionProgress] = []
+    cancel = CancelToken()
+    request = ConversionRequest(
+        source_filename="paper.pdf",
+        source=_pdf(["One", "Two", "Three"]),
+        backend_strategy=BackendStrategy.DOCLING,
+        ocr_mode=OcrMode.OFF,
+        table_mode=TableMode.FAST,
+        gpu_available=False,
+        progress=reports.append,
+        cancel=cancel,
+    )
+
+    with pytest.raises(ConversionCanceledError):
+        with docling_pass_source(request, stage="docling_convert") as document_source:
+            assert isinstance(document_source, DocumentStream)
+            input_document = InputDocument(
+                path_or_stream=document_source.stream,
+                format=InputFormat.PDF,
+                backend=CachedDoclingParseBackend,
+                filename=document_source.name,
+            )
+            backend = input_document._backend
+            assert isinstance(backend, CachedDoclingParseBackend)
+            try:
+                for page_no in (0, 1, 1):
+                    backend.load_page(page_no).unload()
+                cancel.cancel()
+                backend.load_page(2)
+            finally:
+                backend.unload()
+
+    assert [(report.pages_completed, report.pages_total) for report in reports] == [
+        (0, 3),
+        (1, 3),
+        (1, 3),
+    ]
+    assert {report.stage for report in reports} == {"docling_convert"}
@@ -0,0 +1,236 @@
+"""Per-page AUTO OCR tests for the Docling backend.
+
+Purpose:
+    Verify that only pages without a usable text layer are OCR'd in AUTO
+    mode, that their markdown is spliced into the first-pass document in page
+    order (also after per-page layout fallback rebuilt the first pass), and
+    that the OCR'd pages are listed in warnings.
+
+Relationships:
+    - Exercises `infrastructure.docling_page_ocr`, `infrastructure.pdf_inspection`
+      and the AUTO branch of `infrastructure.docling_backend`.
+"""
+
+from __future__ import annotations
+
+import pymupdf
+import pytest
+from docling_core.types.doc import BoundingBox, DocItemLabel, Size
+from docling_core.types.doc.document import DoclingDocument, ProvenanceItem
+
+from scripts.sir_convert_a_lot.domain.specs import BackendStrategy, OcrMode, TableMode
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import ConversionRequest
+from scripts.sir_convert_a_lot.infrastructure.docling_backend import (
+    DoclingConversionBackend,
+    _DoclingAttempt,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_ordering import (
+    evaluate_docling_ordering_quality as backend_ordering_report,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_page_ocr import merge_ocr_pages
+from scripts.sir_convert_a_lot.infrastructure.gpu_runtime_probe import GpuRuntimeProbeResult
+from scripts.sir_convert_a_lot.infrastructure.pdf_inspection import (
+    pages_lacking_text_layer,
+    pdf_page_count,
+)
+
+_BODY = "Born-digital body text with a proper text layer. " * 6
+
+
+def _pdf_with_scanned_page(*, scanned_index: int, page_count: int) -> bytes:
+    document = pymupdf.open()
+    scan = pymupdf.Pixmap(pymupdf.csRGB, pymupdf.IRect(0, 0, 60, 80), False)
+    scan.set_rect(scan.irect, (240, 240, 240))
+    for page_number in range(page_count):
+        page = document.new_page()
+        if page_number == scanned_index:
+            page.insert_image(page.rect, pixmap=scan)
+        else:
+            page.insert_textbox(pymupdf.Rect(72, 72, 540, 720), _BODY, fontsize=10)
+    document.new_page()
+    return bytes(document.tobytes())
+
+
+def _docling_document(pages: dict[int, list[str]]) -> DoclingDocument:
+    document = DoclingDocument(name="paper")
+    for page_no, texts in pages.items():
+        document.add_page(page_no=page_no, size=Size(width=612, height=792))
+        for text in texts:
+            document.add_text(
+                label=DocItemLabel.TEXT,
+                text=text,
+                prov=ProvenanceItem(
+                    page_no=page_no,
+                    bbox=BoundingBox(l=0, t=0, r=10, b=10),
+                    charspan=(0, len(text)),
+                ),
+            )
+    return document
+
+
+@pytest.fixture(autouse=True)
+def _probe_gpu_available(monkeypatch: pytest.MonkeyPatch) -> None:
+    probe = GpuRuntimeProbeResult(
+        runtime_kind="cuda",
+        torch_version="2.10.0",
+        hip_version=None,
+        cuda_version="12.8",
+        is_available=True,
+        device_count=1,
+        device_name="test-gpu",
+    )
+    monkeypatch.setattr(
+        "scripts.sir_convert_a_lot.infrastructure.docling_backend.probe_torch_gpu_runtime",
+        lambda: probe,
+    )
+
+
+def test_text_layer_analysis_flags_only_scanned_pages() -> None:
+    source = _pdf_with_scanned_page(scanned_index=1, page_count=3)
+
+    assert pdf_page_count(source) == 4
+    assert pages_lacking_text_layer(source, min_chars=120) == [1]
+    assert pages_lacking_text_layer(b"not a pdf", min_chars=120) is None
+
+
+def test_merge_ocr_pages_splices_pages_in_order() -> None:
+    text_document = _docling_document(
+        {1: ["Intro paragraph that continues on the"], 2: [], 3: ["Closing remarks."]}
+    )
+    ocr_document = _docling_document({1: ["scanned appendix page."]})
+
+    merged = merge_ocr_pages(
+        text_document=text_document,
+        ocr_document=ocr_document,
+        ocr_page_indexes=[1],
+        page_count=3,
+    )
+
+    assert merged == (
+        "Intro paragraph that continues on the scanned appendix page.\n\nClosing remarks.\n"
+    )
+
+
+def test_auto_mode_ocrs_only_pages_without_text_layer(monkeypatch) -> None:
+    backend = DoclingConversionBackend()
+    source = _pdf_with_scanned_page(scanned_index=2, page_count=3)
+    calls: list[tuple[bool, int | None]] = []
+
+    def _fake_convert_once(
+        request: ConversionRequest,
+        *,
+        ocr_enabled: bool,
+        force_full_page_ocr: bool,
+        acceleration_device,
+        formula_enrichment: bool,
+        formula_preset: str,
+    ) -> _DoclingAttempt:
+        del force_full_page_ocr, acceleration_device, formula_enrichment, formula_preset
+        calls.append((ocr_enabled, pdf_page_count(request.source)))
+        if not ocr_enabled:
+            document = _docling_document(
+                {1: ["First page."], 2: ["Second page."], 3: [], 4: ["Back matter."]}
+            )
+            markdown = "First page.\n\nSecond page.\n\nBack matter."
+            page_count = 4
+        else:
+            document = _docling_document({1: ["Recovered scan text."]})
+            markdown = "Recovered scan text."
+            page_count = 1
+        return _DoclingAttempt(
+            markdown_content=markdown,
+            page_count=page_count,
+            low_confidence=False,
+            document=document,
+        )
+
+    monkeypatch.setattr(backend, "_convert_once", _fake_convert_once)
+    result = backend.convert(
+        ConversionRequest(
+            source_filename="paper.pdf",
+            source=source,
+            backend_strategy=BackendStrategy.DOCLING,
+            ocr_mode=OcrMode.AUTO,
+            table_mode=TableMode.FAST,
+            gpu_available=True,
+        )
+    )
+
+    assert calls == [(False, 4), (True, 1)]
+    assert result.ocr_enabled is True
+    assert result.markdown_content == (
+        "First page.\n\nSecond page.\n\nRecovered scan text.\n\nBack matter.\n"
+    )
+    assert "docling_auto_ocr_pages_applied:3" in result.warnings
+    assert "docling_auto_ocr_retry_applied" not in result.warnings
+
+
+def _exam_page(first_question: int, *, misordered: bool = False) -> list[str]:
+    lines: list[str] = []
+    for number in (first_question, first_question + 1):
+        options = ["- [ ] yes", "- [ ] no"]
+        if misordered and number == first_question + 1:
+            lines.extend([*options, f"- {number}.", "Which option applies?"])
+        else:
+            lines.extend([f"{number}. Which option applies?", *options])
+    return lines
+
+
+def test_auto_mode_merges_ocr_pages_after_page_layout_fallback(monkeypatch) -> None:
+    monkeypatch.setenv("SIR_CONVERT_A_LOT_DOCLING_LAYOUT_MODEL", "docling_layout_egret_large")
+    monkeypatch.setenv("SIR_CONVERT_A_LOT_DOCLING_LAYOUT_FALLBACK_MODELS", "docling_layout_heron")
+    monkeypatch.setenv("SIR_CONVERT_A_LOT_DOCLING_ORDERING_QUALITY_GATE", "1")
+    backend = DoclingConversionBackend()
+    source = _pdf_with_scanned_page(scanned_index=4, page_count=5)
+    calls: list[tuple[str, bool, int | None]] = []
+
+    def _fake_convert_once_with_layout(
+        *,
+        request: ConversionRequest,
+        ocr_enabled: bool,
+        layout_model_key: str,
+        evaluate_ordering_quality: bool,
+        **_,
+    ) -> _DoclingAttempt:
+        calls.append((layout_model_key, ocr_enabled, pdf_page_count(request.source)))
+        if ocr_enabled:
+            pages = [["Recovered scan text."]]
+        elif layout_model_key == "docling_layout_egret_large":
+            pages = [_exam_page(1), _exam_page(3, misordered=True), _exam_page(5), _exam_page(7)]
+            pages.extend([[], []])
+        else:
+            pages = [_exam_page(3), _exam_page(5)]
+        document = _docling_document(dict(enumerate(pages, start=1)))
+        markdown = document.export_to_markdown(escape_html=False, compact_tables=True)
+        return _DoclingAttempt(
+            markdown_content=markdown,
+            page_count=len(pages),
+            low_confidence=False,
+            layout_model_key=layout_model_key,
+            ordering_quality=backend_ordering_report(markdown)
+            if evaluate_ordering_quality
+            else None,
+            document=document,
+        )
+
+    monkeypatch.setattr(backend, "_convert_once_with_layout", _fake_convert_once_with_layout)
+    result = backend.convert(
+        ConversionRequest(
+            source_filename="exam.pdf",
+            source=source,
+            backend_strategy=BackendStrategy.DOCLING,
+            ocr_mode=OcrMode.AUTO,
+            table_mode=TableMode.FAST,
+            gpu_available=True,
+        )
+    )
+
+    assert calls == [
+        ("docling_layout_egret_large", False, 6),
+        ("docling_layout_heron", False, 2),
+        ("docling_layout_egret_large", True, 1),
+    ]
+    assert "docling_auto_ocr_pages_applied:5" in result.warnings
+    assert "docling_auto_ocr_retry_applied" not in result.warnings
+    assert "- 4." not in result.markdown_content
+    assert result.markdown_content.rstrip().endswith("Recovered scan text.")
@@ -0,0 +1,217 @@
+"""Adaptive TableFormer escalation tests.
+
+Purpose:
+    Verify that adaptive table mode keeps simple tables from the FAST pass,
+    escalates tables with merged cells, large grids or poorly recovered
+    structure, reconverts only their pages with ACCURATE TableFormer, and
+    reports per-table decisions and escalation time.
+
+Relationships:
+    - Exercises `infrastructure.docling_table_escalation` and its hook in
+      `infrastructure.docling_backend`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pymupdf
+import pytest
+from docling_core.types.doc import BoundingBox, CoordOrigin, Size, TableCell, TableData
+from docling_core.types.doc.document import DoclingDocument, ProvenanceItem
+
+from scripts.sir_convert_a_lot.domain.specs import (
+    BackendStrategy,
+    FormulaEnrichmentMode,
+    OcrMode,
+    TableMode,
+)
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import ConversionRequest
+from scripts.sir_convert_a_lot.infrastructure.docling_backend import (
+    DoclingConversionBackend,
+    _DoclingAttempt,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_table_escalation import (
+    REASON_CELL_COUNT,
+    REASON_LOW_STRUCTURE_CONFIDENCE,
+    REASON_MERGED_CELLS,
+    decide_tables,
+    escalate_adaptive_tables,
+)
+from scripts.sir_convert_a_lot.infrastructure.gpu_runtime_probe import GpuRuntimeProbeResult
+from scripts.sir_convert_a_lot.infrastructure.pdf_inspection import pdf_page_count
+
+
+@dataclass(frozen=True)
+class _Attempt:
+    document: object | None
+
+
+def _pdf_bytes(page_count: int) -> bytes:
+    with pymupdf.open() as document:
+        for page_number in range(page_count):
+            document.new_page(width=612, height=792).insert_text(
+                (72, 72), f"Page {page_number + 1}"
+            )
+        return bytes(document.tobytes())
+
+
+def _table_data(rows: list[list[str]], *, merged_header: bool = False) -> TableData:
+    cells: list[TableCell] = []
+    for row_index, row in enumerate(rows):
+        for col_index, text in enumerate(row):
+            if merged_header and row_index == 0 and col_index > 0:
+                continue
+            col_span = len(row) if merged_header and row_index == 0 else 1
+            cells.append(
+                TableCell(
+                    text=text,
+                    row_span=1,
+                    col_span=col_span,
+                    start_row_offset_idx=row_index,
+                    end_row_offset_idx=row_index + 1,
+                    start_col_offset_idx=col_index,
+                    end_col_offset_idx=col_index + col_span,
+                )
+            )
+    return TableData(table_cells=cells, num_rows=len(rows), num_cols=len(rows[0]))
+
+
+def _document(tables: list[tuple[int, TableData]], *, page_count: int) -> DoclingDocument:
+    document = DoclingDocument(name="report")
+    for page_no in range(1, page_count + 1):
+        document.add_page(page_no=page_no, size=Size(width=612, height=792))
+    for page_no, data in tables:
+        document.add_table(
+            data=data,
+            prov=ProvenanceItem(
+                page_no=page_no,
+                bbox=BoundingBox(l=72, t=100, r=540, b=300, coord_origin=CoordOrigin.TOPLEFT),
+                charspan=(0, 0),
+            ),
+        )
+    return document
+
+
+_SIMPLE = [["a", "b"], ["1", "2"]]
+_MERGED = [["Totals", ""], ["1", "2"]]
+
+
+def test_decide_tables_flags_merged_large_and_sparse_tables() -> None:
+    large = [[str(col) for col in range(6)] for _ in range(10)]
+    sparse = [["a", "", ""], ["", "", "b"]]
+    document = _document(
+        [
+            (1, _table_data(_SIMPLE)),
+            (1, _table_data(_MERGED, merged_header=True)),
+            (2, _table_data(large)),
+            (2, _table_data(sparse)),
+        ],
+        page_count=2,
+    )
+
+    decisions = decide_tables(document)
+
+    assert [(decision.page_no, decision.reason) for decision in decisions] == [
+        (1, None),
+        (1, REASON_MERGED_CELLS),
+        (2, REASON_CELL_COUNT),
+        (2, REASON_LOW_STRUCTURE_CONFIDENCE),
+    ]
+
+
+def test_escalation_reconverts_only_pages_with_escalated_tables() -> None:
+    document = _document(
+        [(1, _table_data(_SIMPLE)), (3, _table_data(_MERGED, merged_header=True))],
+        page_count=3,
+    )
+    accurate_data = _table_data([["Total", "Sum"], ["1", "2"]])
+    converted_page_counts: list[int | None] = []
+
+    def _convert_pages(pages_pdf: bytes) -> _Attempt:
+        converted_page_counts.append(pdf_page_count(pages_pdf))
+        return _Attempt(document=_document([(1, accurate_data)], page_count=1))
+
+    attempt, decisions, escalation_ms = escalate_adaptive_tables(
+        _Attempt(document=document),
+        source=_pdf_bytes(3),
+        convert_pages=_convert_pages,
+        with_document=lambda _attempt, spliced: _Attempt(document=spliced),
+    )
+
+    assert converted_page_counts == [1]
+    assert [(decision.page_no, decision.escalated) for decision in decisions] == [
+        (1, False),
+        (3, True),
+    ]
+    assert escalation_ms is not None
+    assert isinstance(attempt.document, DoclingDocument)
+    assert attempt.document.tables[1].data == accurate_data
+    assert attempt.document.tables[0].data == document.tables[0].data
+    assert document.tables[1].data.table_cells[0].col_span == 2
+
+
+@pytest.fixture
+def _probe_gpu_available(monkeypatch: pytest.MonkeyPatch) -> None:
+    probe = GpuRuntimeProbeResult(
+        runtime_kind="cuda",
+        torch_version="2.10.0",
+        hip_version=None,
+        cuda_version="12.8",
+        is_available=True,
+        device_count=1,
+        device_name="test-gpu",
+    )
+    monkeypatch.setattr(
+        "scripts.sir_convert_a_lot.infrastructure.docling_backend.probe_torch_gpu_runtime",
+        lambda: probe,
+    )
+
+
+@pytest.mark.usefixtures("_probe_gpu_available")
+def test_backend_adaptive_mode_reports_table_decisions_and_timing(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("SIR_CONVERT_A_LOT_DOCLING_ORDERING_QUALITY_GATE", "0")
+    backend = DoclingConversionBackend()
+    table_modes: list[TableMode] = []
+
+    def _fake_convert_once_with_layout(**kwargs: object) -> _DoclingAttempt:
+        request = kwargs["request"]
+        assert isinstance(request, ConversionRequest)
+        table_modes.append(request.table_mode)
+        if request.table_mode == TableMode.ACCURATE:
+            document = _document([(1, _table_data([["x", "y"], ["1", "2"]]))], page_count=1)
+        else:
+            document = _document(
+                [(1, _table_data(_SIMPLE)), (2, _table_data(_MERGED, merged_header=True))],
+                page_count=2,
+            )
+        return _DoclingAttempt(
+            markdown_content="fast tables\n",
+            page_count=2,
+            low_confidence=False,
+            layout_model_key=str(kwargs["layout_model_key"]),
+            document=document,
+        )
+
+    monkeypatch.setattr(backend, "_convert_once_with_layout", _fake_convert_once_with_layout)
+    result = backend.convert(
+        ConversionRequest(
+            source_filename="report.pdf",
+            source=_pdf_bytes(2),
+            backend_strategy=BackendStrategy.DOCLING,
+            ocr_mode=OcrMode.OFF,
+            table_mode=TableMode.ADAPTIVE,
+            gpu_available=True,
+            formula_enrichment=FormulaEnrichmentMode.OFF,
+        )
+    )
+
+    assert table_modes == [TableMode.ADAPTIVE, TableMode.ACCURATE]
+    assert result.markdown_content.endswith("| x | y |\n| - | - |\n| 1 | 2 |")
+    assert [warning for warning in result.warnings if "table" in warning] == [
+        "docling_table_escalated_to_accurate:page=2,table=1,reason=merged_cells,cells=4",
+        "docling_table_adaptive_kept_fast:1",
+    ]
+    assert "table_escalation_ms" in result.phase_timings_ms
@@ -0,0 +1,237 @@
+"""Hedged PyMuPDF/Docling conversion tests.
+
+Purpose:
+    Verify that HIGH priority auto jobs race PyMuPDF against Docling, finish
+    with an in-process PyMuPDF result while canceling Docling through its
+    cancel token, fall back to Docling when the cheap result fails the
+    quality or ordering checks, record the winner in warnings and stats, join
+    the Docling thread before returning, and stop waiting on Docling at the
+    job's document timeout.
+
+Relationships:
+    - Exercises `infrastructure.hedged_conversion` and its hook in
+      `infrastructure.runtime_conversion`.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from scripts.sir_convert_a_lot.domain.specs import (
+    AccelerationPolicy,
+    BackendStrategy,
+    ConversionSpec,
+    ExecutionSpec,
+    JobSpec,
+    NormalizeMode,
+    OcrMode,
+    Priority,
+    SourceKind,
+    SourceSpec,
+    TableMode,
+)
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
+    ConversionCanceledError,
+    ConversionProgress,
+    ConversionRequest,
+    ConversionResultData,
+)
+from scripts.sir_convert_a_lot.infrastructure.hedged_conversion import (
+    REASON_EXTREME_LINES,
+    REASON_ORDERING,
+    REASON_RESERVED_TOKENS,
+    REASON_SPARSE_OUTPUT,
+    HedgedConversionStats,
+    convert_hedged,
+    pymupdf_rejection_reason,
+)
+from scripts.sir_convert_a_lot.infrastructure.runtime_conversion import execute_job_conversion
+from tests.sir_convert_a_lot.pdf_fixtures import fixture_pdf_bytes
+
+_PROSE = "A plain paragraph of born-digital running text for the hedge.\n" * 20
+
+
+class _PyMuPdfBackend:
+    def __init__(self, markdown_content: str) -> None:
+        self.markdown_content = markdown_content
+        self.requests: list[ConversionRequest] = []
+
+    def convert(self, request: ConversionRequest) -> ConversionResultData:
+        self.requests.append(request)
+        return ConversionResultData(
+            markdown_content=self.markdown_content,
+            backend_used="pymupdf",
+            acceleration_used="cpu",
+            ocr_enabled=False,
+        )
+
+
+class _GatedDoclingBackend:
+    """Docling stand-in that reports progress, waits for `release`, then reports again."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.finished = threading.Event()
+        self.errors: list[BaseException] = []
+
+    def convert(self, request: ConversionRequest) -> ConversionResultData:
+        try:
+            request.report_progress(stage="docling_parse", pages_completed=0, pages_total=1)
+            deadline = time.monotonic() + 5.0
+            while not self.release.wait(timeout=0.01) and time.monotonic() < deadline:
+                if request.cancel is not None and request.cancel.canceled:
+                    break
+            request.report_progress(stage="docling_convert", pages_completed=0, pages_total=1)
+            return ConversionResultData(
+                markdown_content="# Docling result\n",
+                backend_used="docling",
+                acceleration_used="cuda",
+                ocr_enabled=False,
+            )
+        except BaseException as exc:
+            self.errors.append(exc)
+            raise
+        finally:
+            self.finished.set()
+
+
+def _spec(priority: Priority) -> JobSpec:
+    return JobSpec(
+        api_version="v1",
+        source=SourceSpec(kind=SourceKind.UPLOAD, filename="paper.pdf"),
+        conversion=ConversionSpec(
+            output_format="md",
+            backend_strategy=BackendStrategy.AUTO,
+            ocr_mode=OcrMode.AUTO,
+            table_mode=TableMode.FAST,
+            normalize=NormalizeMode.NONE,
+        ),
+        execution=ExecutionSpec(
+            acceleration_policy=AccelerationPolicy.CPU_ONLY,
+            priority=priority,
+        ),
+    )
+
+
+def test_high_priority_job_accepts_pymupdf_and_cancels_docling() -> None:
+    docling_backend = _GatedDoclingBackend()
+    pooled_pymupdf_backend = _PyMuPdfBackend(_PROSE)
+    pymupdf_backend = _PyMuPdfBackend(_PROSE)
+    progress: list[ConversionProgress] = []
+
+    markdown_content, metadata, warnings, timings = execute_job_conversion(
+        spec=_spec(Priority.HIGH),
+        source_filename="paper.pdf",
+        source=fixture_pdf_bytes("paper_alpha.pdf"),
+        gpu_available=True,
+        gpu_runtime_probe=None,
+        docling_backend=docling_backend,
+        pymupdf_backend=pooled_pymupdf_backend,
+        progress=progress.append,
+        hedged_high_priority=True,
+        hedge_pymupdf_backend=pymupdf_backend,
+    )
+    assert docling_backend.finished.is_set()
+
+    assert markdown_content == _PROSE
+    assert metadata.backend_used == "pymupdf"
+    assert "hedged_conversion_winner:pymupdf,reason=accepted" in warnings
+    assert "hedge_pymupdf_ms" in timings
+    assert pymupdf_backend.requests[0].backend_strategy == BackendStrategy.PYMUPDF
+    assert pymupdf_backend.requests[0].ocr_mode == OcrMode.OFF
+    assert pooled_pymupdf_backend.requests == []
+    assert [type(error) for error in docling_backend.errors] == [ConversionCanceledError]
+    assert [report.stage for report in progress] == ["docling_parse"]
+
+
+def test_normal_priority_job_is_not_hedged() -> None:
+    docling_backend = _GatedDoclingBackend()
+    docling_backend.release.set()
+    pymupdf_backend = _PyMuPdfBackend(_PROSE)
+
+    _, metadata, warnings, _ = execute_job_conversion(
+        spec=_spec(Priority.NORMAL),
+        source_filename="paper.pdf",
+        source=fixture_pdf_bytes("paper_alpha.pdf"),
+        gpu_available=True,
+        gpu_runtime_probe=None,
+        docling_backend=docling_backend,
+        pymupdf_backend=pymupdf_backend,
+        hedged_high_priority=True,
+    )
+
+    assert metadata.backend_used == "docling"
+    assert pymupdf_backend.requests == []
+    assert not any(warning.startswith("hedged_conversion_winner:") for warning in warnings)
+
+
+def test_rejected_pymupdf_result_waits_for_docling() -> None:
+    docling_backend = _GatedDoclingBackend()
+    docling_backend.release.set()
+    stats = HedgedConversionStats()
+
+    result = convert_hedged(
+        ConversionRequest(
+            source_filename="paper.pdf",
+            source=fixture_pdf_bytes("paper_alpha.pdf"),
+            backend_strategy=BackendStrategy.AUTO,
+            ocr_mode=OcrMode.AUTO,
+            table_mode=TableMode.FAST,
+            gpu_available=True,
+        ),
+        docling_backend=docling_backend,
+        pymupdf_backend=_PyMuPdfBackend("too short\n"),
+        stats=stats,
+    )
+
+    assert result.backend_used == "docling"
+    assert result.warnings == ["hedged_conversion_winner:docling,reason=sparse_output"]
+    assert stats.snapshot() == {("docling", REASON_SPARSE_OUTPUT): 1}
+
+
+def test_docling_winner_is_not_awaited_past_the_document_timeout() -> None:
+    docling_backend = _GatedDoclingBackend()
+    started = time.perf_counter()
+
+    with pytest.raises(ConversionCanceledError):
+        convert_hedged(
+            ConversionRequest(
+                source_filename="paper.pdf",
+                source=fixture_pdf_bytes("paper_alpha.pdf"),
+                backend_strategy=BackendStrategy.AUTO,
+                ocr_mode=OcrMode.AUTO,
+                table_mode=TableMode.FAST,
+                gpu_available=True,
+            ),
+            docling_backend=docling_backend,
+            pymupdf_backend=_PyMuPdfBackend("too short\n"),
+            stats=HedgedConversionStats(),
+            timeout_seconds=0.2,
+        )
+
+    assert time.perf_counter() - started < 2.0
+    assert docling_backend.finished.wait(timeout=5.0)
+    assert [type(error) for error in docling_backend.errors] == [ConversionCanceledError]
+
+
+@pytest.mark.parametrize(
+    ("markdown_content", "expected"),
+    [
+        (_PROSE, None),
+        (_PROSE + "\n<loc_12>\n", REASON_RESERVED_TOKENS),
+        (_PROSE + "\n" + "x" * 1200 + "\n", REASON_EXTREME_LINES),
+        (
+            _PROSE
+            + "- [ ] stray option\n"
+            + "\n".join(
+                f"{number}. Question {number}\n- [ ] yes\n- [ ] no" for number in range(1, 5)
+            ),
+            REASON_ORDERING,
+        ),
+    ],
+)
+def test_pymupdf_rejection_reason(markdown_content: str, expected: str | None) -> None:
+    assert pymupdf_rejection_reason(markdown_content, page_count=1) == expected
@@ -285,3 +285,21 @@ def test_mark_succeeded_persists_phase_timings(tmp_path: Path) -> None:
     assert persisted.phase_timings_ms["backend_convert_ms"] == 123
     assert persisted.phase_timings_ms["normalize_ms"] == 2
     assert persisted.phase_timings_ms["persist_ms"] >= 0
+
+
+def test_queued_jobs_are_loaded_into_dispatch_queue_on_restart(tmp_path: Path) -> None:
+    data_root = tmp_path / "service_data"
+    config = _runtime_config(data_root)
+
+    runtime = ServiceRuntime(config)
+    queued = runtime.create_job(_spec("a.pdf"), _pdf_bytes("a"), "a.pdf")
+    running = runtime.create_job(_spec("b.pdf"), _pdf_bytes("b"), "b.pdf")
+    done = runtime.create_job(_spec("c.pdf"), _pdf_bytes("c"), "c.pdf")
+    runtime._set_job_status(running.job_id, status=JobStatus.RUNNING, stage="starting")
+    assert runtime.job_store.claim_queued_job(done.job_id) is True
+    runtime._set_job_status(done.job_id, status=JobStatus.SUCCEEDED, stage="completed")
+
+    restarted = ServiceRuntime(config)
+    assert queued.job_id in restarted._dispatch_queue
+    assert running.job_id in restarted._dispatch_queue
+    assert done.job_id not in restarted._dispatch_queue
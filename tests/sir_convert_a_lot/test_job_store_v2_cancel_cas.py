@@ -19,6 +19,7 @@ from scripts.sir_convert_a_lot.domain.specs import JobStatus
 from scripts.sir_convert_a_lot.domain.specs_v2 import JobSpecV2
 from scripts.sir_convert_a_lot.infrastructure.job_store_models_v2 import JobStateConflictV2
 from scripts.sir_convert_a_lot.infrastructure.job_store_v2 import JobStoreV2
+from scripts.sir_convert_a_lot.infrastructure.upload_staging import stage_upload_bytes
 
 
 def _md_to_pdf_spec(*, filename: str) -> JobSpecV2:
@@ -47,7 +48,7 @@ def test_mark_canceled_rejects_terminal_status_and_preserves_success(tmp_path: P
     store.create_job(
         job_id=job_id,
         spec=_md_to_pdf_spec(filename="note.md"),
-        upload_bytes=b"# Title\n\nHello.\n",
+        upload=stage_upload_bytes(b"# Title\n\nHello.\n", store.staging_dir),
         resources_zip_bytes=None,
         reference_docx_bytes=None,
     )
@@ -0,0 +1,149 @@
+"""OCR language selection tests.
+
+Purpose:
+    Verify that Swedish and English are detected from the text layer, that
+    undecidable PDFs fall back to every candidate language, and that the
+    chosen languages key and configure the OCR converter and are reported.
+
+Relationships:
+    - Exercises `infrastructure.ocr_language_selection`, the language field of
+      `infrastructure.docling_converter_options.DoclingConverterKey`, and the
+      backend hook in `infrastructure.docling_backend`.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pymupdf
+import pytest
+from docling.datamodel.accelerator_options import AcceleratorDevice
+from docling.datamodel.base_models import InputFormat
+from docling.datamodel.pipeline_options import EasyOcrOptions, PdfPipelineOptions
+from docling_core.types.doc.document import DoclingDocument
+
+from scripts.sir_convert_a_lot.domain.specs import (
+    BackendStrategy,
+    FormulaEnrichmentMode,
+    OcrMode,
+    TableMode,
+)
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import ConversionRequest
+from scripts.sir_convert_a_lot.infrastructure.docling_backend import DoclingConversionBackend
+from scripts.sir_convert_a_lot.infrastructure.docling_converter_options import (
+    DoclingConverterKey,
+    build_docling_converter,
+)
+from scripts.sir_convert_a_lot.infrastructure.gpu_runtime_probe import GpuRuntimeProbeResult
+from scripts.sir_convert_a_lot.infrastructure.ocr_language_selection import (
+    detect_text_languages,
+    select_ocr_languages,
+)
+
+_SWEDISH = (
+    "Det är viktigt att eleverna får tid för att läsa och skriva. Resultaten visar att "
+    "undervisningen har betydelse för hur de utvecklas, men också att stödet inte är "
+    "tillräckligt. Läraren och rektorn har ett gemensamt ansvar för att arbetet blir av."
+)
+_ENGLISH = (
+    "The results show that the method is robust. It was tested on a corpus of papers, "
+    "and the findings are consistent with the theory. This is not a limitation of the "
+    "approach, which was designed for scale and is shared by the prior work on this task."
+)
+
+
+def _text_pdf_bytes(text: str) -> bytes:
+    with pymupdf.open() as document:
+        document.new_page().insert_textbox(pymupdf.Rect(50, 50, 550, 750), text)
+        return bytes(document.tobytes())
+
+
+def test_detect_text_languages_picks_corpus_languages() -> None:
+    assert detect_text_languages(_SWEDISH) == ("sv",)
+    assert detect_text_languages(_ENGLISH) == ("en",)
+    assert detect_text_languages(f"{_SWEDISH} {_ENGLISH}") == ("sv", "en")
+    assert detect_text_languages("Tabell 1") == ()
+
+
+def test_select_ocr_languages_falls_back_to_all_candidates() -> None:
+    with pymupdf.open() as document:
+        document.new_page()
+        blank_pdf = bytes(document.tobytes())
+
+    assert select_ocr_languages(blank_pdf) == ("sv", "en")
+    assert select_ocr_languages(b"%PDF-not-really") == ("sv", "en")
+
+
+def test_converter_key_languages_configure_easyocr() -> None:
+    key = DoclingConverterKey(
+        table_mode=TableMode.FAST,
+        ocr_enabled=True,
+        force_full_page_ocr=False,
+        acceleration_device=AcceleratorDevice.CPU,
+        layout_model_key="docling_layout_heron",
+        formula_enrichment=False,
+        formula_preset="codeformulav2",
+        ocr_languages=("sv",),
+    )
+
+    converter = build_docling_converter(key)
+
+    pipeline_options = converter.format_to_options[InputFormat.PDF].pipeline_options
+    assert isinstance(pipeline_options, PdfPipelineOptions)
+    assert isinstance(pipeline_options.ocr_options, EasyOcrOptions)
+    assert pipeline_options.ocr_options.lang == ["sv"]
+    assert key != DoclingConverterKey(**{**key.__dict__, "ocr_languages": ("sv", "en")})
+
+
+@pytest.fixture
+def _probe_gpu_available(monkeypatch: pytest.MonkeyPatch) -> None:
+    probe = GpuRuntimeProbeResult(
+        runtime_kind="cuda",
+        torch_version="2.10.0",
+        hip_version=None,
+        cuda_version="12.8",
+        is_available=True,
+        device_count=1,
+        device_name="test-gpu",
+    )
+    monkeypatch.setattr(
+        "scripts.sir_convert_a_lot.infrastructure.docling_backend.probe_torch_gpu_runtime",
+        lambda: probe,
+    )
+
+
+@pytest.mark.usefixtures("_probe_gpu_available")
+def test_backend_keys_ocr_converters_by_detected_languages(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("SIR_CONVERT_A_LOT_DOCLING_OCR_LANGUAGE_DETECTION", "1")
+    monkeypatch.setattr(
+        "scripts.sir_convert_a_lot.infrastructure.docling_backend.ocr_language_engine_available",
+        lambda: True,
+    )
+    backend = DoclingConversionBackend()
+    keys: list[DoclingConverterKey] = []
+
+    def _fake_get_converter(key: DoclingConverterKey) -> object:
+        keys.append(key)
+        return SimpleNamespace(
+            convert=lambda stream: SimpleNamespace(
+                document=DoclingDocument(name="paper"), pages=[object()], confidence=None
+            )
+        )
+
+    monkeypatch.setattr(backend, "_get_converter", _fake_get_converter)
+    result = backend.convert(
+        ConversionRequest(
+            source_filename="paper.pdf",
+            source=_text_pdf_bytes(_ENGLISH),
+            backend_strategy=BackendStrategy.DOCLING,
+            ocr_mode=OcrMode.FORCE,
+            table_mode=TableMode.FAST,
+            gpu_available=True,
+            formula_enrichment=FormulaEnrichmentMode.OFF,
+        )
+    )
+
+    assert [key.ocr_languages for key in keys] == [("en",)]
+    assert result.ocr_languages == ("en",)
@@ -0,0 +1,258 @@
+"""Page-range sharding tests for Sir Convert-a-Lot.
+
+Purpose:
+    Verify shard planning, deterministic stitching of cross-boundary tables
+    and paragraphs, concurrent shard execution bounded by the process-wide
+    shard budget with per-shard timings and aggregated progress, and sharded
+    v1 jobs end to end.
+
+Relationships:
+    - Exercises `infrastructure.page_sharding` directly and through
+      `infrastructure.runtime_engine.ServiceRuntime`.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pymupdf
+
+from scripts.sir_convert_a_lot.domain.specs import (
+    BackendStrategy,
+    JobSpec,
+    JobStatus,
+    OcrMode,
+    TableMode,
+)
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
+    ConversionProgress,
+    ConversionRequest,
+    ConversionResultData,
+)
+from scripts.sir_convert_a_lot.infrastructure.page_sharding import (
+    PageRange,
+    PageShardingPolicy,
+    ShardSlots,
+    convert_page_shards,
+    plan_page_shards,
+    stitch_shard_markdown,
+)
+from scripts.sir_convert_a_lot.infrastructure.pdf_inspection import pdf_page_count
+from scripts.sir_convert_a_lot.infrastructure.runtime_engine import ServiceConfig, ServiceRuntime
+
+
+def _multi_page_pdf(page_count: int) -> bytes:
+    document = pymupdf.open()
+    for page_number in range(page_count):
+        page = document.new_page()
+        page.insert_text((72, 72), f"Section {page_number + 1}", fontsize=16)
+    return bytes(document.tobytes())
+
+
+def _request(source_bytes: bytes, progress=None) -> ConversionRequest:
+    return ConversionRequest(
+        source_filename="thesis.pdf",
+        source=source_bytes,
+        backend_strategy=BackendStrategy.PYMUPDF,
+        ocr_mode=OcrMode.OFF,
+        table_mode=TableMode.FAST,
+        gpu_available=False,
+        progress=progress,
+    )
+
+
+def test_plan_page_shards_balances_ranges_and_respects_thresholds() -> None:
+    policy = PageShardingPolicy(min_pages=10, max_shards=4, min_pages_per_shard=2)
+
+    assert plan_page_shards(9, policy) == []
+    assert plan_page_shards(None, policy) == []
+    assert [shard.label for shard in plan_page_shards(10, policy)] == [
+        "1-3",
+        "4-6",
+        "7-8",
+        "9-10",
+    ]
+    narrow = PageShardingPolicy(min_pages=2, max_shards=8, min_pages_per_shard=4)
+    assert [shard.label for shard in plan_page_shards(9, narrow)] == ["1-5", "6-9"]
+    assert plan_page_shards(7, narrow) == []
+
+
+def test_stitch_rejoins_tables_and_paragraphs_across_boundaries() -> None:
+    first = "# Results\n\n|a|b|\n|---|---|\n|1|2|\n"
+    second = "| a | b |\n|---|---|\n|3|4|\n"
+    third = "|5|6|\n\nThe measurements were taken in the\n"
+    fourth = "morning and evening.\n\n## Discussion\n\nDone.\n"
+
+    assert stitch_shard_markdown([first, second, third, fourth]) == (
+        "# Results\n\n|a|b|\n|---|---|\n|1|2|\n|3|4|\n|5|6|\n\n"
+        "The measurements were taken in the morning and evening.\n\n"
+        "## Discussion\n\nDone.\n"
+    )
+
+
+def test_stitch_keeps_separate_blocks_and_open_fences_apart() -> None:
+    assert stitch_shard_markdown(["Ends a sentence.", "next begins lower."]) == (
+        "Ends a sentence.\n\nnext begins lower.\n"
+    )
+    assert stitch_shard_markdown(["|a|b|\n|---|---|", "|x|y|z|\n|---|---|---|"]) == (
+        "|a|b|\n|---|---|\n\n|x|y|z|\n|---|---|---|\n"
+    )
+    assert stitch_shard_markdown(["|a|b|\n|---|---|\n|1|2|", "|x|y|\n|---|---|\n|3|4|"]) == (
+        "|a|b|\n|---|---|\n|1|2|\n\n|x|y|\n|---|---|\n|3|4|\n"
+    )
+    assert stitch_shard_markdown(["```\ncode line", "continued code\n```"]) == (
+        "```\ncode line\n\ncontinued code\n```\n"
+    )
+
+
+class _ConcurrentBackend:
+    """Fake backend that only returns once every shard is converting at once."""
+
+    def __init__(self, shard_count: int) -> None:
+        self._barrier = threading.Barrier(shard_count, timeout=10.0)
+
+    def convert(self, request: ConversionRequest) -> ConversionResultData:
+        self._barrier.wait()
+        page_count = pdf_page_count(request.source)
+        assert page_count is not None
+        request.report_progress(
+            stage="fake_convert", pages_completed=page_count, pages_total=page_count
+        )
+        return ConversionResultData(
+            markdown_content=f"Shard of {page_count} pages.\n",
+            backend_used="pymupdf",
+            acceleration_used="cpu",
+            ocr_enabled=False,
+            warnings=["shared_warning"],
+            phase_timings_ms={"fake_ms": 2},
+        )
+
+
+def test_convert_page_shards_runs_concurrently_with_per_shard_timings() -> None:
+    shards = [PageRange(0, 2), PageRange(3, 4), PageRange(5, 6)]
+    reports: list[ConversionProgress] = []
+
+    result = convert_page_shards(
+        _ConcurrentBackend(len(shards)),
+        _request(_multi_page_pdf(7), progress=reports.append),
+        shards,
+    )
+
+    assert result.markdown_content == (
+        "Shard of 3 pages.\n\nShard of 2 pages.\n\nShard of 2 pages.\n"
+    )
+    assert result.warnings == ["shared_warning"]
+    assert result.phase_timings_ms["fake_ms"] == 6
+    assert {"shard_0_pages_1-3_ms", "shard_1_pages_4-5_ms", "shard_2_pages_6-7_ms"} <= set(
+        result.phase_timings_ms
+    )
+    assert "shard_split_ms" in result.phase_timings_ms
+    completed = [report.pages_completed for report in reports]
+    assert completed == sorted(completed)
+    assert completed[-1] == 7
+    assert {report.pages_total for report in reports} == {7}
+
+
+class _CountingBackend:
+    """Fake backend recording the peak number of shards converting at once."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._active = 0
+        self.peak = 0
+
+    def convert(self, request: ConversionRequest) -> ConversionResultData:
+        with self._lock:
+            self._active += 1
+            self.peak = max(self.peak, self._active)
+        time.sleep(0.05)
+        with self._lock:
+            self._active -= 1
+        return ConversionResultData(
+            markdown_content="Shard.\n",
+            backend_used="pymupdf",
+            acceleration_used="cpu",
+            ocr_enabled=False,
+        )
+
+
+def test_sharded_jobs_share_one_process_wide_shard_budget() -> None:
+    config = ServiceConfig(
+        api_key="secret-key",
+        data_root=Path("unused"),
+        page_sharding_min_pages=4,
+        page_sharding_min_pages_per_shard=1,
+    )
+    first, second = PageShardingPolicy.from_config(config), PageShardingPolicy.from_config(config)
+    assert first is not None and second is not None
+    assert first.slots is not None and first.slots is second.slots
+
+    backend = _CountingBackend()
+    shards = [PageRange(index, index) for index in range(4)]
+    slots = ShardSlots(3)
+    source = _multi_page_pdf(4)
+    jobs = [
+        threading.Thread(
+            target=convert_page_shards,
+            args=(backend, _request(source), shards),
+            kwargs={"slots": slots},
+        )
+        for _ in range(2)
+    ]
+    for job in jobs:
+        job.start()
+    for job in jobs:
+        job.join()
+
+    assert backend.peak == 3
+
+
+def test_v1_job_converts_large_pdf_in_shards(tmp_path: Path) -> None:
+    runtime = ServiceRuntime(
+        ServiceConfig(
+            api_key="secret-key",
+            data_root=tmp_path / "runtime_data",
+            gpu_available=False,
+            allow_cpu_only=True,
+            enable_supervisor=False,
+            processing_delay_seconds=0.0,
+            page_sharding_min_pages=6,
+            page_sharding_max_shards=3,
+            page_sharding_min_pages_per_shard=2,
+        )
+    )
+    spec = JobSpec.model_validate(
+        {
+            "api_version": "v1",
+            "source": {"kind": "upload", "filename": "thesis.pdf"},
+            "conversion": {
+                "output_format": "md",
+                "backend_strategy": "pymupdf",
+                "ocr_mode": "off",
+                "table_mode": "fast",
+                "normalize": "standard",
+            },
+            "execution": {
+                "acceleration_policy": "cpu_only",
+                "priority": "normal",
+                "document_timeout_seconds": 60,
+            },
+            "retention": {"pin": False},
+        }
+    )
+    job = runtime.create_job(spec, _multi_page_pdf(6), "thesis.pdf")
+    runtime._run_job(job.job_id)
+    runtime.shutdown()
+
+    done = runtime.get_job(job.job_id)
+    assert done is not None
+    assert done.status == JobStatus.SUCCEEDED
+    markdown = done.artifact_path.read_text(encoding="utf-8")
+    positions = [markdown.index(f"Section {page}") for page in range(1, 7)]
+    assert positions == sorted(positions)
+    assert {"shard_0_pages_1-2_ms", "shard_1_pages_3-4_ms", "shard_2_pages_5-6_ms"} <= set(
+        done.phase_timings_ms
+    )
+    assert (done.pages_processed, done.pages_total) == (6, 6)
@@ -0,0 +1,175 @@
+"""PDF pre-classification tests.
+
+Purpose:
+    Verify that PyMuPDF features predict exam-like and scanned PDFs, that
+    applied labels configure the first Docling attempt and are reported, and
+    that prediction hits are counted per label and recorded on the result.
+
+Relationships:
+    - Exercises `infrastructure.pdf_preclassification` and its hooks in
+      `infrastructure.docling_backend`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pymupdf
+import pytest
+
+from scripts.sir_convert_a_lot.domain.specs import (
+    BackendStrategy,
+    FormulaEnrichmentMode,
+    OcrMode,
+    TableMode,
+)
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
+    ConversionRequest,
+    ConversionResultData,
+)
+from scripts.sir_convert_a_lot.infrastructure.docling_backend import (
+    DoclingConversionBackend,
+    _DoclingAttempt,
+)
+from scripts.sir_convert_a_lot.infrastructure.gpu_runtime_probe import GpuRuntimeProbeResult
+from scripts.sir_convert_a_lot.infrastructure.pdf_preclassification import (
+    EXAM_LIKE,
+    FORMULA_HEAVY,
+    SCANNED,
+    TABLES,
+    PreclassificationStats,
+    convert_with_preclassification,
+    preclassify_pdf,
+)
+
+
+@pytest.fixture(autouse=True)
+def _probe_gpu_available(monkeypatch: pytest.MonkeyPatch) -> None:
+    probe = GpuRuntimeProbeResult(
+        runtime_kind="rocm",
+        torch_version="2.10.0+rocm7.1",
+        hip_version="7.1.25424",
+        cuda_version=None,
+        is_available=True,
+        device_count=1,
+        device_name="AMD Radeon AI PRO R9700",
+    )
+    monkeypatch.setattr(
+        "scripts.sir_convert_a_lot.infrastructure.docling_backend.probe_torch_gpu_runtime",
+        lambda: probe,
+    )
+
+
+def _exam_pdf_bytes() -> bytes:
+    with pymupdf.open() as document:
+        page = document.new_page()
+        y = 60
+        for question in range(1, 6):
+            page.insert_text((60, y), f"{question}. Which option is correct?")
+            y += 16
+            for option in "ABCD":
+                page.insert_text((80, y), f"{option}. Option {option}{question}")
+                y += 14
+        return bytes(document.tobytes())
+
+
+def _scanned_pdf_bytes(page_count: int) -> bytes:
+    pixmap = pymupdf.Pixmap(pymupdf.csRGB, pymupdf.IRect(0, 0, 40, 40), False)
+    pixmap.set_rect(pixmap.irect, (200, 200, 200))
+    with pymupdf.open() as document:
+        for _ in range(page_count):
+            page = document.new_page()
+            page.insert_image(page.rect, pixmap=pixmap)
+        return bytes(document.tobytes())
+
+
+def _request(source_bytes: bytes, *, ocr_mode: OcrMode = OcrMode.AUTO) -> ConversionRequest:
+    return ConversionRequest(
+        source_filename="exam.pdf",
+        source=source_bytes,
+        backend_strategy=BackendStrategy.DOCLING,
+        ocr_mode=ocr_mode,
+        table_mode=TableMode.ACCURATE,
+        gpu_available=True,
+        formula_enrichment=FormulaEnrichmentMode.ON,
+    )
+
+
+def test_preclassify_pdf_predicts_exam_like_and_scanned_documents() -> None:
+    exam = preclassify_pdf(_exam_pdf_bytes())
+    scanned = preclassify_pdf(_scanned_pdf_bytes(2))
+
+    assert exam is not None and exam.labels == frozenset({EXAM_LIKE})
+    assert (exam.question_lines, exam.option_lines) == (5, 20)
+    assert scanned is not None and scanned.labels == frozenset({SCANNED})
+    assert preclassify_pdf(b"%PDF-not-really") is None
+
+
+def test_convert_with_preclassification_applies_reports_and_scores_labels() -> None:
+    stats = PreclassificationStats()
+    seen_labels: list[frozenset[str]] = []
+
+    def _convert(request: ConversionRequest) -> ConversionResultData:
+        seen_labels.append(request.preclassified_labels)
+        return ConversionResultData(
+            markdown_content="| a | b |\n| --- | --- |\n| 1 | 2 |\n",
+            backend_used="docling",
+            acceleration_used="cuda",
+            ocr_enabled=False,
+            phase_timings_ms={"formula_enrichment_ms": 3},
+        )
+
+    result = convert_with_preclassification(
+        _request(_exam_pdf_bytes(), ocr_mode=OcrMode.OFF),
+        enabled=True,
+        layout_fallback_available=True,
+        formula_enrichment=True,
+        convert=_convert,
+        stats=stats,
+    )
+
+    assert seen_labels == [frozenset({EXAM_LIKE})]
+    assert result.warnings == ["docling_preclassification_applied:exam_like"]
+    assert set(result.phase_timings_ms) == {"formula_enrichment_ms", "preclassify_ms"}
+    assert result.preclassification_labels == (EXAM_LIKE,)
+    assert result.preclassification_hits == {EXAM_LIKE: False, FORMULA_HEAVY: True, TABLES: False}
+    snapshot = stats.snapshot()
+    assert (snapshot[EXAM_LIKE].predicted, snapshot[EXAM_LIKE].hits) == (1, 0)
+    assert (snapshot[TABLES].observed, snapshot[TABLES].hits) == (1, 0)
+    assert snapshot[FORMULA_HEAVY].hits == 1
+    assert snapshot[SCANNED].total == 0
+
+
+def test_preclassified_labels_configure_first_docling_attempt(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    backend = DoclingConversionBackend()
+    calls: list[tuple[bool, str]] = []
+
+    def _fake_convert_once(
+        request: ConversionRequest,
+        *,
+        ocr_enabled: bool,
+        force_full_page_ocr: bool,
+        acceleration_device: object,
+        formula_enrichment: bool,
+        formula_preset: str,
+    ) -> _DoclingAttempt:
+        del request, force_full_page_ocr, acceleration_device, formula_enrichment
+        calls.append((ocr_enabled, formula_preset))
+        if formula_preset == "granite_docling":
+            return _DoclingAttempt(
+                "<!-- formula-not-decoded -->", page_count=1, low_confidence=False
+            )
+        return _DoclingAttempt("$$x^2$$", page_count=1, low_confidence=False)
+
+    monkeypatch.setattr(backend, "_convert_once", _fake_convert_once)
+    request = replace(
+        _request(_scanned_pdf_bytes(1)), preclassified_labels=frozenset({FORMULA_HEAVY, SCANNED})
+    )
+    result = backend._convert_passes(request)
+
+    assert calls == [(True, "granite_docling"), (True, "codeformulav2")]
+    assert result.ocr_enabled is True
+    assert result.markdown_content == "$$x^2$$"
+    assert result.warnings == ["docling_formula_preset_switched_to_codeformulav2"]
@@ -2,7 +2,9 @@
 
 Purpose:
     Validate Task 11 backend semantics: table-strategy mapping, deterministic
-    output, and metadata truth for `backend_strategy="pymupdf"`.
+    output, and metadata truth for `backend_strategy="pymupdf"`, plus parity of
+    the parallel page-range mode and of path-backed sources with single-pass
+    in-memory conversion.
 
 Relationships:
     - Exercises `scripts.sir_convert_a_lot.infrastructure.pymupdf_backend`.
@@ -10,22 +12,29 @@ Relationships:
 
 from __future__ import annotations
 
+from dataclasses import replace
+
+import pymupdf
 import pytest
 
 from scripts.sir_convert_a_lot.domain.specs import BackendStrategy, OcrMode, TableMode
 from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
     BackendExecutionError,
     BackendInputError,
+    ConversionProgress,
     ConversionRequest,
 )
-from scripts.sir_convert_a_lot.infrastructure.pymupdf_backend import PyMuPdfConversionBackend
-from tests.sir_convert_a_lot.pdf_fixtures import fixture_pdf_bytes
+from scripts.sir_convert_a_lot.infrastructure.pymupdf_backend import (
+    PyMuPdfConversionBackend,
+    split_page_ranges,
+)
+from tests.sir_convert_a_lot.pdf_fixtures import fixture_pdf_bytes, fixture_pdf_path
 
 
 def _request(*, table_mode: TableMode = TableMode.FAST) -> ConversionRequest:
     return ConversionRequest(
         source_filename="paper_alpha.pdf",
-        source_bytes=fixture_pdf_bytes("paper_alpha.pdf"),
+        source=fixture_pdf_bytes("paper_alpha.pdf"),
         backend_strategy=BackendStrategy.PYMUPDF,
         ocr_mode=OcrMode.OFF,
         table_mode=table_mode,
@@ -44,6 +53,16 @@ def test_pymupdf_backend_real_fixture_reports_truthful_metadata() -> None:
     assert result.markdown_content.strip() != ""
 
 
+def test_pymupdf_backend_opens_path_source_in_place() -> None:
+    backend = PyMuPdfConversionBackend()
+    in_memory = backend.convert(_request(table_mode=TableMode.ACCURATE))
+    on_disk = backend.convert(
+        replace(_request(table_mode=TableMode.ACCURATE), source=fixture_pdf_path("paper_alpha.pdf"))
+    )
+
+    assert on_disk.markdown_content == in_memory.markdown_content
+
+
 def test_pymupdf_backend_is_deterministic_for_identical_input() -> None:
     backend = PyMuPdfConversionBackend()
     first = backend.convert(_request(table_mode=TableMode.ACCURATE))
@@ -82,7 +101,7 @@ def test_invalid_pdf_bytes_raise_backend_input_error() -> None:
     backend = PyMuPdfConversionBackend()
     request = ConversionRequest(
         source_filename="broken.pdf",
-        source_bytes=b"not-a-pdf",
+        source=b"not-a-pdf",
         backend_strategy=BackendStrategy.PYMUPDF,
         ocr_mode=OcrMode.OFF,
         table_mode=TableMode.FAST,
@@ -146,3 +165,48 @@ def test_pymupdf_backend_enables_use_glyphs_on_markdown_export(monkeypatch) -> N
     assert observed_kwargs["table_strategy"] == "lines_strict"
     assert observed_kwargs["page_chunks"] is False
     assert observed_kwargs["use_glyphs"] is True
+
+
+def _long_pdf_bytes(page_count: int) -> bytes:
+    with pymupdf.open() as document:
+        for page_number in range(page_count):
+            page = document.new_page(width=612, height=792)
+            page.insert_text((72, 72), f"Section {page_number + 1}", fontsize=20)
+            page.insert_textbox(
+                pymupdf.Rect(72, 100, 540, 600),
+                f"Body text of page {page_number + 1}. " * 40,
+                fontsize=10,
+            )
+            for offset in (0, 20, 40):
+                page.draw_line((72, 640 + offset), (540, 640 + offset))
+        return bytes(document.tobytes())
+
+
+def test_split_page_ranges_is_contiguous_and_balanced() -> None:
+    assert split_page_ranges(10, 3) == [range(0, 4), range(4, 7), range(7, 10)]
+    assert split_page_ranges(2, 8) == [range(0, 1), range(1, 2)]
+
+
+@pytest.mark.parametrize("table_mode", [TableMode.FAST, TableMode.ACCURATE])
+def test_parallel_page_ranges_match_single_pass_conversion(table_mode: TableMode) -> None:
+    source_bytes = _long_pdf_bytes(9)
+    reports: list[ConversionProgress] = []
+    request = ConversionRequest(
+        source_filename="long.pdf",
+        source=source_bytes,
+        backend_strategy=BackendStrategy.PYMUPDF,
+        ocr_mode=OcrMode.OFF,
+        table_mode=table_mode,
+        gpu_available=False,
+        progress=reports.append,
+    )
+    parallel_backend = PyMuPdfConversionBackend(parallel_min_pages=4, parallel_max_processes=2)
+    try:
+        parallel = parallel_backend.convert(request)
+    finally:
+        parallel_backend.shutdown()
+    serial = PyMuPdfConversionBackend().convert(request)
+
+    assert parallel.markdown_content == serial.markdown_content
+    assert "Section 9" in parallel.markdown_content
+    assert reports[-1].pages_completed == reports[-1].pages_total == 9
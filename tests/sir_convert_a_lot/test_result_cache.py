@@ -0,0 +1,271 @@
+"""Content-addressed result cache tests for Sir Convert-a-Lot v1.
+
+Purpose:
+    Verify cache keys only depend on output-affecting inputs, including the
+    service and Docling env settings that change output, TTL and LRU size
+    eviction, and that resubmitting an identical PDF completes from the cache
+    with a `cache_hit` diagnostics marker instead of reconverting.
+
+Relationships:
+    - Exercises `infrastructure.result_cache` and its runtime integration in
+      `infrastructure.runtime_result_cache` / `infrastructure.runtime_engine`.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import replace
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+from scripts.sir_convert_a_lot.application.contracts import ConversionMetadata
+from scripts.sir_convert_a_lot.domain.specs import JobSpec, JobStatus
+from scripts.sir_convert_a_lot.infrastructure import result_cache as result_cache_module
+from scripts.sir_convert_a_lot.infrastructure import runtime_result_cache
+from scripts.sir_convert_a_lot.infrastructure.docling_layout_models import (
+    DOCLING_LAYOUT_FALLBACK_MODELS_ENV_VAR,
+    DOCLING_LAYOUT_MODEL_ENV_VAR,
+    DOCLING_ORDERING_PATCH_ENV_VAR,
+    DOCLING_ORDERING_QUALITY_GATE_ENV_VAR,
+)
+from scripts.sir_convert_a_lot.infrastructure.job_store import JobStore
+from scripts.sir_convert_a_lot.infrastructure.ocr_language_selection import (
+    DOCLING_OCR_LANGUAGE_DETECTION_ENV_VAR,
+)
+from scripts.sir_convert_a_lot.infrastructure.pdf_preclassification import (
+    DOCLING_PRECLASSIFICATION_ENV_VAR,
+)
+from scripts.sir_convert_a_lot.infrastructure.result_cache import (
+    CachedConversionResult,
+    ConversionResultCache,
+    result_cache_key,
+)
+from scripts.sir_convert_a_lot.infrastructure.runtime_engine import ServiceConfig, ServiceRuntime
+
+
+def _job_spec(*, ocr_mode: str = "off", priority: str = "normal", pin: bool = False) -> JobSpec:
+    return JobSpec.model_validate(
+        {
+            "api_version": "v1",
+            "source": {"kind": "upload", "filename": "paper.pdf"},
+            "conversion": {
+                "output_format": "md",
+                "backend_strategy": "auto",
+                "ocr_mode": ocr_mode,
+                "table_mode": "fast",
+                "normalize": "standard",
+            },
+            "execution": {
+                "acceleration_policy": "cpu_only",
+                "priority": priority,
+                "document_timeout_seconds": 30,
+            },
+            "retention": {"pin": pin},
+        }
+    )
+
+
+def _cached(markdown: str, *, job_id: str = "job_source") -> CachedConversionResult:
+    return CachedConversionResult(
+        markdown_bytes=markdown.encode("utf-8"),
+        backend_used="pymupdf",
+        acceleration_used="cpu",
+        ocr_enabled=False,
+        warnings=("note",),
+        source_job_id=job_id,
+    )
+
+
+def test_cache_key_ignores_scheduling_fields_but_not_options_or_revision() -> None:
+    base = result_cache_key(source_sha256="abc", spec=_job_spec(), service_revision="rev1")
+
+    assert base == result_cache_key(
+        source_sha256="abc", spec=_job_spec(priority="high", pin=True), service_revision="rev1"
+    )
+    assert base != result_cache_key(
+        source_sha256="abc", spec=_job_spec(ocr_mode="force"), service_revision="rev1"
+    )
+    assert base != result_cache_key(source_sha256="abc", spec=_job_spec(), service_revision="rev2")
+    assert base != result_cache_key(source_sha256="abd", spec=_job_spec(), service_revision="rev1")
+
+
+def test_runtime_cache_key_covers_output_affecting_service_settings(
+    monkeypatch, tmp_path: Path
+) -> None:
+    job_store = JobStore(data_root=tmp_path, raw_ttl_seconds=60, artifact_ttl_seconds=60)
+
+    def _key(**settings: Any) -> str | None:
+        config = replace(
+            ServiceConfig(api_key="secret-key", data_root=tmp_path, service_revision="rev_a"),
+            **settings,
+        )
+        cache = runtime_result_cache.JobResultCache(config=config, job_store=job_store)
+        return cache.key_for(_job_spec(), "ab" * 32)
+
+    monkeypatch.delenv(DOCLING_OCR_LANGUAGE_DETECTION_ENV_VAR, raising=False)
+    monkeypatch.setattr(runtime_result_cache, "ocr_language_engine_available", lambda: True)
+    base = _key()
+    inactive_parallel = _key(pymupdf_parallel_min_pages=50, pymupdf_parallel_max_processes=1)
+    variants = {
+        _key(auto_backend_triage=True),
+        _key(pymupdf_parallel_min_pages=50, pymupdf_parallel_max_processes=4),
+        _key(page_sharding_min_pages=100),
+    }
+    monkeypatch.setenv(DOCLING_OCR_LANGUAGE_DETECTION_ENV_VAR, "1")
+    variants.add(_key())
+
+    assert base is not None
+    assert base == inactive_parallel
+    assert len(variants) == 4
+    assert base not in variants
+
+
+def test_runtime_cache_key_covers_docling_env_settings(monkeypatch, tmp_path: Path) -> None:
+    job_store = JobStore(data_root=tmp_path, raw_ttl_seconds=60, artifact_ttl_seconds=60)
+    config = ServiceConfig(api_key="secret-key", data_root=tmp_path, service_revision="rev_a")
+
+    def _key() -> str | None:
+        cache = runtime_result_cache.JobResultCache(config=config, job_store=job_store)
+        return cache.key_for(_job_spec(), "ab" * 32)
+
+    flipped = {
+        DOCLING_LAYOUT_MODEL_ENV_VAR: "docling_layout_heron",
+        DOCLING_LAYOUT_FALLBACK_MODELS_ENV_VAR: "docling_layout_v2",
+        DOCLING_ORDERING_PATCH_ENV_VAR: "0",
+        DOCLING_ORDERING_QUALITY_GATE_ENV_VAR: "0",
+        DOCLING_PRECLASSIFICATION_ENV_VAR: "0",
+    }
+    for env_var in flipped:
+        monkeypatch.delenv(env_var, raising=False)
+    base = _key()
+    keys = {base}
+    for env_var, value in flipped.items():
+        with monkeypatch.context() as patch:
+            patch.setenv(env_var, value)
+            keys.add(_key())
+
+    assert base is not None
+    assert len(keys) == len(flipped) + 1
+    assert _key() == base
+
+
+def test_cache_expires_entries_after_ttl(monkeypatch, tmp_path: Path) -> None:
+    cache = ConversionResultCache(data_root=tmp_path, ttl_seconds=60, max_bytes=1024)
+    cache.put("a" * 64, _cached("# cached"))
+    hit = cache.get("a" * 64)
+    assert hit is not None
+    assert hit.markdown_bytes == b"# cached"
+    assert hit.warnings == ("note",)
+
+    later = result_cache_module.utc_now() + timedelta(seconds=61)
+    monkeypatch.setattr(result_cache_module, "utc_now", lambda: later)
+
+    assert cache.get("a" * 64) is None
+    assert list(cache.dir.glob("*/*")) == []
+
+
+def test_cache_evicts_least_recently_used_entries_over_budget(tmp_path: Path) -> None:
+    cache = ConversionResultCache(data_root=tmp_path, ttl_seconds=3600, max_bytes=250)
+    first, second, third = "1" * 64, "2" * 64, "3" * 64
+    cache.put(first, _cached("a" * 100))
+    cache.put(second, _cached("b" * 100))
+    os.utime(cache.dir / first[:2] / f"{first}.md", (1_000, 1_000))
+    os.utime(cache.dir / second[:2] / f"{second}.md", (2_000, 2_000))
+    assert cache.get(first) is not None  # refreshes `first` as most recently used
+
+    cache.put(third, _cached("c" * 100))
+
+    assert cache.get(second) is None
+    assert cache.get(first) is not None
+    assert cache.get(third) is not None
+
+
+def test_cache_put_evicts_from_startup_index_without_scanning(monkeypatch, tmp_path: Path) -> None:
+    first, second, third = "1" * 64, "2" * 64, "3" * 64
+    seeded = ConversionResultCache(data_root=tmp_path, ttl_seconds=3600, max_bytes=250)
+    seeded.put(first, _cached("a" * 100))
+    seeded.put(second, _cached("b" * 100))
+    os.utime(seeded.dir / first[:2] / f"{first}.md", (1_000, 1_000))
+    os.utime(seeded.dir / second[:2] / f"{second}.md", (2_000, 2_000))
+
+    cache = ConversionResultCache(data_root=tmp_path, ttl_seconds=3600, max_bytes=250)
+
+    def _no_scan() -> list[object]:
+        raise AssertionError("put must not scan the cache directory")
+
+    monkeypatch.setattr(cache, "_scan", _no_scan)
+    cache.put(third, _cached("c" * 100))
+
+    assert cache.get(first) is None
+    assert cache.get(second) is not None
+    assert cache.get(third) is not None
+
+
+def test_identical_resubmission_completes_from_cache(monkeypatch, tmp_path: Path) -> None:
+    runtime = ServiceRuntime(
+        ServiceConfig(
+            api_key="secret-key",
+            data_root=tmp_path / "runtime_data",
+            gpu_available=False,
+            allow_cpu_only=True,
+            enable_supervisor=False,
+            processing_delay_seconds=0.0,
+            service_revision="rev_cache",
+        )
+    )
+    conversions: list[str] = []
+
+    def _execute(job) -> tuple[str, ConversionMetadata, list[str], dict[str, int]]:
+        conversions.append(job.job_id)
+        metadata = ConversionMetadata(
+            backend_used="pymupdf",
+            acceleration_used="cpu",
+            ocr_enabled=False,
+            table_mode=job.spec.conversion.table_mode,
+            options_fingerprint="sha256:first",
+            formula_enrichment_used=True,
+            ocr_languages=["sv", "en"],
+            backend_route_reasons=["simple_text_layer"],
+            preclassification_labels=["tables"],
+            preclassification_hits={"exam_like": True, "tables": False},
+        )
+        return ("# converted", metadata, ["converted_warning"], {})
+
+    def _rehash(path: Path) -> str:
+        raise AssertionError(f"upload {path} was re-hashed instead of using the staged digest")
+
+    monkeypatch.setattr(runtime, "_execute_conversion", _execute)
+    monkeypatch.setattr(runtime_result_cache, "file_sha256", _rehash)
+    source = b"%PDF-1.4\n% cache me\n%%EOF\n"
+
+    first = runtime.create_job(_job_spec(), source, "paper.pdf")
+    runtime._run_job(first.job_id)
+    first_done = runtime.get_job(first.job_id)
+    assert first_done is not None and first_done.status == JobStatus.SUCCEEDED
+    assert first_done.cache_hit is False
+    assert first_done.formula_enrichment_used is True
+    assert first_done.ocr_languages == ["sv", "en"]
+    assert first_done.preclassification_labels == ["tables"]
+    assert first_done.preclassification_hits == {"exam_like": True, "tables": False}
+
+    second = runtime.create_job(_job_spec(priority="high"), source, "renamed.pdf")
+    runtime.shutdown()
+
+    assert conversions == [first.job_id]
+    assert second.job_id != first.job_id
+    assert second.status == JobStatus.SUCCEEDED
+    assert second.cache_hit is True
+    assert second.warnings == ["converted_warning"]
+    assert second.backend_used == "pymupdf"
+    assert second.formula_enrichment_used is True
+    assert second.ocr_languages == ["sv", "en"]
+    assert second.backend_route_reasons == ["simple_text_layer"]
+    assert second.preclassification_labels == ["tables"]
+    assert second.preclassification_hits == {"exam_like": True, "tables": False}
+    assert second.artifact_sha256 == first_done.artifact_sha256
+    assert second.artifact_path.read_bytes() == b"# converted"
+    assert "result_cache_lookup_ms" in second.phase_timings_ms
+
+    other_options = runtime.create_job(_job_spec(ocr_mode="force"), source, "paper.pdf")
+    assert other_options.status == JobStatus.QUEUED
@@ -0,0 +1,280 @@
+"""Single-flight coalescing tests for Sir Convert-a-Lot v1.
+
+Purpose:
+    Verify identical in-flight submissions attach to one leader conversion,
+    complete from its artifact with their own job records, share deterministic
+    failures, hand the work to a follower when the leader is canceled, exits
+    early, or times out (only once the leader's run returns), and dispatch a
+    queued leader at the priority of its highest follower.
+
+Relationships:
+    - Exercises `infrastructure.runtime_coalescing` through
+      `infrastructure.runtime_engine.ServiceRuntime`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+from scripts.sir_convert_a_lot.application.contracts import ConversionMetadata
+from scripts.sir_convert_a_lot.domain.specs import JobSpec, JobStatus
+from scripts.sir_convert_a_lot.infrastructure.hedged_conversion import (
+    REASON_ACCEPTED,
+    WINNER_PYMUPDF,
+    hedge_warning,
+)
+from scripts.sir_convert_a_lot.infrastructure.job_store import JobExpired
+from scripts.sir_convert_a_lot.infrastructure.runtime_engine import (
+    ServiceConfig,
+    ServiceError,
+    ServiceRuntime,
+)
+from scripts.sir_convert_a_lot.infrastructure.runtime_supervisor import conversion_timeout_error
+
+_SOURCE = b"%PDF-1.4\n% coalesce me\n%%EOF\n"
+
+
+def _job_spec(*, priority: str = "normal", timeout_seconds: int = 30) -> JobSpec:
+    return JobSpec.model_validate(
+        {
+            "api_version": "v1",
+            "source": {"kind": "upload", "filename": "paper.pdf"},
+            "conversion": {
+                "output_format": "md",
+                "backend_strategy": "auto",
+                "ocr_mode": "off",
+                "table_mode": "fast",
+                "normalize": "standard",
+            },
+            "execution": {
+                "acceleration_policy": "cpu_only",
+                "priority": priority,
+                "document_timeout_seconds": timeout_seconds,
+            },
+            "retention": {"pin": False},
+        }
+    )
+
+
+def _runtime(tmp_path: Path, **overrides: Any) -> ServiceRuntime:
+    config = ServiceConfig(
+        api_key="secret-key",
+        data_root=tmp_path / "runtime_data",
+        gpu_available=False,
+        allow_cpu_only=True,
+        enable_supervisor=False,
+        processing_delay_seconds=0.0,
+        result_cache_max_bytes=0,
+    )
+    return ServiceRuntime(replace(config, **overrides))
+
+
+def _metadata(job) -> ConversionMetadata:
+    return ConversionMetadata(
+        backend_used="pymupdf",
+        acceleration_used="cpu",
+        ocr_enabled=False,
+        table_mode=job.spec.conversion.table_mode,
+        options_fingerprint="sha256:leader",
+    )
+
+
+def test_identical_in_flight_jobs_complete_from_leader_artifact(
+    monkeypatch, tmp_path: Path
+) -> None:
+    runtime = _runtime(tmp_path)
+    conversions: list[str] = []
+
+    def _execute(job) -> tuple[str, ConversionMetadata, list[str], dict[str, int]]:
+        conversions.append(job.job_id)
+        return ("# shared", _metadata(job), ["leader_warning"], {})
+
+    monkeypatch.setattr(runtime, "_execute_conversion", _execute)
+
+    leader = runtime.create_job(_job_spec(), _SOURCE, "paper.pdf")
+    follower = runtime.create_job(_job_spec(priority="high"), _SOURCE, "copy.pdf")
+    canceled = runtime.create_job(_job_spec(), _SOURCE, "paper.pdf")
+    assert follower.status == JobStatus.QUEUED
+    assert follower.progress_stage == "coalesced"
+    assert runtime.cancel_job(canceled.job_id) == "accepted"
+
+    runtime._run_job(follower.job_id)
+    assert conversions == []
+    runtime._run_job(leader.job_id)
+    runtime.shutdown()
+
+    assert conversions == [leader.job_id]
+    leader_done = runtime.get_job(leader.job_id)
+    follower_done = runtime.get_job(follower.job_id)
+    canceled_done = runtime.get_job(canceled.job_id)
+    assert leader_done is not None and follower_done is not None and canceled_done is not None
+    assert leader_done.coalesced_with_job_id is None
+    assert follower_done.status == JobStatus.SUCCEEDED
+    assert follower_done.coalesced_with_job_id == leader.job_id
+    assert follower_done.artifact_path.read_bytes() == b"# shared"
+    assert follower_done.artifact_sha256 == leader_done.artifact_sha256
+    assert follower_done.warnings == ["leader_warning"]
+    assert "coalesced_wait_ms" in follower_done.phase_timings_ms
+    assert canceled_done.status == JobStatus.CANCELED
+
+
+def test_deterministic_leader_failure_is_shared_with_followers(monkeypatch, tmp_path: Path) -> None:
+    runtime = _runtime(tmp_path)
+
+    def _execute(job) -> tuple[str, ConversionMetadata, list[str], dict[str, int]]:
+        raise ServiceError(
+            status_code=422,
+            code="pdf_unreadable",
+            message="Uploaded file is not a readable PDF.",
+            retryable=False,
+        )
+
+    monkeypatch.setattr(runtime, "_execute_conversion", _execute)
+
+    leader = runtime.create_job(_job_spec(), _SOURCE, "paper.pdf")
+    follower = runtime.create_job(_job_spec(), _SOURCE, "paper.pdf")
+    runtime._run_job(leader.job_id)
+    runtime.shutdown()
+
+    follower_done = runtime.get_job(follower.job_id)
+    assert follower_done is not None
+    assert follower_done.status == JobStatus.FAILED
+    assert follower_done.failure_code == "pdf_unreadable"
+    assert follower_done.coalesced_with_job_id == leader.job_id
+
+
+def test_canceled_leader_promotes_next_follower(monkeypatch, tmp_path: Path) -> None:
+    runtime = _runtime(tmp_path)
+    conversions: list[str] = []
+    started: list[str] = []
+
+    def _execute(job) -> tuple[str, ConversionMetadata, list[str], dict[str, int]]:
+        conversions.append(job.job_id)
+        return ("# promoted", _metadata(job), [], {})
+
+    monkeypatch.setattr(runtime, "_execute_conversion", _execute)
+    monkeypatch.setattr(runtime, "run_job_async", started.append)
+
+    leader = runtime.create_job(_job_spec(), _SOURCE, "paper.pdf")
+    second = runtime.create_job(_job_spec(), _SOURCE, "paper.pdf")
+    third = runtime.create_job(_job_spec(), _SOURCE, "paper.pdf")
+    assert runtime.cancel_job(leader.job_id) == "accepted"
+
+    runtime._run_job(leader.job_id)
+    assert started == [second.job_id]
+    runtime._run_job(second.job_id)
+    runtime.shutdown()
+
+    assert conversions == [second.job_id]
+    third_done = runtime.get_job(third.job_id)
+    assert third_done is not None
+    assert third_done.status == JobStatus.SUCCEEDED
+    assert third_done.coalesced_with_job_id == second.job_id
+
+
+def test_restart_rebuilds_groups_from_queued_jobs(tmp_path: Path) -> None:
+    first_runtime = _runtime(tmp_path)
+    leader = first_runtime.create_job(_job_spec(), _SOURCE, "paper.pdf")
+    follower = first_runtime.create_job(_job_spec(), _SOURCE, "paper.pdf")
+    first_runtime.shutdown()
+
+    restarted = _runtime(tmp_path)
+    restarted.shutdown()
+
+    assert not restarted.coalescer.is_follower(leader.job_id)
+    assert restarted.coalescer.is_follower(follower.job_id)
+
+
+def test_hedged_jobs_neither_coalesce_with_nor_cache_for_docling_only_jobs(
+    monkeypatch, tmp_path: Path
+) -> None:
+    runtime = _runtime(
+        tmp_path,
+        hedged_high_priority=True,
+        result_cache_max_bytes=1024 * 1024,
+        service_revision="rev_hedge",
+    )
+    conversions: list[str] = []
+
+    def _execute(job) -> tuple[str, ConversionMetadata, list[str], dict[str, int]]:
+        conversions.append(job.job_id)
+        return ("# cheap", _metadata(job), [hedge_warning(WINNER_PYMUPDF, REASON_ACCEPTED)], {})
+
+    monkeypatch.setattr(runtime, "_execute_conversion", _execute)
+
+    hedged = runtime.create_job(_job_spec(priority="high"), _SOURCE, "paper.pdf")
+    normal = runtime.create_job(_job_spec(), _SOURCE, "paper.pdf")
+    assert normal.progress_stage != "coalesced"
+    runtime._run_job(hedged.job_id)
+    hedged_again = runtime.create_job(_job_spec(priority="high"), _SOURCE, "paper.pdf")
+    runtime.shutdown()
+
+    assert conversions == [hedged.job_id]
+    assert not runtime.coalescer.is_follower(normal.job_id)
+    assert hedged_again.cache_hit is False
+    assert hedged_again.status == JobStatus.QUEUED
+
+
+def test_high_priority_follower_boosts_queued_normal_leader(tmp_path: Path) -> None:
+    runtime = _runtime(tmp_path)
+    earlier = runtime.create_job(_job_spec(), b"%PDF-1.4\n% earlier\n%%EOF\n", "other.pdf")
+    leader = runtime.create_job(_job_spec(), _SOURCE, "paper.pdf")
+    runtime._enqueue(earlier.job_id)
+    runtime._enqueue(leader.job_id)
+
+    follower = runtime.create_job(_job_spec(priority="high"), _SOURCE, "paper.pdf")
+    dispatched = [runtime._dispatch_queue.pop(timeout=0), runtime._dispatch_queue.pop(timeout=0)]
+    runtime.shutdown()
+
+    assert runtime.coalescer.is_follower(follower.job_id)
+    assert dispatched == [leader.job_id, earlier.job_id]
+
+
+def test_leader_exiting_before_conversion_promotes_next_follower(
+    monkeypatch, tmp_path: Path
+) -> None:
+    runtime = _runtime(tmp_path)
+    started: list[str] = []
+    monkeypatch.setattr(runtime, "run_job_async", started.append)
+
+    leader = runtime.create_job(_job_spec(), _SOURCE, "paper.pdf")
+    follower = runtime.create_job(_job_spec(), _SOURCE, "paper.pdf")
+
+    def _expired(job_id: str) -> bool:
+        raise JobExpired(job_id)
+
+    monkeypatch.setattr(runtime.job_store, "claim_queued_job", _expired)
+    runtime._run_job(leader.job_id)
+    runtime.shutdown()
+
+    assert started == [follower.job_id]
+
+
+def test_timed_out_leader_promotes_follower_only_after_its_run_returns(
+    monkeypatch, tmp_path: Path
+) -> None:
+    runtime = _runtime(tmp_path)
+    started: list[str] = []
+    promoted_during_conversion: list[list[str]] = []
+
+    def _execute(job) -> tuple[str, ConversionMetadata, list[str], dict[str, int]]:
+        timeout = conversion_timeout_error(timeout_seconds=30, elapsed_ms=30_000)
+        assert runtime._mark_job_failed(job.job_id, timeout, 30_000)
+        promoted_during_conversion.append(list(started))
+        raise timeout
+
+    monkeypatch.setattr(runtime, "_execute_conversion", _execute)
+    monkeypatch.setattr(runtime, "run_job_async", started.append)
+
+    leader = runtime.create_job(_job_spec(timeout_seconds=30), _SOURCE, "paper.pdf")
+    follower = runtime.create_job(_job_spec(timeout_seconds=600), _SOURCE, "paper.pdf")
+    runtime._run_job(leader.job_id)
+    runtime.shutdown()
+
+    assert promoted_during_conversion == [[]]
+    assert started == [follower.job_id]
+    leader_done = runtime.get_job(leader.job_id)
+    assert leader_done is not None
+    assert leader_done.failure_code == "conversion_timeout"
@@ -81,7 +81,7 @@ def test_execute_job_conversion_emits_quality_warnings_and_strips_reserved_token
     markdown_content, metadata, warnings, timings = execute_job_conversion(
         spec=spec,
         source_filename="paper.pdf",
-        source_bytes=b"%PDF-1.4 fixture",
+        source=b"%PDF-1.4 fixture",
         gpu_available=True,
         gpu_runtime_probe=None,
         docling_backend=_Backend(raw_markdown),
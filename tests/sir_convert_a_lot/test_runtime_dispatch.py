@@ -0,0 +1,140 @@
+"""Dispatch queue and worker pool tests for runtime job execution.
+
+Purpose:
+    Verify that queued jobs dispatch HIGH before NORMAL, FIFO by `created_at`
+    within a priority, that aged NORMAL jobs are no longer overtaken, that
+    pending jobs can be promoted to HIGH, that
+    job worker threads are reused across jobs, and that a created job is
+    enqueued exactly once.
+
+Relationships:
+    - Exercises `infrastructure.runtime_dispatch.JobDispatchQueue` directly.
+    - Exercises `infrastructure.runtime_workers.JobWorkerPool` directly.
+    - Exercises job creation and `_enqueue` of
+      `infrastructure.runtime_engine.ServiceRuntime`.
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from scripts.sir_convert_a_lot.domain.specs import JobSpec, Priority
+from scripts.sir_convert_a_lot.infrastructure.runtime_dispatch import JobDispatchQueue
+from scripts.sir_convert_a_lot.infrastructure.runtime_engine import ServiceConfig, ServiceRuntime
+from scripts.sir_convert_a_lot.infrastructure.runtime_workers import JobWorkerPool
+from tests.sir_convert_a_lot.pdf_fixtures import fixture_pdf_bytes
+
+_BASE = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _at(seconds: float) -> datetime:
+    return _BASE + timedelta(seconds=seconds)
+
+
+def _drain(queue: JobDispatchQueue) -> list[str]:
+    drained: list[str] = []
+    while (job_id := queue.pop(timeout=0)) is not None:
+        drained.append(job_id)
+    return drained
+
+
+def test_high_priority_dispatches_first_and_fifo_within_priority() -> None:
+    queue = JobDispatchQueue(aging_seconds=3600.0, clock=lambda: _at(10).timestamp())
+    queue.push("normal_late", priority=Priority.NORMAL, created_at=_at(3))
+    queue.push("normal_early", priority=Priority.NORMAL, created_at=_at(1))
+    queue.push("high_late", priority=Priority.HIGH, created_at=_at(4))
+    queue.push("high_early", priority=Priority.HIGH, created_at=_at(2))
+
+    assert _drain(queue) == ["high_early", "high_late", "normal_early", "normal_late"]
+
+
+def test_aged_normal_job_is_not_overtaken_by_newer_high_jobs() -> None:
+    queue = JobDispatchQueue(aging_seconds=60.0, clock=lambda: _at(100).timestamp())
+    queue.push("normal_aged", priority=Priority.NORMAL, created_at=_at(0))
+    queue.push("normal_fresh", priority=Priority.NORMAL, created_at=_at(90))
+    queue.push("high_old", priority=Priority.HIGH, created_at=_at(-5))
+    queue.push("high_new", priority=Priority.HIGH, created_at=_at(50))
+
+    assert _drain(queue) == ["high_old", "normal_aged", "high_new", "normal_fresh"]
+
+
+def test_push_ignores_duplicates_and_closed_queue() -> None:
+    queue = JobDispatchQueue()
+    assert queue.push("job_a") is True
+    assert queue.push("job_a", priority=Priority.HIGH) is False
+    assert len(queue) == 1
+
+    queue.close()
+    assert queue.push("job_b") is False
+    assert queue.pop(timeout=0) == "job_a"
+    assert queue.pop(timeout=0) is None
+
+
+def test_promote_moves_pending_normal_job_ahead_of_normal_jobs() -> None:
+    queue = JobDispatchQueue(aging_seconds=3600.0, clock=lambda: _at(10).timestamp())
+    queue.push("normal_early", priority=Priority.NORMAL, created_at=_at(1))
+    queue.push("promoted", priority=Priority.NORMAL, created_at=_at(3))
+    queue.push("high", priority=Priority.HIGH, created_at=_at(2))
+
+    assert queue.promote("promoted", priority=Priority.HIGH) is True
+    assert queue.promote("promoted", priority=Priority.HIGH) is False
+    assert queue.promote("unknown", priority=Priority.HIGH) is False
+    assert _drain(queue) == ["high", "promoted", "normal_early"]
+
+
+def test_worker_pool_reuses_threads_across_jobs() -> None:
+    seen_threads: list[str] = []
+    done = threading.Semaphore(0)
+
+    def _handler(_job_id: str) -> None:
+        seen_threads.append(threading.current_thread().name)
+        done.release()
+
+    pool = JobWorkerPool(size=1, handler=_handler, name="test-worker")
+    for index in range(3):
+        pool.submit(f"job_{index}")
+        assert done.acquire(timeout=2.0)
+    pool.shutdown()
+
+    assert seen_threads == ["test-worker-1"] * 3
+    assert pool.spawned_total == 1
+
+
+def test_created_job_is_enqueued_once_and_missing_jobs_are_skipped(tmp_path: Path) -> None:
+    runtime = ServiceRuntime(
+        ServiceConfig(
+            api_key="secret-key",
+            data_root=tmp_path / "runtime_data",
+            gpu_available=False,
+            allow_cpu_only=True,
+            enable_supervisor=False,
+        )
+    )
+    spec = JobSpec.model_validate(
+        {
+            "api_version": "v1",
+            "source": {"kind": "upload", "filename": "paper.pdf"},
+            "conversion": {
+                "output_format": "md",
+                "backend_strategy": "pymupdf",
+                "ocr_mode": "off",
+                "table_mode": "fast",
+                "normalize": "standard",
+            },
+            "execution": {"acceleration_policy": "cpu_only", "priority": "normal"},
+            "retention": {"pin": False},
+        }
+    )
+    try:
+        job = runtime.create_job(spec, fixture_pdf_bytes("paper_alpha.pdf"), "paper.pdf")
+        assert len(runtime._dispatch_queue) == 0
+
+        runtime._enqueue(job.job_id)
+        runtime._enqueue("job_missing")
+
+        assert len(runtime._dispatch_queue) == 1
+        assert job.job_id in runtime._dispatch_queue
+    finally:
+        runtime.shutdown()
@@ -21,6 +21,8 @@ from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
     BackendExecutionError,
     BackendGpuUnavailableError,
     BackendInputError,
+    ConversionRequest,
+    ConversionResultData,
 )
 from scripts.sir_convert_a_lot.infrastructure.gpu_runtime_probe import GpuRuntimeProbeResult
 from scripts.sir_convert_a_lot.infrastructure.runtime_engine import ServiceConfig, ServiceRuntime
@@ -77,7 +79,7 @@ def test_backend_execution_error_maps_to_internal_failure(monkeypatch, tmp_path:
             processing_delay_seconds=0.01,
         )
     )
-    spec = _job_spec("paper.pdf")
+    spec = _job_spec("paper.pdf", backend_strategy=BackendStrategy.DOCLING)
     job = runtime.create_job(
         spec=spec,
         upload_bytes=fixture_pdf_bytes("paper_alpha.pdf"),
@@ -109,7 +111,7 @@ def test_backend_input_error_maps_to_pdf_unreadable(monkeypatch, tmp_path: Path)
             processing_delay_seconds=0.01,
         )
     )
-    spec = _job_spec("paper.pdf")
+    spec = _job_spec("paper.pdf", backend_strategy=BackendStrategy.DOCLING)
     job = runtime.create_job(
         spec=spec,
         upload_bytes=fixture_pdf_bytes("paper_alpha.pdf"),
@@ -195,6 +197,47 @@ def test_pymupdf_input_error_maps_to_pdf_unreadable(monkeypatch, tmp_path: Path)
     assert stored.failure_retryable is False
 
 
+def test_backend_reads_upload_in_place_and_header_is_checked(monkeypatch, tmp_path: Path) -> None:
+    runtime = ServiceRuntime(
+        ServiceConfig(
+            api_key="secret-key",
+            data_root=tmp_path / "runtime_data",
+            gpu_available=False,
+            allow_cpu_only=True,
+            processing_delay_seconds=0.01,
+        )
+    )
+    requests: list[ConversionRequest] = []
+
+    def _record(request: ConversionRequest) -> ConversionResultData:
+        requests.append(request)
+        return ConversionResultData(
+            markdown_content="# Converted\n",
+            backend_used="pymupdf",
+            acceleration_used="cpu",
+            ocr_enabled=False,
+        )
+
+    monkeypatch.setattr(runtime.pymupdf_backend, "convert", _record)
+    spec = _job_spec("paper.pdf", backend_strategy=BackendStrategy.PYMUPDF)
+    job = runtime.create_job(
+        spec=spec, upload_bytes=fixture_pdf_bytes("paper_alpha.pdf"), source_filename="paper.pdf"
+    )
+    runtime.run_job_async(job.job_id)
+    assert _wait_for_terminal(runtime, job.job_id) == JobStatus.SUCCEEDED
+    assert requests[0].source == job.upload_path
+
+    not_pdf = runtime.create_job(
+        spec=spec, upload_bytes=b"PK\x03\x04 not a pdf", source_filename="paper.pdf"
+    )
+    runtime.run_job_async(not_pdf.job_id)
+    assert _wait_for_terminal(runtime, not_pdf.job_id) == JobStatus.FAILED
+    stored = runtime.get_job(not_pdf.job_id)
+    assert stored is not None
+    assert stored.failure_code == "pdf_unreadable"
+    assert len(requests) == 1
+
+
 def test_backend_gpu_unavailable_maps_to_gpu_not_available(monkeypatch, tmp_path: Path) -> None:
     available_probe = GpuRuntimeProbeResult(
         runtime_kind="rocm",
@@ -280,10 +323,15 @@ def test_run_job_async_ignores_duplicate_active_job_id(monkeypatch, tmp_path: Pa
             runtime._active_job_ids.discard(job_id)
 
     monkeypatch.setattr(runtime, "_run_job", _fake_run_job)
+    job = runtime.create_job(
+        spec=_job_spec("paper.pdf"),
+        upload_bytes=fixture_pdf_bytes("paper_alpha.pdf"),
+        source_filename="paper.pdf",
+    )
 
-    runtime.run_job_async("job_duplicate_check")
+    runtime.run_job_async(job.job_id)
     assert run_started.wait(timeout=1.0)
-    runtime.run_job_async("job_duplicate_check")
+    runtime.run_job_async(job.job_id)
     time.sleep(0.05)
     release_run.set()
 
@@ -0,0 +1,156 @@
+"""Document-timeout watchdog tests for Sir Convert-a-Lot runtimes.
+
+Purpose:
+    Verify overrunning conversions fail with `conversion_timeout`, record
+    elapsed time, are canceled through their cancel token, keep their worker
+    slot until they actually stop, and cannot be overwritten by a late result.
+
+Relationships:
+    - Exercises `infrastructure.runtime_supervisor.SupervisedJobRuntime` via
+      `infrastructure.runtime_engine.ServiceRuntime`.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+from scripts.sir_convert_a_lot.application.contracts import ConversionMetadata
+from scripts.sir_convert_a_lot.domain.specs import JobSpec, JobStatus
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import ConversionCanceledError
+from scripts.sir_convert_a_lot.infrastructure.runtime_engine import ServiceConfig, ServiceRuntime
+
+
+def _job_spec() -> JobSpec:
+    return JobSpec.model_validate(
+        {
+            "api_version": "v1",
+            "source": {"kind": "upload", "filename": "paper.pdf"},
+            "conversion": {
+                "output_format": "md",
+                "backend_strategy": "auto",
+                "ocr_mode": "off",
+                "table_mode": "fast",
+                "normalize": "standard",
+            },
+            "execution": {
+                "acceleration_policy": "cpu_only",
+                "priority": "normal",
+                "document_timeout_seconds": 30,
+            },
+            "retention": {"pin": False},
+        }
+    )
+
+
+def _runtime(tmp_path: Path) -> ServiceRuntime:
+    return ServiceRuntime(
+        ServiceConfig(
+            api_key="secret-key",
+            data_root=tmp_path / "runtime_data",
+            gpu_available=False,
+            allow_cpu_only=True,
+            enable_supervisor=False,
+            processing_delay_seconds=0.0,
+        )
+    )
+
+
+def _metadata(job) -> ConversionMetadata:
+    return ConversionMetadata(
+        backend_used="docling",
+        acceleration_used="cpu",
+        ocr_enabled=False,
+        table_mode=job.spec.conversion.table_mode,
+        options_fingerprint="sha256:test",
+    )
+
+
+def _shorten_watchdog(monkeypatch, runtime: ServiceRuntime) -> None:
+    original_watchdog = runtime._start_conversion_watchdog
+
+    def _short_watchdog(job_id: str, *, timeout_seconds: int, conversion_started: float):
+        assert timeout_seconds == 30
+        return original_watchdog(job_id, timeout_seconds=0, conversion_started=conversion_started)
+
+    monkeypatch.setattr(runtime, "_start_conversion_watchdog", _short_watchdog)
+
+
+def _wait_for_slot_release(runtime: ServiceRuntime, job_id: str) -> bool:
+    deadline = time.monotonic() + 5.0
+    while time.monotonic() < deadline:
+        with runtime._lock:
+            if job_id not in runtime._active_job_ids:
+                return True
+        time.sleep(0.01)
+    return False
+
+
+def test_watchdog_fails_overrunning_job_and_cancels_its_conversion(
+    monkeypatch, tmp_path: Path
+) -> None:
+    runtime = _runtime(tmp_path)
+    job = runtime.create_job(_job_spec(), b"%PDF-1.4\n%%EOF\n", "paper.pdf")
+    slot_held_when_canceled: list[bool] = []
+
+    def _checkpointing_execute(_job) -> tuple[str, ConversionMetadata, list[str], dict[str, int]]:
+        cancel = runtime._conversion_cancel(_job.job_id)
+        assert cancel is not None
+        deadline = time.monotonic() + 5.0
+        while not cancel.canceled and time.monotonic() < deadline:
+            time.sleep(0.01)
+        with runtime._lock:
+            slot_held_when_canceled.append(_job.job_id in runtime._active_job_ids)
+        raise ConversionCanceledError("conversion canceled at a progress checkpoint")
+
+    monkeypatch.setattr(runtime, "_execute_conversion", _checkpointing_execute)
+    _shorten_watchdog(monkeypatch, runtime)
+    runtime.run_job_async(job.job_id)
+
+    assert _wait_for_slot_release(runtime, job.job_id)
+    assert slot_held_when_canceled == [True]
+    failed = runtime.get_job(job.job_id)
+    assert failed is not None
+    assert failed.status == JobStatus.FAILED
+    assert failed.failure_code == "conversion_timeout"
+    assert failed.failure_retryable is False
+    assert failed.failure_details is not None
+    assert failed.failure_details["document_timeout_seconds"] == 0
+    assert "conversion_attempt_ms" in failed.phase_timings_ms
+
+
+def test_watchdog_keeps_slot_until_unresponsive_conversion_returns(
+    monkeypatch, tmp_path: Path
+) -> None:
+    runtime = _runtime(tmp_path)
+    job = runtime.create_job(_job_spec(), b"%PDF-1.4\n%%EOF\n", "paper.pdf")
+    release_conversion = threading.Event()
+    conversion_finished = threading.Event()
+
+    def _stuck_execute(_job) -> tuple[str, ConversionMetadata, list[str], dict[str, int]]:
+        release_conversion.wait(timeout=5.0)
+        conversion_finished.set()
+        return ("# late result", _metadata(_job), [], {})
+
+    monkeypatch.setattr(runtime, "_execute_conversion", _stuck_execute)
+    _shorten_watchdog(monkeypatch, runtime)
+    runtime.run_job_async(job.job_id)
+
+    deadline = time.monotonic() + 5.0
+    failed = runtime.get_job(job.job_id)
+    while time.monotonic() < deadline and (failed is None or failed.status != JobStatus.FAILED):
+        time.sleep(0.01)
+        failed = runtime.get_job(job.job_id)
+    assert failed is not None and failed.failure_code == "conversion_timeout"
+    with runtime._lock:
+        assert job.job_id in runtime._active_job_ids
+    assert not conversion_finished.is_set()
+
+    release_conversion.set()
+    assert conversion_finished.wait(timeout=5.0)
+    assert _wait_for_slot_release(runtime, job.job_id)
+    after_late_result = runtime.get_job(job.job_id)
+    assert after_late_result is not None
+    assert after_late_result.status == JobStatus.FAILED
+    assert after_late_result.failure_code == "conversion_timeout"
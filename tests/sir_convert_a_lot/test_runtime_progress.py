@@ -0,0 +1,199 @@
+"""Page-level conversion progress tests for Sir Convert-a-Lot.
+
+Purpose:
+    Verify that backends report per-page progress through
+    `ConversionRequest.progress`, that the runtime throttles persisting it,
+    and that v1 and v2 job records expose `pages_processed` / `pages_total`.
+
+Relationships:
+    - Exercises `infrastructure.runtime_progress`, `infrastructure.pymupdf_backend`
+      and the progress writes of `infrastructure.job_store` / `job_store_v2`.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pymupdf
+
+from scripts.sir_convert_a_lot.domain.specs import (
+    BackendStrategy,
+    JobSpec,
+    JobStatus,
+    OcrMode,
+    TableMode,
+)
+from scripts.sir_convert_a_lot.domain.specs_v2 import JobSpecV2
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
+    ConversionProgress,
+    ConversionRequest,
+)
+from scripts.sir_convert_a_lot.infrastructure.job_store_v2 import JobStoreV2
+from scripts.sir_convert_a_lot.infrastructure.pymupdf_backend import PyMuPdfConversionBackend
+from scripts.sir_convert_a_lot.infrastructure.runtime_engine import ServiceConfig, ServiceRuntime
+from scripts.sir_convert_a_lot.infrastructure.runtime_progress import ThrottledProgressWriter
+from scripts.sir_convert_a_lot.infrastructure.upload_staging import stage_upload_bytes
+
+
+def _multi_page_pdf(page_count: int) -> bytes:
+    document = pymupdf.open()
+    for page_number in range(page_count):
+        page = document.new_page()
+        page.insert_text((72, 72), f"Section {page_number + 1}", fontsize=16)
+        page.insert_text((72, 110), f"Body text on page {page_number + 1}.", fontsize=10)
+    return bytes(document.tobytes())
+
+
+def _pymupdf_request(source_bytes: bytes, progress=None) -> ConversionRequest:
+    return ConversionRequest(
+        source_filename="paper.pdf",
+        source=source_bytes,
+        backend_strategy=BackendStrategy.PYMUPDF,
+        ocr_mode=OcrMode.OFF,
+        table_mode=TableMode.FAST,
+        gpu_available=False,
+        progress=progress,
+    )
+
+
+def test_throttled_writer_coalesces_reports_between_intervals() -> None:
+    written: list[ConversionProgress] = []
+    now = [0.0]
+
+    def _persist(progress: ConversionProgress) -> bool:
+        written.append(progress)
+        return True
+
+    writer = ThrottledProgressWriter(
+        persist=_persist,
+        min_interval_seconds=1.0,
+        clock=lambda: now[0],
+    )
+
+    writer(ConversionProgress(stage="extract", pages_completed=0, pages_total=10))
+    for page in range(1, 5):
+        now[0] += 0.1
+        writer(ConversionProgress(stage="extract", pages_completed=page, pages_total=10))
+    now[0] += 1.0
+    writer(ConversionProgress(stage="extract", pages_completed=5, pages_total=10))
+    writer(ConversionProgress(stage="extract", pages_completed=6, pages_total=10))
+    writer.flush()
+    writer(ConversionProgress(stage="extract", pages_completed=10, pages_total=10))
+
+    assert [(item.pages_completed, item.pages_total) for item in written] == [
+        (0, 10),
+        (5, 10),
+        (6, 10),
+        (10, 10),
+    ]
+
+
+def test_throttled_writer_stops_once_job_is_no_longer_running() -> None:
+    attempts: list[ConversionProgress] = []
+
+    def _persist(progress: ConversionProgress) -> bool:
+        attempts.append(progress)
+        return False
+
+    writer = ThrottledProgressWriter(persist=_persist, min_interval_seconds=0.0)
+    writer(ConversionProgress(stage="extract", pages_completed=1, pages_total=3))
+    writer(ConversionProgress(stage="ocr", pages_completed=1, pages_total=3))
+
+    assert len(attempts) == 1
+
+
+def test_pymupdf_backend_reports_each_page_without_changing_output() -> None:
+    source = _multi_page_pdf(3)
+    backend = PyMuPdfConversionBackend()
+    reports: list[ConversionProgress] = []
+
+    tracked = backend.convert(_pymupdf_request(source, progress=reports.append))
+    untracked = backend.convert(_pymupdf_request(source))
+
+    assert tracked.markdown_content == untracked.markdown_content
+    assert [(item.stage, item.pages_completed, item.pages_total) for item in reports] == [
+        ("pymupdf_extract", 0, 3),
+        ("pymupdf_extract", 1, 3),
+        ("pymupdf_extract", 2, 3),
+        ("pymupdf_extract", 3, 3),
+    ]
+
+
+def test_v1_job_record_exposes_backend_page_progress(tmp_path: Path) -> None:
+    runtime = ServiceRuntime(
+        ServiceConfig(
+            api_key="secret-key",
+            data_root=tmp_path / "runtime_data",
+            gpu_available=False,
+            allow_cpu_only=True,
+            enable_supervisor=False,
+            processing_delay_seconds=0.0,
+            progress_persist_interval_seconds=60.0,
+        )
+    )
+    spec = JobSpec.model_validate(
+        {
+            "api_version": "v1",
+            "source": {"kind": "upload", "filename": "paper.pdf"},
+            "conversion": {
+                "output_format": "md",
+                "backend_strategy": "pymupdf",
+                "ocr_mode": "off",
+                "table_mode": "fast",
+                "normalize": "standard",
+            },
+            "execution": {
+                "acceleration_policy": "cpu_only",
+                "priority": "normal",
+                "document_timeout_seconds": 60,
+            },
+            "retention": {"pin": False},
+        }
+    )
+    job = runtime.create_job(spec, _multi_page_pdf(4), "paper.pdf")
+    runtime._run_job(job.job_id)
+    runtime.shutdown()
+
+    done = runtime.get_job(job.job_id)
+    assert done is not None
+    assert done.status == JobStatus.SUCCEEDED
+    assert done.pages_total == 4
+    assert done.pages_processed == 4
+    assert done.progress_stage == "pymupdf_extract"
+
+
+def test_v2_store_persists_progress_only_while_running(tmp_path: Path) -> None:
+    store = JobStoreV2(
+        data_root=tmp_path / "service_data", raw_ttl_seconds=3600, artifact_ttl_seconds=3600
+    )
+    spec = JobSpecV2.model_validate(
+        {
+            "api_version": "v2",
+            "source": {"kind": "upload", "filename": "note.md", "format": "md"},
+            "conversion": {
+                "output_format": "pdf",
+                "css_filenames": [],
+                "reference_docx_filename": None,
+            },
+            "retention": {"pin": False},
+        }
+    )
+    store.create_job(
+        job_id="jobv2_progress",
+        spec=spec,
+        upload=stage_upload_bytes(b"# Title\n", store.staging_dir),
+        resources_zip_bytes=None,
+        reference_docx_bytes=None,
+    )
+
+    assert not store.report_conversion_progress(
+        "jobv2_progress", stage="docling_convert", pages_processed=0, pages_total=7
+    )
+    assert store.claim_queued_job("jobv2_progress")
+    assert store.report_conversion_progress(
+        "jobv2_progress", stage="docling_convert", pages_processed=3, pages_total=7
+    )
+
+    record = store.get_job("jobv2_progress")
+    assert record.progress_stage == "docling_convert"
+    assert (record.pages_processed, record.pages_total) == (3, 7)
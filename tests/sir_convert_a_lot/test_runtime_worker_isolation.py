@@ -0,0 +1,217 @@
+"""Process-isolated conversion worker tests for Sir Convert-a-Lot.
+
+Purpose:
+    Verify worker-crash requeue semantics in the runtime, that the spawned
+    worker pool round-trips real conversions and backend errors over IPC,
+    that a canceled conversion terminates its worker, and that the v1 and v2
+    runtimes share one pool.
+
+Relationships:
+    - Exercises `infrastructure.runtime_supervisor.SupervisedJobRuntime` crash
+      handling via `infrastructure.runtime_engine.ServiceRuntime`.
+    - Exercises `infrastructure.conversion_worker_pool.ConversionWorkerPool`
+      and the runtime wiring in `interfaces.http_app_state`.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import time
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from scripts.sir_convert_a_lot.application.contracts import ConversionMetadata
+from scripts.sir_convert_a_lot.domain.specs import (
+    BackendStrategy,
+    JobSpec,
+    JobStatus,
+    OcrMode,
+    TableMode,
+)
+from scripts.sir_convert_a_lot.infrastructure.conversion_backend import (
+    BackendInputError,
+    BackendWorkerCrashedError,
+    CancelToken,
+    ConversionCanceledError,
+    ConversionRequest,
+)
+from scripts.sir_convert_a_lot.infrastructure.conversion_worker_pool import ConversionWorkerPool
+from scripts.sir_convert_a_lot.infrastructure.runtime_engine import ServiceConfig, ServiceRuntime
+from scripts.sir_convert_a_lot.interfaces.http_app_state import (
+    ensure_runtime_state,
+    ensure_runtime_state_v2,
+    shutdown_runtime_state,
+)
+from scripts.sir_convert_a_lot.service import create_app
+from tests.sir_convert_a_lot.pdf_fixtures import fixture_pdf_bytes
+
+
+def _job_spec() -> JobSpec:
+    return JobSpec.model_validate(
+        {
+            "api_version": "v1",
+            "source": {"kind": "upload", "filename": "paper.pdf"},
+            "conversion": {
+                "output_format": "md",
+                "backend_strategy": "auto",
+                "ocr_mode": "off",
+                "table_mode": "fast",
+                "normalize": "standard",
+            },
+            "execution": {
+                "acceleration_policy": "cpu_only",
+                "priority": "normal",
+                "document_timeout_seconds": 1800,
+            },
+            "retention": {"pin": False},
+        }
+    )
+
+
+def _runtime(tmp_path: Path, *, max_worker_crash_requeues: int = 1) -> ServiceRuntime:
+    return ServiceRuntime(
+        ServiceConfig(
+            api_key="secret-key",
+            data_root=tmp_path / "runtime_data",
+            gpu_available=False,
+            allow_cpu_only=True,
+            enable_supervisor=False,
+            processing_delay_seconds=0.0,
+            max_worker_crash_requeues=max_worker_crash_requeues,
+        )
+    )
+
+
+def _wait_for_terminal(runtime: ServiceRuntime, job_id: str) -> JobStatus:
+    deadline = time.monotonic() + 10.0
+    while time.monotonic() < deadline:
+        job = runtime.get_job(job_id)
+        assert job is not None
+        if job.status in {JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELED}:
+            return job.status
+        time.sleep(0.02)
+    raise AssertionError("job did not reach terminal status before timeout")
+
+
+def test_worker_crash_requeues_job_and_next_attempt_succeeds(monkeypatch, tmp_path: Path) -> None:
+    runtime = _runtime(tmp_path)
+    job = runtime.create_job(_job_spec(), fixture_pdf_bytes("paper_alpha.pdf"), "paper.pdf")
+    attempts = 0
+
+    def _crash_then_succeed(_job) -> tuple[str, ConversionMetadata, list[str], dict[str, int]]:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise BackendWorkerCrashedError("docling worker process exited during conversion")
+        metadata = ConversionMetadata(
+            backend_used="docling",
+            acceleration_used="cpu",
+            ocr_enabled=False,
+            table_mode=TableMode.FAST,
+            options_fingerprint="sha256:test",
+        )
+        return ("# recovered", metadata, [], {})
+
+    monkeypatch.setattr(runtime, "_execute_conversion", _crash_then_succeed)
+    runtime.run_job_async(job.job_id)
+
+    assert _wait_for_terminal(runtime, job.job_id) == JobStatus.SUCCEEDED
+    assert attempts == 2
+    assert runtime._worker_crash_counts == {}
+
+
+def test_worker_crash_fails_job_after_requeues_are_exhausted(monkeypatch, tmp_path: Path) -> None:
+    runtime = _runtime(tmp_path, max_worker_crash_requeues=1)
+    job = runtime.create_job(_job_spec(), fixture_pdf_bytes("paper_alpha.pdf"), "paper.pdf")
+    attempts = 0
+
+    def _always_crash(_job) -> tuple[str, ConversionMetadata, list[str], dict[str, int]]:
+        nonlocal attempts
+        attempts += 1
+        raise BackendWorkerCrashedError("docling worker process exited during conversion")
+
+    monkeypatch.setattr(runtime, "_execute_conversion", _always_crash)
+    runtime.run_job_async(job.job_id)
+
+    assert _wait_for_terminal(runtime, job.job_id) == JobStatus.FAILED
+    assert attempts == 2
+    failed = runtime.get_job(job.job_id)
+    assert failed is not None
+    assert failed.failure_code == "conversion_worker_crashed"
+    assert failed.failure_details == {"worker_crashes": 2}
+
+
+def test_worker_pool_round_trips_conversion_and_backend_errors() -> None:
+    pool = ConversionWorkerPool(max_workers=1)
+    try:
+        request = ConversionRequest(
+            source_filename="paper.pdf",
+            source=fixture_pdf_bytes("paper_alpha.pdf"),
+            backend_strategy=BackendStrategy.PYMUPDF,
+            ocr_mode=OcrMode.OFF,
+            table_mode=TableMode.FAST,
+            gpu_available=False,
+        )
+        result = pool.convert("pymupdf", request)
+        assert result.backend_used == "pymupdf"
+        assert result.markdown_content.strip() != ""
+
+        with pytest.raises(BackendInputError):
+            pool.convert("pymupdf", replace(request, source=b"not a pdf"))
+    finally:
+        pool.shutdown()
+
+
+def _pymupdf_request() -> ConversionRequest:
+    return ConversionRequest(
+        source_filename="paper.pdf",
+        source=fixture_pdf_bytes("paper_alpha.pdf"),
+        backend_strategy=BackendStrategy.PYMUPDF,
+        ocr_mode=OcrMode.OFF,
+        table_mode=TableMode.FAST,
+        gpu_available=False,
+    )
+
+
+def test_worker_pool_terminates_worker_of_canceled_conversion() -> None:
+    pool = ConversionWorkerPool(max_workers=1)
+    try:
+        first_worker = pool._workers[0]
+        cancel = CancelToken()
+        cancel.cancel()
+
+        with pytest.raises(ConversionCanceledError):
+            pool.convert("pymupdf", replace(_pymupdf_request(), cancel=cancel))
+
+        assert pool._workers[0] is not first_worker
+        worker_pid = first_worker.pid.value
+        assert worker_pid != 0
+        deadline = time.monotonic() + 10.0
+        while any(child.pid == worker_pid for child in multiprocessing.active_children()):
+            assert time.monotonic() < deadline, "canceled worker process is still alive"
+            time.sleep(0.05)
+        assert pool.convert("pymupdf", _pymupdf_request()).backend_used == "pymupdf"
+    finally:
+        pool.shutdown()
+
+
+def test_v1_and_v2_runtimes_share_one_worker_pool(tmp_path: Path) -> None:
+    app = create_app(
+        ServiceConfig(
+            api_key="secret-key",
+            data_root=tmp_path / "service_data",
+            gpu_available=False,
+            allow_cpu_only=True,
+            enable_supervisor=False,
+            conversion_isolation="process",
+        )
+    )
+    runtime, _ = ensure_runtime_state(app, utc_now_iso="2026-01-01T00:00:00Z")
+    runtime_v2 = ensure_runtime_state_v2(app, utc_now_iso="2026-01-01T00:00:00Z")
+    try:
+        assert runtime.backends.worker_pool is not None
+        assert runtime_v2.backends is runtime.backends
+    finally:
+        shutdown_runtime_state(app)
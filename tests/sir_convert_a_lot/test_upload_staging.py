@@ -0,0 +1,116 @@
+"""Streamed upload staging tests.
+
+Purpose:
+    Verify that uploads are written to a staging file in chunks with an
+    incremental SHA-256, that the size limit aborts staging as bytes arrive,
+    and that job creation commits the staged file into `raw/` by rename
+    without leaving staging files behind.
+
+Relationships:
+    - Exercises `infrastructure.upload_staging` and its use by the v1 job
+      create route through `interfaces.http_upload_staging`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from scripts.sir_convert_a_lot.infrastructure.upload_staging import (
+    UploadStager,
+    UploadTooLargeError,
+    stage_upload_bytes,
+)
+from scripts.sir_convert_a_lot.service import ServiceConfig, create_app
+from tests.sir_convert_a_lot.pdf_fixtures import fixture_pdf_bytes
+
+
+def test_stager_hashes_incrementally_and_commits_by_rename(tmp_path: Path) -> None:
+    stager = UploadStager(tmp_path / "staging", max_bytes=10)
+    for chunk in (b"%PDF", b"-1.7", b"\n"):
+        stager.write(chunk)
+    staged = stager.finish()
+    destination = tmp_path / "raw" / "input.pdf"
+    destination.parent.mkdir()
+
+    staged.commit(destination)
+
+    assert staged.size_bytes == 9
+    assert staged.sha256 == hashlib.sha256(b"%PDF-1.7\n").hexdigest()
+    assert destination.read_bytes() == b"%PDF-1.7\n"
+    assert list((tmp_path / "staging").iterdir()) == []
+
+
+def test_stager_aborts_once_the_limit_is_exceeded(tmp_path: Path) -> None:
+    stager = UploadStager(tmp_path / "staging", max_bytes=6)
+    stager.write(b"%PDF")
+
+    with pytest.raises(UploadTooLargeError):
+        stager.write(b"-1.7")
+
+    assert list((tmp_path / "staging").iterdir()) == []
+
+
+def test_staged_upload_context_discards_uncommitted_file(tmp_path: Path) -> None:
+    with stage_upload_bytes(b"%PDF-1.7\n", tmp_path / "staging") as staged:
+        assert staged.path.exists()
+
+    assert not staged.path.exists()
+
+
+def _post_create(client: TestClient, *, idempotency_key: str, file_bytes: bytes):
+    spec = {
+        "api_version": "v1",
+        "source": {"kind": "upload", "filename": "paper.pdf"},
+        "conversion": {
+            "output_format": "md",
+            "backend_strategy": "pymupdf",
+            "ocr_mode": "off",
+            "table_mode": "fast",
+            "normalize": "standard",
+        },
+        "execution": {
+            "acceleration_policy": "cpu_only",
+            "priority": "normal",
+            "document_timeout_seconds": 1800,
+        },
+        "retention": {"pin": False},
+    }
+    return client.post(
+        "/v1/convert/jobs",
+        headers={"X-API-Key": "secret-key", "Idempotency-Key": idempotency_key},
+        files={
+            "file": ("paper.pdf", file_bytes, "application/pdf"),
+            "job_spec": (None, json.dumps(spec)),
+        },
+    )
+
+
+def test_create_job_streams_upload_into_raw_and_rejects_oversized(tmp_path: Path) -> None:
+    data_root = tmp_path / "service_data"
+    upload = fixture_pdf_bytes("paper_alpha.pdf")
+    app = create_app(
+        ServiceConfig(
+            api_key="secret-key",
+            data_root=data_root,
+            gpu_available=False,
+            allow_cpu_only=True,
+            max_upload_bytes=len(upload),
+            processing_delay_seconds=0.01,
+        )
+    )
+    client = TestClient(app)
+
+    accepted = _post_create(client, idempotency_key="idem-fits", file_bytes=upload)
+    rejected = _post_create(client, idempotency_key="idem-too-big", file_bytes=upload + b"\n")
+
+    assert accepted.status_code == 202
+    job_id = accepted.json()["job"]["job_id"]
+    assert (data_root / "jobs" / job_id / "raw" / "input.pdf").read_bytes() == upload
+    assert rejected.status_code == 413
+    assert rejected.json()["error"]["code"] == "payload_too_large"
+    assert list((data_root / "staging").iterdir()) == []